@@ -0,0 +1,158 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Bitstream Settings: opt-in bitstream compression, configuration clock and SPI bus width for the
+# platforms declaring their configuration Flash (config_flash = (part, bus width wired on the
+# board)). Settings are validated against the Flash part and reduce both JTAG load (compression)
+# and power-on configuration (compression, faster/wider SPI reads) times.
+#
+# ./digilent_arty.py --build --bitstream-compress --config-rate=max --spi-buswidth=4
+# ./litex_acorn_baseboard.py --build --bitstream-compress --config-rate=38.8
+
+import re
+
+from litex.build.xilinx.platform import XilinxPlatform
+from litex.build.lattice.platform import LatticePlatform
+from litex.build.lattice.trellis import LatticeTrellisToolchain
+
+# Configuration Flashes ----------------------------------------------------------------------------
+
+# Max read clock (MHz, Fast Read/Dual/Quad Output Read) and max bus width of the configuration
+# Flashes used on the boards (from the datasheets, conservative values).
+config_flashes = {
+    "IS25LP128"   : (133, 4),
+    "MT25QL128"   : (133, 4),
+    "MX25L12835F" : (104, 4),
+    "MX25U3235F"  : (104, 4),
+    "N25Q128A"    : (108, 4),
+    "N25Q256A"    : (108, 4),
+    "S25FL128L"   : (108, 4),
+    "S25FL128S"   : (104, 4),
+    "SST26VF032B" : (104, 4),
+    "W25Q128JV"   : (133, 4),
+    "W25Q256"     : (104, 4),
+}
+
+# Configuration Clocks -----------------------------------------------------------------------------
+
+# 7-Series/UltraScale CONFIGRATE (MHz): CCLK generated by the internal oscillator, up to +50%.
+xilinx_config_rates     = [3, 6, 9, 12, 16, 22, 26, 33, 40, 50, 66]
+xilinx_config_tolerance = 0.50
+
+# Capture SPI data on CCLK falling edge above this rate (more read timing margin).
+xilinx_fall_edge_rate = 33
+
+# ECP5 MCLK (MHz): generated by the internal oscillator, up to +15%.
+ecp5_config_rates     = [2.4, 4.8, 9.7, 19.4, 38.8, 62.0]
+ecp5_config_tolerance = 0.15
+
+ecp5_spimodes = {1: "fast-read", 2: "dual-spi", 4: "qspi"}
+
+def config_rate_max(config_rates, tolerance, flash_freq):
+    """Returns the highest config rate whose worst-case frequency is supported by the Flash."""
+    rates = [r for r in config_rates if r*(1 + tolerance) <= flash_freq]
+    return max(rates)
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _config_flash(platform):
+    config_flash = getattr(platform, "config_flash", None)
+    if config_flash is None:
+        raise ValueError(f"{type(platform).__module__}: configuration Flash not declared.")
+    part, buswidth = config_flash
+    flash_freq, flash_buswidth = config_flashes[part]
+    return part, flash_freq, min(buswidth, flash_buswidth)
+
+def _check_config_rate(config_rate, config_rates, tolerance, part, flash_freq):
+    if config_rate == "max":
+        return config_rate_max(config_rates, tolerance, flash_freq)
+    config_rate = float(config_rate)
+    if config_rate not in config_rates:
+        raise ValueError("Invalid config rate {}MHz, valid rates: {}.".format(
+            config_rate, config_rates))
+    if config_rate*(1 + tolerance) > flash_freq:
+        raise ValueError("Config rate {}MHz (up to {:.1f}MHz) exceeds {} max freq ({}MHz).".format(
+            config_rate, config_rate*(1 + tolerance), part, flash_freq))
+    return config_rate
+
+def _set_property(commands, name, value):
+    # Replace (or add) a bitstream property in the Vivado commands.
+    command  = f"set_property {name} {value} [current_design]"
+    commands = [c for c in commands if not c.startswith(f"set_property {name} ")]
+    return commands + [command]
+
+# Bitstream Settings -------------------------------------------------------------------------------
+
+def bitstream_settings(platform, compress=False, config_rate=None, spi_buswidth=None):
+    """Applies bitstream settings to platform, returns the additional build kwargs.
+
+    - compress:     Bitstream compression.
+    - config_rate:  Configuration clock (MHz, Xilinx CONFIGRATE/ECP5 MCLK) or "max" for the highest
+                    rate supported by the configuration Flash.
+    - spi_buswidth: SPI bus width for configuration (1, 2 or 4), up to the width wired on the board.
+
+    Xilinx/Vivado settings are added to the platform's bitstream commands (and write_cfgmem
+    interface), ECP5/Trellis settings are returned as ecppack build kwargs.
+    """
+    if not compress and config_rate is None and spi_buswidth is None:
+        return {}
+    part, flash_freq, max_buswidth = _config_flash(platform)
+    if spi_buswidth is not None and spi_buswidth not in [1, 2, 4]:
+        raise ValueError(f"Invalid SPI bus width {spi_buswidth}, valid widths: 1, 2, 4.")
+    if spi_buswidth is not None and spi_buswidth > max_buswidth:
+        raise ValueError(f"SPI bus width {spi_buswidth} not supported (max: {max_buswidth}).")
+
+    # Xilinx (Vivado).
+    if isinstance(platform, XilinxPlatform):
+        toolchain = platform.toolchain
+        if not hasattr(toolchain, "bitstream_commands"):
+            raise ValueError("Bitstream settings require the Vivado toolchain.")
+        commands = list(toolchain.bitstream_commands)
+        if compress:
+            commands = _set_property(commands, "BITSTREAM.GENERAL.COMPRESS", "TRUE")
+        if config_rate is not None:
+            config_rate = int(_check_config_rate(config_rate, xilinx_config_rates,
+                xilinx_config_tolerance, part, flash_freq))
+            commands = _set_property(commands, "BITSTREAM.CONFIG.CONFIGRATE", config_rate)
+            if config_rate > xilinx_fall_edge_rate:
+                commands = _set_property(commands, "BITSTREAM.CONFIG.SPI_FALL_EDGE", "YES")
+        if spi_buswidth is not None:
+            commands = _set_property(commands, "BITSTREAM.CONFIG.SPI_BUSWIDTH", spi_buswidth)
+            interface = f"-interface spix{spi_buswidth}"
+            toolchain.additional_commands = [re.sub(r"-interface spix\d", interface, c)
+                for c in toolchain.additional_commands]
+        toolchain.bitstream_commands = commands
+        return {}
+
+    # Lattice ECP5 (Trellis/ecppack).
+    if isinstance(platform, LatticePlatform) and platform.device.startswith("LFE5"):
+        if not isinstance(platform.toolchain, LatticeTrellisToolchain):
+            raise ValueError("Bitstream settings require the Trellis toolchain.")
+        kwargs = {}
+        if compress:
+            kwargs["compress"] = True
+        if config_rate is not None:
+            kwargs["freq"] = _check_config_rate(config_rate, ecp5_config_rates,
+                ecp5_config_tolerance, part, flash_freq)
+        if spi_buswidth is not None:
+            kwargs["spimode"] = ecp5_spimodes[spi_buswidth]
+        return kwargs
+
+    raise ValueError(f"Bitstream settings not supported on {platform.device}.")
+
+# Arguments ----------------------------------------------------------------------------------------
+
+def bitstream_args(parser):
+    group = parser.add_argument_group(title="Bitstream options")
+    group.add_argument("--bitstream-compress", action="store_true",     help="Compress Bitstream (faster JTAG load/configuration).")
+    group.add_argument("--config-rate",        default=None,            help="Configuration clock (MHz, Xilinx CONFIGRATE/ECP5 MCLK) or max (highest rate supported by the configuration Flash).")
+    group.add_argument("--spi-buswidth",       default=None, type=int,  help="Configuration SPI bus width (1, 2 or 4, Flash Quad Enable bit required for 4 on some parts).")
+
+def bitstream_argdict(args):
+    return {
+        "compress"     : args.bitstream_compress,
+        "config_rate"  : args.config_rate,
+        "spi_buswidth" : args.spi_buswidth,
+    }
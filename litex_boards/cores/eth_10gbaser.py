@@ -0,0 +1,584 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+from migen.genlib.cdc import MultiReg
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+from liteeth.common import eth_phy_description
+from liteeth.phy.xgmii import LiteEthPHYXGMIITX, LiteEthPHYXGMIIRX
+
+from liteiclink.serdes.gtx_7series import GTXQuadPLL, GTX
+from liteiclink.serdes.gth_ultrascale import GTH3QuadPLL, GTH4QuadPLL, GTH3, GTH4
+from liteiclink.serdes.gty_ultrascale import GTYQuadPLL, GTY
+
+# 10GBASE-R Constants ------------------------------------------------------------------------------
+
+BASER_LINERATE   = 10.3125e9
+BASER_DATA_WIDTH = 40 # Transceiver datapath width (66-bit blocks are geared to/from it).
+
+# XGMII Characters.
+XGMII_IDLE  = 0x07
+XGMII_START = 0xfb
+XGMII_END   = 0xfd
+XGMII_ERROR = 0xfe
+
+# Sync Headers (LSB transmitted first: "01" on the wire for Data Blocks).
+SYNC_DATA = 0b10
+SYNC_CTRL = 0b01
+
+# Block Types.
+BLOCK_TYPE_CTRL    = 0x1e # C0-C7.
+BLOCK_TYPE_START_0 = 0x78 # S0 D1-D7.
+BLOCK_TYPE_START_4 = 0x33 # C0-C3 S4 D5-D7.
+BLOCK_TYPE_TERM    = [0x87, 0x99, 0xaa, 0xb4, 0xcc, 0xd2, 0xe1, 0xff] # D0-D(k-1) Tk C(k+1)-C7.
+
+# 7-bit Control Codes.
+CTRL_IDLE  = 0x00
+CTRL_ERROR = 0x1e
+
+# 64b/66b Encoder ----------------------------------------------------------------------------------
+
+class BaseREncoder(Module):
+    """XGMII (64-bit data + 8-bit ctrl) to 66-bit 10GBASE-R Blocks (IEEE 802.3 49.2.4).
+
+    Only generates the Blocks LiteEth's XGMII TX can produce: Data, Idle/Error, Start on lane 0 or
+    4 and Terminate; any other XGMII word is sent as an Error Block.
+    """
+    def __init__(self):
+        self.data  = Signal(64)
+        self.ctrl  = Signal(8)
+        self.block = Signal(66) # Sync Header (2) + Payload (64).
+
+        # # #
+
+        lanes = [self.data[8*i:8*(i + 1)] for i in range(8)]
+        def code(i):
+            return Mux(lanes[i] == XGMII_IDLE, Constant(CTRL_IDLE, 7), Constant(CTRL_ERROR, 7))
+
+        header  = Signal(2)
+        payload = Signal(64)
+        self.comb += [
+            # Idle/Error.
+            header.eq(SYNC_CTRL),
+            payload.eq(Cat(Constant(BLOCK_TYPE_CTRL, 8), *[code(i) for i in range(8)])),
+            # Data.
+            If(self.ctrl == 0x00,
+                header.eq(SYNC_DATA),
+                payload.eq(self.data),
+            # Start.
+            ).Elif((self.ctrl == 0x01) & (lanes[0] == XGMII_START),
+                payload.eq(Cat(Constant(BLOCK_TYPE_START_0, 8), self.data[8:])),
+            ).Elif((self.ctrl == 0x1f) & (lanes[4] == XGMII_START),
+                payload.eq(Cat(Constant(BLOCK_TYPE_START_4, 8), *[code(i) for i in range(4)],
+                    Constant(0, 4), self.data[40:])),
+            )
+        ]
+        # Terminate.
+        for k in range(8):
+            fields = [Constant(BLOCK_TYPE_TERM[k], 8)] + ([self.data[:8*k]] if k else [])
+            if k < 7:
+                fields += [Constant(0, 7 - k), *[code(i) for i in range(k + 1, 8)]]
+            self.comb += If((self.ctrl == ((0xff << k) & 0xff)) & (lanes[k] == XGMII_END),
+                payload.eq(Cat(*fields))
+            )
+        self.sync += self.block.eq(Cat(header, payload))
+
+# 64b/66b Decoder ----------------------------------------------------------------------------------
+
+class BaseRDecoder(Module):
+    """66-bit 10GBASE-R Blocks to XGMII (64-bit data + 8-bit ctrl) (IEEE 802.3 49.2.11)."""
+    def __init__(self):
+        self.block = Signal(66)
+        self.data  = Signal(64)
+        self.ctrl  = Signal(8)
+
+        # # #
+
+        header  = self.block[:2]
+        payload = self.block[2:]
+        def char(i):
+            return Mux(payload[8 + 7*i:8 + 7*(i + 1)] == CTRL_IDLE,
+                Constant(XGMII_IDLE,  8),
+                Constant(XGMII_ERROR, 8))
+        error = [self.data.eq(Replicate(Constant(XGMII_ERROR, 8), 8)), self.ctrl.eq(0xff)]
+
+        cases = {
+            BLOCK_TYPE_CTRL : [
+                self.data.eq(Cat(*[char(i) for i in range(8)])),
+                self.ctrl.eq(0xff),
+            ],
+            BLOCK_TYPE_START_0 : [
+                self.data.eq(Cat(Constant(XGMII_START, 8), payload[8:])),
+                self.ctrl.eq(0x01),
+            ],
+            BLOCK_TYPE_START_4 : [
+                self.data.eq(Cat(*[char(i) for i in range(4)], Constant(XGMII_START, 8),
+                    payload[40:])),
+                self.ctrl.eq(0x1f),
+            ],
+            "default" : error,
+        }
+        for k in range(8):
+            cases[BLOCK_TYPE_TERM[k]] = [
+                self.data.eq(Cat(*([payload[8:8 + 8*k]] if k else []), Constant(XGMII_END, 8),
+                    *[Constant(XGMII_IDLE, 8) for i in range(7 - k)])),
+                self.ctrl.eq((0xff << k) & 0xff),
+            ]
+        self.sync += [
+            If(header == SYNC_DATA,
+                self.data.eq(payload),
+                self.ctrl.eq(0x00),
+            ).Elif(header == SYNC_CTRL,
+                Case(payload[:8], cases)
+            ).Else(*error)
+        ]
+
+# Scrambler / Descrambler --------------------------------------------------------------------------
+
+class BaseRScrambler(Module):
+    """Self-synchronizing 1 + x^39 + x^58 Scrambler (64-bit Payload, Sync Header bypassed)."""
+    def __init__(self):
+        self.i = Signal(66)
+        self.o = Signal(66)
+
+        # # #
+
+        state = Signal(58)
+        s     = [state[n] for n in range(58)]
+        for n in range(64):
+            s.append(self.i[2 + n] ^ s[n + 19] ^ s[n])
+        self.sync += [
+            state.eq(Cat(*s[64:])),
+            self.o.eq(Cat(self.i[:2], *s[58:])),
+        ]
+
+class BaseRDescrambler(Module):
+    """Self-synchronizing 1 + x^39 + x^58 Descrambler (64-bit Payload, Sync Header bypassed)."""
+    def __init__(self):
+        self.i = Signal(66)
+        self.o = Signal(66)
+
+        # # #
+
+        state = Signal(58)
+        s     = [state[n] for n in range(58)] + [self.i[2 + n] for n in range(64)]
+        self.sync += [
+            state.eq(self.i[2 + 6:]),
+            self.o.eq(Cat(self.i[:2], *[s[58 + n] ^ s[n + 19] ^ s[n] for n in range(64)])),
+        ]
+
+# Gearboxes ----------------------------------------------------------------------------------------
+
+class BaseRTXGearbox(Module):
+    """66-bit Blocks to BASER_DATA_WIDTH-bit Transceiver words.
+
+    Running at the Transceiver clock (linerate/BASER_DATA_WIDTH), a Block is requested (ce) when
+    less than BASER_DATA_WIDTH bits are left: ce is then used as clock enable of the upstream
+    (Block rate) logic.
+    """
+    def __init__(self, data_width=BASER_DATA_WIDTH):
+        self.ce    = Signal()
+        self.block = Signal(66)
+        self.o     = Signal(data_width)
+
+        # # #
+
+        buf      = Signal(66 + data_width)
+        buf_next = Signal(66 + data_width)
+        level    = Signal(max=66 + data_width)
+        self.comb += [
+            self.ce.eq(level < data_width),
+            buf_next.eq(buf),
+            If(self.ce,
+                buf_next.eq(buf | (self.block << level)),
+            ),
+        ]
+        self.sync += [
+            self.o.eq(buf_next[:data_width]),
+            buf.eq(buf_next[data_width:]),
+            level.eq(level + Mux(self.ce, 66, 0) - data_width),
+        ]
+
+class BaseRRXGearbox(Module):
+    """BASER_DATA_WIDTH-bit Transceiver words to 66-bit Blocks.
+
+    Blocks are presented with a one cycle ce (clock enable of the downstream Block rate logic).
+    A slip request drops one bit on the next Block, shifting the Block alignment.
+    """
+    def __init__(self, data_width=BASER_DATA_WIDTH):
+        self.i     = Signal(data_width)
+        self.slip  = Signal()
+        self.ce    = Signal()
+        self.block = Signal(66)
+
+        # # #
+
+        buf        = Signal(66 + data_width)
+        buf_next   = Signal(66 + data_width)
+        level      = Signal(max=66 + data_width)
+        level_next = Signal(max=66 + 2*data_width)
+        slip       = Signal()
+        self.comb += [
+            buf_next.eq(buf | (self.i << level)),
+            level_next.eq(level + data_width),
+        ]
+        self.sync += [
+            If(self.slip, slip.eq(1)),
+            self.ce.eq(0),
+            buf.eq(buf_next),
+            level.eq(level_next),
+            If(level_next >= 66,
+                self.ce.eq(1),
+                self.block.eq(buf_next[:66]),
+                buf.eq(buf_next[66:]),
+                level.eq(level_next - 66),
+                If(slip & (level_next >= 67),
+                    slip.eq(0),
+                    buf.eq(buf_next[67:]),
+                    level.eq(level_next - 67),
+                )
+            )
+        ]
+
+# Block Lock ---------------------------------------------------------------------------------------
+
+class BaseRBlockLock(Module):
+    """10GBASE-R Block Lock (IEEE 802.3 49.2.13.2.2).
+
+    Lock is acquired after 64 consecutive valid Sync Headers and lost after 16 invalid Sync Headers
+    in a 64 Blocks window; the Block alignment is slipped on each invalid Sync Header while not
+    locked (waiting for the slip to propagate before checking again).
+    """
+    def __init__(self, slip_wait=8):
+        self.ce     = Signal()
+        self.header = Signal(2)
+        self.lock   = Signal()
+        self.slip   = Signal()
+
+        # # #
+
+        valid      = Signal()
+        count      = Signal(6)
+        invalid    = Signal(4)
+        wait_count = Signal(max=slip_wait + 1)
+        self.comb += valid.eq(self.header[0] ^ self.header[1])
+        slip = [
+            self.slip.eq(1),
+            count.eq(0),
+            invalid.eq(0),
+            wait_count.eq(slip_wait),
+        ]
+        self.sync += [
+            self.slip.eq(0),
+            If(self.ce,
+                If(wait_count != 0,
+                    wait_count.eq(wait_count - 1)
+                ).Elif(~self.lock,
+                    count.eq(count + 1),
+                    If(~valid,
+                        *slip
+                    ).Elif(count == (64 - 1),
+                        self.lock.eq(1),
+                    )
+                ).Else(
+                    count.eq(count + 1),
+                    If(~valid,
+                        invalid.eq(invalid + 1),
+                        If(invalid == (16 - 1),
+                            self.lock.eq(0),
+                            *slip
+                        )
+                    ),
+                    If(count == (64 - 1),
+                        invalid.eq(0),
+                    )
+                )
+            )
+        ]
+
+# TX Packet Buffer ---------------------------------------------------------------------------------
+
+class BaseRTXBuffer(Module):
+    """Store and Forward TX buffer.
+
+    LiteEth's XGMII TX expects valid to remain asserted during a frame: frames are only forwarded
+    once entirely buffered, so a sys clock datapath slower than the line rate throttles the frame
+    rate instead of corrupting frames. Frames larger than the buffer are forwarded as soon as it
+    is full.
+    """
+    def __init__(self, depth=256):
+        self.sink   = sink   = stream.Endpoint(eth_phy_description(64))
+        self.source = source = stream.Endpoint(eth_phy_description(64))
+
+        # # #
+
+        self.submodules.fifo = fifo = stream.SyncFIFO(eth_phy_description(64), depth, buffered=True)
+
+        frames   = Signal(max=depth + 1)
+        ongoing  = Signal()
+        forward  = Signal()
+        frame_in  = sink.valid & sink.ready & sink.last
+        frame_out = source.valid & source.ready & source.last
+        self.comb += [
+            sink.connect(fifo.sink),
+            forward.eq(ongoing | (frames != 0) | ~fifo.sink.ready),
+            fifo.source.connect(source, omit={"valid", "ready"}),
+            source.valid.eq(fifo.source.valid & forward),
+            fifo.source.ready.eq(source.ready & forward),
+        ]
+        self.sync += [
+            If(source.valid & source.ready,
+                ongoing.eq(~source.last)
+            ),
+            If(frame_in & ~frame_out,
+                frames.eq(frames + 1)
+            ).Elif(frame_out & ~frame_in,
+                frames.eq(frames - 1)
+            )
+        ]
+
+# 10GBASE-R PCS ------------------------------------------------------------------------------------
+
+class LiteEthPHY10GBASERPCS(Module):
+    """10GBASE-R PCS
+
+    LiteEth stream <-> XGMII (LiteEth's XGMII TX/RX) <-> 64b/66b Encoder/Decoder <-> Scrambler/
+    Descrambler <-> Gearboxes <-> BASER_DATA_WIDTH-bit Transceiver words.
+
+    The whole PCS runs in the eth_tx/eth_rx (Transceiver) clock domains: the Block rate logic is
+    clock-enabled by the Gearboxes (Block every 66/BASER_DATA_WIDTH cycles).
+    """
+    def __init__(self, tx_buffer_depth=256):
+        self.sink   = sink   = stream.Endpoint(eth_phy_description(64))
+        self.source = source = stream.Endpoint(eth_phy_description(64))
+        self.txdata     = Signal(BASER_DATA_WIDTH)
+        self.rxdata     = Signal(BASER_DATA_WIDTH)
+        self.block_lock = Signal()
+
+        # # #
+
+        xgmii = Record([("tx_data", 64), ("tx_ctl", 8), ("rx_data", 64), ("rx_ctl", 8)])
+
+        # TX (Deficit Idle Count disabled: LiteEth's XGMII TX can accept a word it then doesn't
+        # transmit with it, always inserting the full IFG instead costs at most 3 bytes/frame).
+        tx_buffer    = ClockDomainsRenamer("eth_tx")(BaseRTXBuffer(tx_buffer_depth))
+        tx_xgmii     = LiteEthPHYXGMIITX(xgmii, 64, dic=False)
+        tx_xgmii     = ClockDomainsRenamer("eth_tx")(CEInserter()(tx_xgmii))
+        tx_encoder   = ClockDomainsRenamer("eth_tx")(CEInserter()(BaseREncoder()))
+        tx_scrambler = ClockDomainsRenamer("eth_tx")(CEInserter()(BaseRScrambler()))
+        tx_gearbox   = ClockDomainsRenamer("eth_tx")(BaseRTXGearbox())
+        self.submodules += tx_buffer, tx_xgmii, tx_encoder, tx_scrambler, tx_gearbox
+        self.comb += [
+            sink.connect(tx_buffer.sink),
+            tx_buffer.source.connect(tx_xgmii.sink, omit={"ready"}),
+            tx_buffer.source.ready.eq(tx_xgmii.sink.ready & tx_gearbox.ce),
+            tx_encoder.data.eq(xgmii.tx_data),
+            tx_encoder.ctrl.eq(xgmii.tx_ctl),
+            tx_scrambler.i.eq(tx_encoder.block),
+            tx_gearbox.block.eq(tx_scrambler.o),
+            self.txdata.eq(tx_gearbox.o),
+        ]
+        for m in [tx_xgmii, tx_encoder, tx_scrambler]:
+            self.comb += m.ce.eq(tx_gearbox.ce)
+
+        # RX.
+        rx_gearbox     = ClockDomainsRenamer("eth_rx")(BaseRRXGearbox())
+        rx_block_lock  = ClockDomainsRenamer("eth_rx")(BaseRBlockLock())
+        rx_descrambler = ClockDomainsRenamer("eth_rx")(CEInserter()(BaseRDescrambler()))
+        rx_decoder     = ClockDomainsRenamer("eth_rx")(CEInserter()(BaseRDecoder()))
+        rx_xgmii       = ClockDomainsRenamer("eth_rx")(CEInserter()(LiteEthPHYXGMIIRX(xgmii, 64)))
+        self.submodules += rx_gearbox, rx_block_lock, rx_descrambler, rx_decoder, rx_xgmii
+        self.comb += [
+            rx_gearbox.i.eq(self.rxdata),
+            rx_gearbox.slip.eq(rx_block_lock.slip),
+            rx_block_lock.ce.eq(rx_gearbox.ce),
+            rx_block_lock.header.eq(rx_gearbox.block[:2]),
+            rx_descrambler.i.eq(rx_gearbox.block),
+            # Decode Idle Blocks until locked.
+            rx_decoder.block.eq(Cat(Constant(SYNC_CTRL, 2), Constant(BLOCK_TYPE_CTRL, 8))),
+            If(rx_block_lock.lock,
+                rx_decoder.block.eq(rx_descrambler.o),
+            ),
+            xgmii.rx_data.eq(rx_decoder.data),
+            xgmii.rx_ctl.eq(rx_decoder.ctrl),
+            rx_xgmii.source.connect(source, omit={"valid"}),
+            source.valid.eq(rx_xgmii.source.valid & rx_gearbox.ce),
+            self.block_lock.eq(rx_block_lock.lock),
+        ]
+        for m in [rx_descrambler, rx_decoder, rx_xgmii]:
+            self.comb += m.ce.eq(rx_gearbox.ce)
+
+# 10GBASE-R PHY ------------------------------------------------------------------------------------
+
+def _get_pad(pads, *names):
+    for name in names:
+        if hasattr(pads, name):
+            return getattr(pads, name)
+    raise ValueError(f"Pads have no {'/'.join(names)} signal.")
+
+class LiteEthPHY10GBASER(Module, AutoCSR):
+    """10GBASE-R Ethernet PHY
+
+    LiteEthPHY10GBASERPCS over a 7-Series GTX, UltraScale GTH or UltraScale+ GTH/GTY Transceiver
+    (LiteICLink) at 10.3125Gbps (QPLL, 156.25MHz or 161.1328125MHz RefClk), on one lane of an
+    SFP+/QSFP+ cage.
+
+    LiteICLink's Transceivers only expose an 8b/10b datapath: their 40-bit raw TX/RX data ports are
+    directly connected to the PCS Gearboxes instead.
+
+    The PHY has a 64-bit datapath and is meant to be used with a 64-bit LiteEth core with the
+    MAC/IP/UDP datapath in the sys clock domain (see add_etherbone_10gbaser): sys_clk_freq*64 then
+    has to be > 10Gbps for line rate operation (ex: sys_clk_freq >= 156.25MHz).
+    """
+    dw                      = 64
+    tx_clk_freq             = BASER_LINERATE/BASER_DATA_WIDTH
+    rx_clk_freq             = BASER_LINERATE/BASER_DATA_WIDTH
+    integrated_ifg_inserter = True
+
+    def __init__(self, refclk_pads, refclk_freq, data_pads, sys_clk_freq, device, lane=0,
+        transceiver     = None,
+        tx_polarity     = 0,
+        rx_polarity     = 0,
+        tx_buffer_depth = 256):
+        self.status = CSRStatus(fields=[
+            CSRField("tx_ready",   size=1, offset=0, description="Transceiver TX ready."),
+            CSRField("rx_ready",   size=1, offset=1, description="Transceiver RX ready."),
+            CSRField("block_lock", size=1, offset=2, description="10GBASE-R RX Block Lock."),
+        ])
+
+        # # #
+
+        # Transceiver selection.
+        if transceiver is None:
+            if device.startswith("xc7"):
+                transceiver = "gtx"
+            elif device.startswith("xcku") and not device.startswith("xcku5p"):
+                transceiver = "gth3"
+            elif device.startswith("xczu"):
+                transceiver = "gth4"
+            else:
+                transceiver = "gty"
+        pll_cls, gt_cls, ibufds, params = {
+            "gtx"  : (GTXQuadPLL,  GTX,  "IBUFDS_GTE2", "gtx_params"),
+            "gth3" : (GTH3QuadPLL, GTH3, "IBUFDS_GTE3", "gth_params"),
+            "gth4" : (GTH4QuadPLL, GTH4, "IBUFDS_GTE4", "gth_params"),
+            "gty"  : (GTYQuadPLL,  GTY,  "IBUFDS_GTE4", "gty_params"),
+        }[transceiver]
+
+        # RefClk / QPLL.
+        refclk = Signal()
+        self.specials += Instance(ibufds,
+            i_CEB = 0,
+            i_I   = _get_pad(refclk_pads, "p", "clk_p"),
+            i_IB  = _get_pad(refclk_pads, "n", "clk_n"),
+            o_O   = refclk,
+        )
+        self.submodules.pll = pll = pll_cls(refclk, refclk_freq, BASER_LINERATE)
+
+        # Transceiver.
+        tx_pads = Record([("p", 1), ("n", 1)])
+        rx_pads = Record([("p", 1), ("n", 1)])
+        self.comb += [
+            _get_pad(data_pads, "txp", "tx_p")[lane].eq(tx_pads.p),
+            _get_pad(data_pads, "txn", "tx_n")[lane].eq(tx_pads.n),
+            rx_pads.p.eq(_get_pad(data_pads, "rxp", "rx_p")[lane]),
+            rx_pads.n.eq(_get_pad(data_pads, "rxn", "rx_n")[lane]),
+        ]
+        # (TX buffer enabled: linerate/BASER_DATA_WIDTH is not an integer ratio of the RefClk).
+        gt = gt_cls(pll, tx_pads, rx_pads, sys_clk_freq,
+            data_width       = BASER_DATA_WIDTH,
+            tx_buffer_enable = True,
+            clock_aligner    = False,
+            tx_polarity      = tx_polarity,
+            rx_polarity      = rx_polarity)
+        gt = ClockDomainsRenamer({"tx": "eth_tx", "rx": "eth_rx"})(gt)
+        self.submodules.gt = gt
+        self.cd_eth_tx = gt.cd_tx
+        self.cd_eth_rx = gt.cd_rx
+
+        # Raw datapath (8b/10b bypassed, 10-bit symbols are TXDATA/RXDATA byte + 2 control bits).
+        txdata = Signal(BASER_DATA_WIDTH)
+        rxdata = Signal(BASER_DATA_WIDTH)
+        def symbols_data(data):
+            return Cat(*[data[10*i:10*i + 8] for i in range(BASER_DATA_WIDTH//10)])
+        def symbols_bit(data, n):
+            return Cat(*[data[10*i + n] for i in range(BASER_DATA_WIDTH//10)])
+        params = getattr(gt, params)
+        params.update(
+            i_TXDATA = symbols_data(txdata),
+            o_RXDATA = symbols_data(rxdata),
+        )
+        if transceiver == "gtx":
+            params.update(
+                i_TXCHARDISPVAL  = symbols_bit(txdata, 8),
+                i_TXCHARDISPMODE = symbols_bit(txdata, 9),
+                o_RXCHARISK      = symbols_bit(rxdata, 8),
+                o_RXDISPERR      = symbols_bit(rxdata, 9),
+                # RX CDR for 64b/66b encoded data.
+                p_RXCDR_CFG      = 0x0b000023ff10400020,
+            )
+        else:
+            params.update(
+                i_TXCTRL0 = symbols_bit(txdata, 8),
+                i_TXCTRL1 = symbols_bit(txdata, 9),
+                o_RXCTRL0 = symbols_bit(rxdata, 8),
+                o_RXCTRL1 = symbols_bit(rxdata, 9),
+            )
+
+        # PCS.
+        self.submodules.pcs = pcs = LiteEthPHY10GBASERPCS(tx_buffer_depth)
+        self.comb += [
+            txdata.eq(pcs.txdata),
+            pcs.rxdata.eq(rxdata),
+        ]
+        self.sink, self.source = pcs.sink, pcs.source
+
+        # Status.
+        self.specials += [
+            MultiReg(gt.tx_ready,      self.status.fields.tx_ready),
+            MultiReg(gt.rx_ready,      self.status.fields.rx_ready),
+            MultiReg(pcs.block_lock,   self.status.fields.block_lock),
+        ]
+
+# Etherbone ----------------------------------------------------------------------------------------
+
+def add_etherbone_10gbaser(soc, phy, name="etherbone",
+    mac_address  = 0x10e2d5000000,
+    ip_address   = "192.168.1.50",
+    udp_port     = 1234,
+    buffer_depth = 16):
+    """SoC.add_etherbone for LiteEthPHY10GBASER
+
+    LiteX's add_etherbone is limited to 8/32-bit datapaths: creates a 64-bit LiteEth UDP/IP core
+    (MAC/IP/UDP in the sys clock domain, exposed as soc.ethcore for other UDP users) and an
+    Etherbone on a 32-bit UDP port of it.
+    """
+    from liteeth.core import LiteEthUDPIPCore
+    from liteeth.frontend.etherbone import LiteEthEtherbone
+
+    # Core.
+    ethcore = LiteEthUDPIPCore(
+        phy               = phy,
+        mac_address       = mac_address,
+        ip_address        = ip_address,
+        clk_freq          = int(soc.sys_clk_freq),
+        dw                = 64,
+        with_sys_datapath = True)
+    soc.submodules.ethcore = ethcore
+
+    # Etherbone.
+    etherbone = LiteEthEtherbone(ethcore.udp, udp_port, buffer_depth=buffer_depth)
+    setattr(soc.submodules, name, etherbone)
+    soc.bus.add_master(name=name, master=etherbone.wishbone.bus)
+
+    # Timing constraints.
+    soc.platform.add_period_constraint(phy.cd_eth_tx.clk, 1e9/phy.tx_clk_freq)
+    soc.platform.add_period_constraint(phy.cd_eth_rx.clk, 1e9/phy.rx_clk_freq)
+    soc.platform.add_false_path_constraints(soc.crg.cd_sys.clk,
+        phy.cd_eth_tx.clk,
+        phy.cd_eth_rx.clk)
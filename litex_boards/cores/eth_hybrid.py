@@ -0,0 +1,111 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from liteeth.common import convert_ip
+from liteeth.mac import LiteEthMAC
+from liteeth.core.arp import LiteEthARP
+from liteeth.core.ip import LiteEthIP
+from liteeth.core.icmp import LiteEthICMP
+from liteeth.core.udp import LiteEthUDP
+
+# Hybrid UDP/IP Core -------------------------------------------------------------------------------
+
+class LiteEthHybridUDPIPCore(Module):
+    """LiteEth UDP/IP Core on the Hardware Interface of a Hybrid LiteEthMAC
+
+    Same ARP/IP/ICMP/UDP stack as LiteEthUDPIPCore but built on the crossbar of a MAC created with
+    interface="hybrid": frames targeting the hardware MAC address are handled here, others (and
+    broadcasts) are also forwarded to the CPU through the MAC's Wishbone interface.
+    """
+    def __init__(self, mac, mac_address, ip_address, clk_freq, dw=8):
+        ip_address = convert_ip(ip_address)
+        self.mac = mac
+        self.submodules.arp  = LiteEthARP(mac, mac_address, ip_address, clk_freq, dw=dw)
+        self.submodules.ip   = LiteEthIP(mac, mac_address, ip_address, self.arp.table, dw=dw)
+        self.submodules.icmp = LiteEthICMP(self.ip, ip_address, dw=dw)
+        self.submodules.udp  = LiteEthUDP(self.ip, ip_address, dw=dw)
+
+# SoC Integration ----------------------------------------------------------------------------------
+
+def add_hybrid_ethernet(soc, phy, phy_cd="eth", name="etherbone", data_width=8,
+    mac_address             = 0x10e2d5000001,
+    ip_address              = "192.168.1.51",
+    udp_port                = 1234,
+    buffer_depth            = 16,
+    dynamic_ip              = False,
+    nrxslots                = 2,
+    ntxslots                = 2,
+    with_timing_constraints = True):
+    """SoC.add_ethernet + SoC.add_etherbone sharing the same PHY.
+
+    LiteX's add_ethernet/add_etherbone each require their own PHY: creates a Hybrid LiteEthMAC
+    (exposed as soc.ethmac, with the Wishbone interface/CSRs/IRQ expected by the BIOS/firmware) and
+    an Etherbone on a UDP/IP core (exposed as soc.ethcore_{name} for other UDP users) answering on
+    its own MAC/IP address, allowing firmware networking and Etherbone access at the same time.
+    """
+    from litex.soc.integration.soc import SoCRegion
+    from liteeth.frontend.etherbone import LiteEthEtherbone
+
+    # The firmware (BIOS/libliteeth) uses 10:e2:d5:00:00:00 and LOCALIP (192.168.1.50 by default).
+    firmware_ip = "192.168.1.50"
+    if "LOCALIP1" in soc.constants:
+        firmware_ip = ".".join(str(getattr(soc.constants[f"LOCALIP{i}"], "value",
+            soc.constants[f"LOCALIP{i}"])) for i in range(1, 5))
+    if mac_address == 0x10e2d5000000 or ip_address == firmware_ip:
+        raise ValueError(f"Hybrid Etherbone MAC/IP address must differ from the firmware's "
+                         f"(10:e2:d5:00:00:00/{firmware_ip}).")
+
+    # MAC.
+    assert data_width in [8, 32]
+    with_sys_datapath = (data_width == 32)
+    ethmac = LiteEthMAC(
+        phy        = phy,
+        dw         = data_width,
+        interface  = "hybrid",
+        endianness = soc.cpu.endianness,
+        nrxslots   = nrxslots,
+        ntxslots   = ntxslots,
+        hw_mac     = mac_address,
+        with_sys_datapath = with_sys_datapath)
+    if not with_sys_datapath:
+        # Use PHY's eth_tx/eth_rx clock domains.
+        ethmac = ClockDomainsRenamer({
+            "eth_tx": phy_cd + "_tx",
+            "eth_rx": phy_cd + "_rx"})(ethmac)
+    soc.submodules.ethmac = ethmac
+
+    # Software Interface.
+    ethmac_region_size = (nrxslots + ntxslots)*ethmac.slot_size.constant
+    ethmac_region      = SoCRegion(origin=soc.mem_map.get("ethmac", None), size=ethmac_region_size,
+        cached=False)
+    soc.bus.add_slave(name="ethmac", slave=ethmac.bus, region=ethmac_region)
+    if soc.irq.enabled:
+        soc.irq.add("ethmac", use_loc_if_exists=True)
+    soc.add_constant("ETH_PHY_NO_RESET") # Disable reset from BIOS to avoid disabling Hardware Interface.
+    if dynamic_ip:
+        soc.add_constant("ETH_DYNAMIC_IP")
+
+    # Hardware Interface.
+    ethcore = LiteEthHybridUDPIPCore(ethmac,
+        mac_address = mac_address,
+        ip_address  = ip_address,
+        clk_freq    = int(soc.sys_clk_freq),
+        dw          = data_width)
+    setattr(soc.submodules, "ethcore_" + name, ethcore)
+
+    # Etherbone.
+    etherbone = LiteEthEtherbone(ethcore.udp, udp_port, buffer_depth=buffer_depth)
+    setattr(soc.submodules, name, etherbone)
+    soc.bus.add_master(name=name, master=etherbone.wishbone.bus)
+
+    # Timing constraints.
+    if with_timing_constraints:
+        eth_rx_clk = getattr(phy, "crg", phy).cd_eth_rx.clk
+        eth_tx_clk = getattr(phy, "crg", phy).cd_eth_tx.clk
+        soc.platform.add_period_constraint(eth_rx_clk, 1e9/phy.rx_clk_freq)
+        soc.platform.add_period_constraint(eth_tx_clk, 1e9/phy.tx_clk_freq)
+        soc.platform.add_false_path_constraints(soc.crg.cd_sys.clk, eth_rx_clk, eth_tx_clk)
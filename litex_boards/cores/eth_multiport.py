@@ -0,0 +1,169 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.packet import PacketFIFO, Dispatcher, Arbiter
+
+from liteeth.common import convert_ip, eth_udp_user_description
+
+# UDP Aggregator -----------------------------------------------------------------------------------
+
+class LiteEthUDPAggregator(Module):
+    """Link aggregation of UDP user ports
+
+    Exposes UDP user ports of several UDP/IP cores (one per PHY, same data width/clock domain) as a
+    single one:
+    - TX: packets written to sink go through a shared packet buffer and are sent round-robin over
+      the ports (one packet per port in turn), each port having its own packet buffer so a port
+      sending a packet does not stall the others.
+    - RX (with_rx): packets received on the ports are merged in a shared packet buffer (source).
+      Only enable it with a consumer on source: a full buffer backpressures all the ports.
+    """
+    def __init__(self, udp_ports, buffer_depth=1024, with_rx=False):
+        dw = len(udp_ports[0].sink.data)
+        self.sink   = sink   = stream.Endpoint(eth_udp_user_description(dw))
+        self.source = source = stream.Endpoint(eth_udp_user_description(dw))
+
+        # # #
+
+        words = buffer_depth//(dw//8)
+
+        # TX: Shared Buffer -> Round-Robin Dispatch -> Ports Buffers.
+        tx_buffer = PacketFIFO(eth_udp_user_description(dw),
+            payload_depth = words,
+            param_depth   = words//64,
+            buffered      = True)
+        self.submodules += tx_buffer
+        self.comb += sink.connect(tx_buffer.sink)
+
+        tx_buffers = []
+        for udp_port in udp_ports:
+            port_buffer = PacketFIFO(eth_udp_user_description(dw),
+                payload_depth = words//2,
+                param_depth   = words//128,
+                buffered      = True)
+            self.submodules += port_buffer
+            self.comb += port_buffer.source.connect(udp_port.sink)
+            tx_buffers.append(port_buffer.sink)
+
+        tx_sel = Signal(max=max(len(udp_ports), 2))
+        self.submodules.tx_dispatcher = Dispatcher(tx_buffer.source, tx_buffers)
+        self.comb += self.tx_dispatcher.sel.eq(tx_sel)
+        self.sync += [
+            If(tx_buffer.source.valid & tx_buffer.source.ready & tx_buffer.source.last,
+                tx_sel.eq(tx_sel + 1),
+                If(tx_sel == (len(udp_ports) - 1),
+                    tx_sel.eq(0)
+                )
+            )
+        ]
+
+        # RX: Ports -> Arbiter -> Shared Buffer.
+        if with_rx:
+            rx_buffer = PacketFIFO(eth_udp_user_description(dw),
+                payload_depth = words,
+                param_depth   = words//64,
+                buffered      = True)
+            self.submodules += rx_buffer
+            self.submodules.rx_arbiter = Arbiter([p.source for p in udp_ports], rx_buffer.sink)
+            self.comb += rx_buffer.source.connect(source)
+
+# SoC Integration ----------------------------------------------------------------------------------
+
+def add_multiport_ethernet(soc, phys, data_width=8,
+    mac_address             = 0x10e2d5000000,
+    ip_address              = "192.168.1.50",
+    with_etherbone          = True,
+    etherbone_udp_port      = 1234,
+    with_timing_constraints = True):
+    """UDP/IP core on each PHY of multi-PHY boards (with Etherbone on the first one).
+
+    LiteX's add_ethernet/add_etherbone only support one PHY. Port n uses phys[n] (whose eth_rx/eth_tx
+    clock domains are renamed to eth{n}_rx/eth{n}_tx), mac_address + n and ip_address + n, and is
+    exposed as soc.ethcore_eth{n}. Etherbone (soc.etherbone) is on port 0. Returns the cores, see
+    add_multiport_udp_dram_streamer to stream data on them.
+    """
+    from liteeth.core import LiteEthUDPIPCore
+    from liteeth.frontend.etherbone import LiteEthEtherbone
+
+    assert data_width in [8, 32]
+    with_sys_datapath = (data_width == 32)
+
+    etherbone_cd = "sys"
+    if not with_sys_datapath:
+        # Create Etherbone clock domain and run it from sys clock domain (for all the UDP users).
+        etherbone_cd = "etherbone"
+        soc.clock_domains.cd_etherbone = ClockDomain("etherbone")
+        soc.comb += soc.cd_etherbone.clk.eq(ClockSignal("sys"))
+        soc.comb += soc.cd_etherbone.rst.eq(ResetSignal("sys"))
+
+    ethcores = []
+    for n, phy in enumerate(phys):
+        phy_cd = f"eth{n}"
+
+        # PHY.
+        ClockDomainsRenamer({
+            "eth_tx": phy_cd + "_tx",
+            "eth_rx": phy_cd + "_rx"})(phy)
+
+        # Core.
+        ethcore = LiteEthUDPIPCore(
+            phy               = phy,
+            mac_address       = mac_address + n,
+            ip_address        = convert_ip(ip_address) + n,
+            clk_freq          = int(soc.sys_clk_freq),
+            dw                = data_width,
+            with_sys_datapath = with_sys_datapath)
+        clock_domains = {"eth_tx": phy_cd + "_tx", "eth_rx": phy_cd + "_rx"}
+        if not with_sys_datapath:
+            # Use PHY's eth_tx/eth_rx clock domains.
+            clock_domains["sys"] = phy_cd + "_rx"
+        ethcore = ClockDomainsRenamer(clock_domains)(ethcore)
+        setattr(soc.submodules, f"ethcore_{phy_cd}", ethcore)
+        ethcores.append(ethcore)
+
+        # Timing constraints.
+        if with_timing_constraints:
+            eth_rx_clk = getattr(phy, "crg", phy).cd_eth_rx.clk
+            eth_tx_clk = getattr(phy, "crg", phy).cd_eth_tx.clk
+            soc.platform.add_period_constraint(eth_rx_clk, 1e9/phy.rx_clk_freq)
+            soc.platform.add_period_constraint(eth_tx_clk, 1e9/phy.tx_clk_freq)
+            soc.platform.add_false_path_constraints(soc.crg.cd_sys.clk, eth_rx_clk, eth_tx_clk)
+
+    # Etherbone.
+    if with_etherbone:
+        soc.submodules.etherbone = LiteEthEtherbone(ethcores[0].udp, etherbone_udp_port,
+            cd = etherbone_cd)
+        soc.bus.add_master(name="etherbone", master=soc.etherbone.wishbone.bus)
+
+    return ethcores
+
+def add_multiport_udp_dram_streamer(soc, ethcores, mode="independent", name="udp_streamer",
+    src_port     = 5000,
+    buffer_depth = 4096):
+    """LiteDRAM -> UDP Streamer(s) on multi-port UDP/IP cores.
+
+    - independent: a Streamer per port ({name}{n}), each streaming its own DRAM region.
+    - aggregated:  a single Streamer ({name}) spread over the ports with a LiteEthUDPAggregator
+      ({name}_aggregator, buffer_depth bytes shared buffer).
+
+    See litex_boards/software/udp_dram_dump.py (--streamers) for the Host side.
+    """
+    from litex_boards.cores.udp_dram import add_udp_dram_streamer
+
+    assert mode in ["independent", "aggregated"]
+    dw = max(32, ethcores[0].udp.crossbar.dw)
+    cd = "etherbone" if hasattr(soc, "cd_etherbone") else "sys"
+    if mode == "independent":
+        for n, ethcore in enumerate(ethcores):
+            add_udp_dram_streamer(soc, name=f"{name}{n}", src_port=src_port, ethcore=ethcore)
+    if mode == "aggregated":
+        aggregator = LiteEthUDPAggregator(
+            udp_ports    = [c.udp.crossbar.get_port(src_port, dw=dw, cd=cd) for c in ethcores],
+            buffer_depth = buffer_depth)
+        setattr(soc.submodules, f"{name}_aggregator", aggregator)
+        add_udp_dram_streamer(soc, name=name, src_port=src_port, udp_port=aggregator)
@@ -0,0 +1,163 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.packet import PacketFIFO, Dispatcher, Arbiter
+
+from liteeth.common import eth_etherbone_mmap_description, eth_udp_user_description
+from liteeth.frontend.etherbone import LiteEthEtherbonePacketTX, LiteEthEtherbonePacketRX
+from liteeth.frontend.etherbone import LiteEthEtherboneProbe, LiteEthEtherboneRecord
+
+# Etherbone Burst Wishbone Master ------------------------------------------------------------------
+
+class LiteEthEtherboneBurstMaster(Module):
+    """Pipelined Etherbone Wishbone Master
+
+    Drop-in replacement of LiteEthEtherboneWishboneMaster: read data is pushed to a FIFO on the
+    Wishbone ack instead of being sent before the next access, so a multi-word read record is
+    executed back to back (the next access is issued on the cycle following the ack).
+    """
+    def __init__(self, fifo_depth=4):
+        self.sink   = sink   = stream.Endpoint(eth_etherbone_mmap_description(32))
+        self.source = source = stream.Endpoint(eth_etherbone_mmap_description(32))
+        self.bus    = bus    = wishbone.Interface()
+
+        # # #
+
+        # Read Data FIFO.
+        self.submodules.fifo = fifo = stream.SyncFIFO(eth_etherbone_mmap_description(32),
+            depth    = fifo_depth,
+            buffered = True)
+        self.comb += fifo.source.connect(source)
+
+        # Wishbone Access (reads only issued when the FIFO can take the data).
+        self.comb += [
+            bus.adr.eq(sink.addr),
+            bus.dat_w.eq(sink.data),
+            bus.sel.eq(sink.be),
+            bus.we.eq(sink.we),
+            bus.stb.eq(sink.valid & (sink.we | fifo.sink.ready)),
+            bus.cyc.eq(bus.stb),
+            sink.ready.eq(bus.stb & bus.ack),
+        ]
+
+        # Read Response (as a write record to base_addr, the base return address).
+        self.comb += [
+            fifo.sink.valid.eq(bus.stb & bus.ack & ~sink.we),
+            fifo.sink.last.eq(sink.last),
+            fifo.sink.last_be.eq(sink.last_be),
+            fifo.sink.we.eq(1),
+            fifo.sink.count.eq(sink.count),
+            fifo.sink.base_addr.eq(sink.base_addr),
+            fifo.sink.be.eq(sink.be),
+            fifo.sink.addr.eq(sink.addr),
+            fifo.sink.data.eq(bus.dat_r),
+        ]
+
+# Etherbone Burst ----------------------------------------------------------------------------------
+
+class LiteEthEtherboneBurst(Module):
+    """Etherbone for burst/pipelined accesses
+
+    Same Etherbone as LiteEthEtherbone (master mode) but:
+    - Received packets are buffered (rx_buffer_depth 32-bit words) before being decoded, allowing
+      the Host to keep several requests in flight while the previous ones are executed.
+    - Records are executed with LiteEthEtherboneBurstMaster.
+    - buffer_depth defaults to 256, the maximum Etherbone record (255 words + base address).
+
+    See litex_boards/software/etherbone_batch.py for the batched/pipelined Host client.
+    """
+    def __init__(self, udp, udp_port, buffer_depth=256, rx_buffer_depth=1024, cd="sys"):
+        # Encode/Decode Etherbone packets (with RX buffering).
+        self.submodules.tx = tx = LiteEthEtherbonePacketTX(udp_port)
+        self.submodules.rx = rx = LiteEthEtherbonePacketRX()
+        self.submodules.rx_buffer = rx_buffer = PacketFIFO(eth_udp_user_description(32),
+            payload_depth = rx_buffer_depth,
+            param_depth   = rx_buffer_depth//64,
+            buffered      = True)
+        port = udp.crossbar.get_port(udp_port, dw=32, cd=cd)
+        self.comb += [
+            tx.source.connect(port.sink),
+            port.source.connect(rx_buffer.sink),
+            rx_buffer.source.connect(rx.sink),
+        ]
+
+        # Packets can be probe (Etherbone discovering) or records with writes and reads.
+        self.submodules.probe  = probe  = LiteEthEtherboneProbe()
+        self.submodules.record = record = LiteEthEtherboneRecord(buffer_depth=buffer_depth)
+
+        # Arbitrate/Dispatch probe/records packets.
+        dispatcher = Dispatcher(rx.source, [probe.sink, record.sink])
+        self.comb += dispatcher.sel.eq(~rx.source.pf)
+        arbiter = Arbiter([probe.source, record.source], tx.sink)
+        self.submodules += dispatcher, arbiter
+
+        # Wishbone Master.
+        self.submodules.wishbone = LiteEthEtherboneBurstMaster()
+        self.comb += [
+            record.receiver.source.connect(self.wishbone.sink),
+            self.wishbone.source.connect(record.sender.sink),
+        ]
+
+# SoC Integration ----------------------------------------------------------------------------------
+
+def add_etherbone_burst(soc, phy, phy_cd="eth", name="etherbone", data_width=8,
+    mac_address             = 0x10e2d5000000,
+    ip_address              = "192.168.1.50",
+    udp_port                = 1234,
+    buffer_depth            = 256,
+    rx_buffer_depth         = 1024,
+    with_timing_constraints = True):
+    """SoC.add_etherbone with LiteEthEtherboneBurst.
+
+    Same integration as SoC.add_etherbone (UDP/IP core exposed as soc.ethcore_{name}, Etherbone
+    clock domain when the core runs in the PHY's clock domain).
+    """
+    from liteeth.core import LiteEthUDPIPCore
+
+    # Core.
+    assert data_width in [8, 32]
+    with_sys_datapath = (data_width == 32)
+    ethcore = LiteEthUDPIPCore(
+        phy               = phy,
+        mac_address       = mac_address,
+        ip_address        = ip_address,
+        clk_freq          = int(soc.sys_clk_freq),
+        dw                = data_width,
+        with_sys_datapath = with_sys_datapath)
+    if not with_sys_datapath:
+        # Use PHY's eth_tx/eth_rx clock domains.
+        ethcore = ClockDomainsRenamer({
+            "eth_tx": phy_cd + "_tx",
+            "eth_rx": phy_cd + "_rx",
+            "sys":    phy_cd + "_rx"})(ethcore)
+    setattr(soc.submodules, "ethcore_" + name, ethcore)
+
+    etherbone_cd = "sys"
+    if not with_sys_datapath:
+        # Create Etherbone clock domain and run it from sys clock domain.
+        etherbone_cd = name
+        setattr(soc.clock_domains, f"cd_{name}", ClockDomain(name))
+        soc.comb += getattr(soc, f"cd_{name}").clk.eq(ClockSignal("sys"))
+        soc.comb += getattr(soc, f"cd_{name}").rst.eq(ResetSignal("sys"))
+
+    # Etherbone.
+    etherbone = LiteEthEtherboneBurst(ethcore.udp, udp_port,
+        buffer_depth    = buffer_depth,
+        rx_buffer_depth = rx_buffer_depth,
+        cd              = etherbone_cd)
+    setattr(soc.submodules, name, etherbone)
+    soc.bus.add_master(name=name, master=etherbone.wishbone.bus)
+
+    # Timing constraints.
+    if with_timing_constraints:
+        eth_rx_clk = getattr(phy, "crg", phy).cd_eth_rx.clk
+        eth_tx_clk = getattr(phy, "crg", phy).cd_eth_tx.clk
+        soc.platform.add_period_constraint(eth_rx_clk, 1e9/phy.rx_clk_freq)
+        soc.platform.add_period_constraint(eth_tx_clk, 1e9/phy.tx_clk_freq)
+        soc.platform.add_false_path_constraints(soc.crg.cd_sys.clk, eth_rx_clk, eth_tx_clk)
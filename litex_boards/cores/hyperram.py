@@ -0,0 +1,68 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.axi import *
+from litex.soc.cores.hyperbus import HyperRAM
+
+# HyperRAM Frontend --------------------------------------------------------------------------------
+
+class HyperRAMFrontend(Module):
+    """HyperRAM Frontend
+
+    Wraps LiteX's HyperRAM core to get more of the HyperRAM's bandwidth:
+    - Cache: Accesses are done by cache lines of cache_line_width bits, split into consecutive
+      32-bit accesses that the HyperRAM core merges in a single burst (instead of paying the
+      Command/Address + Latency overhead on each 32-bit access).
+    - 2:1 Clocking: HyperRAM core runs in a clock domain at 2x sys_clk_freq (HyperRAM Clk is then
+      sys_clk_freq/2 instead of sys_clk_freq/4) and is accessed through a Clock Domain Crossing.
+
+    Throughput of the different configurations can be measured with the mem_speed BIOS command.
+    """
+    def __init__(self, pads, sys_clk_freq, latency=6, clk_ratio="4:1", cd_2x="sys2x",
+        cache_size       = 0,
+        cache_line_width = 128):
+        assert clk_ratio in ["4:1", "2:1"]
+        # Cache size: 0 (disabled) or a power of 2 multiple of the cache line (in bytes).
+        assert cache_size == 0 or (
+            (cache_size & (cache_size - 1)) == 0 and cache_size >= cache_line_width//8), \
+            f"HyperRAM cache_size ({cache_size}) must be a power of 2 >= {cache_line_width//8}."
+        self.bus = bus = wishbone.Interface()
+
+        # # #
+
+        # HyperRAM Core.
+        core_cd       = {"4:1": "sys", "2:1": cd_2x}[clk_ratio]
+        core_clk_freq = {"4:1": 1,     "2:1": 2    }[clk_ratio]*sys_clk_freq
+        core = HyperRAM(pads, latency=latency, sys_clk_freq=core_clk_freq)
+        core = ClockDomainsRenamer(core_cd)(core)
+        self.submodules.core = core
+
+        # Cache (in sys clock domain).
+        if cache_size != 0:
+            cache_slave = wishbone.Interface(data_width=cache_line_width)
+            self.submodules.cache = wishbone.Cache(
+                cachesize = cache_size//4,
+                master    = bus,
+                slave     = cache_slave,
+                reverse   = False)
+            bus = cache_slave
+
+        # Clock Domain Crossing (sys to core clock domain).
+        if core_cd != "sys":
+            data_width    = len(bus.dat_w)
+            address_width = len(bus.adr) + log2_int(data_width//8)
+            axi_sys  = AXILiteInterface(data_width=data_width, address_width=address_width)
+            axi_core = AXILiteInterface(data_width=data_width, address_width=address_width, clock_domain=core_cd)
+            wb_core  = wishbone.Interface(data_width=data_width)
+            self.submodules += Wishbone2AXILite(bus, axi_sys)
+            self.submodules += AXILiteClockDomainCrossing(axi_sys, axi_core, cd_from="sys", cd_to=core_cd)
+            self.submodules += ClockDomainsRenamer(core_cd)(AXILite2Wishbone(axi_core, wb_core))
+            bus = wb_core
+
+        # Data-Width Conversion (Cache lines to consecutive 32-bit accesses, merged in bursts).
+        self.submodules += ClockDomainsRenamer(core_cd)(wishbone.Converter(bus, core.bus))
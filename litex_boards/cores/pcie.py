@@ -0,0 +1,46 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import argparse
+
+# PCIe DMA Channels --------------------------------------------------------------------------------
+
+# LitePCIeMSI handles 32 MSI vectors, each DMA channel uses 2 of them (Writer/Reader).
+pcie_msi_vectors = 32
+pcie_max_dmas    = pcie_msi_vectors//2
+
+def pcie_dmas(value):
+    """Validates a number of PCIe DMA channels (argparse type)."""
+    ndmas = int(value)
+    if not (1 <= ndmas <= pcie_max_dmas):
+        raise argparse.ArgumentTypeError(
+            f"{ndmas} DMAs not supported (1 to {pcie_max_dmas}, 2 MSIs per DMA).")
+    return ndmas
+
+# PCIe Lanes ---------------------------------------------------------------------------------------
+
+# Gen3 datapath width (in bits) of the UltraScale(+) PCIe PHYs for each lane count.
+pcie_gen3_data_widths = {4: 128, 8: 256, 16: 512}
+
+def pcie_gen3_data_width(lanes):
+    """Returns the Gen3 datapath width for a number of PCIe lanes."""
+    if lanes not in pcie_gen3_data_widths:
+        raise ValueError(f"PCIe x{lanes} not supported (x4, x8 or x16).")
+    return pcie_gen3_data_widths[lanes]
+
+# Arguments ----------------------------------------------------------------------------------------
+
+def pcie_args(parser, address_width=32):
+    group = parser.add_argument_group(title="PCIe options")
+    group.add_argument("--pcie-dmas",                default=1,             type=pcie_dmas,          help="Number of PCIe DMA channels (each with its own Writer/Reader MSIs).")
+    group.add_argument("--pcie-address-width",       default=address_width, type=int, choices=[32, 64], help="PCIe DMA address width.")
+    group.add_argument("--pcie-dma-buffering-depth", default=1024,          type=int,                help="PCIe DMA buffering depth (in bytes).")
+
+def pcie_argdict(args):
+    return {
+        "pcie_dmas"                : args.pcie_dmas,
+        "pcie_address_width"       : args.pcie_address_width,
+        "pcie_dma_buffering_depth" : args.pcie_dma_buffering_depth,
+    }
@@ -0,0 +1,95 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+
+# LitePCIe DMA Benchmark ---------------------------------------------------------------------------
+
+class LitePCIeDMABench(Module, AutoCSR):
+    """LitePCIe DMA Benchmark
+
+    Pattern Generator/Checker connected to the streams of a LitePCIe DMA, to measure sustained DMA
+    throughput independently of any user logic:
+    - Generator: Drives the DMA Writer (FPGA -> Host) at full datapath rate with an incrementing
+      32-bit counter pattern.
+    - Checker: Accepts DMA Reader (Host -> FPGA) data at full datapath rate and checks it against
+      the same pattern (resynchronizing when the Host restarts the counter from 0).
+
+    The DMA Loopback (LitePCIeDMA's loopback CSR) takes precedence over the Generator/Checker when
+    enabled (and is used by the Host to measure DMA round-trip latency). Beats/Errors are counted in
+    hardware and read by litex_boards/software/litepcie_bench.py.
+    """
+    def __init__(self, dma):
+        data_width = len(dma.sink.data)
+        nwords     = data_width//32
+        self.control = CSRStorage(fields=[
+            CSRField("generator", size=1, offset=0, description="Generator Enable."),
+            CSRField("checker",   size=1, offset=1, description="Checker Enable."),
+            CSRField("reset",     size=1, offset=8, pulse=True, description="Counters/Pattern Reset."),
+        ])
+        self.generator_beats = CSRStatus(32, description="Generated beats (of data_width bits).")
+        self.checker_beats   = CSRStatus(32, description="Checked beats (of data_width bits).")
+        self.checker_errors  = CSRStatus(32, description="Beats not matching the pattern.")
+        self.data_width      = CSRConstant(data_width)
+
+        # # #
+
+        reset = self.control.fields.reset
+
+        # Generator.
+        gen_count = Signal(32)
+        self.comb += [
+            dma.sink.valid.eq(self.control.fields.generator),
+            dma.sink.data.eq(Cat(*[(gen_count + i)[:32] for i in range(nwords)])),
+        ]
+        self.sync += [
+            If(dma.sink.valid & dma.sink.ready,
+                gen_count.eq(gen_count + nwords),
+                self.generator_beats.status.eq(self.generator_beats.status + 1),
+            ),
+            If(reset,
+                gen_count.eq(0),
+                self.generator_beats.status.eq(0),
+            ),
+        ]
+
+        # Checker.
+        chk_count = Signal(32)
+        chk_data  = Signal(32)
+        self.comb += [
+            dma.source.ready.eq(self.control.fields.checker),
+            chk_data.eq(dma.source.data[:32]),
+        ]
+        self.sync += [
+            If(dma.source.valid & dma.source.ready,
+                chk_count.eq(chk_data + nwords),
+                self.checker_beats.status.eq(self.checker_beats.status + 1),
+                If(((chk_data != chk_count) & (chk_data != 0)) |
+                   (dma.source.data != Cat(*[(chk_data + i)[:32] for i in range(nwords)])),
+                    self.checker_errors.status.eq(self.checker_errors.status + 1),
+                ),
+            ),
+            If(reset,
+                chk_count.eq(0),
+                self.checker_beats.status.eq(0),
+                self.checker_errors.status.eq(0),
+            ),
+        ]
+
+# Add PCIe DMA Benchmark ---------------------------------------------------------------------------
+
+def add_pcie_bench(soc, name="pcie_bench"):
+    """Adds a LitePCIeDMABench on the last PCIe DMA channel of soc (/dev/litepcie{DMA_CHANNELS-1}
+    on the Host, selected from csr.csv by litex_boards/software/litepcie_bench.py).
+
+    The first DMA is used by the PCIe DMA <-> DRAM when present, the Benchmark then requires 2 DMAs.
+    """
+    ndmas = soc.constants["DMA_CHANNELS"]
+    ndmas = getattr(ndmas, "value", ndmas) # SoCConstant or int (SoCCore.add_constant).
+    if hasattr(soc, "pcie_dram") and ndmas < 2:
+        raise ValueError("PCIe DMA <-> DRAM and Benchmark require 2 DMAs.")
+    setattr(soc.submodules, name, LitePCIeDMABench(getattr(soc, f"pcie_dma{ndmas - 1}")))
@@ -0,0 +1,56 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import AutoCSR
+
+from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+
+# LitePCIe DMA <-> LiteDRAM ------------------------------------------------------------------------
+
+class LitePCIeDRAMDMA(Module, AutoCSR):
+    """LitePCIe DMA <-> LiteDRAM
+
+    Connects the streams of a LitePCIe DMA to dedicated LiteDRAM native ports, allowing the Host
+    to use the card's DRAM as a staging buffer without going through the CPU/Wishbone bus:
+    - Host -> DRAM: Data sent by the Host (LitePCIe DMA Reader) is written to DRAM by a
+      LiteDRAMDMAWriter.
+    - DRAM -> Host: Data read from DRAM by a LiteDRAMDMAReader is sent to the Host (LitePCIe DMA
+      Writer).
+
+    Each direction is programmed through base (byte offset in DRAM), length (in bytes) and enable
+    CSRs and the bulk copy is then entirely done in hardware, the LitePCIe DMAs being themselves
+    driven by their descriptor tables on the Host side.
+
+    Throughput can be measured with litex_boards/software/litepcie_dram_bench.py.
+    """
+    def __init__(self, dma, crossbar, fifo_depth=64):
+        data_width = len(dma.source.data)
+
+        # # #
+
+        # Host -> DRAM.
+        writer_port = crossbar.get_port(mode="write")
+        writer_conv = stream.Converter(data_width, writer_port.data_width)
+        writer      = LiteDRAMDMAWriter(writer_port, fifo_depth=fifo_depth, with_csr=True)
+        self.submodules.writer_conv = writer_conv
+        self.submodules.writer      = writer
+        self.comb += [
+            dma.source.connect(writer_conv.sink),
+            writer_conv.source.connect(writer.sink),
+        ]
+
+        # DRAM -> Host.
+        reader_port = crossbar.get_port(mode="read")
+        reader_conv = stream.Converter(reader_port.data_width, data_width)
+        reader      = LiteDRAMDMAReader(reader_port, fifo_depth=fifo_depth, fifo_buffered=True, with_csr=True)
+        self.submodules.reader_conv = reader_conv
+        self.submodules.reader      = reader
+        self.comb += [
+            reader.source.connect(reader_conv.sink),
+            reader_conv.source.connect(dma.sink),
+        ]
@@ -0,0 +1,547 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from math import ceil, log2
+
+from migen import *
+
+from migen.genlib.misc import WaitTimer
+
+from litex.build.io import SDROutput, SDRTristate
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+from litex.soc.cores.icap import ICAP
+
+# Flash Operations ---------------------------------------------------------------------------------
+
+FLASH_OP_ERASE_PROGRAM = 0 # Erase sectors on entry + Program pages (Data from the Host).
+FLASH_OP_PROGRAM       = 1 # Program pages (Data from the Host).
+FLASH_OP_ERASE         = 2 # Erase sectors.
+FLASH_OP_VERIFY        = 3 # Read + Compare (Data from the Host).
+FLASH_OP_READ          = 4 # Read (Data to the Host).
+FLASH_OP_CMD           = 5 # Raw command (cmd_data/cmd CSRs, Single SPI).
+
+# SPI Flash Commands.
+SPI_WREN = 0x06
+SPI_RDSR = 0x05
+
+# Core <-> PHY Layouts (Same as LiteSPI's).
+spi_core2phy_layout = [
+    ("data", 32), # Data to transmit (right-aligned).
+    ("len",   6), # XFer length (in bits).
+    ("width", 4), # XFer width (1/4).
+    ("mask",  8), # DQ output enable.
+]
+spi_phy2core_layout = [
+    ("data", 32), # Received data (right-aligned).
+]
+
+# Quad SPI PHY -------------------------------------------------------------------------------------
+
+class QSPIFlashPHY(Module):
+    """Quad SPI Flash PHY
+
+    Shifts the spi_core2phy_layout commands (data/len/width/mask) out to the Flash and returns the
+    captured data (spi_phy2core_layout), MSB first, in Single (width=1, WP#/HOLD# driven high) or
+    Quad (width=4) SPI. The Flash clock is generated through the configuration logic:
+    - 7-Series: STARTUPE2's USRCCLKO (DQs/CS_n on pads).
+    - UltraScale(+): STARTUPE3's USRCCLKO (DQs/CS_n on pads) or, when no pads are provided, the
+      primary configuration Flash through STARTUPE3's DO/DI/DTS/FCSBO.
+
+    Data is sampled at the end of the high phase of the clock, SPI clock is
+    sys_clk_freq/(2*(div + 1)).
+    """
+    def __init__(self, pads, device, div, cs_n=None, cs_delay=8):
+        self.sink   = sink   = stream.Endpoint(spi_core2phy_layout)
+        self.source = source = stream.Endpoint(spi_phy2core_layout)
+        self.cs     = Signal()
+
+        # # #
+
+        clk     = Signal()
+        clk_reg = Signal()
+        cs_n_o  = Signal(reset=1)
+        dq_o    = Signal(4)
+        dq_oe   = Signal(4)
+        dq_i    = Signal(4)
+        self.sync += clk_reg.eq(clk)
+
+        # I/Os.
+        if device.startswith("xc7"):
+            assert pads is not None
+            self.specials += Instance("STARTUPE2",
+                i_CLK       = 0,
+                i_GSR       = 0,
+                i_GTS       = 0,
+                i_KEYCLEARB = 0,
+                i_PACK      = 0,
+                i_USRCCLKO  = clk_reg,
+                i_USRCCLKTS = 0,
+                i_USRDONEO  = 1,
+                i_USRDONETS = 1,
+            )
+        elif device.startswith(("xcku", "xcvu", "xczu", "xcau")):
+            do  = Signal(4)
+            dts = Signal(4, reset=0b1111)
+            di  = Signal(4)
+            cs  = Signal(reset=1)
+            if pads is None:
+                self.sync += [
+                    do.eq(dq_o),
+                    dts.eq(~dq_oe),
+                    dq_i.eq(di),
+                    cs.eq(cs_n_o),
+                ]
+            self.specials += Instance("STARTUPE3",
+                i_GSR       = 0,
+                i_GTS       = 0,
+                i_KEYCLEARB = 0,
+                i_PACK      = 0,
+                i_USRCCLKO  = clk_reg,
+                i_USRCCLKTS = 0,
+                i_USRDONEO  = 1,
+                i_USRDONETS = 1,
+                i_FCSBO     = cs,
+                i_FCSBTS    = int(pads is not None),
+                i_DO        = do,
+                i_DTS       = dts,
+                o_DI        = di,
+            )
+        else:
+            raise NotImplementedError(f"QSPIFlashPHY: Unsupported device {device}.")
+        if pads is not None:
+            dqs = pads.dq if hasattr(pads, "dq") else [pads.mosi, pads.miso, pads.wp, pads.hold]
+            for i in range(4):
+                self.specials += SDRTristate(
+                    io = dqs[i],
+                    o  = dq_o[i],
+                    oe = dq_oe[i],
+                    i  = dq_i[i],
+                )
+            self.specials += SDROutput(i=cs_n_o, o=pads.cs_n if cs_n is None else cs_n)
+
+        # CS control (Ensure cs_delay cycles between XFers, released after Init).
+        init     = Signal(reset=1)
+        cs_timer = WaitTimer(cs_delay + 1)
+        self.submodules += cs_timer
+        self.comb += [
+            cs_timer.wait.eq(self.cs & ~init),
+            cs_n_o.eq(~cs_timer.done),
+        ]
+
+        # Clk Divider.
+        tick     = Signal()
+        tick_cnt = Signal(max=div + 1)
+        self.comb += tick.eq(tick_cnt == div)
+        self.sync += If(tick, tick_cnt.eq(0)).Else(tick_cnt.eq(tick_cnt + 1))
+
+        # Shift Registers.
+        sr_out = Signal(32)
+        sr_in  = Signal(32)
+        sr_cnt = Signal(6)
+        self.comb += [
+            If(sink.width == 4,
+                dq_o.eq(sr_out[-4:]),
+                dq_oe.eq(sink.mask[:4]),
+            ).Else(
+                dq_o.eq(Cat(sr_out[-1], 0, 1, 1)),
+                dq_oe.eq(Cat(sink.mask[0], 0, 1, 1)),
+            ),
+            source.data.eq(sr_in),
+        ]
+
+        # FSM.
+        init_cnt = Signal(4)
+        self.submodules.fsm = fsm = FSM(reset_state="INIT")
+        fsm.act("INIT",
+            # Give a few clock cycles to STARTUPE2/3 to switch to the user clock.
+            If(tick,
+                NextValue(clk, ~clk),
+                NextValue(init_cnt, init_cnt + 1),
+                If(init_cnt == (2**len(init_cnt) - 1),
+                    NextValue(init, 0),
+                    NextState("IDLE")
+                )
+            )
+        )
+        fsm.act("IDLE",
+            If(~cs_n_o & sink.valid,
+                NextValue(sr_out, sink.data << (32 - sink.len)),
+                NextValue(sr_in,  0),
+                NextValue(sr_cnt, sink.len),
+                NextState("XFER")
+            )
+        )
+        fsm.act("XFER",
+            If(tick,
+                If(~clk,
+                    NextValue(clk, 1)
+                ).Else(
+                    NextValue(clk, 0),
+                    If(sink.width == 4,
+                        NextValue(sr_in,  Cat(dq_i, sr_in)),
+                        NextValue(sr_out, Cat(Signal(4), sr_out)),
+                    ).Else(
+                        NextValue(sr_in,  Cat(dq_i[1], sr_in)),
+                        NextValue(sr_out, Cat(Signal(1), sr_out)),
+                    ),
+                    NextValue(sr_cnt, sr_cnt - sink.width),
+                    If(sr_cnt == sink.width,
+                        NextState("END")
+                    )
+                )
+            )
+        )
+        fsm.act("END",
+            source.valid.eq(1),
+            source.last.eq(1),
+            If(source.ready,
+                sink.ready.eq(1),
+                NextState("IDLE")
+            )
+        )
+
+# LitePCIe Flash -----------------------------------------------------------------------------------
+
+class LitePCIeFlash(Module, AutoCSR):
+    """LitePCIe SPI Flash Programmer
+
+    Quad SPI Flash programming engine fed by a LitePCIe DMA, to update the bitstream of PCIe cards
+    at Flash speed instead of through bit-banged CSR accesses:
+    - Erase/Program: Sectors are erased when the address enters them and the data streamed by the
+      Host (DMA Reader, Host -> FPGA) is programmed page by page (Quad Page Program), the DMA
+      filling the next pages while the Flash is busy erasing/programming.
+    - Verify: The Flash is read (Quad Output Read) and compared to the data streamed by the Host,
+      mismatches are counted in hardware (errors/error_address).
+    - Read: The Flash is read and streamed to the Host (DMA Writer, FPGA -> Host).
+    - Cmd: Raw Single SPI commands (ID, Status/Configuration registers, Quad Enable...).
+
+    Address must be page aligned for program operations and sector aligned for erase operations,
+    otherwise the Operation is refused (unaligned). The Host must pad the data to the DMA buffer
+    size; remaining saturates at 0 on an unaligned length (last partial sector/page/word fully
+    erased/programmed/read). Opcodes default to 3-byte addressing and can be changed to 4-byte
+    addressing ones (and Read dummy cycles) through the opcodes CSR.
+
+    Used with an ICAP for reload by litex_boards/software/litepcie_flash.py.
+    """
+    def __init__(self, dma, pads, device, sys_clk_freq, spi_clk_freq=25e6, cs_n=None,
+        page_size=256, sector_size=65536):
+        data_width = len(dma.source.data)
+        page_words = page_size//4
+        self.control = CSRStorage(fields=[
+            CSRField("start", size=1, offset=0, pulse=True, description="Start Operation."),
+            CSRField("op",    size=3, offset=4, description="Operation.", values=[
+                ("``0b000``", "Erase + Program."),
+                ("``0b001``", "Program."),
+                ("``0b010``", "Erase."),
+                ("``0b011``", "Verify."),
+                ("``0b100``", "Read."),
+                ("``0b101``", "Raw Command."),
+            ]),
+        ])
+        self.address = CSRStorage(32, description="Flash Address (in bytes).")
+        self.length  = CSRStorage(32, description="Length (in bytes).")
+        self.opcodes = CSRStorage(fields=[
+            CSRField("erase",      size=8, offset=0,  reset=0xd8, description="Sector Erase opcode."),
+            CSRField("program",    size=8, offset=8,  reset=0x32, description="Quad Page Program opcode."),
+            CSRField("read",       size=8, offset=16, reset=0x6b, description="Quad Output Read opcode."),
+            CSRField("addr_bytes", size=3, offset=24, reset=3,    description="Address bytes (3 or 4)."),
+            CSRField("dummy",      size=5, offset=27, reset=8,    description="Read dummy cycles."),
+        ])
+        self.cmd = CSRStorage(fields=[
+            CSRField("tx_len", size=3, offset=0, description="Raw Command TX bytes (1-4)."),
+            CSRField("rx_len", size=3, offset=4, description="Raw Command RX bytes (0-4)."),
+        ])
+        self.cmd_data      = CSRStorage(32, description="Raw Command TX data (right-aligned, MSB first).")
+        self.cmd_rdata     = CSRStatus(32,  description="Raw Command RX data (right-aligned, MSB first).")
+        self.done          = CSRStatus(description="Operation done.")
+        self.unaligned     = CSRStatus(description="Last Operation refused (unaligned address).")
+        self.remaining     = CSRStatus(32, description="Remaining bytes of the Operation.")
+        self.errors        = CSRStatus(32, description="Verify errors (in 32-bit words).")
+        self.error_address = CSRStatus(32, description="Verify first error address.")
+        self.page_size     = CSRConstant(page_size)
+        self.sector_size   = CSRConstant(sector_size)
+
+        # # #
+
+        start      = self.control.fields.start
+        op         = self.control.fields.op
+        opcodes    = self.opcodes.fields
+        addr       = Signal(32)
+        addr_bits  = Signal(6)
+        remaining  = self.remaining.status
+        errors     = self.errors.status
+        erased     = Signal()
+        wip        = Signal()
+        words      = Signal(max=page_words)
+        do_erase   = Signal()
+        do_program = Signal()
+        unaligned  = Signal()
+        self.comb += [
+            addr_bits.eq(opcodes.addr_bytes*8),
+            do_erase.eq(  (op == FLASH_OP_ERASE_PROGRAM) | (op == FLASH_OP_ERASE)),
+            do_program.eq((op == FLASH_OP_ERASE_PROGRAM) | (op == FLASH_OP_PROGRAM)),
+            unaligned.eq(
+                (do_erase   & (self.address.storage[:int(log2(sector_size))] != 0)) |
+                (do_program & (self.address.storage[:int(log2(page_size))]   != 0))),
+        ]
+
+        # PHY.
+        div = max(ceil(sys_clk_freq/(2*spi_clk_freq)) - 1, 1)
+        self.submodules.phy = phy = QSPIFlashPHY(pads, device, div, cs_n=cs_n)
+
+        # Host -> Flash (2 pages buffering, reset on start).
+        tx_conv = stream.Converter(data_width, 32)
+        tx_fifo = stream.SyncFIFO([("data", 32)], 2*page_words)
+        tx_conv = ResetInserter()(tx_conv)
+        tx_fifo = ResetInserter()(tx_fifo)
+        self.submodules += tx_conv, tx_fifo
+        self.comb += [
+            tx_conv.reset.eq(start),
+            tx_fifo.reset.eq(start),
+            dma.source.connect(tx_conv.sink),
+            tx_conv.source.connect(tx_fifo.sink),
+        ]
+        tx_data = Signal(32) # Host bytes in SPI order.
+        self.comb += tx_data.eq(
+            Cat(*[tx_fifo.source.data[8*i:8*(i+1)] for i in reversed(range(4))]))
+
+        # Flash -> Host.
+        rx_conv = stream.Converter(32, data_width)
+        rx_conv = ResetInserter()(rx_conv)
+        self.submodules += rx_conv
+        self.comb += [
+            rx_conv.reset.eq(start),
+            rx_conv.source.connect(dma.sink),
+            rx_conv.sink.data.eq(Cat(*[phy.source.data[8*i:8*(i+1)] for i in reversed(range(4))])),
+        ]
+
+        # FSM.
+        def spi(data, nbits, width=1, mask=0b1):
+            return [
+                phy.cs.eq(1),
+                phy.sink.valid.eq(1),
+                phy.sink.data.eq(data),
+                phy.sink.len.eq(nbits),
+                phy.sink.width.eq(width),
+                phy.sink.mask.eq(mask),
+            ]
+
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        self.comb += [
+            # PHY responses are only flow-controlled during Verify/Read data.
+            phy.source.ready.eq(1),
+            If(fsm.ongoing("READ-DATA"),
+                If(op == FLASH_OP_VERIFY,
+                    phy.source.ready.eq(tx_fifo.source.valid),
+                ).Else(
+                    phy.source.ready.eq(rx_conv.sink.ready),
+                )
+            )
+        ]
+        fsm.act("IDLE",
+            self.done.status.eq(1),
+            If(start,
+                NextValue(addr,      self.address.storage),
+                NextValue(remaining, self.length.storage),
+                NextValue(erased,    0),
+                NextValue(self.unaligned.status, unaligned),
+                If(~unaligned, Case(op, {
+                    FLASH_OP_VERIFY : [
+                        NextValue(errors, 0),
+                        NextValue(self.error_address.status, 0),
+                        NextState("READ-CMD"),
+                    ],
+                    FLASH_OP_READ   : NextState("READ-CMD"),
+                    FLASH_OP_CMD    : NextState("CMD-TX"),
+                    "default"       : NextState("PROG"),
+                }))
+            )
+        )
+
+        # Erase/Program.
+        fsm.act("PROG",
+            If(remaining == 0,
+                NextState("IDLE")
+            ).Elif(do_erase & ~erased & (~do_program | (addr[:int(log2(sector_size))] == 0)),
+                NextState("ERASE-WREN")
+            ).Elif(do_program & (tx_fifo.level >= page_words),
+                NextState("PAGE-WREN")
+            )
+        )
+        fsm.act("ERASE-WREN",
+            spi(SPI_WREN, 8),
+            If(phy.sink.ready, NextState("ERASE-WREN-END"))
+        )
+        fsm.act("ERASE-WREN-END", NextState("ERASE-CMD"))
+        fsm.act("ERASE-CMD",
+            spi(opcodes.erase, 8),
+            If(phy.sink.ready, NextState("ERASE-ADDR"))
+        )
+        fsm.act("ERASE-ADDR",
+            spi(addr, addr_bits),
+            If(phy.sink.ready, NextState("ERASE-END"))
+        )
+        fsm.act("ERASE-END",
+            If(do_program,
+                NextValue(erased, 1),
+            ).Else(
+                NextValue(addr, addr + sector_size),
+                If(remaining > sector_size,
+                    NextValue(remaining, remaining - sector_size)
+                ).Else(
+                    NextValue(remaining, 0)
+                )
+            ),
+            NextState("POLL")
+        )
+        fsm.act("PAGE-WREN",
+            spi(SPI_WREN, 8),
+            If(phy.sink.ready, NextState("PAGE-WREN-END"))
+        )
+        fsm.act("PAGE-WREN-END", NextState("PAGE-CMD"))
+        fsm.act("PAGE-CMD",
+            spi(opcodes.program, 8),
+            If(phy.sink.ready, NextState("PAGE-ADDR"))
+        )
+        fsm.act("PAGE-ADDR",
+            spi(addr, addr_bits),
+            NextValue(words, 0),
+            If(phy.sink.ready, NextState("PAGE-DATA"))
+        )
+        fsm.act("PAGE-DATA",
+            spi(tx_data, 32, width=4, mask=0b1111),
+            phy.sink.valid.eq(tx_fifo.source.valid),
+            tx_fifo.source.ready.eq(phy.sink.ready),
+            If(phy.sink.ready,
+                NextValue(words, words + 1),
+                If(words == (page_words - 1),
+                    NextState("PAGE-END")
+                )
+            )
+        )
+        fsm.act("PAGE-END",
+            NextValue(addr,   addr + page_size),
+            NextValue(erased, 0),
+            If(remaining > page_size,
+                NextValue(remaining, remaining - page_size)
+            ).Else(
+                NextValue(remaining, 0)
+            ),
+            NextState("POLL")
+        )
+
+        # Status Polling (Wait Erase/Program completion).
+        fsm.act("POLL",
+            spi(SPI_RDSR, 8),
+            If(phy.sink.ready, NextState("POLL-DATA"))
+        )
+        fsm.act("POLL-DATA",
+            spi(0, 8, mask=0b0),
+            If(phy.sink.ready,
+                NextValue(wip, phy.source.data[0]),
+                NextState("POLL-END")
+            )
+        )
+        fsm.act("POLL-END",
+            If(wip,
+                NextState("POLL")
+            ).Else(
+                NextState("PROG")
+            )
+        )
+
+        # Verify/Read.
+        fsm.act("READ-CMD",
+            spi(opcodes.read, 8),
+            If(phy.sink.ready, NextState("READ-ADDR"))
+        )
+        fsm.act("READ-ADDR",
+            spi(addr, addr_bits),
+            If(phy.sink.ready,
+                If(opcodes.dummy == 0,
+                    NextState("READ-DATA")
+                ).Else(
+                    NextState("READ-DUMMY")
+                )
+            )
+        )
+        fsm.act("READ-DUMMY",
+            spi(0, opcodes.dummy, mask=0b0),
+            If(phy.sink.ready, NextState("READ-DATA"))
+        )
+        fsm.act("READ-DATA",
+            spi(0, 32, width=4, mask=0b0000),
+            phy.sink.valid.eq(remaining != 0),
+            If(op == FLASH_OP_VERIFY,
+                tx_fifo.source.ready.eq(phy.source.valid),
+            ).Else(
+                rx_conv.sink.valid.eq(phy.source.valid),
+            ),
+            If(phy.sink.ready,
+                NextValue(addr, addr + 4),
+                If(remaining > 4,
+                    NextValue(remaining, remaining - 4)
+                ).Else(
+                    NextValue(remaining, 0)
+                ),
+                If((op == FLASH_OP_VERIFY) & (tx_data != phy.source.data),
+                    NextValue(errors, errors + 1),
+                    If(errors == 0,
+                        NextValue(self.error_address.status, addr)
+                    )
+                )
+            ),
+            If(remaining == 0,
+                NextState("READ-END")
+            )
+        )
+        fsm.act("READ-END", NextState("IDLE"))
+
+        # Raw Command.
+        fsm.act("CMD-TX",
+            spi(self.cmd_data.storage, self.cmd.fields.tx_len*8),
+            If(phy.sink.ready,
+                If(self.cmd.fields.rx_len == 0,
+                    NextState("CMD-END")
+                ).Else(
+                    NextState("CMD-RX")
+                )
+            )
+        )
+        fsm.act("CMD-RX",
+            spi(0, self.cmd.fields.rx_len*8, mask=0b0),
+            If(phy.sink.ready,
+                NextValue(self.cmd_rdata.status, phy.source.data),
+                NextState("CMD-END")
+            )
+        )
+        fsm.act("CMD-END", NextState("IDLE"))
+
+# UltraScale ICAP ----------------------------------------------------------------------------------
+
+class USICAP(ICAP):
+    """ICAP for UltraScale(+) FPGAs
+
+    LiteX's ICAP (same sequencer/CSRs/reload) on an ICAPE3 instead of an ICAPE2, allowing the same
+    IPROG reload over PCIe than on 7-Series targets.
+    """
+    def __init__(self, with_csr=True):
+        ICAP.__init__(self, with_csr=with_csr, simulation=True)
+
+        # # #
+
+        _i_icape3 = Signal(32)
+        _o_icape3 = Signal(32)
+        self.comb += _i_icape3.eq(Cat(*[self._i[8*i:8*(i+1)][::-1] for i in range(4)]))
+        self.comb += self._o.eq(Cat(*[_o_icape3[8*i:8*(i+1)][::-1] for i in range(4)]))
+        self.specials += Instance("ICAPE3",
+            i_CLK   = ClockSignal("icap"),
+            i_CSIB  = self._csib,
+            i_RDWRB = self._rdwrb,
+            i_I     = _i_icape3,
+            o_O     = _o_icape3,
+        )
@@ -0,0 +1,174 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+from litesata.common import logical_sector_size
+
+from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+
+from litex_boards.cores.sata_raid import LiteSATARAID0
+
+# LiteDRAM <-> SATA Streamer -----------------------------------------------------------------------
+
+class LiteSATADRAMStreamer(Module, AutoCSR):
+    """LiteDRAM <-> SATA Streamer (Recorder/Player)
+
+    Streams between a DRAM ring buffer (through dedicated LiteDRAM native ports) and the drive(s) of
+    a LiteSATARAID0 (a single drive or RAID-0), without going through the CPU/Wishbone bus: the
+    drives are accessed with large commands (the RAID-0's stripes, called blocks here) from/to
+    their stripe buffers, allowing them to run at their rated speed.
+
+    - record:   blocks*block_sectors sectors are read from the ring buffer and written to the
+      drive(s) from sector.
+    - playback: blocks*block_sectors sectors are read from the drive(s) from sector and written to
+      the ring buffer.
+
+    The ring buffer is programmed through base (byte offset in DRAM) and size (in bytes, 0 for no
+    wrap) CSRs, both aligned on DRAM words: accesses wrap at its end, so a recording/playback can be
+    larger than the buffer. Playback is only done once all the data has been written to DRAM. The
+    duration and the drives' command latencies are measured (see
+    litex_boards/software/sata_dram_bench.py).
+    """
+    def __init__(self, raid, dram_read_port, dram_write_port, fifo_depth=256):
+        dw          = len(raid.sink.data)
+        word_bytes  = dram_read_port.data_width//8
+        block_bytes = raid.stripe_sectors*logical_sector_size
+        assert dram_write_port.data_width == dram_read_port.data_width
+        assert (block_bytes % word_bytes) == 0
+        self.control = CSRStorage(fields=[
+            CSRField("record",   size=1, offset=0, pulse=True, description="Start record."),
+            CSRField("playback", size=1, offset=1, pulse=True, description="Start playback."),
+        ])
+        self.base        = CSRStorage(32, description="Ring buffer base (byte offset in DRAM).")
+        self.size        = CSRStorage(32, description="Ring buffer size (in bytes, 0: no wrap).")
+        self.sector      = CSRStorage(48, description="First sector (on each drive).")
+        self.blocks      = CSRStorage(32, description="Length (in blocks).")
+        self.status      = CSRStatus(fields=[
+            CSRField("done",   size=1, offset=0, description="Record/Playback done."),
+            CSRField("failed", size=1, offset=1, description="A SATA command failed."),
+        ])
+        self.cycles      = CSRStatus(64, description="Record/Playback duration (in sys_clk cycles).")
+        self.latency_max = CSRStatus(32, description="Max command latency (in sys_clk cycles).")
+        self.latency_sum = CSRStatus(64, description="Sum of command latencies (in sys_clk cycles).")
+
+        # # #
+
+        self.submodules.raid = raid
+        record   = self.control.fields.record
+        playback = self.control.fields.playback
+        start    = Signal()
+        self.comb += [
+            start.eq(record | playback),
+            raid.write.eq(record),
+            raid.read.eq(playback),
+            raid.sector.eq(self.sector.storage),
+            raid.stripes.eq(self.blocks.storage),
+        ]
+
+        # DRAM Reader/Writer.
+        reader = LiteDRAMDMAReader(dram_read_port,  fifo_depth=fifo_depth, fifo_buffered=True)
+        writer = LiteDRAMDMAWriter(dram_write_port, fifo_depth=fifo_depth, fifo_buffered=True)
+        r_conv = stream.Converter(dram_read_port.data_width, dw)
+        w_conv = stream.Converter(dw, dram_write_port.data_width)
+        self.submodules += reader, writer, r_conv, w_conv
+        self.comb += [
+            reader.source.connect(r_conv.sink),
+            r_conv.source.connect(raid.sink),
+            raid.source.connect(w_conv.sink),
+        ]
+
+        # Ring Buffer Addresses.
+        playing   = Signal()
+        offset    = Signal(32)
+        remaining = Signal(32)
+        address   = Signal(dram_read_port.address_width)
+        advance   = Signal()
+        self.comb += [
+            address.eq(self.base.storage[log2_int(word_bytes):] + offset),
+            # Record: DRAM -> SATA.
+            reader.sink.valid.eq(~playing & (remaining != 0)),
+            reader.sink.address.eq(address),
+            # Playback: SATA -> DRAM.
+            writer.sink.valid.eq(playing & (remaining != 0) & w_conv.source.valid),
+            writer.sink.address.eq(address),
+            writer.sink.data.eq(w_conv.source.data),
+            w_conv.source.ready.eq(playing & (remaining != 0) & writer.sink.ready),
+            advance.eq((reader.sink.valid & reader.sink.ready) |
+                       (writer.sink.valid & writer.sink.ready)),
+        ]
+        self.sync += [
+            If(start,
+                playing.eq(playback),
+                offset.eq(0),
+                remaining.eq(self.blocks.storage*(block_bytes//word_bytes)),
+            ).Elif(advance,
+                offset.eq(offset + 1),
+                If(offset == (self.size.storage[log2_int(word_bytes):] - 1),
+                    offset.eq(0)
+                ),
+                remaining.eq(remaining - 1),
+            )
+        ]
+
+        # DRAM Writer Level (writes accepted but still in its FIFO, not yet sent to DRAM).
+        w_level = Signal(max=fifo_depth + 2)
+        w_cmd   = Signal()
+        w_data  = Signal()
+        self.comb += [
+            w_cmd.eq(writer.sink.valid & writer.sink.ready),
+            w_data.eq(dram_write_port.wdata.valid & dram_write_port.wdata.ready),
+        ]
+        self.sync += [
+            If(w_cmd & ~w_data,
+                w_level.eq(w_level + 1)
+            ).Elif(~w_cmd & w_data,
+                w_level.eq(w_level - 1)
+            )
+        ]
+
+        # Status.
+        busy = Signal()
+        self.comb += [
+            busy.eq(~raid.done | (remaining != 0) | (w_level != 0)),
+            self.status.fields.done.eq(~busy),
+            self.status.fields.failed.eq(raid.failed),
+            self.latency_max.status.eq(raid.latency_max),
+            self.latency_sum.status.eq(raid.latency_sum),
+        ]
+        self.sync += [
+            If(start,
+                self.cycles.status.eq(0)
+            ).Elif(busy,
+                self.cycles.status.eq(self.cycles.status + 1)
+            )
+        ]
+
+# SoC Integration ----------------------------------------------------------------------------------
+
+def add_sata_dram_streamer(soc, name="sata_streamer", crossbars=None, block_sectors=128,
+    block_buffers=2):
+    """Adds a LiteSATADRAMStreamer to the SATA core(s) of the SoC.
+
+    Uses the crossbar of SoC.add_sata (or the drives' crossbars, for RAID-0) with its own ports and
+    stripe buffers (block_buffers blocks per drive for Writer and Reader), block_sectors being the
+    size of the SATA commands.
+    """
+    assert hasattr(soc, "sdram"), "SATA DRAM Streamer requires DRAM."
+    if crossbars is None:
+        assert hasattr(soc, "sata_crossbar"), "SATA DRAM Streamer requires SATA."
+        crossbars = [soc.sata_crossbar]
+    raid = LiteSATARAID0(crossbars,
+        stripe_sectors = block_sectors,
+        stripe_buffers = block_buffers,
+        with_csr       = False)
+    streamer = LiteSATADRAMStreamer(raid,
+        dram_read_port  = soc.sdram.crossbar.get_port(mode="read"),
+        dram_write_port = soc.sdram.crossbar.get_port(mode="write"))
+    setattr(soc.submodules, name, streamer)
+    soc.add_constant(f"{name.upper()}_BLOCK_SECTORS", block_sectors)
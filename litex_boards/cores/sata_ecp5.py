@@ -0,0 +1,455 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import math
+from types import SimpleNamespace
+
+from migen import *
+from migen.genlib.cdc import MultiReg
+from migen.genlib.misc import WaitTimer
+from migen.genlib.resetsync import AsyncResetSynchronizer
+
+from litex.soc.cores.code_8b10b import Encoder, Decoder
+
+from liteiclink.serdes.serdes_ecp5 import SerDesECP5PLL, SerDesECP5
+
+from litesata.common import *
+from litesata.phy import LiteSATAPHY
+from litesata.phy.ctrl import LiteSATAPHYCtrl
+from litesata.phy.datapath import LiteSATAPHYDatapath
+
+# ECP5 SATA Init -----------------------------------------------------------------------------------
+
+class ECP5SATATXInit(Module):
+    """TX SerDes/Lane reset sequence (resets the TX PLL and waits for its lock)."""
+    def __init__(self, tx_lol):
+        self.restart = Signal()
+        self.done    = Signal()
+        self.tx_rst  = Signal()
+        self.pcs_rst = Signal()
+
+        # # #
+
+        _tx_lol = Signal()
+        self.specials += MultiReg(tx_lol, _tx_lol)
+
+        self.submodules.timer = timer = WaitTimer(1024)
+
+        self.submodules.fsm = fsm = ResetInserter()(FSM(reset_state="RESET"))
+        self.comb += fsm.reset.eq(self.restart)
+        fsm.act("RESET",
+            self.tx_rst.eq(1),
+            self.pcs_rst.eq(1),
+            timer.wait.eq(1),
+            If(timer.done,
+                NextState("WAIT-PLL-LOCK")
+            )
+        )
+        fsm.act("WAIT-PLL-LOCK",
+            self.pcs_rst.eq(1),
+            timer.wait.eq(~_tx_lol),
+            If(timer.done,
+                NextState("READY")
+            )
+        )
+        fsm.act("READY",
+            self.done.eq(1),
+            If(_tx_lol,
+                NextState("RESET")
+            )
+        )
+
+class ECP5SATARXInit(Module):
+    """RX SerDes/Lane reset sequence.
+
+    Unlike the SerDesECP5's init, does not wait for the CDR lock nor restart on Loss Of Signal: the
+    link is idle (or sending OOB bursts) until the end of the OOB sequence, re-alignment is handled
+    by LiteSATAPHYCtrl (through restart).
+    """
+    def __init__(self):
+        self.restart = Signal()
+        self.done    = Signal()
+        self.rx_rst  = Signal()
+        self.pcs_rst = Signal()
+
+        # # #
+
+        self.submodules.timer = timer = WaitTimer(1024)
+
+        self.submodules.fsm = fsm = ResetInserter()(FSM(reset_state="RESET"))
+        self.comb += fsm.reset.eq(self.restart)
+        fsm.act("RESET",
+            self.rx_rst.eq(1),
+            self.pcs_rst.eq(1),
+            timer.wait.eq(1),
+            If(timer.done,
+                NextState("RESET-PCS")
+            )
+        )
+        fsm.act("RESET-PCS",
+            self.pcs_rst.eq(1),
+            timer.wait.eq(1),
+            If(timer.done,
+                NextState("READY")
+            )
+        )
+        fsm.act("READY",
+            self.done.eq(1)
+        )
+
+# ECP5 SATA OOB ------------------------------------------------------------------------------------
+
+# OOB signals: 6 bursts of ALIGNs (106.7ns) separated by idles of 320ns (COMINIT) or 106.7ns
+# (COMWAKE). Gaps between 175ns and 525ns are detected as COMINIT and between 35ns and 175ns as
+# COMWAKE.
+oob_burst_time        = 106.7e-9
+oob_cominit_idle_time = 320.0e-9
+oob_comwake_idle_time = 106.7e-9
+oob_bursts            = 6
+
+class ECP5SATAOOBTX(Module):
+    """OOB (COMINIT/COMWAKE) generator, in sata_tx domain.
+
+    Starts a sequence on cominit/comwake rising edges and asserts done at its end (until cominit
+    and comwake are released). active/idle control the TX data (ALIGNs) and electrical idle.
+    """
+    def __init__(self, clk_freq):
+        self.cominit = Signal()
+        self.comwake = Signal()
+        self.done    = Signal()
+        self.active  = Signal()
+        self.idle    = Signal()
+
+        # # #
+
+        burst_cycles   = round(oob_burst_time*clk_freq)
+        cominit_cycles = round(oob_cominit_idle_time*clk_freq)
+        comwake_cycles = round(oob_comwake_idle_time*clk_freq)
+
+        cominit_d = Signal()
+        comwake_d = Signal()
+        idle_len  = Signal(max=cominit_cycles + 1)
+        timer     = Signal(max=cominit_cycles + 1)
+        bursts    = Signal(max=oob_bursts + 1)
+        self.sync += [
+            cominit_d.eq(self.cominit),
+            comwake_d.eq(self.comwake),
+            If(~self.cominit & ~self.comwake,
+                self.done.eq(0)
+            )
+        ]
+
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            NextValue(timer,  0),
+            NextValue(bursts, 0),
+            If(self.cominit & ~cominit_d,
+                NextValue(idle_len, cominit_cycles - 1),
+                NextState("BURST")
+            ),
+            If(self.comwake & ~comwake_d,
+                NextValue(idle_len, comwake_cycles - 1),
+                NextState("BURST")
+            )
+        )
+        fsm.act("BURST",
+            self.active.eq(1),
+            NextValue(timer, timer + 1),
+            If(timer == (burst_cycles - 1),
+                NextValue(timer, 0),
+                NextValue(bursts, bursts + 1),
+                NextState("IDLE-GAP")
+            )
+        )
+        fsm.act("IDLE-GAP",
+            self.active.eq(1),
+            self.idle.eq(1),
+            NextValue(timer, timer + 1),
+            If(timer == idle_len,
+                NextValue(timer, 0),
+                If(bursts == oob_bursts,
+                    NextValue(self.done, 1),
+                    NextState("IDLE")
+                ).Else(
+                    NextState("BURST")
+                )
+            )
+        )
+
+class ECP5SATAOOBRX(Module):
+    """OOB (COMINIT/COMWAKE) detector, from the SerDes' Loss Of Signal.
+
+    Measures the idle gaps between bursts and asserts cominit/comwake after 3 consecutive gaps of
+    the same type, until the link stays idle (end of sequence) or active (ALIGNs) for a long time.
+    """
+    def __init__(self, rx_los, clk_freq):
+        self.cominit = Signal()
+        self.comwake = Signal()
+        self.idle    = Signal()
+
+        # # #
+
+        def cycles(t):
+            return math.ceil(t*clk_freq)
+
+        los   = Signal()
+        los_d = Signal()
+        self.specials += MultiReg(rx_los, los)
+        self.comb += self.idle.eq(los)
+
+        count_max    = cycles(2*525e-9)
+        count        = Signal(max=count_max + 1)
+        cominit_gaps = Signal(2)
+        comwake_gaps = Signal(2)
+        self.sync += [
+            los_d.eq(los),
+            # Idle/Burst duration.
+            If(los != los_d,
+                count.eq(0)
+            ).Elif(count != count_max,
+                count.eq(count + 1)
+            ),
+            # Idle gap end: classify gap.
+            If(~los & los_d,
+                If((count >= cycles(175e-9)) & (count <= cycles(525e-9)),
+                    If(cominit_gaps != 3, cominit_gaps.eq(cominit_gaps + 1)),
+                    comwake_gaps.eq(0)
+                ).Elif((count >= cycles(35e-9)) & (count < cycles(175e-9)),
+                    If(comwake_gaps != 3, comwake_gaps.eq(comwake_gaps + 1)),
+                    cominit_gaps.eq(0)
+                ).Else(
+                    cominit_gaps.eq(0),
+                    comwake_gaps.eq(0)
+                )
+            ),
+            # Long Idle/Burst: end of sequence.
+            If(count == count_max,
+                cominit_gaps.eq(0),
+                comwake_gaps.eq(0)
+            )
+        ]
+        self.comb += [
+            self.cominit.eq(cominit_gaps == 3),
+            self.comwake.eq(comwake_gaps == 3),
+        ]
+
+# ECP5 SATA PHY CRG --------------------------------------------------------------------------------
+
+class ECP5LiteSATAPHYCRG(Module):
+    def __init__(self, phy):
+        self.tx_reset = Signal()
+        self.rx_reset = Signal()
+
+        self.clock_domains.cd_sata_tx = ClockDomain()
+        self.clock_domains.cd_sata_rx = ClockDomain()
+
+        # # #
+
+        # TX/RX clocks: SerDes' half rate PCLKs (16-bit data-width).
+        self.comb += [
+            self.cd_sata_tx.clk.eq(phy.serdes.txoutclk),
+            self.cd_sata_rx.clk.eq(phy.serdes.rxoutclk),
+        ]
+
+        # Resets.
+        self.specials += [
+            AsyncResetSynchronizer(self.cd_sata_tx, ~phy.tx_init.done | self.tx_reset),
+            AsyncResetSynchronizer(self.cd_sata_rx, ~phy.rx_init.done | self.rx_reset),
+        ]
+
+# ECP5 SATA PHY (Transceiver) ----------------------------------------------------------------------
+
+class ECP5LiteSATAPHY(Module):
+    """SATA Transceiver on ECP5-5G SerDes (DCU).
+
+    Built on LiteICLink's SerDesECP5 (for its DCU/PLL configuration and SCI reconfiguration of the
+    polarities and CDR hold), with SATA specific reset sequences, 8b10b coding and OOB signaling
+    in the sata_tx/sata_rx domains:
+    - TX OOB bursts are generated in fabric (ALIGNs) with the DCU's electrical idle port (the SCI
+      reconfiguration being too slow for OOB timings).
+    - RX OOB signals are detected from the DCU's Loss Of Signal (squelch) output.
+    """
+    def __init__(self, refclk, tx_pads, rx_pads, gen, clk_freq, refclk_freq=150e6, data_width=16,
+        dual=0, channel=0):
+        assert gen in ["gen1", "gen2"] # Gen3 (6Gbps) above ECP5-5G's 5Gbps.
+        assert data_width == 16
+        self.data_width = data_width
+
+        # Control
+        self.ready = Signal()
+
+        # Transceiver
+        self.tx_idle     = Signal()
+        self.tx_polarity = Signal()
+        self.rx_polarity = Signal()
+        self.rx_cdrhold  = Signal()
+
+        # OOB
+        self.tx_cominit_stb = Signal()
+        self.tx_cominit_ack = Signal()
+        self.tx_comwake_stb = Signal()
+        self.tx_comwake_ack = Signal()
+        self.rx_idle        = Signal()
+        self.rx_cominit_stb = Signal()
+        self.rx_comwake_stb = Signal()
+
+        # Datapath
+        self.sink   = stream.Endpoint(phy_description(data_width))
+        self.source = stream.Endpoint(phy_description(data_width))
+
+        # # #
+
+        linerate = {"gen1": 1.5e9, "gen2": 3.0e9}[gen]
+        tx_clk_freq = linerate/20
+
+        # SerDes.
+        self.submodules.pll = pll = SerDesECP5PLL(refclk, refclk_freq=refclk_freq, linerate=linerate)
+        self.submodules.serdes = serdes = SerDesECP5(pll, tx_pads, rx_pads,
+            dual        = dual,
+            channel     = channel,
+            data_width  = 20,
+            tx_polarity = self.tx_polarity,
+            rx_polarity = self.rx_polarity)
+        self.comb += serdes.rx_cdr_hold.eq(self.rx_cdrhold)
+
+        # Reset sequences.
+        tx_lol = Signal()
+        rx_los = Signal()
+        self.submodules.tx_init = tx_init = ECP5SATATXInit(tx_lol)
+        self.submodules.rx_init = rx_init = ECP5SATARXInit()
+        self.comb += self.ready.eq(tx_init.done & rx_init.done)
+
+        # TX Datapath.
+        tx_idle = Signal()
+        tx_ei   = Signal()
+        tx_bus  = Signal(24)
+        self.specials += MultiReg(self.tx_idle, tx_idle, "sata_tx")
+        self.submodules.encoder = encoder = ClockDomainsRenamer("sata_tx")(Encoder(2, True))
+        self.submodules.oob_tx  = oob_tx  = ClockDomainsRenamer("sata_tx")(ECP5SATAOOBTX(tx_clk_freq))
+        align      = primitives["ALIGN"]
+        align_word = Signal()
+        self.sync.sata_tx += [
+            align_word.eq(~align_word),
+            tx_ei.eq(Mux(oob_tx.active, oob_tx.idle, tx_idle)),
+        ]
+        self.comb += [
+            self.sink.ready.eq(1),
+            If(oob_tx.active,
+                # ALIGNs (on 2 words) during OOB bursts.
+                encoder.k[0].eq(~align_word),
+                encoder.d[0].eq(Mux(align_word, (align >> 16) & 0xff, (align >>  0) & 0xff)),
+                encoder.d[1].eq(Mux(align_word, (align >> 24) & 0xff, (align >>  8) & 0xff)),
+            ).Else(
+                encoder.k[0].eq(self.sink.charisk[0]),
+                encoder.k[1].eq(self.sink.charisk[1]),
+                encoder.d[0].eq(self.sink.data[0:8]),
+                encoder.d[1].eq(self.sink.data[8:16]),
+            ),
+            tx_bus[ 0:10].eq(encoder.output[0]),
+            tx_bus[12:22].eq(encoder.output[1]),
+        ]
+
+        # RX Datapath.
+        rx_bus = Signal(24)
+        self.submodules.decoders = decoders = [
+            ClockDomainsRenamer("sata_rx")(Decoder(True)) for _ in range(2)]
+        self.sync.sata_rx += [
+            decoders[0].input.eq(rx_bus[ 0:10]),
+            decoders[1].input.eq(rx_bus[12:22]),
+        ]
+        self.comb += [
+            self.source.valid.eq(1),
+            self.source.charisk.eq(Cat(decoders[0].k, decoders[1].k)),
+            self.source.data.eq(Cat(decoders[0].d, decoders[1].d)),
+        ]
+
+        # OOB.
+        oob_rx = ECP5SATAOOBRX(rx_los, clk_freq)
+        self.submodules.oob_rx = oob_rx
+        self.specials += [
+            MultiReg(self.tx_cominit_stb, oob_tx.cominit, "sata_tx"),
+            MultiReg(self.tx_comwake_stb, oob_tx.comwake, "sata_tx"),
+        ]
+        tx_oob_done = Signal()
+        self.specials += MultiReg(oob_tx.done, tx_oob_done)
+        self.comb += [
+            self.tx_cominit_ack.eq(self.tx_cominit_stb & tx_oob_done),
+            self.tx_comwake_ack.eq(self.tx_comwake_stb & tx_oob_done),
+            self.rx_idle.eq(oob_rx.idle),
+            self.rx_cominit_stb.eq(oob_rx.cominit),
+            self.rx_comwake_stb.eq(oob_rx.comwake),
+        ]
+
+        # DCU resets/electrical idle/datapaths overrides (SerDesECP5's own init restarts the RX and
+        # Lanes on Loss Of Signal, which happens during OOB sequences).
+        serdes.serdes_params.update(
+            i_D_FFC_TRST          = tx_init.tx_rst,
+            i_CHX_FFC_LANE_TX_RST = tx_init.pcs_rst,
+            i_CHX_FFC_RRST        = rx_init.rx_rst,
+            i_CHX_FFC_LANE_RX_RST = rx_init.pcs_rst,
+            i_CHX_FFC_EI_EN       = tx_ei,
+            o_D_FFS_PLOL          = tx_lol,
+            o_CHX_FFS_RLOS        = rx_los,
+            **{"i_CHX_FF_TX_D_%d" % n: tx_bus[n] for n in range(tx_bus.nbits)},
+            **{"o_CHX_FF_RX_D_%d" % n: rx_bus[n] for n in range(rx_bus.nbits)},
+        )
+
+# LiteSATAECP5PHY ----------------------------------------------------------------------------------
+
+class LiteSATAECP5PHY(LiteSATAPHY):
+    """SATA PHY on ECP5-5G SerDes (DCU).
+
+    Drop-in replacement for LiteSATAPHY (LiteSATA's ECP5 PHY is not available in all releases),
+    reusing its vendor agnostic Control/Datapath. refclk is the SerDes reference clock (pads,
+    through the DCU's EXTREFB, or Signal), Gen1 and Gen2 require a 150MHz reference clock.
+    """
+    def __init__(self, refclk, tx_pads, rx_pads, gen, clk_freq, refclk_freq=150e6, dual=0,
+        channel=0, with_csr=True):
+        self.pads   = SimpleNamespace(tx=tx_pads, rx=rx_pads)
+        self.gen    = gen
+        self.refclk = refclk
+
+        # Control/Status
+        self.enable = Signal()
+        self.ready  = Signal()
+
+        # Transceiver / Clocks
+        if not isinstance(refclk, Signal):
+            refclk_pads = refclk
+            refclk      = Signal()
+            self.specials.extref = Instance("EXTREFB",
+                i_REFCLKP         = refclk_pads.p,
+                i_REFCLKN         = refclk_pads.n,
+                o_REFCLKO         = refclk,
+                p_REFCK_PWDNB     = "0b1",
+                p_REFCK_RTERM     = "0b1", # 100 Ohm
+                p_REFCK_DCBIAS_EN = "0b0",
+            )
+            self.extref.attr.add(("LOC", f"EXTREF{dual}"))
+        self.submodules.phy = ECP5LiteSATAPHY(refclk, tx_pads, rx_pads, gen, clk_freq,
+            refclk_freq = refclk_freq,
+            dual        = dual,
+            channel     = channel)
+        self.submodules.crg = ECP5LiteSATAPHYCRG(self.phy)
+
+        # Control
+        self.submodules.ctrl = LiteSATAPHYCtrl(self.phy, self.crg, clk_freq)
+
+        # Datapath
+        self.submodules.datapath = LiteSATAPHYDatapath(self.phy, self.ctrl)
+        self.comb += [
+            self.ctrl.rx_idle.eq(self.datapath.rx_idle),
+            self.ctrl.misalign.eq(self.datapath.misalign)
+        ]
+        self.sink, self.source = self.datapath.sink, self.datapath.source
+
+        # Restart/Status
+        self.comb += self.phy.tx_init.restart.eq(~self.enable)
+        self.comb += self.phy.rx_init.restart.eq(~self.enable | self.ctrl.rx_reset)
+        self.comb += self.ready.eq(self.phy.ready & self.ctrl.ready)
+
+        # CSRs
+        if with_csr:
+            self.add_csr()
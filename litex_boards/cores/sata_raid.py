@@ -0,0 +1,498 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from functools import reduce
+from operator import or_, add
+
+from migen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+from litesata.common import logical_sector_size
+
+# SATA Stripe Writer -------------------------------------------------------------------------------
+
+class LiteSATAStripeWriter(Module):
+    """Writes the stream received on sink to a SATA user port, stripe_sectors sectors per command.
+
+    A write command is only issued once a full stripe is buffered (the data is never missing during
+    the command), the n-th stripe since start being written at sector + n*stripe_sectors.
+    """
+    def __init__(self, port, stripe_sectors, fifo_depth):
+        self.sink        = sink = stream.Endpoint([("data", 32)])
+        self.start       = Signal()
+        self.sector      = Signal(48)
+        self.idle        = Signal()
+        self.failed      = Signal()
+        self.cmd_done    = Signal()   # Command completed.
+        self.cmd_latency = Signal(32) # Command latency (from issue to completion, in cycles).
+
+        # # #
+
+        stripe_dwords = stripe_sectors*logical_sector_size//4
+        assert fifo_depth >= stripe_dwords
+
+        # Stripe Buffer.
+        self.submodules.fifo = fifo = stream.SyncFIFO([("data", 32)], fifo_depth, buffered=True)
+        self.comb += sink.connect(fifo.sink)
+
+        # Write Commands.
+        sector = Signal(48)
+        count  = Signal(max=stripe_dwords)
+        self.comb += [
+            port.sink.write.eq(1),
+            port.sink.sector.eq(sector),
+            port.sink.count.eq(stripe_sectors),
+            port.sink.last.eq(count == (stripe_dwords - 1)),
+            port.sink.data.eq(fifo.source.data),
+        ]
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            self.idle.eq((fifo.level == 0) & ~sink.valid),
+            NextValue(count, 0),
+            If(fifo.level >= stripe_dwords,
+                NextState("SEND-CMD-AND-DATA")
+            )
+        )
+        fsm.act("SEND-CMD-AND-DATA",
+            port.sink.valid.eq(fifo.source.valid),
+            fifo.source.ready.eq(port.sink.ready),
+            If(port.sink.valid & port.sink.ready,
+                NextValue(count, count + 1),
+                If(port.sink.last,
+                    NextState("WAIT-ACK")
+                )
+            )
+        )
+        fsm.act("WAIT-ACK",
+            port.source.ready.eq(1),
+            If(port.source.valid,
+                NextState("IDLE")
+            )
+        )
+        self.comb += self.cmd_done.eq(fsm.ongoing("WAIT-ACK") & port.source.valid)
+        self.sync += [
+            If(self.start,
+                sector.eq(self.sector),
+                self.failed.eq(0),
+            ).Elif(self.cmd_done,
+                sector.eq(sector + stripe_sectors),
+                self.failed.eq(self.failed | port.source.failed),
+            ),
+            self.cmd_latency.eq(self.cmd_latency + 1),
+            If(fsm.ongoing("IDLE"),
+                self.cmd_latency.eq(0)
+            )
+        ]
+
+# SATA Stripe Reader -------------------------------------------------------------------------------
+
+class LiteSATAStripeReader(Module):
+    """Reads stripes of stripe_sectors sectors from a SATA user port to source.
+
+    Each stripe is read with a single command (issued when the buffer can hold the full stripe),
+    from consecutive sectors starting at sector; a stripe is read for each credit given with add.
+    """
+    def __init__(self, port, stripe_sectors, fifo_depth):
+        self.source      = source = stream.Endpoint([("data", 32)])
+        self.start       = Signal()
+        self.sector      = Signal(48)
+        self.add         = Signal()
+        self.idle        = Signal()
+        self.failed      = Signal()
+        self.cmd_done    = Signal()   # Command completed.
+        self.cmd_latency = Signal(32) # Command latency (from issue to completion, in cycles).
+
+        # # #
+
+        stripe_dwords = stripe_sectors*logical_sector_size//4
+        assert fifo_depth >= stripe_dwords
+
+        # Stripe Buffer.
+        self.submodules.fifo = fifo = stream.SyncFIFO([("data", 32)], fifo_depth, buffered=True)
+        self.comb += fifo.source.connect(source)
+
+        # Read Commands.
+        sector  = Signal(48)
+        credits = Signal(32)
+        self.comb += [
+            port.sink.last.eq(1),
+            port.sink.read.eq(1),
+            port.sink.sector.eq(sector),
+            port.sink.count.eq(stripe_sectors),
+            fifo.sink.data.eq(port.source.data),
+        ]
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            self.idle.eq(credits == 0),
+            If((credits != 0) & (fifo.level <= (fifo_depth - stripe_dwords)),
+                NextState("SEND-CMD")
+            )
+        )
+        fsm.act("SEND-CMD",
+            port.sink.valid.eq(1),
+            If(port.sink.ready,
+                NextState("RECEIVE-DATA")
+            )
+        )
+        fsm.act("RECEIVE-DATA",
+            # Data (buffer has room for the full stripe) then response (end).
+            fifo.sink.valid.eq(port.source.valid & ~port.source.end),
+            port.source.ready.eq(fifo.sink.ready | port.source.end),
+            If(port.source.valid & port.source.end,
+                NextState("IDLE")
+            )
+        )
+        done = self.cmd_done
+        self.comb += done.eq(fsm.ongoing("RECEIVE-DATA") & port.source.valid & port.source.end)
+        self.sync += [
+            If(self.start,
+                sector.eq(self.sector),
+                credits.eq(0),
+                self.failed.eq(0),
+            ).Else(
+                If(done,
+                    sector.eq(sector + stripe_sectors),
+                    self.failed.eq(self.failed | port.source.failed),
+                ),
+                credits.eq(credits + self.add - done),
+            ),
+            self.cmd_latency.eq(self.cmd_latency + 1),
+            If(fsm.ongoing("IDLE"),
+                self.cmd_latency.eq(0)
+            )
+        ]
+
+# SATA RAID-0 --------------------------------------------------------------------------------------
+
+class LiteSATARAID0(Module, AutoCSR):
+    """SATA RAID-0 (Striping) Streamer
+
+    Stripes a single logical stream over SATA drives (one LiteSATACrossbar per drive): stripe k (of
+    stripe_sectors sectors) is stored on drive k % n at sector + (k//n)*stripe_sectors, each drive
+    being written/read with stripe_sectors commands from its own stripe buffers (stripe_buffers
+    stripes for its Writer and Reader, 2 for double buffering), so the throughput scales with the
+    number of drives (up to sys_clk_freq*data_width).
+
+    - write: stripes*stripe_sectors*512 bytes received on sink are written to the drives.
+    - read:  stripes*stripe_sectors*512 bytes are read from the drives and sent to source (last on
+      the final word).
+
+    Unlike LiteSATAStriping (LiteSATA's RAID frontend, striping each dword over the drives), the
+    stripe size is configurable and large stripes keep the SSDs' command overhead low.
+    """
+    def __init__(self, crossbars, stripe_sectors=16, stripe_buffers=2, data_width=None,
+        with_csr=True):
+        n = len(crossbars)
+        if data_width is None:
+            data_width = 32*2**log2_int(n, need_pow2=False)
+        stripe_dwords = stripe_sectors*logical_sector_size//4
+        stripe_words  = stripe_dwords*32//data_width
+        assert stripe_buffers >= 1
+        assert (data_width % 32) == 0
+        assert (stripe_words*data_width) == (stripe_dwords*32)
+        self.n              = n
+        self.stripe_sectors = stripe_sectors
+
+        self.sink        = sink   = stream.Endpoint([("data", data_width)])
+        self.source      = source = stream.Endpoint([("data", data_width)])
+        self.write       = Signal() # Start write.
+        self.read        = Signal() # Start read.
+        self.sector      = Signal(48)
+        self.stripes     = Signal(32)
+        self.done        = Signal()
+        self.failed      = Signal()
+        self.cycles      = Signal(64)
+        self.latency_max = Signal(32) # Max command latency (in cycles).
+        self.latency_sum = Signal(64) # Sum of the command latencies (in cycles).
+
+        # # #
+
+        start = Signal()
+        self.comb += start.eq(self.write | self.read)
+
+        # Drives (Writer/Reader on their own ports of the Drive's crossbar).
+        writers, readers = [], []
+        fifo_depth       = stripe_buffers*stripe_dwords
+        for crossbar in crossbars:
+            writer = LiteSATAStripeWriter(crossbar.get_port(), stripe_sectors, fifo_depth)
+            reader = LiteSATAStripeReader(crossbar.get_port(), stripe_sectors, fifo_depth)
+            w_conv = stream.Converter(data_width, 32)
+            r_conv = stream.Converter(32, data_width)
+            self.submodules += writer, reader, w_conv, r_conv
+            self.comb += [
+                w_conv.source.connect(writer.sink),
+                reader.source.connect(r_conv.sink),
+                writer.start.eq(start),
+                writer.sector.eq(self.sector),
+                reader.start.eq(start),
+                reader.sector.eq(self.sector),
+            ]
+            writers.append((writer, w_conv))
+            readers.append((reader, r_conv))
+        self.comb += self.failed.eq(reduce(or_, [w.failed | r.failed
+            for (w, _), (r, _) in zip(writers, readers)]))
+
+        # Write: Dispatch sink's stripes to the Drives.
+        wr_active  = Signal()
+        wr_drive   = Signal(max=max(n, 2))
+        wr_words   = Signal(max=max(stripe_words, 2))
+        wr_stripes = Signal(32)
+        w_convs    = [c for _, c in writers]
+        for i, conv in enumerate(w_convs):
+            self.comb += [
+                conv.sink.valid.eq(sink.valid & wr_active & (wr_drive == i)),
+                conv.sink.data.eq(sink.data),
+            ]
+        self.comb += sink.ready.eq(wr_active & Array(c.sink.ready for c in w_convs)[wr_drive])
+        self.sync += [
+            If(self.write,
+                wr_active.eq(self.stripes != 0),
+                wr_drive.eq(0),
+                wr_words.eq(0),
+                wr_stripes.eq(self.stripes),
+            ).Elif(sink.valid & sink.ready,
+                wr_words.eq(wr_words + 1),
+                If(wr_words == (stripe_words - 1),
+                    wr_words.eq(0),
+                    wr_drive.eq(wr_drive + 1),
+                    If(wr_drive == (n - 1),
+                        wr_drive.eq(0)
+                    ),
+                    wr_stripes.eq(wr_stripes - 1),
+                    If(wr_stripes == 1,
+                        wr_active.eq(0)
+                    )
+                )
+            )
+        ]
+
+        # Read: Give read credits to the Drives (stripe k to drive k % n).
+        rd_assign_drive   = Signal(max=max(n, 2))
+        rd_assign_stripes = Signal(32)
+        self.sync += [
+            If(self.read,
+                rd_assign_drive.eq(0),
+                rd_assign_stripes.eq(self.stripes),
+            ).Elif(rd_assign_stripes != 0,
+                rd_assign_drive.eq(rd_assign_drive + 1),
+                If(rd_assign_drive == (n - 1),
+                    rd_assign_drive.eq(0)
+                ),
+                rd_assign_stripes.eq(rd_assign_stripes - 1),
+            )
+        ]
+        for i, (reader, _) in enumerate(readers):
+            self.comb += reader.add.eq((rd_assign_stripes != 0) & (rd_assign_drive == i))
+
+        # Read: Merge the Drives' stripes to source.
+        rd_active  = Signal()
+        rd_drive   = Signal(max=max(n, 2))
+        rd_words   = Signal(max=max(stripe_words, 2))
+        rd_stripes = Signal(32)
+        r_convs    = [c for _, c in readers]
+        for i, conv in enumerate(r_convs):
+            self.comb += conv.source.ready.eq(source.ready & rd_active & (rd_drive == i))
+        self.comb += [
+            source.valid.eq(rd_active & Array(c.source.valid for c in r_convs)[rd_drive]),
+            source.data.eq(Array(c.source.data for c in r_convs)[rd_drive]),
+            source.last.eq((rd_stripes == 1) & (rd_words == (stripe_words - 1))),
+        ]
+        self.sync += [
+            If(self.read,
+                rd_active.eq(self.stripes != 0),
+                rd_drive.eq(0),
+                rd_words.eq(0),
+                rd_stripes.eq(self.stripes),
+            ).Elif(source.valid & source.ready,
+                rd_words.eq(rd_words + 1),
+                If(rd_words == (stripe_words - 1),
+                    rd_words.eq(0),
+                    rd_drive.eq(rd_drive + 1),
+                    If(rd_drive == (n - 1),
+                        rd_drive.eq(0)
+                    ),
+                    rd_stripes.eq(rd_stripes - 1),
+                    If(rd_stripes == 1,
+                        rd_active.eq(0)
+                    )
+                )
+            )
+        ]
+
+        # Status.
+        busy = Signal()
+        self.comb += [
+            busy.eq(wr_active | rd_active | (rd_assign_stripes != 0) |
+                reduce(or_, [~w.idle | ~r.idle for (w, _), (r, _) in zip(writers, readers)])),
+            self.done.eq(~busy),
+        ]
+        self.sync += [
+            If(start,
+                self.cycles.eq(0)
+            ).Elif(busy,
+                self.cycles.eq(self.cycles + 1)
+            )
+        ]
+
+        # Command Latencies.
+        drives = [d for (w, _), (r, _) in zip(writers, readers) for d in [w, r]]
+        self.sync += [
+            If(start,
+                self.latency_max.eq(0),
+                self.latency_sum.eq(0),
+            ).Else(
+                self.latency_sum.eq(self.latency_sum +
+                    reduce(add, [Mux(d.cmd_done, d.cmd_latency, 0) for d in drives])),
+                *[If(d.cmd_done & (d.cmd_latency > self.latency_max),
+                    self.latency_max.eq(d.cmd_latency)
+                ) for d in drives],
+            )
+        ]
+
+        if with_csr:
+            self.add_csr()
+
+    def add_csr(self):
+        self._control     = CSRStorage(fields=[
+            CSRField("write", size=1, offset=0, pulse=True, description="Start write (Write ``1``)."),
+            CSRField("read",  size=1, offset=1, pulse=True, description="Start read (Write ``1``)."),
+        ])
+        self._sector      = CSRStorage(48, description="First sector (on each drive).")
+        self._stripes     = CSRStorage(32, description="Length (in stripes).")
+        self._status      = CSRStatus(fields=[
+            CSRField("done",   size=1, offset=0, description="Write/Read done."),
+            CSRField("failed", size=1, offset=1, description="A SATA command failed."),
+        ])
+        self._cycles      = CSRStatus(64, description="Write/Read duration (in sys_clk cycles).")
+        self._latency_max = CSRStatus(32, description="Max command latency (in sys_clk cycles).")
+        self._latency_sum = CSRStatus(64, description="Sum of the command latencies (in sys_clk cycles).")
+
+        # # #
+
+        self.comb += [
+            self.write.eq(self._control.fields.write),
+            self.read.eq(self._control.fields.read),
+            self.sector.eq(self._sector.storage),
+            self.stripes.eq(self._stripes.storage),
+            self._status.fields.done.eq(self.done),
+            self._status.fields.failed.eq(self.failed),
+            self._cycles.status.eq(self.cycles),
+            self._latency_max.status.eq(self.latency_max),
+            self._latency_sum.status.eq(self.latency_sum),
+        ]
+
+# SATA RAID-0 Bench --------------------------------------------------------------------------------
+
+class LiteSATARAID0Bench(Module, AutoCSR):
+    """Pattern Generator/Checker on a LiteSATARAID0
+
+    Feeds the RAID-0's sink with a counter pattern (always valid) on write and checks the data read
+    from its source (always ready), so the measured durations are the drives' ones (see
+    software/sata_raid_bench.py).
+    """
+    def __init__(self, raid):
+        self.errors = CSRStatus(32, description="Read errors (since last write/read).")
+
+        # # #
+
+        dw    = len(raid.sink.data)
+        lanes = dw//32
+
+        # Generator.
+        gen_count = Signal(32)
+        self.comb += [
+            raid.sink.valid.eq(1),
+            raid.sink.data.eq(Cat(*[(gen_count*lanes + i)[:32] for i in range(lanes)])),
+        ]
+        self.sync += [
+            If(raid.write,
+                gen_count.eq(0)
+            ).Elif(raid.sink.valid & raid.sink.ready,
+                gen_count.eq(gen_count + 1)
+            )
+        ]
+
+        # Checker.
+        chk_count = Signal(32)
+        errors    = self.errors.status
+        self.comb += raid.source.ready.eq(1)
+        self.sync += [
+            If(raid.read,
+                chk_count.eq(0),
+                errors.eq(0),
+            ).Elif(raid.source.valid & raid.source.ready,
+                chk_count.eq(chk_count + 1),
+                If(raid.source.data != Cat(*[(chk_count*lanes + i)[:32] for i in range(lanes)]),
+                    errors.eq(errors + 1)
+                )
+            )
+        ]
+
+# SoC Integration ----------------------------------------------------------------------------------
+
+def add_sata_raid0(soc, phys=None, name="sata_raid", stripe_sectors=16, stripe_buffers=2,
+    with_bench=True, crossbars=None):
+    """SATA RAID-0 on several SATA PHYs.
+
+    LiteX's add_sata only supports one PHY. Drive n uses phys[n] (whose sata_tx/sata_rx clock
+    domains are renamed to sata{n}_tx/sata{n}_rx) with its own LiteSATACore/LiteSATACrossbar
+    (soc.sata_core{n}/soc.sata_crossbar{n}) and Identify (soc.sata_identify{n}). The RAID-0 is
+    exposed as soc.{name} (and its Pattern Generator/Checker as soc.{name}_bench).
+
+    Existing crossbars can also be passed instead of phys (ex: the crossbar of SoC.add_sata, to
+    benchmark a single drive).
+    """
+    from litesata.core import LiteSATACore
+    from litesata.frontend.arbitration import LiteSATACrossbar
+    from litesata.frontend.identify import LiteSATAIdentify, LiteSATAIdentifyCSR
+
+    if phys is None:
+        phys = []
+    if crossbars is None:
+        crossbars = []
+    else:
+        assert len(phys) == 0
+    for n, phy in enumerate(phys):
+        # Check SATA PHY/System clock frequencies (SATA clock: Line rate/20 at 16-bit, /40 at
+        # 32-bit data-width; System clock: Line rate/40 for the 32-bit core).
+        data_width    = phy.phy.data_width
+        sata_clk_freq = {"gen1": 75e6, "gen2": 150e6, "gen3": 300e6}[phy.gen]*16/data_width
+        assert soc.sys_clk_freq >= sata_clk_freq*data_width/32
+
+        # PHY.
+        ClockDomainsRenamer({
+            "sata_tx": f"sata{n}_tx",
+            "sata_rx": f"sata{n}_rx"})(phy)
+
+        # Core/Crossbar.
+        core     = LiteSATACore(phy)
+        crossbar = LiteSATACrossbar(core)
+        setattr(soc.submodules, f"sata_core{n}",     core)
+        setattr(soc.submodules, f"sata_crossbar{n}", crossbar)
+        crossbars.append(crossbar)
+
+        # Identify.
+        identify = LiteSATAIdentifyCSR(LiteSATAIdentify(crossbar.get_port()))
+        setattr(soc.submodules, f"sata_identify{n}", identify)
+
+        # Timing constraints.
+        soc.platform.add_period_constraint(phy.crg.cd_sata_tx.clk, 1e9/sata_clk_freq)
+        soc.platform.add_period_constraint(phy.crg.cd_sata_rx.clk, 1e9/sata_clk_freq)
+        soc.platform.add_false_path_constraints(
+            soc.crg.cd_sys.clk,
+            phy.crg.cd_sata_tx.clk,
+            phy.crg.cd_sata_rx.clk)
+
+    # RAID-0.
+    raid = LiteSATARAID0(crossbars, stripe_sectors=stripe_sectors, stripe_buffers=stripe_buffers)
+    setattr(soc.submodules, name, raid)
+    soc.add_constant(f"{name.upper()}_DRIVES",         len(crossbars))
+    soc.add_constant(f"{name.upper()}_STRIPE_SECTORS", stripe_sectors)
+    if with_bench:
+        setattr(soc.submodules, f"{name}_bench", LiteSATARAID0Bench(raid))
+
+    return raid
@@ -0,0 +1,45 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SDR SDRAM Rate -----------------------------------------------------------------------------------
+
+# Min clock period (tCK in ns, CL3) of the SDR SDRAM parts fitted on the boards (slowest speedgrade
+# fitted): LiteDRAM's SDR modules only describe the speedgrade timings (tRP/tRCD/...), not tCK.
+sdr_tck = {
+    "AS4C16M16"   : 7.0, # -7  (143MHz).
+    "AS4C32M16"   : 7.0, # -7  (143MHz).
+    "IS42S16160"  : 7.0, # -7  (143MHz).
+    "IS42S16320"  : 7.0, # -7  (143MHz).
+    "M12L16161A"  : 6.0, # -6T (166MHz).
+    "M12L64322A"  : 6.0, # -6T (166MHz), also EM638325-6H.
+    "MT48LC16M16" : 7.5, # -75 (133MHz).
+}
+
+def sdram_max_clk_freq(module_cls):
+    """Returns the max SDRAM clock frequency of module_cls (from its tCK)."""
+    tck = sdr_tck.get(module_cls.__name__, None)
+    if tck is None:
+        raise ValueError(f"{module_cls.__name__}: tCK unknown, set the SDRAM rate explicitly.")
+    return 1e9/tck
+
+def sdram_rate_auto(module_cls, sys_clk_freq, rate="auto", max_clk_freq=None):
+    """Returns the GENSDRPHY rate for module_cls at sys_clk_freq.
+
+    With rate="auto", the Half-Rate PHY ("1:2", SDRAM clocked at 2x sys_clk_freq, doubling SDRAM
+    bandwidth) is selected when the SDRAM supports 2x sys_clk_freq, the Full-Rate PHY ("1:1")
+    otherwise. max_clk_freq optionally limits the SDRAM clock further (board routing/IOs).
+    """
+    if rate != "auto":
+        return rate
+    clk_freq = sdram_max_clk_freq(module_cls)
+    if max_clk_freq is not None:
+        clk_freq = min(clk_freq, max_clk_freq)
+    if sys_clk_freq > clk_freq:
+        raise ValueError("{}: sys_clk_freq {:3.2f}MHz exceeds SDRAM max frequency ({:3.2f}MHz).".format(
+            module_cls.__name__, sys_clk_freq/1e6, clk_freq/1e6))
+    rate = "1:2" if 2*sys_clk_freq <= clk_freq else "1:1"
+    print("SDRAM: {} rate selected for {:3.2f}MHz sys_clk_freq ({} max: {:3.2f}MHz).".format(
+        rate, sys_clk_freq/1e6, module_cls.__name__, clk_freq/1e6))
+    return rate
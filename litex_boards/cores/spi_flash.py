@@ -0,0 +1,303 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from functools import reduce
+from operator import or_
+
+from migen import *
+
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+from litex.soc.integration.soc import SoCRegion
+
+# SPI Flash XIP Opcodes ----------------------------------------------------------------------------
+
+# Read opcodes from the fastest to the slowest, for each pads mode. QPI (READ_4_4_4) is not used:
+# it shares its 0xeb code with READ_1_4_4 (so can't be selected on the module) and requires the
+# flash to be switched to QPI mode before the first MMAP access.
+spi_flash_xip_opcodes = {
+    "1x": [
+        "READ_1_1_1_DTR",
+        "READ_1_1_1_FAST",
+        "READ_1_1_1",
+    ],
+    "4x": [
+        "READ_1_4_4_DTR",
+        "READ_1_4_4",
+        "READ_1_1_4",
+        "READ_1_2_2_DTR",
+        "READ_1_2_2",
+        "READ_1_1_2",
+        "READ_1_1_1_DTR",
+        "READ_1_1_1_FAST",
+        "READ_1_1_1",
+    ],
+}
+
+def spi_flash_xip_opcode(module, mode="4x", rate="1:1"):
+    """Returns the fastest read opcode supported by the SPI Flash module (class) and the pads mode.
+
+    DTR opcodes are only supported by the 1:1 rate PHY (DDR SPI Clk generated from sys_clk).
+    """
+    from litespi.opcodes import SpiNorFlashOpCodes
+    for name in spi_flash_xip_opcodes[mode]:
+        if ("DTR" in name) and (rate != "1:1"):
+            continue
+        opcode = getattr(SpiNorFlashOpCodes, name)
+        if opcode in module.supported_opcodes:
+            return opcode
+    raise ValueError(f"No {mode} read opcode supported by {module.__name__}.")
+
+# SPI Flash Cache ----------------------------------------------------------------------------------
+
+class LiteSPIFlashCache(Module, AutoCSR):
+    """SPI Flash Read Cache
+
+    Direct-mapped read cache for the LiteSPI MMAP (the SPI Flash being read-only on the bus, writes
+    are acked and ignored). Lines are filled with sequential word reads that the MMAP turns into a
+    single SPI Flash burst. With prefetch, the next line is filled after each fill, continuing the
+    burst: hits are served during the fills, a prefetch being aborted (between two words) on a miss
+    on another line.
+
+    Lines are invalidated with the control/flush CSR or the invalidate signal (SPI Flash written
+    through the master, PHY configuration changes). The accesses, misses and stalls (bus cycles
+    waiting for a miss to be served) are counted for benchmarking (see software/spi_flash_bench.py).
+    """
+    def __init__(self, slave, size=1024, line_size=16, with_prefetch=True):
+        words_per_line = line_size//4
+        nlines         = size//line_size
+        assert words_per_line >= 2 and nlines >= 2
+        wordbits = log2_int(words_per_line)
+        linebits = log2_int(nlines)
+        tagbits  = len(slave.adr) - wordbits - linebits
+        self.bus        = bus = wishbone.Interface(data_width=32, adr_width=len(slave.adr))
+        self.invalidate = Signal()
+        self.control    = CSRStorage(fields=[
+            CSRField("flush", size=1, offset=0, pulse=True, description="Invalidate all lines."),
+            CSRField("clear", size=1, offset=1, pulse=True, description="Clear the counters."),
+        ])
+        self.accesses = CSRStatus(32, description="Bus read accesses.")
+        self.misses   = CSRStatus(32, description="Bus read accesses missing the cache.")
+        self.stalls   = CSRStatus(32, description="Bus cycles waiting for a miss to be served.")
+
+        # # #
+
+        # Address split: TAG | LINE | WORD.
+        adr_word = bus.adr[:wordbits]
+        adr_line = bus.adr[wordbits:wordbits + linebits]
+        adr_tag  = bus.adr[wordbits + linebits:]
+
+        # Line being filled (refill or prefetch).
+        fill_word  = Signal(wordbits)
+        fill_line  = Signal(linebits)
+        fill_tag   = Signal(tagbits)
+        fill_start = Signal()
+        fill_done  = Signal()
+        fill_stale = Signal()
+        self.comb += slave.adr.eq(Cat(fill_word, fill_line, fill_tag))
+
+        # Memories (data/tag, with a read port for the bus and a write port for the fills).
+        data_mem     = Memory(32, nlines*words_per_line)
+        data_rd_port = data_mem.get_port()
+        data_wr_port = data_mem.get_port(write_capable=True)
+        tag_mem      = Memory(tagbits, nlines)
+        tag_rd_port  = tag_mem.get_port()
+        tag_wr_port  = tag_mem.get_port(write_capable=True)
+        self.specials += data_mem, data_rd_port, data_wr_port, tag_mem, tag_rd_port, tag_wr_port
+        self.comb += [
+            data_rd_port.adr.eq(Cat(adr_word, adr_line)),
+            data_wr_port.adr.eq(Cat(fill_word, fill_line)),
+            data_wr_port.dat_w.eq(slave.dat_r),
+            tag_rd_port.adr.eq(adr_line),
+            tag_wr_port.adr.eq(fill_line),
+            tag_wr_port.dat_w.eq(fill_tag),
+            bus.dat_r.eq(data_rd_port.dat_r),
+        ]
+
+        # Valid bits: a line is invalid while being filled, and not set valid when an invalidation
+        # occurred during its fill.
+        valids     = Array(Signal() for _ in range(nlines))
+        start_line = Signal(linebits)
+        invalidate = Signal()
+        self.comb += invalidate.eq(self.invalidate | self.control.fields.flush)
+        self.sync += [
+            If(fill_start,
+                valids[start_line].eq(0),
+                fill_stale.eq(0)
+            ),
+            If(fill_done & ~fill_stale & ~invalidate,
+                valids[fill_line].eq(1)
+            ),
+            If(invalidate,
+                fill_stale.eq(1),
+                [valids[i].eq(0) for i in range(nlines)]
+            )
+        ]
+
+        # Bus FSM: hits are served while a line is being filled, misses request a refill.
+        hit       = Signal()
+        miss      = Signal()
+        miss_req  = Signal()
+        miss_fill = Signal()
+        self.comb += [
+            hit.eq(valids[adr_line] & (tag_rd_port.dat_r == adr_tag)),
+            miss_fill.eq((fill_line == adr_line) & (fill_tag == adr_tag)),
+        ]
+        self.submodules.bus_fsm = bus_fsm = FSM(reset_state="IDLE")
+        bus_fsm.act("IDLE",
+            If(bus.cyc & bus.stb,
+                NextState("TEST")
+            )
+        )
+        bus_fsm.act("TEST",
+            If(bus.we | hit,
+                bus.ack.eq(1),
+                NextState("IDLE")
+            ).Else(
+                miss.eq(1),
+                NextState("MISS")
+            )
+        )
+        bus_fsm.act("MISS",
+            miss_req.eq(1),
+            If(fill_done & miss_fill,
+                NextState("IDLE") # Test again.
+            )
+        )
+
+        # Fill FSM.
+        prefetch = Signal()
+        last     = Signal()
+        self.comb += last.eq(fill_word == (words_per_line - 1))
+        self.submodules.fill_fsm = fill_fsm = FSM(reset_state="IDLE")
+        fill_fsm.act("IDLE",
+            If(miss_req,
+                fill_start.eq(1),
+                start_line.eq(adr_line),
+                NextValue(fill_line, adr_line),
+                NextValue(fill_tag,  adr_tag),
+                NextValue(fill_word, 0),
+                NextState("FILL")
+            ).Elif(prefetch,
+                NextValue(prefetch, 0),
+                NextState("PREFETCH-TAG")
+            )
+        )
+        fill_fsm.act("PREFETCH-TAG",
+            NextState("PREFETCH-TEST")
+        )
+        fill_fsm.act("PREFETCH-TEST",
+            If(miss_req | (valids[fill_line] & (tag_wr_port.dat_r == fill_tag)),
+                NextState("IDLE")
+            ).Else(
+                fill_start.eq(1),
+                start_line.eq(fill_line),
+                NextValue(fill_word, 0),
+                NextState("FILL")
+            )
+        )
+        fill_fsm.act("FILL",
+            slave.cyc.eq(1),
+            slave.stb.eq(1),
+            If(slave.ack,
+                data_wr_port.we.eq(1),
+                NextValue(fill_word, fill_word + 1),
+                If(last,
+                    tag_wr_port.we.eq(1),
+                    fill_done.eq(1),
+                    # Prefetch the next line (continuing the SPI Flash burst).
+                    NextValue(Cat(fill_line, fill_tag), Cat(fill_line, fill_tag) + 1),
+                    NextValue(prefetch, with_prefetch),
+                    NextState("IDLE")
+                # Abort (line left invalid) on a miss on another line.
+                ).Elif(miss_req & ~miss_fill,
+                    NextState("IDLE")
+                )
+            )
+        )
+
+        # Counters (stalls: from the miss to the ack of the access, hits are not counted).
+        miss_pending = Signal()
+        self.sync += If(miss, miss_pending.eq(1)).Elif(bus.ack, miss_pending.eq(0))
+        self.sync += [
+            If(self.control.fields.clear,
+                self.accesses.status.eq(0),
+                self.misses.status.eq(0),
+                self.stalls.status.eq(0),
+            ).Else(
+                If(bus.cyc & bus.stb & bus.ack & ~bus.we,
+                    self.accesses.status.eq(self.accesses.status + 1)
+                ),
+                If(miss,
+                    self.misses.status.eq(self.misses.status + 1)
+                ),
+                If(miss | (miss_pending & ~bus.ack),
+                    self.stalls.status.eq(self.stalls.status + 1)
+                )
+            )
+        ]
+
+# SoC Integration ----------------------------------------------------------------------------------
+
+def add_spi_flash_xip(soc, module, name="spiflash", mode="4x", clk_freq=None, rate="1:1",
+    cache_size=1024, cache_line_size=16, with_prefetch=True, **kwargs):
+    """Adds an SPI Flash (SoC.add_spi_flash) in eXecute-In-Place performance mode.
+
+    - module is the SPI Flash module class: it is configured with its fastest read opcode for the
+      pads mode (see spi_flash_xip_opcode).
+    - the SPI Clk is the highest one <= clk_freq (default: sys_clk_freq/2) with the 1:1 rate PHY
+      (add_spi_flash defaults to sys_clk_freq/4); with the 1:2 rate PHY, it is sys_clk_freq.
+    - a LiteSPIFlashCache (cache_size bytes, cache_line_size bytes lines, with next line prefetch)
+      is inserted between the bus and the LiteSPI MMAP.
+
+    The same constants as add_spi_flash are generated, so the BIOS/firmwares are unchanged.
+    """
+    from litespi import LiteSPI
+    from litespi.phy.generic import LiteSPIPHY
+    from litespi.opcodes import SpiNorFlashOpCodes
+
+    # Checks/Parameters.
+    assert mode in ["1x", "4x"]
+    assert rate in ["1:1", "1:2"]
+    if clk_freq is None: clk_freq = soc.sys_clk_freq/2
+    module  = module(spi_flash_xip_opcode(module, mode=mode, rate=rate))
+    divisor = max(int(-(-soc.sys_clk_freq//(2*clk_freq))) - 1, 0) # SPI Clk: sys_clk/(2*(1+div)).
+
+    # PHY.
+    soc.check_if_exists(name + "_phy")
+    pads = soc.platform.request(name if mode == "1x" else name + mode)
+    phy  = LiteSPIPHY(pads, module, device=soc.platform.device, default_divisor=divisor, rate=rate)
+    setattr(soc.submodules, name + "_phy", phy)
+
+    # Core.
+    soc.check_if_exists(name + "_core")
+    core = LiteSPI(phy, mmap_endianness=soc.cpu.endianness, **kwargs)
+    setattr(soc.submodules, name + "_core", core)
+
+    # Cache.
+    cache = LiteSPIFlashCache(core.bus,
+        size          = cache_size,
+        line_size     = cache_line_size,
+        with_prefetch = with_prefetch)
+    setattr(soc.submodules, name + "_cache", cache)
+    invalidate = []
+    if hasattr(phy.phy, "clk_divisor"):
+        invalidate.append(phy.phy.clk_divisor.re)
+    if hasattr(core, "mmap") and hasattr(core.mmap, "dummy_bits"):
+        invalidate.append(core.mmap.dummy_bits.re)
+    if hasattr(core, "master"):
+        invalidate.append(core.master.cs)
+    soc.comb += cache.invalidate.eq(reduce(or_, invalidate, 0))
+    region = SoCRegion(origin=soc.mem_map.get(name, None), size=module.total_size)
+    soc.bus.add_slave(name=name, slave=cache.bus, region=region)
+
+    # Constants.
+    soc.add_constant(f"{name}_PHY_FREQUENCY",     soc.sys_clk_freq)
+    soc.add_constant(f"{name}_MODULE_NAME",       module.name.upper())
+    soc.add_constant(f"{name}_MODULE_TOTAL_SIZE", module.total_size)
+    soc.add_constant(f"{name}_MODULE_PAGE_SIZE",  module.page_size)
+    if SpiNorFlashOpCodes.READ_1_1_4 in module.supported_opcodes:
+        soc.add_constant(f"{name}_MODULE_QUAD_CAPABLE")
+    return module.read_opcode
@@ -0,0 +1,189 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+from liteeth.common import convert_ip
+
+from litedram.frontend.dma import LiteDRAMDMAReader
+
+# Constants ----------------------------------------------------------------------------------------
+
+UDP_DRAM_HEADER_LENGTH = 8 # Sequence number (32-bit LE) + DRAM byte offset (32-bit LE).
+
+# LiteDRAM -> UDP Streamer -------------------------------------------------------------------------
+
+class LiteEthUDPDRAMStreamer(Module, AutoCSR):
+    """LiteDRAM -> UDP Streamer
+
+    Reads a DRAM region through a dedicated LiteDRAM native port and sends it as UDP packets, at
+    Ethernet line rate and without going through the CPU/Wishbone bus.
+
+    Each packet carries a header (32-bit sequence number and 32-bit byte offset of the data in
+    DRAM, little-endian) followed by up to payload bytes of data, allowing the Host to reassemble
+    the region and detect lost packets (see litex_boards/software/udp_dram_dump.py). The offset is
+    absolute (not relative to base) so that late packets of a previous run still land at the right
+    place on the Host.
+
+    The region is programmed through base (byte offset in DRAM) and length (in bytes) CSRs; base,
+    length and payload have to be multiples of alignment bytes (DRAM word and udp_port's data
+    width), otherwise start is refused and the error status is set. A gap (in sys_clk cycles) can
+    be inserted between packets to pace the stream for slow Hosts.
+    """
+    def __init__(self, udp_port, dram_port, src_port=5000, fifo_depth=256):
+        dw         = len(udp_port.sink.data)
+        word_bytes = dram_port.data_width//8
+        assert (64 % dw) == 0
+        self.alignment = alignment = max(word_bytes, dw//8)
+        self.control = CSRStorage(fields=[
+            CSRField("start", size=1, offset=0, pulse=True, description="Start (Write ``1``)."),
+        ])
+        self.base       = CSRStorage(32, description="Region base (byte offset in DRAM).")
+        self.length     = CSRStorage(32, description="Region length (in bytes).")
+        self.ip_address = CSRStorage(32, reset=convert_ip("192.168.1.100"), description="Dest. IP.")
+        self.udp_port   = CSRStorage(16, reset=src_port, description="Destination UDP port.")
+        self.payload    = CSRStorage(16, reset=1024, description="Max payload (bytes, w/o header).")
+        self.gap        = CSRStorage(32, description="Inter-packet gap (in sys_clk cycles).")
+        self.status     = CSRStatus(fields=[
+            CSRField("done",  size=1, offset=0, description="Streaming done."),
+            CSRField("error", size=1, offset=1, description="Start refused (unaligned)."),
+        ])
+        self.packets    = CSRStatus(32, description="Number of packets sent.")
+
+        # # #
+
+        # DRAM Reader.
+        reader = LiteDRAMDMAReader(dram_port, fifo_depth=fifo_depth, fifo_buffered=True)
+        conv   = stream.Converter(dram_port.data_width, dw)
+        self.submodules += reader, conv
+        self.comb += reader.source.connect(conv.sink)
+
+        start        = Signal()
+        rd_address   = Signal(dram_port.address_width)
+        rd_remaining = Signal(32)
+        self.comb += [
+            reader.sink.valid.eq(rd_remaining != 0),
+            reader.sink.address.eq(rd_address),
+        ]
+        self.sync += [
+            If(start,
+                rd_address.eq(self.base.storage[log2_int(word_bytes):]),
+                rd_remaining.eq(self.length.storage[log2_int(word_bytes):]),
+            ).Elif(reader.sink.valid & reader.sink.ready,
+                rd_address.eq(rd_address + 1),
+                rd_remaining.eq(rd_remaining - 1),
+            )
+        ]
+
+        # Packetizer.
+        source    = udp_port.sink
+        remaining = Signal(32)
+        size      = Signal(16)
+        seq       = Signal(32)
+        offset    = Signal(32)
+        count     = Signal(16)
+        gap       = Signal(32)
+        header    = Signal(64)
+        last      = Signal()
+        aligned   = Signal()
+        error     = Signal()
+        self.comb += [
+            aligned.eq(
+                (self.base.storage[:log2_int(alignment)]    == 0) &
+                (self.length.storage[:log2_int(alignment)]  == 0) &
+                (self.payload.storage[:log2_int(alignment)] == 0) &
+                (self.payload.storage != 0)),
+            self.status.fields.error.eq(error),
+            header.eq(Cat(seq, offset)),
+            last.eq(count == (size[log2_int(dw//8):] - 1)),
+            source.src_port.eq(src_port),
+            source.dst_port.eq(self.udp_port.storage),
+            source.ip_address.eq(self.ip_address.storage),
+            source.length.eq(size + UDP_DRAM_HEADER_LENGTH),
+            source.last_be.eq(Mux(source.last, 1 << (dw//8 - 1), 0)),
+        ]
+
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            self.status.fields.done.eq(1),
+            If(self.control.fields.start,
+                NextValue(error, ~aligned),
+                If(aligned,
+                    start.eq(1),
+                    NextValue(remaining, self.length.storage),
+                    NextValue(seq, 0),
+                    NextValue(offset, self.base.storage),
+                    NextValue(self.packets.status, 0),
+                    NextState("NEXT"),
+                )
+            )
+        )
+        fsm.act("NEXT",
+            NextValue(count, 0),
+            NextValue(gap, self.gap.storage),
+            NextValue(size, Mux(remaining < self.payload.storage, remaining, self.payload.storage)),
+            If(remaining == 0,
+                NextState("IDLE"),
+            ).Else(
+                NextState("GAP"),
+            )
+        )
+        fsm.act("GAP",
+            NextValue(gap, gap - 1),
+            If(gap == 0,
+                NextState("HEADER"),
+            )
+        )
+        fsm.act("HEADER",
+            source.valid.eq(1),
+            source.data.eq(Array(header[i*dw:(i + 1)*dw] for i in range(64//dw))[count]),
+            If(source.ready,
+                NextValue(count, count + 1),
+                If(count == (64//dw - 1),
+                    NextValue(count, 0),
+                    NextState("DATA"),
+                )
+            )
+        )
+        fsm.act("DATA",
+            conv.source.connect(source, keep={"valid", "ready", "data"}),
+            source.last.eq(last),
+            If(source.valid & source.ready,
+                NextValue(count, count + 1),
+                If(last,
+                    NextValue(seq, seq + 1),
+                    NextValue(offset, offset + size),
+                    NextValue(remaining, remaining - size),
+                    NextValue(self.packets.status, self.packets.status + 1),
+                    NextState("NEXT"),
+                )
+            )
+        )
+
+# SoC Integration ----------------------------------------------------------------------------------
+
+def add_udp_dram_streamer(soc, name="udp_streamer", src_port=5000, ethcore=None, udp_port=None):
+    """Adds a LiteEthUDPDRAMStreamer to the UDP/IP core of the SoC's Etherbone.
+
+    The Streamer uses a 32-bit (or the core's data width if larger) UDP port in the sys clock
+    domain: sys_clk_freq*32 has to be > 1Gbps for 1Gbps line rate. Another UDP/IP core can be
+    selected with ethcore, or a UDP user port in the sys clock domain provided with udp_port.
+    """
+    assert hasattr(soc, "sdram"), "UDP DRAM Streamer requires DRAM."
+    if udp_port is None:
+        ethcore  = ethcore or getattr(soc, "ethcore_etherbone", None) or getattr(soc, "ethcore")
+        dw       = max(32, ethcore.udp.crossbar.dw)
+        # add_etherbone renames the 8-bit core's sys clock domain: use its sys clock alias.
+        cd       = "etherbone" if hasattr(soc, "cd_etherbone") else "sys"
+        udp_port = ethcore.udp.crossbar.get_port(src_port, dw=dw, cd=cd)
+    streamer = LiteEthUDPDRAMStreamer(udp_port,
+        dram_port = soc.sdram.crossbar.get_port(mode="read"),
+        src_port  = src_port)
+    setattr(soc.submodules, name, streamer)
+    # Exported for the Host (base/length/payload alignment, in bytes).
+    soc.add_constant(f"{name}_alignment", streamer.alignment)
@@ -140,6 +140,7 @@ _io = [
 class Platform(XilinxPlatform):
     default_clk_name   = "clk100"
     default_clk_period = 1e9/100e6
+    config_flash       = ("S25FL128S", 4) # Configuration SPI Flash (part, bus width).
 
     def __init__(self, device="xc7k160tffg676-1", toolchain="vivado"):
         XilinxPlatform.__init__(self, device, _io, toolchain=toolchain)
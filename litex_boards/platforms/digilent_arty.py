@@ -337,6 +337,7 @@ _numato_sdcard_pmod_io = numato_sdcard_pmod_io("pmodd") # SDCARD PMOD on JD.
 class Platform(XilinxPlatform):
     default_clk_name   = "clk100"
     default_clk_period = 1e9/100e6
+    config_flash       = ("S25FL128L", 4) # Configuration SPI Flash (part, bus width).
 
     def __init__(self, variant="a7-35", toolchain="vivado"):
         device = {
@@ -206,6 +206,7 @@ _connectors = [
 class Platform(XilinxPlatform):
     default_clk_name   = "clk100"
     default_clk_period = 1e9/100e6
+    config_flash       = ("S25FL128S", 4) # Configuration SPI Flash (part, bus width).
 
     def __init__(self, variant="s7-50", toolchain="vivado"):
         device = {
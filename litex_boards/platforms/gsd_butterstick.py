@@ -185,6 +185,7 @@ def raw_syzygy_io(syzygy, iostandard="LVCMOS33"):
 class Platform(LatticePlatform):
     default_clk_name   = "clk30"
     default_clk_period = 1e9/30e6
+    config_flash       = ("W25Q128JV", 4) # Configuration SPI Flash (part, bus width).
 
     def __init__(self, revision="1.0", device="85F", toolchain="trellis", **kwargs):
         assert revision in ["1.0"]
@@ -127,6 +127,7 @@ _connectors = [
 class Platform(LatticePlatform):
     default_clk_name   = "clk50"
     default_clk_period = 1e9/506
+    config_flash       = ("W25Q128JV", 4) # Configuration SPI Flash (part, bus width).
 
     def __init__(self, toolchain="trellis", **kwargs):
         LatticePlatform.__init__(self, "LFE5UM5G-45F-8BG381I", _io, _connectors, toolchain=toolchain, **kwargs)
@@ -137,6 +137,7 @@ _connectors = [
 class Platform(XilinxPlatform):
     default_clk_name   = "clk50"
     default_clk_period = 1e9/50e6
+    config_flash       = ("MT25QL128", 4) # Configuration SPI Flash (part, bus width).
 
     # these resources conflict with daughterboard resources
     # so they are only used if the daughterboard is not present
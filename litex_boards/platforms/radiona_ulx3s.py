@@ -193,6 +193,7 @@ _io_2_0 = [
 class Platform(LatticePlatform):
     default_clk_name   = "clk25"
     default_clk_period = 1e9/25e6
+    config_flash       = ("IS25LP128", 4) # Configuration SPI Flash (part, bus width).
 
     def __init__(self, device="LFE5U-45F", revision="2.0", toolchain="trellis", **kwargs):
         assert device in ["LFE5U-12F", "LFE5U-25F", "LFE5U-45F", "LFE5U-85F"]
@@ -250,6 +250,7 @@ _connectors = [
 class Platform(XilinxPlatform):
     default_clk_name   = "clk156"
     default_clk_period = 1e9/156.5e6
+    config_flash       = ("N25Q256A", 4) # Configuration SPI Flash (part, bus width).
 
     def __init__(self, toolchain="vivado"):
         XilinxPlatform.__init__(self, "xc7a200t-fbg676-2", _io, _connectors, toolchain=toolchain)
@@ -287,6 +287,17 @@ _io = [
         Subsignal("tx_p",  Pins("AF7 AG9 AH7 AJ9")),
     ),
 
+    # PCIe
+    ("pcie_x8", 0,
+        Subsignal("rst_n", Pins("BD21"), IOStandard("LVCMOS12")),
+        Subsignal("clk_n", Pins("AM10")),
+        Subsignal("clk_p", Pins("AM11")),
+        Subsignal("rx_n",  Pins("AF1 AG3 AH1 AJ3 AK1 AL3 AM1 AN3")),
+        Subsignal("rx_p",  Pins("AF2 AG4 AH2 AJ4 AK2 AL4 AM2 AN4")),
+        Subsignal("tx_n",  Pins("AF6 AG8 AH6 AJ8 AK6 AL8 AM6 AN8")),
+        Subsignal("tx_p",  Pins("AF7 AG9 AH7 AJ9 AK7 AL9 AM7 AN9")),
+    ),
+
     # QSFP28
     ("qsfp28", 0,
         Subsignal("clk_n", Pins("K10")),
@@ -294,11 +305,11 @@ _io = [
         Subsignal("fs0", Pins("AT20"), IOStandard("LVCMOS12")),
         Subsignal("fs1", Pins("AU22"), IOStandard("LVCMOS12")),
         Subsignal("intl", Pins("BE21")),
-        Subsignal("lpmode", Pins("BD18")),
+        Subsignal("lpmode", Pins("BD18"), IOStandard("LVCMOS12")),
         Subsignal("modprsl", Pins("BE20")),
         Subsignal("modskll", Pins("BE16")),
         Subsignal("refclk_reset", Pins("AT22"), IOStandard("LVCMOS12")),
-        Subsignal("resetl", Pins("BE17")),
+        Subsignal("resetl", Pins("BE17"), IOStandard("LVCMOS12")),
         Subsignal("rxn", Pins("N3 M1 L3 K1")),
         Subsignal("rxp", Pins("N4 M2 L4 K2")),
         Subsignal("txn", Pins("N8 M6 L8 K6")),
@@ -310,11 +321,11 @@ _io = [
         Subsignal("fs0", Pins("AR22"), IOStandard("LVCMOS12")),
         Subsignal("fs1", Pins("AU20"), IOStandard("LVCMOS12")),
         Subsignal("intl", Pins("AV21")),
-        Subsignal("lpmode", Pins("AV22")),
+        Subsignal("lpmode", Pins("AV22"), IOStandard("LVCMOS12")),
         Subsignal("modprsl", Pins("BC19")),
         Subsignal("modskll", Pins("AY20")),
         Subsignal("refclk_reset", Pins("AR21"), IOStandard("LVCMOS12")),
-        Subsignal("resetl", Pins("BC18")),
+        Subsignal("resetl", Pins("BC18"), IOStandard("LVCMOS12")),
         Subsignal("rxn", Pins("U3 T1 R3 P1")),
         Subsignal("rxp", Pins("U4 T2 R4 P2")),
         Subsignal("txn", Pins("U8 T6 R8 P6")),
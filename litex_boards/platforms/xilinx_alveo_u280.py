@@ -179,6 +179,17 @@ _io = [
         Subsignal("tx_p",  Pins("AL11 AM9 AN11 AP9")),
     ),
 
+    # PCIe (hardware tests in progress)
+    ("pcie_x8", 0,
+        Subsignal("rst_n", Pins("BH26"), IOStandard("LVCMOS18")),
+        Subsignal("clk_n", Pins("AR14")),
+        Subsignal("clk_p", Pins("AR15")),
+        Subsignal("rx_n",  Pins("AL1 AM3 AN5 AN1 AP3 AR1 AT3 AU1")),
+        Subsignal("rx_p",  Pins("AL2 AM4 AN6 AN2 AP4 AR2 AT4 AU2")),
+        Subsignal("tx_n",  Pins("AL10 AM8 AN10 AP8 AR10 AR6 AT8 AU10")),
+        Subsignal("tx_p",  Pins("AL11 AM9 AN11 AP9 AR11 AR7 AT9 AU11")),
+    ),
+
     # QSFP28 (not tested on hardware)
     ("qsfp28", 0,
         Subsignal("clk_n", Pins("R41")),
@@ -186,11 +197,11 @@ _io = [
         #Subsignal("fs0", Pins(""), IOStandard("LVCMOS18")), # not found in u280 pins
         #Subsignal("fs1", Pins(""), IOStandard("LVCMOS18")), # not found in u280 pins
         Subsignal("intl", Pins("B32")),
-        Subsignal("lpmode", Pins("C29")),
+        Subsignal("lpmode", Pins("C29"), IOStandard("LVCMOS18")),
         Subsignal("modprsl", Pins("A33")),
         Subsignal("modskll", Pins("A31")),
         #Subsignal("refclk_reset", Pins(""), IOStandard("LVCMOS12")), # not found in u280 pins
-        Subsignal("resetl", Pins("B30")),
+        Subsignal("resetl", Pins("B30"), IOStandard("LVCMOS18")),
         Subsignal("rxn", Pins("L54 K52 J54 H52")),
         Subsignal("rxp", Pins("L53 K51 J53 H51")),
         Subsignal("txn", Pins("L49 L45 K47 J49")),
@@ -202,11 +213,11 @@ _io = [
         #Subsignal("fs0", Pins(""), IOStandard("LVCMOS18")), # not found in u280 pins
         #Subsignal("fs1", Pins(""), IOStandard("LVCMOS18")), # not found in u280 pins
         Subsignal("intl", Pins("E29")),
-        Subsignal("lpmode", Pins("F29")),
+        Subsignal("lpmode", Pins("F29"), IOStandard("LVCMOS18")),
         Subsignal("modprsl", Pins("F33")),
         Subsignal("modskll", Pins("D30")),
         #Subsignal("refclk_reset", Pins(""), IOStandard("LVCMOS12")), # not found in u280 pins
-        Subsignal("resetl", Pins("E33")),
+        Subsignal("resetl", Pins("E33"), IOStandard("LVCMOS18")),
         Subsignal("rxn", Pins("G54 F52 E54 D52")),
         Subsignal("rxp", Pins("G53 F51 E53 D51")),
         Subsignal("txn", Pins("G49 E49 C49 A50")),
@@ -543,6 +543,7 @@ _connectors = [
 class Platform(XilinxPlatform):
     default_clk_name   = "clk156"
     default_clk_period = 1e9/156.5e6
+    config_flash       = ("N25Q128A", 4) # Configuration SPI Flash (part, bus width).
 
     def __init__(self, toolchain="vivado"):
         XilinxPlatform.__init__(self, "xc7k325t-ffg900-2", _io, _connectors, toolchain=toolchain)
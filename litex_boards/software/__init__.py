@@ -0,0 +1,40 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import shutil
+
+from litex.build import tools
+
+from litex.soc.integration.export import get_csr_csv
+
+# LitePCIe Software --------------------------------------------------------------------------------
+
+_litepcie_python_modules = ["litepcie_host.py", "litepcie_dma.py"]
+
+def generate_litepcie_python(soc, dst):
+    """Python bindings (litepcie_host/litepcie_dma) for the driver, with the SoC's csr.csv."""
+    os.makedirs(dst, exist_ok=True)
+    src = os.path.dirname(os.path.abspath(__file__))
+    for module in _litepcie_python_modules:
+        shutil.copy(os.path.join(src, module), os.path.join(dst, module))
+    tools.write_to_file(os.path.join(dst, "__init__.py"), "\n".join([
+        "import os",
+        "",
+        "from .litepcie_host import LitePCIeDevice, LitePCIeBAR",
+        "",
+        "CSR_CSV = os.path.join(os.path.dirname(__file__), \"csr.csv\")",
+        "",
+    ]))
+    tools.write_to_file(os.path.join(dst, "csr.csv"), get_csr_csv(
+        csr_regions = soc.csr_regions,
+        constants   = soc.constants,
+        mem_regions = soc.mem_regions))
+
+def generate_litepcie_software(soc, dst):
+    """LitePCIe kernel driver/user-space utilities, with the Python bindings in dst/python/litepcie_soc."""
+    from litepcie.software import generate_litepcie_software as _generate_litepcie_software
+    _generate_litepcie_software(soc, dst)
+    generate_litepcie_python(soc, os.path.join(dst, "python", "litepcie_soc"))
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Batched/pipelined Etherbone client: accesses are split in records of up to 255 words (the maximum
+# of an Etherbone record) and several records are kept in flight, instead of CommUDP's single
+# request/response round trip per access. Best used with targets built with --etherbone-burst
+# (LiteEthEtherboneBurst, buffering the requests in flight), works with the default Etherbone
+# when used with --window=1.
+#
+# python3 -m litex_boards.software.etherbone_batch --csr-csv=build/<target>/csr.csv dump dump.bin \
+#     --address=0x40000000 --length=0x100000
+# python3 -m litex_boards.software.etherbone_batch --csr-csv=build/<target>/csr.csv load dump.bin \
+#     --address=0x40000000
+# python3 -m litex_boards.software.etherbone_batch --csr-csv=build/<target>/csr.csv bench
+#
+# CommUDPBatch can also be used directly from scripts (bus.read(addr, length), bus.write(addr,
+# datas), bus.regs...) as a drop-in replacement of CommUDP.
+
+import sys
+import time
+import socket
+import struct
+import argparse
+
+from litex.tools.remote.etherbone import EtherbonePacket, EtherboneRecord
+from litex.tools.remote.etherbone import EtherboneReads, EtherboneWrites
+from litex.tools.remote.comm_udp import CommUDP
+
+# Constants ----------------------------------------------------------------------------------------
+
+ETHERBONE_RECORD_MAX_WORDS = 255
+
+# CommUDPBatch -------------------------------------------------------------------------------------
+
+class CommUDPBatch(CommUDP):
+    """CommUDP with batched/pipelined accesses.
+
+    Reads/writes are split in records of up to max_words words, with up to window requests in
+    flight and lost requests sent again after timeout. Multi-word writes are verified by reading
+    back all their words (in a separate record: write+read records are not supported by LiteEth's
+    Etherbone) and written again on mismatch; single-word writes (CSRs) are posted, as with CommUDP.
+    """
+    def __init__(self, server="192.168.1.50", port=1234, csr_csv=None, debug=False, timeout=0.2,
+        window    = 3,
+        max_words = ETHERBONE_RECORD_MAX_WORDS,
+        retries   = 10):
+        CommUDP.__init__(self, server=server, port=port, csr_csv=csr_csv, debug=debug,
+            timeout=timeout)
+        assert 1 <= max_words <= ETHERBONE_RECORD_MAX_WORDS
+        self.window    = window
+        self.max_words = max_words
+        self.retries   = retries
+
+    def _send_record(self, record):
+        packet = EtherbonePacket()
+        packet.records = [record]
+        packet.encode()
+        self.socket.sendto(packet.bytes, (self.server, self.port))
+
+    def _send(self, addr, length, datas):
+        # Writes.
+        if datas is not None:
+            record = EtherboneRecord()
+            record.writes = EtherboneWrites(base_addr=addr, datas=iter(datas))
+            record.wcount = len(record.writes)
+            self._send_record(record)
+            if length == 1:
+                return None
+            # Verify with a read back of the written words.
+
+        # Reads.
+        self.read_counter = (self.read_counter + 1) & 0xffffffff
+        record = EtherboneRecord()
+        record.reads  = EtherboneReads(addrs=[addr + 4*j for j in range(length)])
+        record.rcount = len(record.reads)
+        record.reads.base_ret_addr = self.read_counter
+        self._send_record(record)
+        return self.read_counter
+
+    def _transfer(self, requests):
+        # requests: list of (addr, length, datas); datas is None for reads.
+        results = [None]*len(requests)
+        pending = {} # id -> request index.
+        index   = 0
+        retries = 0
+        while (index < len(requests)) or pending:
+            # Keep window requests in flight.
+            while (index < len(requests)) and (len(pending) < self.window):
+                id = self._send(*requests[index])
+                if id is not None:
+                    pending[id] = index
+                index += 1
+            if not pending:
+                continue
+
+            # Receive responses (matched on their base return address).
+            try:
+                datas, _ = self.socket.recvfrom(8192)
+            except socket.timeout:
+                retries += 1
+                if retries > self.retries:
+                    raise
+                if self.debug:
+                    print(f"socket timeout, sending {len(pending)} request(s) again.")
+                for id, i in list(pending.items()):
+                    del pending[id]
+                    pending[self._send(*requests[i])] = i
+                continue
+            packet = EtherbonePacket(datas)
+            packet.decode()
+            if packet.pr or not packet.records:
+                continue
+            record = packet.records.pop()
+            i = pending.pop(record.writes.base_addr, None)
+            if i is None:
+                continue
+            results[i] = record.writes.get_datas()
+
+            # Write not verified (lost/partial): write again.
+            datas = requests[i][2]
+            if (datas is not None) and (results[i] != list(datas)):
+                retries += 1
+                if retries > self.retries:
+                    raise OSError(f"Write @ 0x{requests[i][0]:08x} failed.")
+                pending[self._send(*requests[i])] = i
+        return results
+
+    def _split(self, addr, length, datas=None):
+        return [(addr + 4*i, min(self.max_words, length - i),
+            None if datas is None else datas[i:i + self.max_words])
+            for i in range(0, length, self.max_words)]
+
+    def read(self, addr, length=None, burst="incr"):
+        assert burst == "incr"
+        length_int = 1 if length is None else length
+        datas = []
+        for r in self._transfer(self._split(addr, length_int)):
+            datas += r
+        if self.debug:
+            for i, value in enumerate(datas):
+                print("read 0x{:08x} @ 0x{:08x}".format(value, addr + 4*i))
+        return datas[0] if length is None else datas
+
+    def write(self, addr, datas):
+        datas = datas if isinstance(datas, list) else [datas]
+        self._transfer(self._split(addr, len(datas), datas))
+        if self.debug:
+            for i, value in enumerate(datas):
+                print("write 0x{:08x} @ 0x{:08x}".format(value, addr + 4*i))
+
+# Run ----------------------------------------------------------------------------------------------
+
+def _default_address(bus):
+    for name in ["main_ram", "sram"]:
+        if hasattr(bus.mems, name):
+            return getattr(bus.mems, name).base
+    raise ValueError("No main_ram/sram in csr.csv, use --address.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched/pipelined Etherbone client.")
+    parser.add_argument("command",   choices=["dump", "load", "bench"], help="Dump memory to file, load file to memory or bench accesses.")
+    parser.add_argument("filename",  nargs="?",                          help="Dump/Load file.")
+    parser.add_argument("--ip",      default="192.168.1.50",             help="Board IP address.")
+    parser.add_argument("--udp-port", default=1234, type=int,            help="Etherbone UDP port.")
+    parser.add_argument("--csr-csv", default="csr.csv",                  help="SoC CSV file.")
+    parser.add_argument("--address", default=None,                       help="Memory address (default: main_ram or sram base).")
+    parser.add_argument("--length",  default="0x10000",                  help="Dump/Bench length (in bytes).")
+    parser.add_argument("--window",  default=3,    type=int,             help="Number of requests in flight (1 for the default Etherbone).")
+    parser.add_argument("--timeout", default=0.2,  type=float,           help="Response timeout (in seconds).")
+    args = parser.parse_args()
+
+    bus = CommUDPBatch(args.ip, port=args.udp_port, csr_csv=args.csr_csv, timeout=args.timeout,
+        window=args.window)
+    bus.open()
+    address = _default_address(bus) if args.address is None else int(args.address, 0)
+    length  = int(args.length, 0)
+
+    def report(name, nbytes, elapsed):
+        print("{:s}: {:d} bytes in {:.3f}s ({:.2f} MB/s).".format(
+            name, nbytes, elapsed, nbytes/elapsed/1e6), file=sys.stderr)
+
+    # Dump.
+    if args.command == "dump":
+        start = time.time()
+        datas = bus.read(address, length//4)
+        report("Dump", 4*len(datas), time.time() - start)
+        with open(args.filename, "wb") as f:
+            f.write(struct.pack(f"<{len(datas)}I", *datas))
+
+    # Load.
+    if args.command == "load":
+        with open(args.filename, "rb") as f:
+            data = f.read()
+        data += bytes(-len(data) % 4)
+        start = time.time()
+        bus.write(address, list(struct.unpack(f"<{len(data)//4}I", data)))
+        report("Load", len(data), time.time() - start)
+
+    # Bench.
+    if args.command == "bench":
+        start = time.time()
+        for i in range(1000):
+            bus.regs.ctrl_scratch.read()
+        elapsed = time.time() - start
+        print("Single reads: {:.0f} accesses/s.".format(1000/elapsed), file=sys.stderr)
+        datas = [i & 0xffffffff for i in range(length//4)]
+        start = time.time()
+        bus.write(address, datas)
+        report("Write", length, time.time() - start)
+        start = time.time()
+        errors = sum(a != b for a, b in zip(bus.read(address, length//4), datas))
+        report("Read", length, time.time() - start)
+        print(f"{errors} errors.", file=sys.stderr)
+
+    bus.close()
+
+if __name__ == "__main__":
+    main()
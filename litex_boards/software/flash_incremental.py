@@ -0,0 +1,187 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Incremental SPI Flash programming for the targets' --flash: the regions (bitstream, BIOS,
+# firmware) are compared per erase sector with the previous flashing (hash manifest cached in the
+# build directory: --flash-mode=manifest) or with the Flash contents (read back through the
+# programmer: --flash-mode=readback), and only the changed sectors are erased and programmed.
+#
+# ./digilent_arty.py --build --flash --flash-mode=manifest
+# ./icebreaker.py --build --flash --flash-mode=readback --flash-region=app.bin@0x60000
+#
+# The manifest describes what was last flashed from this build directory: use --flash-mode=full (or
+# readback) when the board has been flashed from elsewhere.
+
+import os
+import sys
+import json
+import hashlib
+import tempfile
+
+kB = 1024
+
+# Erase granularity used for the comparisons (64KB: largest erase block of the supported Flashes,
+# so a changed sector is always erased entirely by the programmers).
+SECTOR_SIZE = 64*kB
+
+MANIFEST_FILENAME = "flash_manifest.json"
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _sectors(address, data, sector_size):
+    # Sectors erased/programmed by the programmers for a region (first/last ones padded with erased
+    # bytes).
+    offset   = address % sector_size
+    address -= offset
+    data     = b"\xff"*offset + data
+    data    += b"\xff"*(-len(data) % sector_size)
+    return {address + i: data[i:i + sector_size] for i in range(0, len(data), sector_size)}
+
+def _hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _runs(addresses, sector_size):
+    # Group sector addresses in contiguous runs: [(address, nsectors), ...].
+    runs = []
+    for address in sorted(addresses):
+        if runs and (runs[-1][0] + runs[-1][1]*sector_size) == address:
+            runs[-1][1] += 1
+        else:
+            runs.append([address, 1])
+    return runs
+
+def parse_flash_region(region):
+    """Parses a FILE@OFFSET region (as given with --flash-region)."""
+    filename, _, offset = region.rpartition("@")
+    if not filename:
+        raise ValueError(f"Invalid Flash region {region} (expected FILE@OFFSET).")
+    return (int(offset, 0), filename)
+
+# Manifest -----------------------------------------------------------------------------------------
+
+class FlashManifest:
+    def __init__(self, filename, sector_size=SECTOR_SIZE):
+        self.filename    = filename
+        self.sector_size = sector_size
+        self.sectors     = {}
+        if os.path.exists(filename):
+            with open(filename) as f:
+                manifest = json.load(f)
+            if manifest.get("sector_size") == sector_size:
+                self.sectors = {int(a, 0): h for a, h in manifest["sectors"].items()}
+
+    def update(self, sectors):
+        self.sectors.update({a: _hash(d) for a, d in sectors.items()})
+
+    def save(self):
+        with open(self.filename, "w") as f:
+            json.dump({
+                "sector_size" : self.sector_size,
+                "sectors"     : {f"0x{a:08x}": h for a, h in sorted(self.sectors.items())},
+            }, f, indent=4)
+
+# Read-Back ----------------------------------------------------------------------------------------
+
+def flash_read(prog, address, length, filename):
+    """Reads length bytes of the Flash at address to filename (supported programmers only)."""
+    from litex.build.openocd import OpenOCD
+    from litex.build.openfpgaloader import OpenFPGALoader
+    from litex.build.lattice.programmer import IceStormProgrammer
+    if isinstance(prog, IceStormProgrammer):
+        prog.call(["iceprog", "-o", str(address), "-R", str(length), filename])
+    elif isinstance(prog, OpenFPGALoader):
+        prog.call(prog.cmd + ["--dump-flash", "--offset", str(address), "--file-size", str(length),
+            filename])
+    elif isinstance(prog, OpenOCD):
+        script = "; ".join([
+            "init",
+            "jtagspi_init 0 {{{}}}".format(prog.find_flash_proxy()),
+            "flash read_bank 0 {{{}}} 0x{:x} 0x{:x}".format(filename, address, length),
+            "exit",
+        ])
+        prog.call(["openocd", "-f", prog.find_config(), "-c", script])
+    else:
+        raise NotImplementedError(f"Flash read-back not supported with {type(prog).__name__}.")
+    with open(filename, "rb") as f:
+        return f.read()
+
+# Flash Regions ------------------------------------------------------------------------------------
+
+def flash_regions(prog, regions, build_dir, mode="full", extra_regions=[], sector_size=SECTOR_SIZE,
+    flash=None, partial=True):
+    """Flashes regions and extra_regions ([(address, filename), ...]) with the programmer.
+
+    - full:     regions are entirely flashed (and recorded in the manifest).
+    - manifest: only the sectors that changed since the last flashing (manifest) are flashed.
+    - readback: only the sectors that differ from the Flash contents are flashed.
+
+    flash(address, filename) defaults to prog.flash. Programmers that can only write a region
+    entirely (partial=False, ex DFU) flash the whole region when one of its sectors changed.
+    """
+    assert mode in ["full", "manifest", "readback"]
+    flash    = prog.flash if flash is None else flash
+    manifest = FlashManifest(os.path.join(build_dir, MANIFEST_FILENAME), sector_size)
+    if mode == "readback" and not partial:
+        print("Flash read-back not supported, using manifest.", file=sys.stderr)
+        mode = "manifest"
+
+    for address, filename in regions + extra_regions:
+        with open(filename, "rb") as f:
+            data = f.read()
+        aligned = (address % sector_size) == 0
+        sectors = _sectors(address, data, sector_size)
+
+        # Changed sectors.
+        if (mode == "full") or not aligned:
+            changed = None
+        elif mode == "manifest":
+            changed = [a for a, d in sectors.items() if manifest.sectors.get(a) != _hash(d)]
+        else:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                try:
+                    current = flash_read(prog, address, len(sectors)*sector_size,
+                        os.path.join(tmp_dir, "readback.bin"))
+                    current = _sectors(address, current, sector_size)
+                    changed = [a for a, d in sectors.items() if current.get(a) != d]
+                except NotImplementedError as e:
+                    print(f"{e} Using manifest.", file=sys.stderr)
+                    changed = [a for a, d in sectors.items() if manifest.sectors.get(a) != _hash(d)]
+
+        # Flash.
+        name = os.path.basename(filename)
+        if changed is None or (changed and not partial):
+            print(f"Flashing {name} @ 0x{address:08x} ({len(data)} bytes).", file=sys.stderr)
+            flash(address, filename)
+        elif not changed:
+            print(f"{name} @ 0x{address:08x} unchanged, skipped.", file=sys.stderr)
+        else:
+            print("Flashing {} @ 0x{:08x}: {}/{} sectors changed.".format(
+                name, address, len(changed), len(sectors)), file=sys.stderr)
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                for run_address, run_sectors in _runs(changed, sector_size):
+                    run_data = b"".join(sectors[run_address + i*sector_size]
+                        for i in range(run_sectors))
+                    # Don't pad the last sector of the region with erased bytes.
+                    run_data = run_data[:max(len(data) - (run_address - address), 0)]
+                    run_filename = os.path.join(tmp_dir, f"{run_address:08x}.bin")
+                    with open(run_filename, "wb") as f:
+                        f.write(run_data)
+                    flash(run_address, run_filename)
+        manifest.update(sectors)
+    manifest.save()
+
+# Arguments ----------------------------------------------------------------------------------------
+
+def flash_args(parser, with_regions=True):
+    group = parser.add_argument_group(title="Flash options")
+    group.add_argument("--flash-mode",       default="full", choices=["full", "manifest", "readback"], help="Flash whole images (full) or only the sectors changed since the last flashing (manifest) or differing from the Flash contents (readback).")
+    if with_regions:
+        group.add_argument("--flash-region", default=[],     action="append",                          help="Additional region to flash (FILE@OFFSET, ex firmware), can be repeated.")
+
+def flash_argdict(args):
+    return {
+        "mode"          : args.flash_mode,
+        "extra_regions" : [parse_flash_region(r) for r in getattr(args, "flash_region", [])],
+    }
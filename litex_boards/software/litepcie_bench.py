@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# LitePCIe DMA benchmark harness, to compare PCIe targets on equal terms:
+# - DMA bandwidth (FPGA -> Host, Host -> FPGA, Loopback) across Host transfer sizes.
+# - DMA round-trip latency percentiles (Host -> FPGA -> Host, through the DMA Loopback).
+# - CSR read latency percentiles (PCIe non-posted reads, through the driver and the BAR).
+# - MSI interrupt rate.
+#
+# ./xilinx_kcu105.py --with-pcie --with-pcie-bench --driver --build --load
+# (Build/load the driver from build/xilinx_kcu105/driver/kernel, then:)
+# python3 -m litex_boards.software.litepcie_bench --csr-csv=build/xilinx_kcu105/csr.csv --json=kcu105.json
+#
+# The Benchmark is on the last DMA channel (/dev/litepcie{DMA_CHANNELS-1}), selected from csr.csv
+# when --device is not specified. Without --with-pcie-bench, FPGA -> Host/Host -> FPGA tests are
+# skipped and only the Loopback (always available on the DMAs) is measured.
+
+import os
+import sys
+import json
+import time
+import select
+import struct
+import argparse
+
+from litex_boards.software.litepcie_host import LitePCIeDevice, LitePCIeBAR, litepcie_device
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _irq_count(name="litepcie"):
+    # Sum of the /proc/interrupts counts (all CPUs) of the LitePCIe MSIs.
+    count = 0
+    with open("/proc/interrupts") as f:
+        for line in f:
+            if name not in line:
+                continue
+            for field in line.split()[1:]:
+                if not field.isdigit():
+                    break
+                count += int(field)
+    return count
+
+def _percentiles(samples, percentiles=[50, 90, 99, 99.9]):
+    samples = sorted(samples)
+    r = {f"p{p}": samples[min(int(len(samples)*p/100), len(samples) - 1)] for p in percentiles}
+    r["min"] = samples[0]
+    r["max"] = samples[-1]
+    return r
+
+def _pattern(size):
+    # Incrementing 32-bit counter pattern, restarting from 0 on each transfer (checked by
+    # LitePCIeDMABench's Checker; errors then indicate DMA buffers read before being refilled).
+    return b"".join(i.to_bytes(4, "little") for i in range(size//4))
+
+class _Bench:
+    def __init__(self, dev):
+        self.dev     = dev
+        self.present = hasattr(dev.regs, "pcie_bench_control")
+
+    def control(self, generator=0, checker=0, reset=0):
+        self.dev.regs.pcie_bench_control.write(generator << 0 | checker << 1 | reset << 8)
+
+    def status(self):
+        return {
+            "generator_beats" : self.dev.regs.pcie_bench_generator_beats.read(),
+            "checker_beats"   : self.dev.regs.pcie_bench_checker_beats.read(),
+            "checker_errors"  : self.dev.regs.pcie_bench_checker_errors.read(),
+        }
+
+# Bandwidth ----------------------------------------------------------------------------------------
+
+def bandwidth(dev, bench, test, size, duration, buffer_size):
+    rx_buf = bytearray(size)
+    tx_buf = _pattern(size)
+    poller = select.poll()
+    poller.register(dev.fd, {
+        "writer"   : select.POLLIN,
+        "reader"   : select.POLLOUT,
+        "loopback" : select.POLLIN | select.POLLOUT,
+    }[test])
+
+    # Configure datapath.
+    dev.dma_set_loopback(test == "loopback")
+    if bench.present:
+        bench.control(reset=1)
+        bench.control(generator=(test == "writer"), checker=(test == "reader"))
+
+    # Start DMAs.
+    if test in ["writer", "loopback"]:
+        dev.dma_writer(1)
+    if test in ["reader", "loopback"]:
+        dev.dma_reader(1)
+
+    # Transfer.
+    irqs  = _irq_count()
+    nrx   = 0
+    ntx   = 0
+    start = time.time()
+    while (time.time() - start) < duration:
+        for fd, event in poller.poll(100):
+            if event & select.POLLIN:
+                nrx += os.readv(dev.fd, [rx_buf])
+            if event & select.POLLOUT:
+                ntx += os.write(dev.fd, tx_buf)
+    elapsed = time.time() - start
+    irqs    = _irq_count() - irqs
+    writer_hw_count = dev.dma_writer(1)[0] if test != "reader" else 0
+    reader_hw_count = dev.dma_reader(1)[0] if test != "writer" else 0
+
+    # Stop.
+    dev.dma_writer(0)
+    dev.dma_reader(0)
+    dev.dma_set_loopback(0)
+    r = {
+        "test"         : test,
+        "size"         : size,
+        "duration"     : elapsed,
+        "rx_bytes"     : nrx,
+        "tx_bytes"     : ntx,
+        "host_gbps"    : 8*max(nrx, ntx)/elapsed/1e9,
+        "hw_gbps"      : 8*buffer_size*max(writer_hw_count, reader_hw_count)/elapsed/1e9,
+        "lost_buffers" : max(writer_hw_count - nrx//buffer_size, 0) if test != "reader" else 0,
+        "irqs"         : irqs,
+        "irq_rate"     : irqs/elapsed,
+    }
+    if bench.present:
+        r.update(bench.status())
+        bench.control()
+    return r
+
+# Latency ------------------------------------------------------------------------------------------
+
+# Loopback buffers tag: magic, sequence number, submission time (ns).
+_tag_fmt   = "<IIQ"
+_tag_magic = 0x4c415443
+
+def dma_latency(dev, n, size, buffer_size, timeout=10.0):
+    """DMA round-trip latency (Host -> FPGA -> Host through the DMA Loopback), in us.
+
+    Each Host buffer is tagged with a sequence number and its submission time, the latency is
+    measured when the buffer is received back. The DMA Reader loops continuously on its ring, so
+    buffers are submitted continuously (size bytes per write, as a streaming application does) and
+    buffers received again (ring re-reads) are ignored: latencies include the DMA rings queueing.
+    """
+    rx_buf = bytearray(size)
+    tx_buf = bytearray(size)
+    poller = select.poll()
+    poller.register(dev.fd, select.POLLIN | select.POLLOUT)
+
+    # Start DMAs in Loopback.
+    dev.dma_set_loopback(1)
+    dev.dma_writer(1)
+    dev.dma_reader(1)
+
+    # Transfer.
+    samples = []
+    seq     = 0
+    last    = -1
+    start   = time.time()
+    try:
+        while len(samples) < n:
+            if (time.time() - start) > timeout:
+                raise TimeoutError("DMA Loopback: {}/{} buffers received back in {:.1f}s.".format(
+                    len(samples), n, timeout))
+            for fd, event in poller.poll(100):
+                if event & select.POLLOUT:
+                    now = time.perf_counter_ns()
+                    for i in range(size//buffer_size):
+                        struct.pack_into(_tag_fmt, tx_buf, i*buffer_size, _tag_magic, seq + i, now)
+                    seq += os.write(dev.fd, tx_buf)//buffer_size
+                if event & select.POLLIN:
+                    nrx = os.readv(dev.fd, [rx_buf])
+                    now = time.perf_counter_ns()
+                    for offset in range(0, nrx, buffer_size):
+                        magic, rx_seq, t = struct.unpack_from(_tag_fmt, rx_buf, offset)
+                        if magic == _tag_magic and rx_seq > last:
+                            samples.append((now - t)/1e3)
+                            last = rx_seq
+    finally:
+        # Stop.
+        dev.dma_writer(0)
+        dev.dma_reader(0)
+        dev.dma_set_loopback(0)
+    return _percentiles(samples[:n])
+
+def csr_latency(comm, n):
+    samples = []
+    addr    = comm.regs.ctrl_scratch.addr
+    for i in range(n):
+        start = time.perf_counter()
+        comm.read(addr)
+        samples.append((time.perf_counter() - start)*1e6)
+    return _percentiles(samples)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LitePCIe DMA benchmark harness.")
+    parser.add_argument("--device",       default=None,                 help="LitePCIe device (default: last DMA channel, with the Benchmark).")
+    parser.add_argument("--csr-csv",      default="csr.csv",            help="SoC CSV file.")
+    parser.add_argument("--bar",          default=None,                 help="PCIe BAR (ex: 01:00.0), to also measure direct BAR latency.")
+    parser.add_argument("--sizes",        default="8192,65536,1048576", help="Host transfer sizes (in bytes, multiple of the DMA buffer size).")
+    parser.add_argument("--duration",     default=1.0, type=float,      help="Duration of each bandwidth test (in seconds).")
+    parser.add_argument("--samples",      default=10000, type=int,      help="Number of latency samples.")
+    parser.add_argument("--latency-size", default=None, type=int,       help="DMA latency Host transfer size (in bytes, default: DMA buffer size).")
+    parser.add_argument("--json",         default=None,                 help="JSON output file (- for stdout).")
+    args = parser.parse_args()
+
+    device  = litepcie_device(args.csr_csv, channel=-1) if args.device is None else args.device
+    results = {"device": device}
+    with LitePCIeDevice(device, args.csr_csv) as dev:
+        bench = _Bench(dev)
+        _, (_, buffer_size, buffer_count) = dev.dma_mmap_info()
+        results["dma_buffer_size"]  = buffer_size
+        results["dma_buffer_count"] = buffer_count
+        results["pcie_bench"]       = bench.present
+
+        # Bandwidth.
+        if not dev.dma_request(reader=True, writer=True):
+            raise OSError(f"{device} DMA not available.")
+        try:
+            tests = ["writer", "reader", "loopback"] if bench.present else ["loopback"]
+            sizes = [int(size, 0) for size in args.sizes.split(",")]
+            results["bandwidth"] = []
+            for test in tests:
+                for size in sizes:
+                    assert size % buffer_size == 0
+                    r = bandwidth(dev, bench, test, size, args.duration, buffer_size)
+                    results["bandwidth"].append(r)
+                    print("{:8s} {:8d} bytes: {:6.2f} Gbps (hw: {:6.2f} Gbps), {:8.0f} IRQs/s".format(
+                        test, size, r["host_gbps"], r["hw_gbps"], r["irq_rate"]), file=sys.stderr)
+
+            # DMA Latency.
+            size = buffer_size if args.latency_size is None else args.latency_size
+            assert size % buffer_size == 0
+            results["dma_latency_size"] = size
+            results["dma_latency_us"]   = dma_latency(dev, args.samples, size, buffer_size)
+        finally:
+            dev.dma_release(reader=True, writer=True)
+        r = results["dma_latency_us"]
+        print("DMA round-trip latency ({} bytes): p50: {:.2f}us, p99: {:.2f}us, max: {:.2f}us".format(
+            size, r["p50"], r["p99"], r["max"]), file=sys.stderr)
+
+        # CSR Latency.
+        results["csr_latency_us"] = {"driver": csr_latency(dev, args.samples)}
+    if args.bar is not None:
+        with LitePCIeBAR(args.bar, args.csr_csv) as bar:
+            results["csr_latency_us"]["bar"] = csr_latency(bar, args.samples)
+    for name, r in results["csr_latency_us"].items():
+        print("CSR read latency ({}): p50: {:.2f}us, p99: {:.2f}us, max: {:.2f}us".format(
+            name, r["p50"], r["p99"], r["max"]), file=sys.stderr)
+
+    # JSON.
+    if args.json is not None:
+        f = sys.stdout if args.json == "-" else open(args.json, "w")
+        json.dump(results, f, indent=4)
+        if f is not sys.stdout:
+            f.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Zero-copy NumPy access to the DMA rings of the LitePCIe driver generated with --driver.
+#
+# with LitePCIeDMA("/dev/litepcie0", csr_csv="csr.csv", dtype="int16") as dma:
+#     for bufs in dma.writer_buffers(): # FPGA -> Host, (n, DMA_BUFFER_SIZE/2) int16 views.
+#         process(bufs)
+#
+# Buffers are NumPy views on the kernel DMA buffers (no copy) and are only valid until the iterator
+# is resumed: they are then released to the DMA. The buffers are mapped cached, on architectures
+# without PCIe cache coherency the CPU caches must be handled by the user.
+
+import select
+import asyncio
+
+import numpy as np
+
+from .litepcie_host import LitePCIeDevice
+
+# LitePCIe DMA -------------------------------------------------------------------------------------
+
+class LitePCIeDMA(LitePCIeDevice):
+    """LitePCIe DMA
+
+    LitePCIeDevice with the TX (Host -> FPGA, DMA Reader) and RX (FPGA -> Host, DMA Writer) rings
+    mapped as NumPy arrays of shape (buffer_count, buffer_size/itemsize). Completed buffers are
+    iterated in batches (contiguous slices of the rings), synchronously or with async for.
+    """
+    def __init__(self, device="/dev/litepcie0", csr_csv="csr.csv", dtype=np.uint8,
+        reader=True, writer=True, debug=False):
+        LitePCIeDevice.__init__(self, device=device, csr_csv=csr_csv, debug=debug)
+        self.reader = reader
+        self.writer = writer
+        if not self.dma_request(reader=reader, writer=writer):
+            self.close()
+            raise OSError(f"{device} DMA not available.")
+
+        # Map DMA rings.
+        (tx_offset, tx_size, tx_count), (rx_offset, rx_size, rx_count) = self.dma_mmap_info()
+        self.buffer_size  = rx_size
+        self.buffer_count = rx_count
+        self._tx_mmap = self.dma_mmap(tx_offset, tx_size, tx_count)
+        self._rx_mmap = self.dma_mmap(rx_offset, rx_size, rx_count)
+        self.tx = np.frombuffer(self._tx_mmap, dtype=dtype).reshape(tx_count, -1)
+        self.rx = np.frombuffer(self._rx_mmap, dtype=dtype).reshape(rx_count, -1)
+
+        # Statistics.
+        self.overflows = 0 # FPGA -> Host buffers overwritten before being consumed.
+
+    def close(self):
+        if hasattr(self, "_rx_mmap"):
+            if self.writer:
+                self.dma_writer(0)
+            if self.reader:
+                self.dma_reader(0)
+            # Drop NumPy views before unmapping.
+            del self.tx, self.rx
+            self._tx_mmap.close()
+            self._rx_mmap.close()
+            del self._tx_mmap, self._rx_mmap
+            self.dma_release(reader=self.reader, writer=self.writer)
+        LitePCIeDevice.close(self)
+
+    # Batches --------------------------------------------------------------------------------------
+
+    def _batches(self, ring, sw_count, n):
+        # Split n buffers from sw_count in contiguous slices of the ring.
+        while n:
+            start = sw_count % self.buffer_count
+            end   = min(start + n, self.buffer_count)
+            yield ring[start:end]
+            sw_count += end - start
+            n        -= end - start
+
+    def _writer_available(self):
+        hw_count, sw_count = self.dma_writer(1)
+        n = hw_count - sw_count
+        if n > self.buffer_count:
+            # Overflow: skip to the oldest buffer not yet overwritten.
+            self.overflows += n - self.buffer_count
+            sw_count        = hw_count - self.buffer_count
+            n               = self.buffer_count
+        return sw_count, n
+
+    def _reader_available(self):
+        hw_count, sw_count = self.dma_reader(1)
+        # Same limit than the driver: keep at most half of the ring queued.
+        return sw_count, self.buffer_count//2 - (sw_count - hw_count)
+
+    # Synchronous Iteration ------------------------------------------------------------------------
+
+    def _poll(self, event, timeout):
+        poller = select.poll()
+        poller.register(self.fd, event)
+        return poller.poll(timeout)
+
+    def writer_buffers(self, timeout=100):
+        """Iterates over completed FPGA -> Host buffers, released when resumed."""
+        while True:
+            sw_count, n = self._writer_available()
+            if n <= 0:
+                self._poll(select.POLLIN, timeout)
+                continue
+            for bufs in self._batches(self.rx, sw_count, n):
+                yield bufs
+            self.dma_writer_update(sw_count + n)
+
+    def reader_buffers(self, timeout=100):
+        """Iterates over free Host -> FPGA buffers (to be filled), submitted when resumed."""
+        while True:
+            sw_count, n = self._reader_available()
+            if n <= 0:
+                self._poll(select.POLLOUT, timeout)
+                continue
+            for bufs in self._batches(self.tx, sw_count, n):
+                yield bufs
+            self.dma_reader_update(sw_count + n)
+
+    # Asynchronous Iteration -----------------------------------------------------------------------
+
+    async def _wait(self, writable):
+        loop   = asyncio.get_running_loop()
+        future = loop.create_future()
+        add    = loop.add_writer    if writable else loop.add_reader
+        remove = loop.remove_writer if writable else loop.remove_reader
+        add(self.fd, lambda: future.done() or future.set_result(None))
+        try:
+            await future
+        finally:
+            remove(self.fd)
+
+    async def async_writer_buffers(self):
+        """Async version of writer_buffers, waiting on the driver's poll from the event loop."""
+        while True:
+            sw_count, n = self._writer_available()
+            if n <= 0:
+                await self._wait(writable=False)
+                continue
+            for bufs in self._batches(self.rx, sw_count, n):
+                yield bufs
+            self.dma_writer_update(sw_count + n)
+
+    async def async_reader_buffers(self):
+        """Async version of reader_buffers, waiting on the driver's poll from the event loop."""
+        while True:
+            sw_count, n = self._reader_available()
+            if n <= 0:
+                await self._wait(writable=True)
+                continue
+            for bufs in self._batches(self.tx, sw_count, n):
+                yield bufs
+            self.dma_reader_update(sw_count + n)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Host <-> DRAM throughput benchmark for targets built with --with-pcie-dram-dma.
+#
+# ./xilinx_kcu105.py --with-pcie --with-pcie-dram-dma --driver --build --load
+# (Build/load the driver from build/xilinx_kcu105/driver/kernel, then:)
+# python3 -m litex_boards.software.litepcie_dram_bench --csr-csv=build/xilinx_kcu105/csr.csv
+
+import time
+import argparse
+
+from litex_boards.software.litepcie_host import LitePCIeDevice
+
+# Helpers ------------------------------------------------------------------------------------------
+
+class _DRAMDMA:
+    def __init__(self, dev, name):
+        self.dev  = dev
+        self.name = name
+
+    def __getattr__(self, reg):
+        return getattr(self.dev.regs, f"pcie_dram_{self.name}_{reg}")
+
+def _wait_done(dram_dma, start, timeout):
+    while not dram_dma.done.read():
+        if (time.time() - start) > timeout:
+            raise TimeoutError(f"DRAM {dram_dma.name} DMA timeout (offset: 0x{dram_dma.offset.read():08x}).")
+    return time.time() - start
+
+# Benchmarks ---------------------------------------------------------------------------------------
+
+def host_to_dram(dev, base, length, timeout=10):
+    writer = _DRAMDMA(dev, "writer")
+    writer.enable.write(0)
+    writer.base.write(base)
+    writer.length.write(length)
+    writer.enable.write(1)
+    start = time.time()
+    dev.dma_reader(1)
+    try:
+        return length/_wait_done(writer, start, timeout)
+    finally:
+        dev.dma_reader(0)
+        writer.enable.write(0)
+
+def dram_to_host(dev, base, length, timeout=10):
+    reader = _DRAMDMA(dev, "reader")
+    reader.enable.write(0)
+    reader.base.write(base)
+    reader.length.write(length)
+    dev.dma_writer(1)
+    start = time.time()
+    reader.enable.write(1)
+    try:
+        return length/_wait_done(reader, start, timeout)
+    finally:
+        reader.enable.write(0)
+        dev.dma_writer(0)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LitePCIe Host <-> DRAM throughput benchmark.")
+    parser.add_argument("--device",  default="/dev/litepcie0", help="LitePCIe device.")
+    parser.add_argument("--csr-csv", default="csr.csv",        help="SoC CSV file.")
+    parser.add_argument("--base",    default="0x04000000",     help="DRAM base offset (in bytes, avoid regions used by the CPU).")
+    parser.add_argument("--length",  default="0x04000000",     help="Transfer length (in bytes).")
+    parser.add_argument("--loops",   default=4, type=int,      help="Number of transfers in each direction.")
+    args = parser.parse_args()
+
+    base   = int(args.base,   0)
+    length = int(args.length, 0)
+
+    with LitePCIeDevice(args.device, args.csr_csv) as dev:
+        if not dev.dma_request(reader=True, writer=True):
+            raise OSError(f"{args.device} DMA not available.")
+        try:
+            dev.dma_set_loopback(0)
+            for name, bench in [("Host -> DRAM", host_to_dram), ("DRAM -> Host", dram_to_host)]:
+                speeds = [bench(dev, base, length) for _ in range(args.loops)]
+                print("{}: {:3.2f} GB/s (min: {:3.2f} GB/s, max: {:3.2f} GB/s, {} x {:d} MB)".format(
+                    name,
+                    sum(speeds)/len(speeds)/1e9,
+                    min(speeds)/1e9,
+                    max(speeds)/1e9,
+                    args.loops,
+                    length//(1024*1024)))
+        finally:
+            dev.dma_release(reader=True, writer=True)
+
+if __name__ == "__main__":
+    main()
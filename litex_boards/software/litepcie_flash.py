@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SPI Flash update over PCIe for targets built with --with-pcie-flash: the bitstream is streamed by
+# the LitePCIe DMA to the LitePCIeFlash engine (sector erase + quad page program in hardware), read
+# back and verified in hardware, then the FPGA is reloaded through the ICAP. With --incremental, the
+# Flash is read back first and only the changed sectors are erased/programmed.
+#
+# ./sqrl_acorn.py --with-pcie --with-pcie-flash --driver --build --load
+# (Build/load the driver from build/sqrl_acorn/driver/kernel, then:)
+# python3 -m litex_boards.software.litepcie_flash --csr-csv=build/sqrl_acorn/csr.csv \
+#     --quad-enable --reload build/sqrl_acorn/gateware/sqrl_acorn.bin
+#
+# The Flash Programmer is on the last DMA channel (/dev/litepcie{DMA_CHANNELS-1}), selected from
+# csr.csv when --device is not specified.
+
+import os
+import sys
+import time
+import select
+import argparse
+
+from litex_boards.software.litepcie_host import LitePCIeDevice, litepcie_device
+
+# Constants (litex_boards/cores/pcie_flash.py) -----------------------------------------------------
+
+FLASH_OP_ERASE_PROGRAM = 0
+FLASH_OP_PROGRAM       = 1
+FLASH_OP_ERASE         = 2
+FLASH_OP_VERIFY        = 3
+FLASH_OP_READ          = 4
+FLASH_OP_CMD           = 5
+
+ICAP_CMD_REG   = 0b00100
+ICAP_CMD_IPROG = 0b01111
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _align(value, alignment):
+    return (value + alignment - 1)//alignment*alignment
+
+class _Flash:
+    def __init__(self, dev):
+        self.dev = dev
+        if not hasattr(dev.regs, "pcie_flash_control"):
+            raise ValueError("SoC built without --with-pcie-flash.")
+        self.page_size   = dev.constants.d.get("pcie_flash_page_size",   256)
+        self.sector_size = dev.constants.d.get("pcie_flash_sector_size", 65536)
+
+    def __getattr__(self, reg):
+        return getattr(self.dev.regs, f"pcie_flash_{reg}")
+
+    def start(self, op, address=0, length=0):
+        # Erase operations are done on full sectors, others on full pages.
+        alignment = {
+            FLASH_OP_ERASE_PROGRAM : self.sector_size,
+            FLASH_OP_ERASE         : self.sector_size,
+            FLASH_OP_CMD           : 1,
+        }.get(op, self.page_size)
+        if (address % alignment) or (length % alignment):
+            raise ValueError("Flash address/length (0x{:08x}/0x{:x}) not {:d}-byte aligned.".format(
+                address, length, alignment))
+        self.address.write(address)
+        self.length.write(length)
+        self.control.write(op << 4 | 1)
+        if self.unaligned.read():
+            raise ValueError("Flash address (0x{:08x}) refused by the Flash core.".format(address))
+
+    def wait(self, timeout=10):
+        start = time.time()
+        while not self.done.read():
+            if (time.time() - start) > timeout:
+                raise TimeoutError("Flash operation timeout.")
+            time.sleep(1e-3)
+
+    def cmd(self, tx, tx_len, rx_len=0):
+        self.cmd_data.write(tx)
+        self.dev.regs.pcie_flash_cmd.write(tx_len | rx_len << 4)
+        self.start(FLASH_OP_CMD)
+        self.wait()
+        return self.cmd_rdata.read() & ((1 << 8*rx_len) - 1)
+
+    def read_id(self):
+        return self.cmd(0x9f, 1, 3)
+
+    def wait_wip(self, timeout=10):
+        start = time.time()
+        while self.cmd(0x05, 1, 1) & 0b1:
+            if (time.time() - start) > timeout:
+                raise TimeoutError("Flash WIP timeout.")
+
+    def quad_enable(self):
+        # QE bit (bit 1) of CR1/SR2, written with WRSR/WRR (SR1 + CR1/SR2): Spansion/Cypress/Winbond/
+        # ISSI-style Flashes (Micron Flashes have Quad I/O always enabled and ignore it).
+        sr1 = self.cmd(0x05, 1, 1)
+        cr1 = self.cmd(0x35, 1, 1)
+        if cr1 & 0b10:
+            return
+        self.cmd(0x06, 1)
+        self.cmd(0x01 << 16 | sr1 << 8 | cr1 | 0b10, 3)
+        self.wait_wip()
+
+    def four_byte(self):
+        self.opcodes.write(0xdc | 0x34 << 8 | 0x6c << 16 | 4 << 24 | 8 << 27)
+
+def _changed_runs(address, data, current, sector_size):
+    # Contiguous runs of sectors differing from the current Flash contents: [(address, data), ...].
+    runs = []
+    for i in range(0, len(data), sector_size):
+        if data[i:i + sector_size] == current[i:i + sector_size]:
+            continue
+        if runs and (runs[-1][0] + len(runs[-1][1])) == (address + i):
+            runs[-1][1] += data[i:i + sector_size]
+        else:
+            runs.append([address + i, bytearray(data[i:i + sector_size])])
+    return [(a, bytes(d)) for a, d in runs]
+
+def _progress(name, done, total, start):
+    elapsed = time.time() - start
+    speed   = done/elapsed if elapsed else 0
+    print("\r{:8s}: {:5.1f}% ({:d}/{:d} KB, {:6.2f} KB/s)".format(
+        name, 100*done/total, done//1024, total//1024, speed/1024), end="", file=sys.stderr)
+
+# Host -> Flash ------------------------------------------------------------------------------------
+
+def stream_to_flash(dev, flash, name, op, address, data, timeout):
+    """Runs an Erase/Program/Verify operation, streaming data through the TX DMA ring."""
+    (tx_offset, buffer_size, buffer_count), _ = dev.dma_mmap_info()
+    tx = dev.dma_mmap(tx_offset, buffer_size, buffer_count)
+    n  = len(data)//buffer_size
+
+    def fill(sw_count, hw_count):
+        # Keep at most half of the ring queued (as the driver).
+        while (sw_count < n) and (sw_count - hw_count) < buffer_count//2:
+            offset = (sw_count % buffer_count)*buffer_size
+            tx[offset:offset + buffer_size] = data[sw_count*buffer_size:(sw_count + 1)*buffer_size]
+            sw_count += 1
+        return sw_count
+
+    # Pre-fill the ring before enabling the DMA (which is free-running on the ring).
+    flash.start(op, address, len(data))
+    sw_count = fill(0, 0)
+    dev.dma_reader(1)
+    dev.dma_reader_update(sw_count)
+    try:
+        start = time.time()
+        while not flash.done.read():
+            hw_count, _ = dev.dma_reader(1)
+            if hw_count > sw_count and sw_count < n:
+                raise OSError("DMA underflow, Flash data lost.")
+            if sw_count < n:
+                sw_count = fill(sw_count, hw_count)
+                dev.dma_reader_update(sw_count)
+            _progress(name, len(data) - flash.remaining.read(), len(data), start)
+            if (time.time() - start) > timeout:
+                raise TimeoutError(f"Flash {name} timeout.")
+            time.sleep(1e-3)
+        _progress(name, len(data), len(data), start)
+        print(file=sys.stderr)
+    finally:
+        dev.dma_reader(0)
+        tx.close()
+
+# Flash -> Host ------------------------------------------------------------------------------------
+
+def read_from_flash(dev, flash, address, length, timeout):
+    data   = bytearray()
+    poller = select.poll()
+    poller.register(dev.fd, select.POLLIN)
+    dev.dma_writer(1)
+    flash.start(FLASH_OP_READ, address, length)
+    try:
+        start = time.time()
+        while len(data) < length:
+            if poller.poll(100):
+                data += os.read(dev.fd, length - len(data))
+            _progress("Read", len(data), length, start)
+            if (time.time() - start) > timeout:
+                raise TimeoutError("Flash read timeout.")
+        print(file=sys.stderr)
+    finally:
+        dev.dma_writer(0)
+    return bytes(data[:length])
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LitePCIe SPI Flash update utility.")
+    parser.add_argument("bitstream",     nargs="?",                help="Bitstream/image to program (.bin).")
+    parser.add_argument("--device",      default=None,             help="LitePCIe device (default: last DMA channel, with the Flash Programmer).")
+    parser.add_argument("--csr-csv",     default="csr.csv",        help="SoC CSV file.")
+    parser.add_argument("--offset",      default="0",              help="Flash offset (in bytes, sector aligned).")
+    parser.add_argument("--no-erase",    action="store_true",      help="Program without erasing (already erased Flash).")
+    parser.add_argument("--no-verify",   action="store_true",      help="Skip read-back verify.")
+    parser.add_argument("--incremental", action="store_true",      help="Read back the Flash and only erase/program the sectors that changed.")
+    parser.add_argument("--quad-enable", action="store_true",      help="Set the QE bit of the Flash (Spansion/Winbond/ISSI).")
+    parser.add_argument("--four-byte",   action="store_true",      help="Use 4-byte address opcodes (Flashes > 16MB).")
+    parser.add_argument("--read",        default=None,             help="Read Flash to file (with --length) instead of programming.")
+    parser.add_argument("--length",      default="0x1000000",      help="Read length (in bytes).")
+    parser.add_argument("--reload",      action="store_true",      help="Reload FPGA (ICAP IPROG) when done.")
+    parser.add_argument("--timeout",     default=600, type=float,  help="Operation timeout (in seconds).")
+    args = parser.parse_args()
+
+    offset = int(args.offset, 0)
+    device = litepcie_device(args.csr_csv, channel=-1) if args.device is None else args.device
+
+    with LitePCIeDevice(device, args.csr_csv) as dev:
+        flash = _Flash(dev)
+        print("Flash ID: 0x{:06x}".format(flash.read_id()), file=sys.stderr)
+        if args.quad_enable:
+            flash.quad_enable()
+        if args.four_byte:
+            flash.four_byte()
+
+        # DMA.
+        if not dev.dma_request(reader=True, writer=True):
+            raise OSError(f"{device} DMA not available.")
+        try:
+            dev.dma_set_loopback(0)
+            _, (_, buffer_size, _) = dev.dma_mmap_info()
+            alignment = max(flash.sector_size, buffer_size)
+
+            # Read.
+            if args.read is not None:
+                length = int(args.length, 0)
+                data   = read_from_flash(dev, flash, offset, _align(length, buffer_size), args.timeout)
+                with open(args.read, "wb") as f:
+                    f.write(data[:length])
+
+            # Erase + Program / Verify (image padded with erased bytes).
+            elif args.bitstream is not None:
+                with open(args.bitstream, "rb") as f:
+                    data = f.read()
+                data += b"\xff"*(_align(len(data), alignment) - len(data))
+                runs  = [(offset, data)]
+                if args.incremental:
+                    current = read_from_flash(dev, flash, offset, len(data), args.timeout)
+                    runs    = _changed_runs(offset, data, current, alignment)
+                    changed = sum(len(d) for _, d in runs)//alignment
+                    print("{:d}/{:d} sectors changed.".format(changed, len(data)//alignment),
+                        file=sys.stderr)
+                op = FLASH_OP_PROGRAM if args.no_erase else FLASH_OP_ERASE_PROGRAM
+                for address, run_data in runs:
+                    stream_to_flash(dev, flash, "Program", op, address, run_data, args.timeout)
+                    if not args.no_verify:
+                        stream_to_flash(dev, flash, "Verify", FLASH_OP_VERIFY, address, run_data,
+                            args.timeout)
+                        errors = flash.errors.read()
+                        if errors:
+                            raise ValueError("Verify failed: {} errors (first @ 0x{:08x}).".format(
+                                errors, flash.error_address.read()))
+                        print("Verify OK.", file=sys.stderr)
+        finally:
+            dev.dma_release(reader=True, writer=True)
+
+        # Reload.
+        if args.reload:
+            dev.regs.icap_addr.write(ICAP_CMD_REG)
+            dev.regs.icap_data.write(ICAP_CMD_IPROG)
+            dev.regs.icap_write.write(1)
+            print("FPGA reload, rescan the PCIe bus to use the new bitstream.", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
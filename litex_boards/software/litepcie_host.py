@@ -0,0 +1,214 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Host-side access to LitePCIe devices through the kernel driver generated with --driver
+# (/dev/litepcieX), mirroring the ioctls of litepcie/software/kernel/litepcie.h, or directly through
+# the CSR BAR (sysfs resource0).
+
+import os
+import mmap
+import fcntl
+import struct
+
+from litex.tools.remote.csr_builder import CSRBuilder
+from litex.tools.remote.comm_pcie   import CommPCIe
+
+# IOCTLs -------------------------------------------------------------------------------------------
+
+def _ioc(direction, nr, size):
+    return (direction << 30) | (size << 16) | (ord("S") << 8) | nr
+
+def _iow(nr, size):  return _ioc(1, nr, size)
+def _ior(nr, size):  return _ioc(2, nr, size)
+def _iowr(nr, size): return _ioc(3, nr, size)
+
+# Structures (with C padding).
+_reg_fmt         = "IIB3x"   # addr, val, is_write.
+_dma_fmt         = "B"       # loopback_enable.
+_dma_ctrl_fmt    = "B7xqq"   # enable, hw_count, sw_count.
+_lock_fmt        = "BBBBBB"  # reader/writer request, reader/writer release, reader/writer status.
+_mmap_info_fmt   = "QQQQQQ"  # tx buf offset/size/count, rx buf offset/size/count.
+_mmap_update_fmt = "q"       # sw_count.
+
+LITEPCIE_IOCTL_REG                    = _iowr(0,  struct.calcsize(_reg_fmt))
+LITEPCIE_IOCTL_DMA                    = _iow(20,  struct.calcsize(_dma_fmt))
+LITEPCIE_IOCTL_DMA_WRITER             = _iowr(21, struct.calcsize(_dma_ctrl_fmt))
+LITEPCIE_IOCTL_DMA_READER             = _iowr(22, struct.calcsize(_dma_ctrl_fmt))
+LITEPCIE_IOCTL_MMAP_DMA_INFO          = _ior(24,  struct.calcsize(_mmap_info_fmt))
+LITEPCIE_IOCTL_LOCK                   = _iowr(25, struct.calcsize(_lock_fmt))
+LITEPCIE_IOCTL_MMAP_DMA_WRITER_UPDATE = _iow(26,  struct.calcsize(_mmap_update_fmt))
+LITEPCIE_IOCTL_MMAP_DMA_READER_UPDATE = _iow(27,  struct.calcsize(_mmap_update_fmt))
+
+# DMA Channels -------------------------------------------------------------------------------------
+
+def litepcie_device(csr_csv, channel=0, board=0):
+    """Returns the /dev/litepcieX device of a DMA channel (negative: from the last one).
+
+    The driver creates one device per DMA channel (DMA_CHANNELS, from csr_csv) and per board.
+    """
+    constants = {name: value for group, name, value, *_ in CSRBuilder.get_csr_items(csr_csv)
+        if group == "constant"}
+    channels = int(constants["dma_channels"])
+    if not (-channels <= channel < channels):
+        raise ValueError(f"DMA channel {channel} not available ({channels} DMA channels).")
+    return "/dev/litepcie{}".format(board*channels + channel%channels)
+
+# LitePCIe Device ----------------------------------------------------------------------------------
+
+class LitePCIeDevice(CSRBuilder):
+    """LitePCIe Device
+
+    Opens a /dev/litepcieX DMA channel of the LitePCIe driver; CSRs described in csr_csv are then
+    accessible by name through regs (ex: dev.regs.ctrl_scratch.read()), in the same way than with
+    litex.tools.litex_client.RemoteClient.
+    """
+    def __init__(self, device="/dev/litepcie0", csr_csv="csr.csv", debug=False):
+        self.device = device
+        self.debug  = debug
+        CSRBuilder.__init__(self, comm=self, csr_csv=csr_csv)
+        self.open()
+
+    def open(self):
+        if hasattr(self, "fd"):
+            return
+        self.fd = os.open(self.device, os.O_RDWR | os.O_CLOEXEC)
+
+    def close(self):
+        if not hasattr(self, "fd"):
+            return
+        os.close(self.fd)
+        del self.fd
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _ioctl(self, request, fmt, *values):
+        buf = bytearray(struct.pack(fmt, *values))
+        fcntl.ioctl(self.fd, request, buf)
+        return struct.unpack(fmt, buf)
+
+    # CSR Access -----------------------------------------------------------------------------------
+
+    def read(self, addr, length=None, burst="incr"):
+        assert burst == "incr"
+        data = []
+        for i in range(1 if length is None else length):
+            _, value, _ = self._ioctl(LITEPCIE_IOCTL_REG, _reg_fmt, addr + 4*i, 0, 0)
+            if self.debug:
+                print("read 0x{:08x} @ 0x{:08x}".format(value, addr + 4*i))
+            if length is None:
+                return value
+            data.append(value)
+        return data
+
+    def write(self, addr, data):
+        data = data if isinstance(data, list) else [data]
+        for i, value in enumerate(data):
+            self._ioctl(LITEPCIE_IOCTL_REG, _reg_fmt, addr + 4*i, value, 1)
+            if self.debug:
+                print("write 0x{:08x} @ 0x{:08x}".format(value, addr + 4*i))
+
+    # DMA Control ----------------------------------------------------------------------------------
+
+    def dma_request(self, reader=True, writer=True):
+        status = self._ioctl(LITEPCIE_IOCTL_LOCK, _lock_fmt, reader, writer, 0, 0, 0, 0)
+        return bool(status[4] and status[5])
+
+    def dma_release(self, reader=True, writer=True):
+        self._ioctl(LITEPCIE_IOCTL_LOCK, _lock_fmt, 0, 0, reader, writer, 0, 0)
+
+    def dma_set_loopback(self, enable):
+        self._ioctl(LITEPCIE_IOCTL_DMA, _dma_fmt, enable)
+
+    def dma_reader(self, enable):
+        """Host -> FPGA DMA, returns (hw_count, sw_count) in buffers."""
+        _, hw_count, sw_count = self._ioctl(LITEPCIE_IOCTL_DMA_READER, _dma_ctrl_fmt, enable, 0, 0)
+        return hw_count, sw_count
+
+    def dma_writer(self, enable):
+        """FPGA -> Host DMA, returns (hw_count, sw_count) in buffers."""
+        _, hw_count, sw_count = self._ioctl(LITEPCIE_IOCTL_DMA_WRITER, _dma_ctrl_fmt, enable, 0, 0)
+        return hw_count, sw_count
+
+    # DMA Buffers (mmap) ---------------------------------------------------------------------------
+
+    def dma_mmap_info(self):
+        """Returns ((tx_offset, tx_size, tx_count), (rx_offset, rx_size, rx_count)) of the DMA rings.
+
+        TX ring: Host -> FPGA (DMA Reader), RX ring: FPGA -> Host (DMA Writer).
+        """
+        info = self._ioctl(LITEPCIE_IOCTL_MMAP_DMA_INFO, _mmap_info_fmt, 0, 0, 0, 0, 0, 0)
+        return info[0:3], info[3:6]
+
+    def dma_mmap(self, offset, size, count):
+        """Maps one of the DMA rings (as returned by dma_mmap_info) in user-space."""
+        return mmap.mmap(self.fd, size*count, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE,
+            offset=offset)
+
+    def dma_writer_update(self, sw_count):
+        """Releases FPGA -> Host buffers consumed from the mmap'ed RX ring (up to sw_count)."""
+        self._ioctl(LITEPCIE_IOCTL_MMAP_DMA_WRITER_UPDATE, _mmap_update_fmt, sw_count)
+
+    def dma_reader_update(self, sw_count):
+        """Submits Host -> FPGA buffers filled in the mmap'ed TX ring (up to sw_count)."""
+        self._ioctl(LITEPCIE_IOCTL_MMAP_DMA_READER_UPDATE, _mmap_update_fmt, sw_count)
+
+# LitePCIe BAR -------------------------------------------------------------------------------------
+
+class LitePCIeBAR(CommPCIe):
+    """LitePCIe BAR
+
+    Direct CSR access through a mmap of the CSR BAR (ex: bar="01:00.0"), without going through the
+    driver: each word is a single 32-bit load/store on the BAR (multi-word accesses are not merged,
+    the LitePCIe Wishbone bridge only handles single dword requests). The BAR is mapped at the CSR
+    base, so addresses from csr_csv are rebased.
+    """
+    def __init__(self, bar, csr_csv="csr.csv", debug=False):
+        CommPCIe.__init__(self, bar=bar, csr_csv=csr_csv, debug=debug)
+        self.base = 0
+        if csr_csv is not None and "csr" in self.mems.d:
+            self.base = self.mems.csr.base
+        self.open()
+
+    def open(self):
+        if hasattr(self, "file"):
+            return
+        self.file = os.open(self.bar, os.O_RDWR | os.O_SYNC)
+        self.mmap = mmap.mmap(self.file, 0)
+        self.regs32 = memoryview(self.mmap).cast("I")
+
+    def close(self):
+        if not hasattr(self, "file"):
+            return
+        self.regs32.release()
+        self.mmap.close()
+        os.close(self.file)
+        del self.file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, addr, length=None, burst="incr"):
+        assert burst == "incr"
+        offset = (addr - self.base)//4
+        data   = [self.regs32[offset + i] for i in range(1 if length is None else length)]
+        if self.debug:
+            for i, value in enumerate(data):
+                print("read 0x{:08x} @ 0x{:08x}".format(value, addr + 4*i))
+        return data[0] if length is None else data
+
+    def write(self, addr, data):
+        data   = data if isinstance(data, list) else [data]
+        offset = (addr - self.base)//4
+        for i, value in enumerate(data):
+            self.regs32[offset + i] = value
+            if self.debug:
+                print("write 0x{:08x} @ 0x{:08x}".format(value, addr + 4*i))
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# litex_server equivalent for PCIe targets: serves the Etherbone requests of RemoteClient based tools
+# (litex_client, litescope_cli, litex_term --csr-csv...) over the CSR BAR or the LitePCIe driver
+# instead of JTAGBone/UARTBone.
+#
+# python3 -m litex_boards.software.litepcie_server --bar=01:00.0 --csr-csv=build/<target>/csr.csv
+# or (through the driver generated with --driver, when the BAR can't be mapped from user-space):
+# python3 -m litex_boards.software.litepcie_server --device=/dev/litepcie0 --csr-csv=build/<target>/csr.csv
+#
+# RemoteClient's requests are served with absolute CSR addresses (the server is not a CommPCIe, so
+# the client does not translate them): each Etherbone record (ex: a multi-word CSR) is a single
+# request/round-trip to the server. On the device side, the words of a record are still accessed
+# one by one (single 32-bit load/store on the BAR, or one REG ioctl per word with --device): the
+# LitePCIe Wishbone bridge only handles single dword requests.
+
+import time
+import argparse
+
+from litex.tools.remote.etherbone import EtherbonePacket, EtherboneRecord, EtherboneReads
+from litex.tools.litex_server import RemoteServer
+
+from litex_boards.software.litepcie_host import LitePCIeDevice, LitePCIeBAR
+
+# Vectored Access ----------------------------------------------------------------------------------
+
+def read_vector(bus, addrs):
+    """Reads a list of (non-contiguous) addresses from a RemoteClient in a single Etherbone record.
+
+    ex: read_vector(bus, [bus.regs.ctrl_scratch.addr, bus.regs.ctrl_bus_errors.addr]).
+    """
+    record = EtherboneRecord()
+    record.reads  = EtherboneReads(addrs=[bus.base_address + addr for addr in addrs])
+    record.rcount = len(record.reads)
+
+    packet = EtherbonePacket()
+    packet.records = [record]
+    packet.encode()
+    bus.send_packet(bus.socket, packet)
+
+    packet = EtherbonePacket(bus.receive_packet(bus.socket))
+    packet.decode()
+    return packet.records.pop().writes.get_datas()
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LitePCIe CSR Server utility.")
+    parser.add_argument("--bind-ip",   default="localhost", help="Host bind address.")
+    parser.add_argument("--bind-port", default=1234,        help="Host bind port.")
+    parser.add_argument("--csr-csv",   default="csr.csv",   help="SoC CSV file (for CSR base translation).")
+    parser.add_argument("--bar",       default=None,        help="PCIe BAR (ex: 01:00.0), direct BAR mapping.")
+    parser.add_argument("--device",    default=None,        help="LitePCIe device (ex: /dev/litepcie0), through the driver.")
+    parser.add_argument("--threads",   default=4, type=int, help="Number of server threads.")
+    parser.add_argument("--debug",     action="store_true", help="Enable debug.")
+    args = parser.parse_args()
+
+    if args.bar is not None:
+        print("[LitePCIeBAR] bar: {} / ".format(args.bar), end="")
+        comm = LitePCIeBAR(args.bar, csr_csv=args.csr_csv, debug=args.debug)
+    elif args.device is not None:
+        print("[LitePCIeDevice] device: {} / ".format(args.device), end="")
+        comm = LitePCIeDevice(args.device, csr_csv=args.csr_csv, debug=args.debug)
+    else:
+        print("Need to specify --bar or --device, exiting.")
+        exit()
+
+    server = RemoteServer(comm, args.bind_ip, int(args.bind_port))
+    server.open()
+    server.start(args.threads)
+    try:
+        while True:
+            time.sleep(100)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+if __name__ == "__main__":
+    main()
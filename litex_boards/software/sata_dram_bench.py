@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# LiteDRAM <-> SATA Streamer control and sustained throughput benchmark (targets built with
+# --with-sata-streamer): records a DRAM ring buffer to the drive(s) and/or plays it back, reporting
+# the throughputs and command latencies measured by the Streamer (in sys_clk cycles, independent of
+# the Host link).
+#
+# litex_server --udp (or --uart/--jtag/--pcie)
+# python3 -m litex_boards.software.sata_dram_bench --csr-csv=build/<target>/csr.csv record --length=4GB
+# python3 -m litex_boards.software.sata_dram_bench --csr-csv=build/<target>/csr.csv playback --length=4GB
+# python3 -m litex_boards.software.sata_dram_bench --csr-csv=build/<target>/csr.csv bench --check
+#
+# Warning: record/bench overwrite the data of the drive(s) (from --sector).
+
+import sys
+import time
+import random
+import argparse
+
+from litex import RemoteClient
+
+from litex_boards.software.sata_raid_bench import parse_length
+
+# SATA DRAM Streamer Driver ------------------------------------------------------------------------
+
+class SATADRAMStreamerDriver:
+    def __init__(self, bus, name="sata_streamer"):
+        self.bus           = bus
+        self.name          = name
+        self.block_sectors = getattr(bus.constants, f"{name}_block_sectors")
+        self.sys_clk_freq  = bus.constants.config_clock_frequency
+        for reg in ["control", "base", "size", "sector", "blocks", "status", "cycles",
+            "latency_max", "latency_sum"]:
+            setattr(self, reg, getattr(bus.regs, f"{name}_{reg}"))
+
+    def run(self, command, base, size, sector, blocks, timeout=60.0):
+        self.base.write(base)
+        self.size.write(size)
+        self.sector.write(sector)
+        self.blocks.write(blocks)
+        self.control.write({"record": 0b01, "playback": 0b10}[command])
+        start = time.time()
+        while not (self.status.read() & 0b01):
+            if (time.time() - start) > timeout:
+                raise TimeoutError(f"SATA DRAM Streamer {command} timeout.")
+            time.sleep(0.01)
+        failed = bool(self.status.read() & 0b10)
+        return self.cycles.read()/self.sys_clk_freq, failed
+
+    def latencies(self, blocks):
+        # Average/Max command latencies (in seconds).
+        return (self.latency_sum.read()/blocks/self.sys_clk_freq,
+                self.latency_max.read()/self.sys_clk_freq)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteDRAM <-> SATA Streamer control/benchmark.")
+    parser.add_argument("command",   choices=["record", "playback", "bench"], help="Record DRAM to drive(s), play back drive(s) to DRAM or bench both.")
+    parser.add_argument("--csr-csv", default="csr.csv",               help="SoC CSV file.")
+    parser.add_argument("--host",    default="localhost",             help="litex_server host.")
+    parser.add_argument("--port",    default=1234,  type=int,         help="litex_server port.")
+    parser.add_argument("--base",    default="0x0",                   help="Ring buffer base (byte offset in DRAM).")
+    parser.add_argument("--size",    default="16MB",                  help="Ring buffer size (in bytes or with KB/MB/GB suffix, 0: no wrap).")
+    parser.add_argument("--sector",  default=0,     type=int,         help="First sector (on each drive).")
+    parser.add_argument("--length",  default="256MB",                 help="Record/Playback length (rounded to blocks, in bytes or with KB/MB/GB suffix).")
+    parser.add_argument("--check",   action="store_true",             help="Bench: fill the ring buffer with random data and check it after playback (to a second ring buffer).")
+    parser.add_argument("--timeout", default=600.0, type=float,       help="Record/Playback timeout (in seconds).")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    streamer = SATADRAMStreamerDriver(bus)
+
+    base   = int(args.base, 0)
+    size   = parse_length(args.size)
+    blocks = max(parse_length(args.length)//(streamer.block_sectors*512), 1)
+    nbytes = blocks*streamer.block_sectors*512
+    print("{:d} bytes blocks: {:d} blocks ({:d} bytes), {:d} bytes ring buffer @ 0x{:08x}.".format(
+        streamer.block_sectors*512, blocks, nbytes, size, base), file=sys.stderr)
+
+    # Check: Fill ring buffer (bench only).
+    check = args.check and (args.command == "bench")
+    if check:
+        assert size != 0, "--check requires a ring buffer size."
+        dram_base = bus.mems.main_ram.base
+        words     = min(size, nbytes)//4
+        datas     = [random.getrandbits(32) for _ in range(words)]
+        bus.write(dram_base + base, datas)
+
+    # Record/Playback.
+    errors   = 0
+    commands = {"bench": ["record", "playback"]}.get(args.command, [args.command])
+    for command in commands:
+        # Bench: Play back to a second ring buffer (after the first one).
+        _base = base + size if (args.command == "bench" and command == "playback") else base
+        elapsed, failed = streamer.run(command, _base, size, args.sector, blocks,
+            timeout=args.timeout)
+        print("{:s}: {:.3f}s ({:.2f} MB/s){:s}.".format(command.capitalize(), elapsed,
+            nbytes/elapsed/1e6, ", FAILED" if failed else ""), file=sys.stderr)
+        print("  Command latency: {:.3f}ms avg / {:.3f}ms max.".format(
+            *[l*1e3 for l in streamer.latencies(blocks)]), file=sys.stderr)
+        errors += failed
+
+    # Check: Compare ring buffers.
+    if check:
+        readback = bus.read(dram_base + base + size, words)
+        check_errors = sum(a != b for a, b in zip(readback, datas))
+        print("{:d} errors.".format(check_errors), file=sys.stderr)
+        errors += check_errors
+
+    bus.close()
+    sys.exit(errors != 0)
+
+if __name__ == "__main__":
+    main()
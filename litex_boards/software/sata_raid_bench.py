@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SATA RAID-0 Benchmark: writes a counter pattern to the drives of a target built with
+# --sata-drives > 1 (or to the single drive of litex_acorn_baseboard --with-sata), reads it back and
+# checks it with the SoC's Pattern Generator/Checker, reporting the throughputs and command
+# latencies measured by the RAID-0 (in sys_clk cycles, independent of the Host link).
+#
+# litex_server --udp (or --uart/--jtag)
+# python3 -m litex_boards.software.sata_raid_bench --csr-csv=build/<target>/csr.csv --length=1GB
+#
+# Warning: overwrites the data of the drives (from --sector).
+
+import sys
+import time
+import argparse
+
+from litex import RemoteClient
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def parse_length(length):
+    units = {"KB": 1e3, "MB": 1e6, "GB": 1e9}
+    for unit, factor in units.items():
+        if length.upper().endswith(unit):
+            return int(float(length[:-len(unit)])*factor)
+    return int(length, 0)
+
+# SATA RAID-0 Driver -------------------------------------------------------------------------------
+
+class SATARAID0Driver:
+    def __init__(self, bus, name="sata_raid"):
+        self.bus            = bus
+        self.name           = name
+        self.drives         = getattr(bus.constants, f"{name}_drives")
+        self.stripe_sectors = getattr(bus.constants, f"{name}_stripe_sectors")
+        self.sys_clk_freq   = bus.constants.config_clock_frequency
+        for reg in ["control", "sector", "stripes", "status", "cycles", "latency_max", "latency_sum"]:
+            setattr(self, reg, getattr(bus.regs, f"{name}_{reg}"))
+        self.errors = getattr(bus.regs, f"{name}_bench_errors", None)
+
+    def run(self, command, sector, stripes, timeout=60.0):
+        self.sector.write(sector)
+        self.stripes.write(stripes)
+        self.control.write({"write": 0b01, "read": 0b10}[command])
+        start = time.time()
+        while not (self.status.read() & 0b01):
+            if (time.time() - start) > timeout:
+                raise TimeoutError(f"SATA RAID-0 {command} timeout.")
+            time.sleep(0.01)
+        failed = bool(self.status.read() & 0b10)
+        return self.cycles.read()/self.sys_clk_freq, failed
+
+    def latencies(self, stripes):
+        # Average/Max command latencies (in seconds).
+        return (self.latency_sum.read()/stripes/self.sys_clk_freq,
+                self.latency_max.read()/self.sys_clk_freq)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="SATA RAID-0 Benchmark.")
+    parser.add_argument("--csr-csv", default="csr.csv",               help="SoC CSV file.")
+    parser.add_argument("--host",    default="localhost",             help="litex_server host.")
+    parser.add_argument("--port",    default=1234,  type=int,         help="litex_server port.")
+    parser.add_argument("--sector",  default=0,     type=int,         help="First sector (on each drive).")
+    parser.add_argument("--length",  default="256MB",                 help="Benchmark length (rounded to stripes, in bytes or with KB/MB/GB suffix).")
+    parser.add_argument("--timeout", default=60.0,  type=float,       help="Write/Read timeout (in seconds).")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    raid = SATARAID0Driver(bus)
+
+    stripe_bytes = raid.stripe_sectors*512
+    stripes      = max(parse_length(args.length)//stripe_bytes, 1)
+    nbytes       = stripes*stripe_bytes
+    print("{:d} drives, {:d} bytes stripes: {:d} stripes ({:d} bytes).".format(
+        raid.drives, stripe_bytes, stripes, nbytes), file=sys.stderr)
+
+    errors = 0
+    for command in ["write", "read"]:
+        elapsed, failed = raid.run(command, args.sector, stripes, timeout=args.timeout)
+        print("{:s}: {:.3f}s ({:.2f} MB/s){:s}.".format(command.capitalize(), elapsed,
+            nbytes/elapsed/1e6, ", FAILED" if failed else ""), file=sys.stderr)
+        print("  Command latency: {:.3f}ms avg / {:.3f}ms max.".format(
+            *[l*1e3 for l in raid.latencies(stripes)]), file=sys.stderr)
+        errors += failed
+    if raid.errors is not None:
+        errors += raid.errors.read()
+        print("{:d} errors.".format(raid.errors.read()), file=sys.stderr)
+
+    bus.close()
+    sys.exit(errors != 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SDCard Benchmark (targets built with --with-sdcard): initializes the SDCard (at up to 25MHz),
+# switches it to High-Speed/4-bit (and then to --clk-freq, up to 50MHz, once switched), then
+# measures multi-block DMA write/read throughputs between main RAM and the SDCard and checks the
+# data read back.
+#
+# litex_server --udp (or --uart/--jtag)
+# python3 -m litex_boards.software.sdcard_bench --csr-csv=build/<target>/csr.csv --length=64MB
+# python3 -m litex_boards.software.sdcard_bench --csr-csv=build/<target>/csr.csv --clk-freq=50e6
+#
+# Warning: --write overwrites the data of the SDCard (from --block).
+
+import sys
+import time
+import random
+import argparse
+
+from litex import RemoteClient
+
+from litex_boards.software.sata_raid_bench import parse_length
+
+# SDCard Constants ---------------------------------------------------------------------------------
+
+SD_RESPONSE_NONE       = 0
+SD_RESPONSE_SHORT      = 1
+SD_RESPONSE_LONG       = 2
+SD_RESPONSE_SHORT_BUSY = 3
+
+SD_DATA_NONE  = 0
+SD_DATA_READ  = 1
+SD_DATA_WRITE = 2
+
+SD_CLK_FREQ_INIT    = 400e3
+SD_CLK_FREQ_DEFAULT = 25e6 # Default Speed (until switched to High-Speed).
+SD_CLK_FREQ_HS      = 50e6 # High-Speed (SDR25, 3.3V signaling).
+
+# SDCard Driver ------------------------------------------------------------------------------------
+
+class SDCardDriver:
+    def __init__(self, bus, timeout=1.0, clk_freq_hs=None):
+        self.bus     = bus
+        self.timeout = timeout
+        self.clk_freq     = min(getattr(bus.constants, "sdcard_clk_freq", SD_CLK_FREQ_DEFAULT),
+            SD_CLK_FREQ_DEFAULT)
+        self.clk_freq_hs  = self.clk_freq if clk_freq_hs is None else clk_freq_hs
+        assert self.clk_freq_hs <= SD_CLK_FREQ_HS
+        self.sys_clk_freq = bus.constants.config_clock_frequency
+        self.rca = 0
+
+    def set_clk_freq(self, clk_freq):
+        # Same divider as the BIOS (power of 2, 2 to 256).
+        divider = int(self.sys_clk_freq//clk_freq)
+        divider = 1 << max(divider - 1, 1).bit_length()
+        divider = min(max(divider, 2), 256)
+        self.bus.regs.sdphy_clocker_divider.write(divider)
+        return self.sys_clk_freq/divider
+
+    def wait(self, reg):
+        start = time.time()
+        while True:
+            event = reg.read()
+            if event & 0b0001:
+                return (event & 0b1100) == 0
+            if (time.time() - start) > self.timeout:
+                return False
+
+    def wait_dma(self, reg, length):
+        # DMA done (timeout extended with the transfer length, down to 1MB/s).
+        start = time.time()
+        while not (reg.read() & 0b1):
+            if (time.time() - start) > (self.timeout + length/1e6):
+                return False
+        return True
+
+    def cmd(self, cmd, arg=0, response=SD_RESPONSE_SHORT, data=SD_DATA_NONE):
+        self.bus.regs.sdcore_cmd_argument.write(arg)
+        self.bus.regs.sdcore_cmd_command.write((cmd << 8) | (data << 5) | response)
+        self.bus.regs.sdcore_cmd_send.write(1)
+        return self.wait(self.bus.regs.sdcore_cmd_event)
+
+    def response(self):
+        return self.bus.regs.sdcore_cmd_response.read() & 0xffffffff
+
+    def data_cmd(self, cmd, arg, block_length, block_count, data):
+        self.bus.regs.sdcore_block_length.write(block_length)
+        self.bus.regs.sdcore_block_count.write(block_count)
+        for _ in range(16):
+            if self.cmd(cmd, arg, data=data):
+                return True
+        return False
+
+    def init(self):
+        # Identification (at 400KHz).
+        self.set_clk_freq(SD_CLK_FREQ_INIT)
+        for _ in range(100):
+            self.bus.regs.sdphy_init_initialize.write(1)
+            if self.cmd(0, response=SD_RESPONSE_NONE): # GO_IDLE.
+                break
+        else:
+            raise IOError("SDCard not detected.")
+        if not self.cmd(8, 0x000001aa):                # SEND_IF_COND.
+            raise IOError("SDCard ver2.00+ required.")
+        clk_freq = self.set_clk_freq(self.clk_freq)
+        for _ in range(1000):                          # APP_SEND_OP_COND (until ready).
+            self.cmd(55, 0)
+            if self.cmd(41, 0x70ff8000, response=SD_RESPONSE_SHORT_BUSY):
+                if self.response() & 0x80000000:
+                    break
+        else:
+            raise IOError("SDCard initialization timeout.")
+        self.cmd(2, response=SD_RESPONSE_LONG)         # ALL_SEND_CID.
+        self.cmd(3)                                    # SET_RELATIVE_ADDRESS.
+        self.rca = (self.response() >> 16) & 0xffff
+        self.cmd(7, self.rca << 16, response=SD_RESPONSE_SHORT_BUSY) # SELECT_CARD.
+
+        # Transfer mode: 4-bit, High-Speed, 512 bytes blocks.
+        self.cmd(55, self.rca << 16)
+        self.cmd(6, 2)                                 # SET_BUS_WIDTH (4-bit).
+        hs_arg = (1 << 31) | 0xfffff1                  # SWITCH_FUNC (Access Mode: SDR25).
+        if not (self.data_cmd(6, hs_arg, 64, 1, SD_DATA_READ) and
+                self.wait(self.bus.regs.sdcore_data_event)):
+            raise IOError("SDCard High-Speed switch failed.")
+        clk_freq = self.set_clk_freq(self.clk_freq_hs) # High-Speed SDCard Clk (once switched).
+        self.cmd(16, 512)                              # SET_BLOCKLEN.
+        return clk_freq
+
+    def read(self, block, count, base):
+        dma = self.bus.regs
+        dma.sdblock2mem_dma_enable.write(0)
+        dma.sdblock2mem_dma_base.write(base)
+        dma.sdblock2mem_dma_length.write(512*count)
+        dma.sdblock2mem_dma_enable.write(1)
+        ok  = self.data_cmd(18, block, 512, count, SD_DATA_READ) # READ_MULTIPLE_BLOCK.
+        ok &= self.wait(self.bus.regs.sdcore_data_event)
+        ok &= self.wait_dma(dma.sdblock2mem_dma_done, 512*count)
+        ok &= self.cmd(12, response=SD_RESPONSE_SHORT_BUSY)      # STOP_TRANSMISSION.
+        return ok
+
+    def write(self, block, count, base):
+        dma = self.bus.regs
+        dma.sdmem2block_dma_enable.write(0)
+        dma.sdmem2block_dma_base.write(base)
+        dma.sdmem2block_dma_length.write(512*count)
+        dma.sdmem2block_dma_enable.write(1)
+        ok  = self.data_cmd(25, block, 512, count, SD_DATA_WRITE) # WRITE_MULTIPLE_BLOCK.
+        ok &= self.cmd(12, response=SD_RESPONSE_SHORT_BUSY)       # STOP_TRANSMISSION.
+        ok &= self.wait_dma(dma.sdmem2block_dma_done, 512*count)
+        return ok
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="SDCard Benchmark.")
+    parser.add_argument("--csr-csv",  default="csr.csv",         help="SoC CSV file.")
+    parser.add_argument("--host",     default="localhost",       help="litex_server host.")
+    parser.add_argument("--port",     default=1234,  type=int,   help="litex_server port.")
+    parser.add_argument("--block",    default=0,     type=int,   help="First block.")
+    parser.add_argument("--length",   default="16MB",            help="Benchmark length (rounded to chunks, in bytes or with KB/MB/GB suffix).")
+    parser.add_argument("--chunk",    default="1MB",             help="DMA transfer size (per multi-block command, in main RAM).")
+    parser.add_argument("--write",    action="store_true",       help="Also benchmark writes (random data, checked on read).")
+    parser.add_argument("--clk-freq", default=None,  type=float, help="SDCard Clk frequency once switched to High-Speed (up to 50MHz, default: SDCARD_CLK_FREQ).")
+    parser.add_argument("--timeout",  default=1.0,   type=float, help="SDCard command timeout (in seconds, extended with the length for DMAs).")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    sdcard = SDCardDriver(bus, timeout=args.timeout, clk_freq_hs=args.clk_freq)
+
+    clk_freq = sdcard.init()
+    chunk    = parse_length(args.chunk)//512
+    chunks   = max(parse_length(args.length)//(chunk*512), 1)
+    nbytes   = chunks*chunk*512
+    base     = bus.mems.main_ram.base
+    print("SDCard Clk: {:.2f}MHz, {:d} chunks of {:d} blocks ({:d} bytes).".format(
+        clk_freq/1e6, chunks, chunk, nbytes), file=sys.stderr)
+
+    errors = 0
+
+    # Write (fill the DMA buffer with random data, written to each chunk).
+    if args.write:
+        datas = [random.getrandbits(32) for _ in range(chunk*512//4)]
+        bus.write(base, datas)
+        start = time.time()
+        for n in range(chunks):
+            errors += not sdcard.write(args.block + n*chunk, chunk, base)
+        elapsed = time.time() - start
+        print("Write: {:.3f}s ({:.2f} MB/s).".format(elapsed, nbytes/elapsed/1e6), file=sys.stderr)
+
+    # Read (to a second DMA buffer).
+    start = time.time()
+    for n in range(chunks):
+        errors += not sdcard.read(args.block + n*chunk, chunk, base + chunk*512)
+    elapsed = time.time() - start
+    print("Read:  {:.3f}s ({:.2f} MB/s).".format(elapsed, nbytes/elapsed/1e6), file=sys.stderr)
+
+    # Check (last chunk).
+    if args.write:
+        readback = bus.read(base + chunk*512, chunk*512//4)
+        errors  += sum(a != b for a, b in zip(readback, datas))
+    print("{:d} errors.".format(errors), file=sys.stderr)
+
+    bus.close()
+    sys.exit(errors != 0)
+
+if __name__ == "__main__":
+    main()
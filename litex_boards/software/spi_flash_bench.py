@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SPI Flash XIP Benchmark (targets built with --spi-flash-xip): drives the BIOS console to measure
+# the boot time (to the BIOS prompt, and bus cycles spent waiting for the SPI Flash during the boot)
+# and the SPI Flash fetch bandwidth (BIOS mem_speed, sequential/random reads), with the cache
+# statistics (accesses/misses/stalls).
+#
+# python3 -m litex_boards.software.spi_flash_bench --csr-csv=build/<target>/csr.csv --port=<port>
+#
+# Boot statistics require the SoC to be reset: through the BIOS reboot command or, on targets
+# without SoC reset (iCE40), by resetting/re-plugging the board after starting with --no-reboot.
+
+import re
+import sys
+import time
+import argparse
+
+import serial
+
+from litex_boards.software.sata_raid_bench import parse_length
+
+# CSV Parsing --------------------------------------------------------------------------------------
+
+def parse_csr_csv(filename):
+    csrs, mems, constants = {}, {}, {}
+    for line in open(filename):
+        if line.startswith("#"):
+            continue
+        fields = line.strip().split(",")
+        if fields[0] == "csr_register":
+            csrs[fields[1]] = int(fields[2], 0)
+        if fields[0] == "memory_region":
+            mems[fields[1]] = int(fields[2], 0)
+        if fields[0] == "constant":
+            constants[fields[1]] = fields[2]
+    return csrs, mems, constants
+
+# BIOS Console -------------------------------------------------------------------------------------
+
+class BIOSConsole:
+    prompt = re.compile(rb"litex\S*> ")
+
+    def __init__(self, port, baudrate, timeout=10.0):
+        self.port    = serial.Serial(port, baudrate, timeout=0.1)
+        self.timeout = timeout
+
+    def wait_prompt(self, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        output  = b""
+        start   = time.time()
+        while not self.prompt.search(output):
+            output += self.port.read(1024)
+            if (time.time() - start) > timeout:
+                raise TimeoutError("BIOS prompt timeout.")
+        return output.decode(errors="replace")
+
+    def command(self, cmd, timeout=None):
+        self.port.reset_input_buffer()
+        self.port.write(f"{cmd}\n".encode())
+        return self.wait_prompt(timeout)
+
+    def read32(self, addr):
+        # Memory dump: 0xaddr  b0 b1 b2 b3 (little-endian CPU).
+        output = self.command(f"mem_read 0x{addr:08x} 4")
+        dump   = re.search(r"0x{:08x}\s+((?:[0-9a-f]{{2}} ){{4}})".format(addr), output)
+        if dump is None:
+            raise IOError(f"Unable to read 0x{addr:08x}.")
+        return int.from_bytes(bytes.fromhex(dump.group(1).replace(" ", "")), "little")
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="SPI Flash XIP Benchmark.")
+    parser.add_argument("--csr-csv",   default="csr.csv",               help="SoC CSV file.")
+    parser.add_argument("--port",      default="/dev/ttyUSB1",          help="BIOS console serial port.")
+    parser.add_argument("--baudrate",  default=115200, type=int,        help="BIOS console baudrate.")
+    parser.add_argument("--name",      default="spiflash",              help="SPI Flash name.")
+    parser.add_argument("--offset",    default="0x0",                   help="Benchmark offset in SPI Flash (bitstream/BIOS regions are fine, reads only).")
+    parser.add_argument("--length",    default="64KB",                  help="Benchmark length (in bytes or with KB/MB suffix).")
+    parser.add_argument("--no-reboot", action="store_true",             help="Don't reboot the SoC (reset it manually) for the boot measurement.")
+    parser.add_argument("--timeout",   default=60.0,   type=float,      help="BIOS boot/command timeout (in seconds).")
+    args = parser.parse_args()
+
+    csrs, mems, constants = parse_csr_csv(args.csr_csv)
+    sys_clk_freq = int(constants["config_clock_frequency"])
+    console      = BIOSConsole(args.port, args.baudrate, timeout=args.timeout)
+    cache_regs   = ["control", "accesses", "misses", "stalls"]
+    cache_csrs   = {n: csrs.get(f"{args.name}_cache_{n}") for n in cache_regs}
+    with_cache   = None not in cache_csrs.values()
+
+    def cache_stats():
+        accesses, misses, stalls = [console.read32(cache_csrs[n]) for n in cache_regs[1:]]
+        return "{:d} accesses, {:d} misses ({:.1f}%), {:.3f}ms stalled".format(
+            accesses, misses, 100*misses/max(accesses, 1), stalls*1e3/sys_clk_freq)
+
+    # Boot.
+    print("Boot...", file=sys.stderr)
+    start = time.time()
+    if args.no_reboot:
+        console.wait_prompt()
+    else:
+        console.port.write(b"\nreboot\n")
+        time.sleep(0.1)
+        console.port.reset_input_buffer()
+        console.wait_prompt()
+    elapsed = time.time() - start
+    print("  Prompt after {:.3f}s (includes console output).".format(elapsed), file=sys.stderr)
+    if with_cache:
+        print("  SPI Flash: " + cache_stats() + ".", file=sys.stderr)
+
+    # Fetch Bandwidth.
+    base   = mems[args.name] + int(args.offset, 0)
+    length = parse_length(args.length)
+    for mode, random in [("Sequential", 0), ("Random", 1)]:
+        if with_cache:
+            console.command(f"mem_write 0x{cache_csrs['control']:08x} 0x3") # Flush/Clear.
+        output = console.command(f"mem_speed 0x{base:08x} {length:d} 1 {random:d}")
+        speed  = re.search(r"Read speed: (\S+)", output)
+        print("{:s} Read: {:s}.".format(mode, speed.group(1) if speed else "n/a"), file=sys.stderr)
+        if with_cache:
+            print("  SPI Flash: " + cache_stats() + ".", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# DRAM dump over UDP for targets built with --with-udp-streamer: the DRAM region is programmed and
+# started over Etherbone, then received from the LiteEthUDPDRAMStreamer as sequence-numbered UDP
+# packets (8-byte header: sequence number + DRAM byte offset, little-endian) and reassembled. Lost
+# packets are detected from the offsets and requested again (one streamer run per lost packet).
+# Offset, length and payload have to be multiples of the Streamer's alignment (DRAM word).
+#
+# ./xilinx_kcu105.py --with-etherbone --with-udp-streamer --build --load
+# python3 -m litex_boards.software.udp_dram_dump --csr-csv=build/xilinx_kcu105/csr.csv \
+#     --offset=0 --length=0x10000000 dump.bin
+#
+# With several Streamers (--with-dual-ethernet --eth-dual-mode=independent targets), the region is
+# split between them and Streamer n sends to the Host UDP port udp_port + n:
+# python3 -m litex_boards.software.udp_dram_dump --csr-csv=build/colorlight_5a_75b/csr.csv \
+#     --streamers=udp_streamer0,udp_streamer1 --length=0x400000 dump.bin
+
+import sys
+import time
+import socket
+import select
+import struct
+import argparse
+
+from litex.tools.remote.comm_udp import CommUDP
+
+# Constants (litex_boards/cores/udp_dram.py) -------------------------------------------------------
+
+UDP_DRAM_HEADER_LENGTH = 8
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _host_ip(ip):
+    # Local address of the interface routing to the board.
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.connect((ip, 1))
+    host_ip = s.getsockname()[0]
+    s.close()
+    return host_ip
+
+def _ip_to_int(ip):
+    return struct.unpack(">I", socket.inet_aton(ip))[0]
+
+class _Streamer:
+    def __init__(self, bus, name="udp_streamer"):
+        self.bus  = bus
+        self.name = name
+        if not hasattr(bus.regs, f"{name}_control"):
+            raise ValueError("SoC built without --with-udp-streamer.")
+
+    def __getattr__(self, reg):
+        return getattr(self.bus.regs, f"{self.name}_{reg}")
+
+    def configure(self, host_ip, port, payload, gap):
+        self.ip_address.write(_ip_to_int(host_ip))
+        self.udp_port.write(port)
+        self.payload.write(payload)
+        self.gap.write(gap)
+
+    @property
+    def alignment(self):
+        return self.bus.constants.d.get(f"{self.name}_alignment", 1)
+
+    def start(self, offset, length):
+        self.base.write(offset)
+        self.length.write(length)
+        self.control.write(1)
+        if self.status.read() & 0b10:
+            raise ValueError(f"{self.name}: start refused (unaligned offset/length/payload).")
+
+# Receive ------------------------------------------------------------------------------------------
+
+def receive(socks, streamers, data, received, offset, chunks, payload):
+    """Streams DRAM[offset + position:][:length] to data[position:] for each (position, length) of
+    chunks (one per streamer/socket), returns the received bytes.
+
+    Packets are placed from their (absolute) DRAM offset: late packets of a previous run are still
+    written at the right place, packets outside of data are dropped."""
+    nbytes    = 0
+    buf       = bytearray(payload + UDP_DRAM_HEADER_LENGTH)
+    for sock, streamer, (position, length) in zip(socks, streamers, chunks):
+        streamer.start(offset + position, length)
+    socks = socks[:len(chunks)]
+    total = sum(length for _, length in chunks)
+    while nbytes < total:
+        readable, _, _ = select.select(socks, [], [], socks[0].gettimeout())
+        if not readable:
+            break
+        for sock in readable:
+            n = sock.recv_into(buf)
+            if n < UDP_DRAM_HEADER_LENGTH:
+                continue
+            _, pkt_offset = struct.unpack_from("<II", buf)
+            pkt_offset   -= offset
+            pkt_length    = n - UDP_DRAM_HEADER_LENGTH
+            if (pkt_offset < 0) or (pkt_offset + pkt_length > len(data)) or (pkt_offset % payload):
+                continue
+            data[pkt_offset:pkt_offset + pkt_length] = buf[UDP_DRAM_HEADER_LENGTH:n]
+            if not received[pkt_offset//payload]:
+                received[pkt_offset//payload] = 1
+                nbytes += pkt_length
+    return nbytes
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="DRAM dump over UDP utility.")
+    parser.add_argument("filename",                                   help="Output file.")
+    parser.add_argument("--ip",        default="192.168.1.50",        help="Board IP address.")
+    parser.add_argument("--host-ip",   default=None,                  help="Host IP address (default: route to the board).")
+    parser.add_argument("--udp-port",  default=5000,    type=int,     help="Host UDP port.")
+    parser.add_argument("--csr-csv",   default="csr.csv",             help="SoC CSV file.")
+    parser.add_argument("--streamers", default="udp_streamer",        help="Streamer(s) name(s) (comma separated, the region is split between them).")
+    parser.add_argument("--offset",    default="0",                   help="DRAM offset (in bytes).")
+    parser.add_argument("--length",    default="0x100000",            help="Length (in bytes).")
+    parser.add_argument("--payload",   default=1024,    type=int,     help="UDP payload (in bytes, <= 1464 with a 1500 MTU).")
+    parser.add_argument("--gap",       default=0,       type=int,     help="Inter-packet gap (in sys_clk cycles, to pace slow Hosts).")
+    parser.add_argument("--retries",   default=3,       type=int,     help="Number of retries for lost packets.")
+    parser.add_argument("--timeout",   default=0.5,     type=float,   help="Receive timeout (in seconds).")
+    args = parser.parse_args()
+
+    offset = int(args.offset, 0)
+    length = int(args.length, 0)
+
+    bus = CommUDP(args.ip, csr_csv=args.csr_csv)
+    bus.open()
+    host_ip   = args.host_ip or _host_ip(args.ip)
+    streamers = [_Streamer(bus, name) for name in args.streamers.split(",")]
+    alignment = max(streamer.alignment for streamer in streamers)
+    for arg, value in [("offset", offset), ("length", length), ("payload", args.payload)]:
+        if value % alignment:
+            parser.error(f"--{arg} has to be a multiple of {alignment} bytes.")
+    if args.payload == 0:
+        parser.error("--payload has to be > 0.")
+    socks     = []
+    for n, streamer in enumerate(streamers):
+        streamer.configure(host_ip, args.udp_port + n, args.payload, args.gap)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 64*1024*1024)
+        sock.bind(("", args.udp_port + n))
+        sock.settimeout(args.timeout)
+        socks.append(sock)
+
+    data     = bytearray(length)
+    npackets = (length + args.payload - 1)//args.payload
+    received = bytearray(npackets)
+
+    # Split the region between the Streamers (on packet boundaries).
+    chunk  = args.payload*((npackets + len(streamers) - 1)//len(streamers))
+    chunks = [(p, min(chunk, length - p)) for p in range(0, length, chunk)]
+
+    # Dump.
+    start   = time.time()
+    nbytes  = receive(socks, streamers, data, received, offset, chunks, args.payload)
+    elapsed = time.time() - start
+    lost    = [i for i in range(npackets) if not received[i]]
+    print("Received {:d}/{:d} bytes in {:.3f}s ({:.2f} MB/s), {:d}/{:d} packets lost.".format(
+        nbytes, length, elapsed, nbytes/elapsed/1e6, len(lost), npackets), file=sys.stderr)
+
+    # Retries (on the first Streamer).
+    for retry in range(args.retries):
+        if not lost:
+            break
+        for i in lost:
+            pkt_length = min(args.payload, length - i*args.payload)
+            receive(socks[:1], streamers[:1], data, received, offset,
+                [(i*args.payload, pkt_length)], args.payload)
+        lost = [i for i in lost if not received[i]]
+        print("Retry {:d}: {:d} packets lost.".format(retry, len(lost)), file=sys.stderr)
+
+    for sock in socks:
+        sock.close()
+    bus.close()
+    with open(args.filename, "wb") as f:
+        f.write(data)
+    if lost:
+        raise OSError(f"{len(lost)} packets lost.")
+
+if __name__ == "__main__":
+    main()
@@ -25,7 +25,11 @@ from litedram.modules import MT40A512M16
 from litedram.phy import usddrphy
 
 from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.eth_10gbaser import LiteEthPHY10GBASER, add_etherbone_10gbaser
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -60,7 +64,8 @@ class CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(150e6), ddram_channel=0, with_led_chaser=True,
-                 with_pcie=False, **kwargs):
+                 with_pcie=False, pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_bench=False, with_etherbone=False, eth_ip="192.168.1.50", **kwargs):
         platform = adi_adrv2crr_fmc.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -91,7 +96,30 @@ class BaseSoC(SoCCore):
                 speed = "gen3",
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
+
+        # 10G Etherbone (10GBASE-R on QSFP Lane 0, 156.25MHz RefClk from the AD9545) --------------
+        if with_etherbone:
+            qsfp_ctl = platform.request("qsfp_ctl")
+            self.comb += [
+                qsfp_ctl.resetl.eq(1),
+                qsfp_ctl.lpmode.eq(0),
+            ]
+            qsfp_pads = platform.request("qsfp")
+            self.submodules.ethphy = LiteEthPHY10GBASER(
+                refclk_pads  = qsfp_pads,
+                refclk_freq  = 156.25e6,
+                data_pads    = qsfp_pads,
+                sys_clk_freq = sys_clk_freq,
+                device       = platform.device)
+            add_etherbone_10gbaser(self, self.ethphy, ip_address=eth_ip)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -122,18 +150,26 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on ADI ADRV2CRR-FMC")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",           action="store_true", help="Build design")
-    target_group.add_argument("--load",            action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq",    default=150e6,       help="System clock frequency (default: 150 MHz)")
-    target_group.add_argument("--with-pcie",       action="store_true", help="Enable PCIe support")
-    target_group.add_argument("--driver",          action="store_true", help="Generate PCIe driver")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=150e6,          help="System clock frequency (default: 150 MHz)")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver")
+    target_group.add_argument("--with-etherbone",           action="store_true",    help="Enable 10G Etherbone support (10GBASE-R on QSFP Lane 0).")
+    target_group.add_argument("--eth-ip",                   default="192.168.1.50", help="Etherbone IP address.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_pcie    = args.with_pcie,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_pcie                = args.with_pcie,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_etherbone           = args.with_etherbone,
+        eth_ip                   = args.eth_ip,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
 
@@ -27,7 +27,11 @@ from litedram.phy import s7ddrphy
 from liteeth.phy import LiteEthPHY
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -59,10 +63,15 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(100e6),
-        with_ethernet   = False, with_etherbone=False, eth_ip="192.168.1.50", eth_dynamic_ip=False,
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_sata       = False,
+        with_ethernet            = False, with_etherbone=False, with_hybrid_ethernet=False,
+        eth_ip                   = "192.168.1.50", eth_dynamic_ip=False,
+        with_led_chaser          = True,
+        with_pcie                = False,
+        pcie_dmas                = 1,
+        pcie_address_width       = 32,
+        pcie_dma_buffering_depth = 1024,
+        with_pcie_bench          = False,
+        with_sata                = False,
         **kwargs):
         platform = aliexpress_stlv7325.Platform()
 
@@ -86,7 +95,7 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHY(
                 clock_pads = self.platform.request("eth_clocks", 0),
                 pads       = self.platform.request("eth", 0),
@@ -95,13 +104,22 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
         # TODO verify / test
         # SATA -------------------------------------------------------------------------------------
@@ -141,32 +159,38 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on AliExpress STLV7325")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",         action="store_true", help="Build design.")
-    target_group.add_argument("--load",          action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq",  default=100e6,       help="System clock frequency.")
+    target_group.add_argument("--build",                    action="store_true",              help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",              help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=100e6,                    help="System clock frequency.")
     ethopts = target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true",              help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true",              help="Enable Etherbone support.")
-    target_group.add_argument("--eth-ip",          default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
-    target_group.add_argument("--eth-dynamic-ip",  action="store_true",              help="Enable dynamic Ethernet IP addresses setting.")
-    target_group.add_argument("--with-pcie",       action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",          action="store_true", help="Generate PCIe driver.")
-    target_group.add_argument("--with-sata",       action="store_true", help="Enable SATA support.")
+    ethopts.add_argument("--with-ethernet",  action="store_true",                             help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone", action="store_true",                             help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true",                       help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
+    target_group.add_argument("--eth-ip",                   default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
+    target_group.add_argument("--eth-dynamic-ip",           action="store_true",              help="Enable dynamic Ethernet IP addresses setting.")
+    target_group.add_argument("--with-pcie",                action="store_true",              help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",              help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",              help="Generate PCIe driver.")
+    target_group.add_argument("--with-sata",                action="store_true",              help="Enable SATA support.")
     sdopts = target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
+    sdopts.add_argument("--with-spi-sdcard", action="store_true",                             help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",     action="store_true",                             help="Enable SDCard support.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_pcie      = args.with_pcie,
-        with_sata      = args.with_sata,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_ethernet            = args.with_ethernet,
+        with_etherbone           = args.with_etherbone,
+        with_hybrid_ethernet     = args.with_hybrid_ethernet,
+        eth_ip                   = args.eth_ip,
+        eth_dynamic_ip           = args.eth_dynamic_ip,
+        with_pcie                = args.with_pcie,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_sata                = args.with_sata,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     if args.with_spi_sdcard:
@@ -22,14 +22,17 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.video import VideoS7HDMIPHY
 
-from litedram.modules import MTA18ASF2G72PZ
+from litedram.modules import MTA18ASF2G72PZ, parse_spd_hexdump, SDRAMRegisteredModule
 from litedram.phy.s7ddrphy import A7DDRPHY
 from litedram.init import get_sdram_phy_py_header
 from litedram.core.controller import ControllerSettings
 from litedram.common import PhySettings, GeomSettings, TimingSettings
 
 from liteeth.phy import LiteEthS7PHYRGMII
-from litex.soc.cores.hyperbus import HyperRAM
+
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.hyperram import HyperRAMFrontend
+from litex_boards.cores.bitstream import bitstream_args, bitstream_argdict, bitstream_settings
 
 from litespi.modules import S25FL128S0
 from litespi.opcodes import SpiNorFlashOpCodes as Codes
@@ -74,9 +77,11 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, *, sys_clk_freq=int(100e6), iodelay_clk_freq=200e6,
-            with_ethernet=False, with_etherbone=False, eth_ip="192.168.1.50", eth_reset_time="10e-3", eth_dynamic_ip=False,
-            with_hyperram=False, with_sdcard=False, with_jtagbone=True, with_uartbone=False, with_spi_flash=False,
-            with_led_chaser=True, with_video_terminal=False, with_video_framebuffer=False, **kwargs):
+            with_ethernet=False, with_etherbone=False, with_hybrid_ethernet=False,
+            eth_ip="192.168.1.50", eth_reset_time="10e-3", eth_dynamic_ip=False,
+            with_hyperram=False, hyperram_clk_ratio="4:1", hyperram_cache_size=0,
+            with_sdcard=False, with_jtagbone=True, with_uartbone=False, with_spi_flash=False,
+            with_led_chaser=True, with_video_terminal=False, with_video_framebuffer=False, spd_dump=None, **kwargs):
         platform = antmicro_datacenter_ddr4_test_board.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -94,17 +99,28 @@ class BaseSoC(SoCCore):
                 sys_clk_freq     = sys_clk_freq,
                 is_rdimm         = True,
             )
+            if spd_dump is not None:
+                ram_spd    = parse_spd_hexdump(spd_dump)
+                ram_module = SDRAMRegisteredModule.from_spd_data(ram_spd, sys_clk_freq)
+                ram_size   = None # From SPD.
+                print("DDR4: loaded config from", spd_dump)
+            else:
+                ram_module = MTA18ASF2G72PZ(sys_clk_freq, "1:4")
+                ram_size   = 0x40000000
             self.add_sdram("sdram",
                 phy                     = self.ddrphy,
-                module                  = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
+                module                  = ram_module,
                 l2_cache_size           = kwargs.get("l2_size", 8192),
                 l2_cache_min_data_width = 256,
-                size                    = 0x40000000,
+                size                    = ram_size,
             )
 
         # HyperRAM ---------------------------------------------------------------------------------
         if with_hyperram:
-            self.submodules.hyperram = HyperRAM(platform.request("hyperram"), sys_clk_freq=sys_clk_freq)
+            self.submodules.hyperram = HyperRAMFrontend(platform.request("hyperram"),
+                sys_clk_freq = sys_clk_freq,
+                clk_ratio    = hyperram_clk_ratio,
+                cache_size   = hyperram_cache_size)
             self.bus.add_slave("hyperram", slave=self.hyperram.bus, region=SoCRegion(origin=0x20000000, size=8*1024*1024))
 
         # SD Card ----------------------------------------------------------------------------------
@@ -112,7 +128,7 @@ class BaseSoC(SoCCore):
             self.add_sdcard()
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
@@ -126,6 +142,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
 
         # UartBone ---------------------------------------------------------------------------------
         if with_uartbone:
@@ -188,19 +206,24 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",         action="store_true",    help="Add Ethernet")
     ethopts.add_argument("--with-etherbone",        action="store_true",    help="Add EtherBone")
+    ethopts.add_argument("--with-hybrid-ethernet",  action="store_true",    help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     target_group.add_argument("--eth-ip",                 default="192.168.1.50", help="Ethernet/Etherbone IP address")
     target_group.add_argument("--eth-dynamic-ip",         action="store_true",    help="Enable dynamic Ethernet IP addresses setting")
     target_group.add_argument("--eth-reset-time",         default="10e-3",        help="Duration of Ethernet PHY reset")
     target_group.add_argument("--with-hyperram",          action="store_true",    help="Add HyperRAM")
+    target_group.add_argument("--hyperram-clk-ratio",     default="4:1", choices=["4:1", "2:1"],          help="HyperRAM Clk ratio to sys_clk_freq (4:1 or 2:1)")
+    target_group.add_argument("--hyperram-cache-size",    default=0, type=int,    help="HyperRAM Cache size in bytes (0 to disable)")
     target_group.add_argument("--with-sdcard",            action="store_true",    help="Add SDCard")
     target_group.add_argument("--with-jtagbone",          action="store_true",    help="Add JTAGBone")
     target_group.add_argument("--with-uartbone",          action="store_true",    help="Add UartBone on 2nd serial")
     target_group.add_argument("--with-video-terminal",    action="store_true",    help="Enable Video Terminal (HDMI)")
     target_group.add_argument("--with-video-framebuffer", action="store_true",    help="Enable Video Framebuffer (HDMI)")
     target_group.add_argument("--with-spi-flash",         action="store_true",    help="Enable SPI Flash (MMAPed).")
+    target_group.add_argument("--spd-dump",               type=str,               help="DDR4 configuration file, dumped using the `sdram_spd` command in LiteX BIOS.")
     builder_args(parser)
     soc_core_args(parser)
     vivado_build_args(parser)
+    bitstream_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -210,17 +233,22 @@ def main():
         iodelay_clk_freq       = int(float(args.iodelay_clk_freq)),
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        with_hybrid_ethernet   = args.with_hybrid_ethernet,
         eth_ip                 = args.eth_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_hyperram          = args.with_hyperram,
+        hyperram_clk_ratio     = args.hyperram_clk_ratio,
+        hyperram_cache_size    = args.hyperram_cache_size,
         with_sdcard            = args.with_sdcard,
         with_jtagbone          = args.with_jtagbone,
         with_uartbone          = args.with_uartbone,
         with_spi_flash         = args.with_spi_flash,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        spd_dump               = args.spd_dump,
         **soc_core_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
+    bitstream_settings(soc.platform, **bitstream_argdict(args))
     if args.build:
         builder.build(**vivado_build_argdict(args))
         builder.soc.generate_sdram_phy_py_header(os.path.join(builder.output_dir, "sdram_init.py"))
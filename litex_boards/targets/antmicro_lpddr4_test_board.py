@@ -20,7 +20,9 @@ from litedram.modules import MT53E256M16D1
 from litedram.phy import lpddr4
 
 from liteeth.phy import LiteEthS7PHYRGMII
-from litex.soc.cores.hyperbus import HyperRAM
+
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.hyperram import HyperRAMFrontend
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -46,8 +48,10 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, *, sys_clk_freq=int(50e6), iodelay_clk_freq=200e6,
-            with_ethernet=False, with_etherbone=False, eth_ip="192.168.1.50", eth_dynamic_ip=False,
-            with_hyperram=False, with_sdcard=False, with_jtagbone=True, with_uartbone=False,
+            with_ethernet=False, with_etherbone=False, with_hybrid_ethernet=False,
+            eth_ip="192.168.1.50", eth_dynamic_ip=False,
+            with_hyperram=False, hyperram_clk_ratio="4:1", hyperram_cache_size=0,
+            with_sdcard=False, with_jtagbone=True, with_uartbone=False,
             with_led_chaser=True, **kwargs):
         platform = antmicro_lpddr4_test_board.Platform()
 
@@ -72,7 +76,10 @@ class BaseSoC(SoCCore):
 
         # HyperRAM ---------------------------------------------------------------------------------
         if with_hyperram:
-            self.submodules.hyperram = HyperRAM(platform.request("hyperram"), sys_clk_freq=sys_clk_freq)
+            self.submodules.hyperram = HyperRAMFrontend(platform.request("hyperram"),
+                sys_clk_freq = sys_clk_freq,
+                clk_ratio    = hyperram_clk_ratio,
+                cache_size   = hyperram_cache_size)
             self.bus.add_slave("hyperram", slave=self.hyperram.bus, region=SoCRegion(origin=0x20000000, size=8*1024*1024))
 
         # SD Card ----------------------------------------------------------------------------------
@@ -80,7 +87,7 @@ class BaseSoC(SoCCore):
             self.add_sdcard()
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
@@ -93,6 +100,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
 
         # Jtagbone ---------------------------------------------------------------------------------
         if with_jtagbone:
@@ -122,9 +131,12 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",   action="store_true",    help="Add Ethernet.")
     ethopts.add_argument("--with-etherbone",  action="store_true",    help="Add EtherBone.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     target_group.add_argument("--eth-ip",           default="192.168.1.50", help="Ethernet/Etherbone IP address.")
     target_group.add_argument("--eth-dynamic-ip",   action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
     target_group.add_argument("--with-hyperram",    action="store_true",    help="Add HyperRAM.")
+    target_group.add_argument("--hyperram-clk-ratio",  default="4:1", choices=["4:1", "2:1"],       help="HyperRAM Clk ratio to sys_clk_freq (4:1 or 2:1).")
+    target_group.add_argument("--hyperram-cache-size", default=0, type=int, help="HyperRAM Cache size in bytes (0 to disable).")
     target_group.add_argument("--with-sdcard",      action="store_true",    help="Add SDCard.")
     target_group.add_argument("--with-jtagbone",    action="store_true",    help="Add JTAGBone.")
     target_group.add_argument("--with-uartbone",    action="store_true",    help="Add UartBone on 2nd serial.")
@@ -136,16 +148,19 @@ def main():
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        sys_clk_freq      = int(float(args.sys_clk_freq)),
-        iodelay_clk_freq  = int(float(args.iodelay_clk_freq)),
-        with_ethernet     = args.with_ethernet,
-        with_etherbone    = args.with_etherbone,
-        eth_ip            = args.eth_ip,
-        eth_dynamic_ip    = args.eth_dynamic_ip,
-        with_hyperram     = args.with_hyperram,
-        with_sdcard       = args.with_sdcard,
-        with_jtagbone     = args.with_jtagbone,
-        with_uartbone     = args.with_uartbone,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        iodelay_clk_freq     = int(float(args.iodelay_clk_freq)),
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_ip               = args.eth_ip,
+        eth_dynamic_ip       = args.eth_dynamic_ip,
+        with_hyperram        = args.with_hyperram,
+        hyperram_clk_ratio   = args.hyperram_clk_ratio,
+        hyperram_cache_size  = args.hyperram_cache_size,
+        with_sdcard          = args.with_sdcard,
+        with_jtagbone        = args.with_jtagbone,
+        with_uartbone        = args.with_uartbone,
         **soc_core_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
@@ -39,6 +39,10 @@ from litedram.phy import s7ddrphy
 
 from liteeth.phy.s7rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.etherbone_burst import add_etherbone_burst
+from litex_boards.cores.udp_dram import add_udp_dram_streamer
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -68,11 +72,15 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(125e6),
-        with_ethernet   = False,
-        with_etherbone  = False,
-        with_rts_reset  = False,
-        with_led_chaser = True,
-        spd_dump        = None,
+        with_ethernet        = False,
+        with_etherbone       = False,
+        with_hybrid_ethernet = False,
+        etherbone_burst      = False,
+        eth_data_width       = 8,
+        with_udp_streamer    = False,
+        with_rts_reset       = False,
+        with_led_chaser      = True,
+        spd_dump             = None,
         **kwargs
     ):
         platform = berkeleylab_marble.Platform()
@@ -113,7 +121,7 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet ---------------------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -124,11 +132,23 @@ class BaseSoC(SoCCore):
             self.add_ethernet(
                 phy            = self.ethphy,
                 dynamic_ip     = True,
-                software_debug = False
+                software_debug = False,
+                data_width     = eth_data_width
             )
 
-        if with_etherbone:
-            self.add_etherbone(phy=self.ethphy, buffer_depth=255)
+        if with_etherbone and etherbone_burst:
+            add_etherbone_burst(self, phy=self.ethphy, data_width=eth_data_width)
+        elif with_etherbone:
+            self.add_etherbone(phy=self.ethphy, buffer_depth=255, data_width=eth_data_width)
+
+        if with_hybrid_ethernet:
+            add_hybrid_ethernet(self, phy=self.ethphy, buffer_depth=255, dynamic_ip=True,
+                data_width=eth_data_width)
+
+        # UDP DRAM Streamer ------------------------------------------------------------------------
+        if with_udp_streamer:
+            assert with_etherbone or with_hybrid_ethernet, "UDP DRAM Streamer requires Etherbone."
+            add_udp_dram_streamer(self)
 
         # System I2C (behing multiplexer) ----------------------------------------------------------
         i2c_pads = platform.request('i2c_fpga')
@@ -151,6 +171,10 @@ def main():
     target_group.add_argument("--sys-clk-freq",   default=125e6,       help="System clock frequency.")
     target_group.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     target_group.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    target_group.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
+    target_group.add_argument("--eth-data-width", default=8, type=int, help="Ethernet datapath width (in bits).", choices=[8, 32])
+    target_group.add_argument("--etherbone-burst", action="store_true", help="Use burst/pipelined Etherbone (see software/etherbone_batch.py).")
+    target_group.add_argument("--with-udp-streamer", action="store_true", help="Enable DRAM -> UDP Streamer (with Etherbone, see software/udp_dram_dump.py).")
     target_group.add_argument("--with-rts-reset", action="store_true", help="Connect UART RTS line to sys_clk reset.")
     target_group.add_argument("--with-bist",      action="store_true", help="Add DDR3 BIST Generator/Checker.")
     target_group.add_argument("--spd-dump",       type=str,            help="DDR3 configuration file, dumped using the `spdread` command in LiteX BIOS.")
@@ -158,12 +182,19 @@ def main():
     soc_core_args(parser)
     args = parser.parse_args()
 
+    assert not (args.with_hybrid_ethernet and (args.with_ethernet or args.with_etherbone))
+    assert args.with_etherbone or not args.etherbone_burst, "--etherbone-burst requires Etherbone."
+
     soc = BaseSoC(
-        sys_clk_freq  = int(float(args.sys_clk_freq)),
-        with_ethernet = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        with_bist = args.with_bist,
-        spd_dump = args.spd_dump,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        etherbone_burst      = args.etherbone_burst,
+        eth_data_width       = args.eth_data_width,
+        with_udp_streamer    = args.with_udp_streamer,
+        with_bist            = args.with_bist,
+        spd_dump             = args.spd_dump,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -55,10 +55,13 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import M12L16161A, M12L64322A
+from litex_boards.cores.sdram import sdram_rate_auto
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 
 from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -116,8 +119,11 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, board, revision, sys_clk_freq=60e6, toolchain="trellis", with_ethernet=False,
-                 with_etherbone=False, eth_ip="192.168.1.50", eth_phy=0, with_led_chaser=True,
-                 use_internal_osc=False, sdram_rate="1:1", **kwargs):
+                 with_etherbone=False, with_hybrid_ethernet=False, eth_ip="192.168.1.50", eth_phy=0,
+                 eth_data_width=32,
+                 with_dual_ethernet=False, eth_dual_mode="independent", with_udp_streamer=False,
+                 with_led_chaser=True, use_internal_osc=False, sdram_rate="1:1", with_sdram_bist=False,
+                 **kwargs):
         board = board.lower()
         assert board in ["5a-75b", "5a-75e"]
         if board == "5a-75b":
@@ -125,9 +131,15 @@ class BaseSoC(SoCCore):
         elif board == "5a-75e":
             platform = colorlight_5a_75e.Platform(revision=revision, toolchain=toolchain)
 
-        if board == "5a-75e" and revision == "6.0" and (with_etherbone or with_ethernet):
+        with_eth = with_ethernet or with_etherbone or with_hybrid_ethernet or with_dual_ethernet
+        if board == "5a-75e" and revision == "6.0" and with_eth:
             assert use_internal_osc, "You cannot use the 25MHz clock as system clock since it is provided by the Ethernet PHY and will stop during PHY reset."
 
+        # SDRAM Rate -------------------------------------------------------------------------------
+        sdram_cls  = M12L64322A if (board == "5a-75e" and revision == "6.0") else M12L16161A
+        sdram_rate = sdram_rate_auto(sdram_cls, sys_clk_freq, sdram_rate,
+            max_clk_freq = 125e6) # Board/IOs limited.
+
         # CRG --------------------------------------------------------------------------------------
         with_rst     = kwargs["uart_name"] not in ["serial", "crossover"] # serial_rx shared with user_btn_n.
         with_usb_pll = kwargs.get("uart_name", None) == "usb_acm"
@@ -145,28 +157,50 @@ class BaseSoC(SoCCore):
         if not self.integrated_main_ram_size:
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.submodules.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
-            if board == "5a-75e" and revision == "6.0":
-                sdram_cls  = M12L64322A
-            else:
-                sdram_cls  = M12L16161A
             self.add_sdram("sdram",
                 phy                     = self.sdrphy,
                 module                  = sdram_cls(sys_clk_freq, sdram_rate),
                 l2_cache_size           = kwargs.get("l2_size", 8192),
                 l2_cache_full_memory_we = False,
-
+                with_bist               = with_sdram_bist,
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
                 tx_delay   = 0e-9)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, data_width=32)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=32)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=eth_data_width)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, data_width=eth_data_width)
+
+        # Dual Ethernet ----------------------------------------------------------------------------
+        # Both PHYs, each with its own MAC/UDP/IP stack (eth_ip on PHY 0 with Etherbone, eth_ip + 1
+        # on PHY 1), UDP DRAM Streamers on independent ports or aggregated over both.
+        if with_dual_ethernet:
+            from litex_boards.cores.eth_multiport import add_multiport_ethernet
+            for n in range(2):
+                setattr(self.submodules, f"ethphy{n}", LiteEthPHYRGMII(
+                    clock_pads = self.platform.request("eth_clocks", n),
+                    pads       = self.platform.request("eth", n),
+                    tx_delay   = 0e-9))
+            self.ethcores = add_multiport_ethernet(self, phys=[self.ethphy0, self.ethphy1],
+                data_width = eth_data_width,
+                ip_address = eth_ip)
+
+        # UDP DRAM Streamer ------------------------------------------------------------------------
+        if with_udp_streamer:
+            assert with_etherbone or with_hybrid_ethernet or with_dual_ethernet
+            if with_dual_ethernet:
+                from litex_boards.cores.eth_multiport import add_multiport_udp_dram_streamer
+                add_multiport_udp_dram_streamer(self, self.ethcores, mode=eth_dual_mode)
+            else:
+                from litex_boards.cores.udp_dram import add_udp_dram_streamer
+                add_udp_dram_streamer(self)
 
         # Leds -------------------------------------------------------------------------------------
         # Disable leds when serial is used.
@@ -188,26 +222,38 @@ def main():
     target_group.add_argument("--revision",          default="7.0", type=str,          help="Board revision (6.0, 6.1, 7.0 or 8.0).")
     target_group.add_argument("--sys-clk-freq",      default=60e6,                     help="System clock frequency")
     ethopts = target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",    action="store_true",              help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",   action="store_true",              help="Enable Etherbone support.")
+    ethopts.add_argument("--with-ethernet",      action="store_true",              help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",     action="store_true",              help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true",            help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
+    ethopts.add_argument("--with-dual-ethernet", action="store_true",              help="Enable both Ethernet PHYs (Etherbone on PHY 0, a UDP/IP stack per PHY).")
     target_group.add_argument("--eth-ip",            default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
     target_group.add_argument("--eth-phy",           default=0, type=int,              help="Ethernet PHY (0 or 1).")
+    target_group.add_argument("--eth-data-width",    default=32, type=int,             help="Ethernet datapath width (in bits).", choices=[8, 32])
+    target_group.add_argument("--eth-dual-mode",     default="independent",            help="Dual Ethernet UDP streaming mode (independent: a Streamer per PHY, aggregated: one Streamer over both PHYs).", choices=["independent", "aggregated"])
+    target_group.add_argument("--with-udp-streamer", action="store_true",              help="Enable DRAM -> UDP Streamer (requires --with-etherbone, --with-hybrid-ethernet or --with-dual-ethernet).")
     target_group.add_argument("--use-internal-osc",  action="store_true",              help="Use internal oscillator.")
-    target_group.add_argument("--sdram-rate",        default="1:1",                    help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    target_group.add_argument("--sdram-rate",        default="1:1", choices=["1:1", "1:2", "auto"], help="SDRAM Rate (1:1 Full Rate, 1:2 Half Rate or auto).")
+    target_group.add_argument("--with-sdram-bist",   action="store_true",              help="Enable SDRAM BIST Generator/Checker (rate benchmark with the sdram_bist BIOS command).")
     builder_args(parser)
     soc_core_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(board=args.board, revision=args.revision,
-        sys_clk_freq     = int(float(args.sys_clk_freq)),
-        toolchain        = args.toolchain,
-        with_ethernet    = args.with_ethernet,
-        with_etherbone   = args.with_etherbone,
-        eth_ip           = args.eth_ip,
-        eth_phy          = args.eth_phy,
-        use_internal_osc = args.use_internal_osc,
-        sdram_rate       = args.sdram_rate,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        toolchain            = args.toolchain,
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_ip               = args.eth_ip,
+        eth_phy              = args.eth_phy,
+        eth_data_width       = args.eth_data_width,
+        with_dual_ethernet   = args.with_dual_ethernet,
+        eth_dual_mode        = args.eth_dual_mode,
+        with_udp_streamer    = args.with_udp_streamer,
+        use_internal_osc     = args.use_internal_osc,
+        sdram_rate           = args.sdram_rate,
+        with_sdram_bist      = args.with_sdram_bist,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -23,10 +23,13 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.interconnect.csr import *
 
 from litedram.modules import M12L64322A # Compatible with EM638325-6H.
+from litex_boards.cores.sdram import sdram_rate_auto
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 
 from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -95,13 +98,19 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, board="i5", revision="7.0", toolchain="trellis", sys_clk_freq=60e6, with_ethernet=False,
-                 with_etherbone=False, local_ip="", remote_ip="", eth_phy=0, with_led_chaser=True, 
-                 use_internal_osc=False, sdram_rate="1:1", with_video_terminal=False,
-                 with_video_framebuffer=False, **kwargs):
+                 with_etherbone=False, with_hybrid_ethernet=False, local_ip="", remote_ip="",
+                 eth_phy=0, eth_data_width=8,
+                 with_dual_ethernet=False, eth_dual_mode="independent", with_udp_streamer=False,
+                 with_led_chaser=True, use_internal_osc=False, sdram_rate="1:1", with_video_terminal=False,
+                 with_video_framebuffer=False, with_sdram_bist=False, **kwargs):
         board = board.lower()
         assert board in ["i5", "i9"]
         platform = colorlight_i5.Platform(board=board, revision=revision, toolchain=toolchain)
 
+        # SDRAM Rate -------------------------------------------------------------------------------
+        sdram_rate = sdram_rate_auto(M12L64322A, sys_clk_freq, sdram_rate,
+            max_clk_freq = 125e6) # Board/IOs limited.
+
         # CRG --------------------------------------------------------------------------------------
         with_usb_pll   = kwargs.get("uart_name", None) == "usb_acm"
         with_video_pll = with_video_terminal or with_video_framebuffer
@@ -136,19 +145,46 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = M12L64322A(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size", 8192),
+                with_bist     = with_sdram_bist,
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
                 tx_delay = 0)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, data_width=eth_data_width)
+
+        # Dual Ethernet ----------------------------------------------------------------------------
+        # Both PHYs, each with its own MAC/UDP/IP stack (local_ip on PHY 0 with Etherbone,
+        # local_ip + 1 on PHY 1), UDP DRAM Streamers on independent ports or aggregated over both.
+        if with_dual_ethernet:
+            from litex_boards.cores.eth_multiport import add_multiport_ethernet
+            for n in range(2):
+                setattr(self.submodules, f"ethphy{n}", LiteEthPHYRGMII(
+                    clock_pads = self.platform.request("eth_clocks", n),
+                    pads       = self.platform.request("eth", n),
+                    tx_delay   = 0))
+            self.ethcores = add_multiport_ethernet(self, phys=[self.ethphy0, self.ethphy1],
+                data_width = eth_data_width,
+                ip_address = local_ip or "192.168.1.50")
+
+        # UDP DRAM Streamer ------------------------------------------------------------------------
+        if with_udp_streamer:
+            assert with_etherbone or with_hybrid_ethernet or with_dual_ethernet
+            if with_dual_ethernet:
+                from litex_boards.cores.eth_multiport import add_multiport_udp_dram_streamer
+                add_multiport_udp_dram_streamer(self, self.ethcores, mode=eth_dual_mode)
+            else:
+                from litex_boards.cores.udp_dram import add_udp_dram_streamer
+                add_udp_dram_streamer(self)
 
         if local_ip:
             local_ip = local_ip.split(".")
@@ -185,16 +221,22 @@ def main():
     target_group.add_argument("--revision",         default="7.0", type=str,  help="Board revision (7.0).")
     target_group.add_argument("--sys-clk-freq",     default=60e6,             help="System clock frequency.")
     ethopts = target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",   action="store_true",      help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",  action="store_true",      help="Enable Etherbone support.")
+    ethopts.add_argument("--with-ethernet",      action="store_true",   help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",     action="store_true",   help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
+    ethopts.add_argument("--with-dual-ethernet", action="store_true",   help="Enable both Ethernet PHYs (Etherbone on PHY 0, a UDP/IP stack per PHY).")
     target_group.add_argument("--remote-ip",        default="192.168.1.100",  help="Remote IP address of TFTP server.")
     target_group.add_argument("--local-ip",         default="192.168.1.50",   help="Local IP address.")
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard",  action="store_true",	    help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",      action="store_true",	    help="Enable SDCard support.")
     target_group.add_argument("--eth-phy",          default=0, type=int,      help="Ethernet PHY (0 or 1).")
+    target_group.add_argument("--eth-data-width",   default=8, type=int,      help="Ethernet datapath width (in bits).", choices=[8, 32])
+    target_group.add_argument("--eth-dual-mode",    default="independent",    help="Dual Ethernet UDP streaming mode (independent: a Streamer per PHY, aggregated: one Streamer over both PHYs).", choices=["independent", "aggregated"])
+    target_group.add_argument("--with-udp-streamer", action="store_true",     help="Enable DRAM -> UDP Streamer (requires --with-etherbone, --with-hybrid-ethernet or --with-dual-ethernet).")
     target_group.add_argument("--use-internal-osc", action="store_true",      help="Use internal oscillator.")
-    target_group.add_argument("--sdram-rate",       default="1:1",            help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    target_group.add_argument("--sdram-rate",       default="1:1", choices=["1:1", "1:2", "auto"], help="SDRAM Rate (1:1 Full Rate, 1:2 Half Rate or auto).")
+    target_group.add_argument("--with-sdram-bist",  action="store_true",      help="Enable SDRAM BIST Generator/Checker (rate benchmark with the sdram_bist BIOS command).")
     viopts = target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
@@ -208,11 +250,17 @@ def main():
         sys_clk_freq           = int(float(args.sys_clk_freq)),
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        with_hybrid_ethernet   = args.with_hybrid_ethernet,
         local_ip               = args.local_ip,
         remote_ip              = args.remote_ip,
         eth_phy                = args.eth_phy,
+        eth_data_width         = args.eth_data_width,
+        with_dual_ethernet     = args.with_dual_ethernet,
+        eth_dual_mode          = args.eth_dual_mode,
+        with_udp_streamer      = args.with_udp_streamer,
         use_internal_osc       = args.use_internal_osc,
         sdram_rate             = args.sdram_rate,
+        with_sdram_bist        = args.with_sdram_bist,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         **soc_core_argdict(args)
@@ -21,7 +21,10 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -40,7 +43,9 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_pcie=False,
+                 pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_bench=False, **kwargs):
         platform = decklink_intensity_pro_4k.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -55,7 +60,14 @@ class BaseSoC(SoCCore):
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -63,19 +75,23 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC Blackmagic Decklink Intensity Pro 4K")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",        action="store_true", help="Build design.")
-    target_group.add_argument("--load",         action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq", default=125e6,       help="System clock frequency.")
-    target_group.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",       action="store_true", help="Generate PCIe driver.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=125e6,          help="System clock frequency.")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_pcie    = args.with_pcie | True, # FIXME: Always enable PCIe for now.
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_pcie                = args.with_pcie | True, # FIXME: Always enable PCIe for now.
+        with_pcie_bench          = args.with_pcie_bench,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -27,7 +27,10 @@ from litedram.modules import MT41K128M16
 from litedram.phy import s7ddrphy
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -71,7 +74,11 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCMini):
-    def __init__(self, sys_clk_freq=int(100e6), with_pcie=False, with_sata=False, with_video_terminal=False, with_video_framebuffer=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(100e6), with_pcie=False,
+                 pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_bench=False,
+                 with_sata=False, with_sata_streamer=False,
+                 with_video_terminal=False, with_video_framebuffer=False, **kwargs):
         if with_video_terminal or with_video_framebuffer:
             sys_clk_freq = int(148.5e6) # FIXME: For now requires sys_clk >= video_clk.
         platform = decklink_mini_4k.Platform()
@@ -100,7 +107,14 @@ class BaseSoC(SoCMini):
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -132,6 +146,13 @@ class BaseSoC(SoCMini):
 
             # Core
             self.add_sata(phy=self.sata_phy, mode="read+write")
+
+            # LiteDRAM <-> SATA Streamer (Recorder/Player, see software/sata_dram_bench.py).
+            if with_sata_streamer:
+                from litex_boards.cores.sata_dram import add_sata_dram_streamer
+                add_sata_dram_streamer(self)
+                self.add_jtagbone(chain=2) # Host control, chain 1 already used by JTAG UART.
+
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
             self.submodules.videophy = VideoS7GTPHDMIPHY(platform.request("hdmi_out"),
@@ -150,27 +171,33 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC Blackmagic Decklink Mini 4K")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",                  action="store_true", help="Build design.")
-    target_group.add_argument("--load",                   action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq",           default=148.5e6,     help="System clock frequency.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=148.5e6,        help="System clock frequency.")
     pcieopts = target_group.add_mutually_exclusive_group()
-    pcieopts.add_argument("--with-pcie",            action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",                 action="store_true", help="Generate PCIe driver.")
+    pcieopts.add_argument("--with-pcie",            action="store_true",            help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
     viopts = target_group.add_mutually_exclusive_group()
-    viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
-    viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
-    pcieopts.add_argument("--with-sata",            action="store_true", help="Enable SATA support (over PCIe2SATA).")
+    viopts.add_argument("--with-video-terminal",    action="store_true",            help="Enable Video Terminal (HDMI).")
+    viopts.add_argument("--with-video-framebuffer", action="store_true",            help="Enable Video Framebuffer (HDMI).")
+    pcieopts.add_argument("--with-sata",            action="store_true",            help="Enable SATA support (over PCIe2SATA).")
+    target_group.add_argument("--with-sata-streamer",       action="store_true",    help="Enable LiteDRAM <-> SATA Streamer (Recorder/Player, Host control over JTAGBone, see software/sata_dram_bench.py).")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq           = int(float(args.sys_clk_freq)),
-        with_pcie              = args.with_pcie,
-        with_sata              = args.with_sata,
-        with_video_terminal    = args.with_video_terminal,
-        with_video_framebuffer = args.with_video_framebuffer,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_pcie                = args.with_pcie,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_sata                = args.with_sata,
+        with_sata_streamer       = args.with_sata_streamer,
+        with_video_terminal      = args.with_video_terminal,
+        with_video_framebuffer   = args.with_video_framebuffer,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -9,6 +9,9 @@
 # Build/Load bitstream:
 # ./decklink_quad_hdmi_recorder.py --csr-csv=csr.csv --build --load
 #
+# Build/Load bitstream with PCIe and DRAM (DRAM used as capture buffer, streamed to the Host):
+# ./decklink_quad_hdmi_recorder.py --with-pcie --with-pcie-dram-dma --driver --csr-csv=csr.csv --build --load
+#
 # Use:
 # litex_server --jtag --jtag-config=openocd_xc7_ft232.cfg
 # litex_term crossover
@@ -28,7 +31,11 @@ from litedram.modules import MT41J256M16
 from litedram.phy import usddrphy
 
 from litepcie.phy.uspciephy import USPCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_dram import LitePCIeDRAMDMA
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie import pcie_gen3_data_width, pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -58,7 +65,9 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(200e6), with_pcie=False, pcie_lanes=4, **kwargs):
+    def __init__(self, sys_clk_freq=int(200e6), with_pcie=False, pcie_lanes=4,
+                 pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_dram_dma=False, with_pcie_bench=False, **kwargs):
         platform = decklink_quad_hdmi_recorder.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -85,21 +94,26 @@ class BaseSoC(SoCCore):
             )
 
         # PCIe -------------------------------------------------------------------------------------
-        # FIXME: Does not seem to be working when also enabling DRAM. Has been tested succesfully by
-        # disabling DRAM with --integrated-main-ram-size=0x100.
+        # The PHY crosses its datapaths/MSIs/status to sys clk domain (AsyncFIFOs/MultiRegs) and
+        # add_pcie constrains the sys_clk <-> pcie_clk paths as false paths.
         if with_pcie:
-            data_width = {
-                4 : 128,
-                8 : 256,
-            }[pcie_lanes]
             self.submodules.pcie_phy = USPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 speed      = "gen3",
-                data_width = data_width,
+                data_width = pcie_gen3_data_width(pcie_lanes),
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
-            # False Paths (FIXME: Improve integration).
-            platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks sys_clk] -to [get_clocks pcie_clk_1]")
-            platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks pcie_clk_1] -to [get_clocks sys_clk]")
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA <-> DRAM (DRAM used as a capture buffer, streamed to the Host).
+            if with_pcie_dram_dma:
+                assert hasattr(self, "sdram"), "PCIe DMA <-> DRAM requires DRAM."
+                self.submodules.pcie_dram = LitePCIeDRAMDMA(self.pcie_dma0, self.sdram.crossbar)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -107,18 +121,24 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Blackmagic Decklink Quad HDMI Recorder")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",        action="store_true", help="Build design.")
-    target_group.add_argument("--load",         action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq", default=200e6,       help="System clock frequency.")
-    target_group.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",       action="store_true", help="Generate PCIe driver.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=200e6,          help="System clock frequency.")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-dram-dma",       action="store_true",    help="Connect PCIe DMA to DRAM (Host <-> DRAM streaming).")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_pcie      = args.with_pcie,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_pcie                = args.with_pcie,
+        with_pcie_dram_dma       = args.with_pcie_dram_dma,
+        with_pcie_bench          = args.with_pcie_bench,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
 	)
     builder = Builder(soc, **builder_argdict(args))
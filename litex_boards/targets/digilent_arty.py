@@ -28,6 +28,10 @@ from litedram.phy import s7ddrphy
 
 from liteeth.phy.mii import LiteEthPHYMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.etherbone_burst import add_etherbone_burst
+from litex_boards.cores.bitstream import bitstream_args, bitstream_argdict, bitstream_settings
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -68,9 +72,10 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="a7-35", toolchain="vivado", sys_clk_freq=int(100e6),
-                 with_ethernet=False, with_etherbone=False, eth_ip="192.168.1.50",
-                 eth_dynamic_ip=False, with_led_chaser=True, with_jtagbone=True,
-                 with_spi_flash=False, with_pmod_gpio=False, **kwargs):
+                 with_ethernet=False, with_etherbone=False, with_hybrid_ethernet=False,
+                 eth_ip="192.168.1.50", eth_dynamic_ip=False, etherbone_burst=False,
+                 with_led_chaser=True, with_jtagbone=True,
+                 with_spi_flash=False, spi_flash_xip=False, with_pmod_gpio=False, **kwargs):
         platform = digilent_arty.Platform(variant=variant, toolchain=toolchain)
 
         # CRG --------------------------------------------------------------------------------------
@@ -93,14 +98,18 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
-            if with_etherbone:
+            if with_etherbone and etherbone_burst:
+                add_etherbone_burst(self, phy=self.ethphy, ip_address=eth_ip)
+            elif with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
 
         # Jtagbone ---------------------------------------------------------------------------------
         if with_jtagbone:
@@ -110,7 +119,11 @@ class BaseSoC(SoCCore):
         if with_spi_flash:
             from litespi.modules import S25FL128L
             from litespi.opcodes import SpiNorFlashOpCodes as Codes
-            self.add_spi_flash(mode="4x", module=S25FL128L(Codes.READ_1_1_4), rate="1:2", with_master=True)
+            if spi_flash_xip:
+                from litex_boards.cores.spi_flash import add_spi_flash_xip
+                add_spi_flash_xip(self, mode="4x", module=S25FL128L, rate="1:2", with_master=True)
+            else:
+                self.add_spi_flash(mode="4x", module=S25FL128L(Codes.READ_1_1_4), rate="1:2", with_master=True)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -127,6 +140,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
+    from litex_boards.software.flash_incremental import flash_args, flash_argdict
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Arty A7")
     target_group = parser.add_argument_group(title="Target options")
     target_group.add_argument("--toolchain",           default="vivado",                 help="FPGA toolchain (vivado, symbiflow or yosys+nextpnr).")
@@ -138,33 +152,42 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",      action="store_true",              help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone",     action="store_true",              help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true",            help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     target_group.add_argument("--eth-ip",              default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
     target_group.add_argument("--eth-dynamic-ip",      action="store_true",              help="Enable dynamic Ethernet IP addresses setting.")
+    target_group.add_argument("--etherbone-burst",     action="store_true",              help="Use burst/pipelined Etherbone (see software/etherbone_batch.py).")
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard",     action="store_true",              help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",         action="store_true",              help="Enable SDCard support.")
     target_group.add_argument("--sdcard-adapter",      type=str,                         help="SDCard PMOD adapter (digilent or numato).")
     target_group.add_argument("--with-jtagbone",       action="store_true",              help="Enable JTAGbone support.")
     target_group.add_argument("--with-spi-flash",      action="store_true",              help="Enable SPI Flash (MMAPed).")
+    target_group.add_argument("--spi-flash-xip",       action="store_true",              help="Run SPI Flash in XIP performance mode (fastest opcode, prefetch and cache, see software/spi_flash_bench.py).")
     target_group.add_argument("--with-pmod-gpio",      action="store_true",              help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
     builder_args(parser)
     soc_core_args(parser)
     vivado_build_args(parser)
+    flash_args(parser)
+    bitstream_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
+    assert args.with_etherbone or not args.etherbone_burst, "--etherbone-burst requires Etherbone."
 
     soc = BaseSoC(
-        variant        = args.variant,
-        toolchain      = args.toolchain,
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_jtagbone  = args.with_jtagbone,
-        with_spi_flash = args.with_spi_flash,
-        with_pmod_gpio = args.with_pmod_gpio,
+        variant              = args.variant,
+        toolchain            = args.toolchain,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_ip               = args.eth_ip,
+        eth_dynamic_ip       = args.eth_dynamic_ip,
+        etherbone_burst      = args.etherbone_burst,
+        with_jtagbone        = args.with_jtagbone,
+        with_spi_flash       = args.with_spi_flash,
+        spi_flash_xip        = args.spi_flash_xip,
+        with_pmod_gpio       = args.with_pmod_gpio,
         **soc_core_argdict(args)
     )
     if args.sdcard_adapter == "numato":
@@ -178,6 +201,7 @@ def main():
 
     builder = Builder(soc, **builder_argdict(args))
     builder_kwargs = vivado_build_argdict(args) if args.toolchain == "vivado" else {}
+    builder_kwargs.update(bitstream_settings(soc.platform, **bitstream_argdict(args)))
     if args.build:
         builder.build(**builder_kwargs)
 
@@ -186,8 +210,10 @@ def main():
         prog.load_bitstream(builder.get_bitstream_filename(mode="sram"))
 
     if args.flash:
+        from litex_boards.software.flash_incremental import flash_regions
         prog = soc.platform.create_programmer()
-        prog.flash(0, builder.get_bitstream_filename(mode="flash"))
+        flash_regions(prog, [(0, builder.get_bitstream_filename(mode="flash"))], builder.output_dir,
+            **flash_argdict(args))
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,7 @@
 from migen import *
 
 from litex_boards.platforms import digilent_arty_s7
+from litex_boards.cores.bitstream import bitstream_args, bitstream_argdict, bitstream_settings
 from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 
 from litex.soc.cores.clock import *
@@ -95,6 +96,7 @@ def main():
     builder_args(parser)
     soc_core_args(parser)
     vivado_build_args(parser)
+    bitstream_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -104,6 +106,7 @@ def main():
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
+    bitstream_settings(soc.platform, **bitstream_argdict(args))
     if args.build:
         builder.build(**vivado_build_argdict(args))
 
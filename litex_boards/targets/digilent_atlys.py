@@ -24,6 +24,8 @@ from litex.soc.cores.led import LedChaser
 from litedram.modules import MT47H64M16
 from litedram.phy import s6ddrphy
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -147,7 +149,8 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, with_ethernet=True, with_etherbone=False, eth_phy=0, **kwargs):
+    def __init__(self, with_ethernet=True, with_etherbone=False, with_hybrid_ethernet=False,
+                 eth_phy=0, **kwargs):
         sys_clk_freq = int(75e6)
         platform     = digilent_atlys.Platform()
 
@@ -175,7 +178,7 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             from liteeth.phy import LiteEthPHYGMIIMII
             self.submodules.ethphy = LiteEthPHYGMIIMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
@@ -185,6 +188,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
             self.ethphy.crg.cd_eth_rx.clk.attr.add("keep")
             self.ethphy.crg.cd_eth_tx.clk.attr.add("keep")
             self.platform.add_platform_command("""
@@ -207,18 +212,20 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Atlys")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",          action="store_true", help="Build design.")
-    target_group.add_argument("--load",           action="store_true", help="Load bitstream.")
-    target_group.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
-    target_group.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    target_group.add_argument("--build",                action="store_true", help="Build design.")
+    target_group.add_argument("--load",                 action="store_true", help="Load bitstream.")
+    target_group.add_argument("--with-ethernet",        action="store_true", help="Enable Ethernet support.")
+    target_group.add_argument("--with-etherbone",       action="store_true", help="Enable Etherbone support.")
+    target_group.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
 
     builder_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
         **soc_core_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
@@ -20,6 +20,8 @@ from litedram.phy import s7ddrphy
 
 from liteeth.phy.s7rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -45,7 +47,7 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(100e6), with_ethernet=False, with_etherbone=False,
-                 with_led_chaser=True, **kwargs):
+                 with_hybrid_ethernet=False, with_led_chaser=True, **kwargs):
         platform = digilent_genesys2.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -67,7 +69,7 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -75,6 +77,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -94,6 +98,7 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
@@ -102,9 +107,10 @@ def main():
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
         **soc_core_argdict(args)
     )
     if args.with_spi_sdcard:
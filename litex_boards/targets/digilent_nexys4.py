@@ -25,6 +25,8 @@ from litex.soc.integration.soc import colorer
 from litex.soc.cores.video import VideoVGAPHY
 from liteeth.phy.rmii import LiteEthPHYRMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -164,7 +166,9 @@ def addCellularRAM(soc, platform, name, origin):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(75e6), with_led_chaser=True, with_ethernet=False, with_etherbone=False, with_video_terminal=False, with_video_framebuffer=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(75e6), with_led_chaser=True, with_ethernet=False,
+                 with_etherbone=False, with_hybrid_ethernet=False, with_video_terminal=False,
+                 with_video_framebuffer=False, **kwargs):
         platform = digilent_nexys4.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -177,7 +181,7 @@ class BaseSoC(SoCCore):
         addCellularRAM(self,platform,"main_ram", 0x40000000)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -185,6 +189,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
@@ -212,6 +218,7 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",         action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone",        action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet",  action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard",        action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",            action="store_true", help="Enable SDCard support.")
@@ -226,6 +233,7 @@ def main():
         sys_clk_freq           = int(float(args.sys_clk_freq)),
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        with_hybrid_ethernet   = args.with_hybrid_ethernet,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         **soc_core_argdict(args)
@@ -22,6 +22,8 @@ from litedram.phy import s7ddrphy
 
 from liteeth.phy.rmii import LiteEthPHYRMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -52,8 +54,8 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(75e6), with_ethernet=False, with_etherbone=False,
-                 with_led_chaser=True, with_video_terminal=False, with_video_framebuffer=False,
-                 **kwargs):
+                 with_hybrid_ethernet=False, with_led_chaser=True, with_video_terminal=False,
+                 with_video_framebuffer=False, **kwargs):
         platform = digilent_nexys4ddr.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -75,7 +77,7 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -83,6 +85,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
@@ -110,6 +114,7 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",         action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone",        action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet",  action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard",        action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",            action="store_true", help="Enable SDCard support.")
@@ -124,6 +129,7 @@ def main():
         sys_clk_freq           = int(float(args.sys_clk_freq)),
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        with_hybrid_ethernet   = args.with_hybrid_ethernet,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         **soc_core_argdict(args)
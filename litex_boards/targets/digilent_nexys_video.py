@@ -22,6 +22,10 @@ from litedram.phy import s7ddrphy
 
 from liteeth.phy.s7rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.etherbone_burst import add_etherbone_burst
+from litex_boards.cores.udp_dram import add_udp_dram_streamer
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -75,6 +79,8 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, toolchain="vivado", sys_clk_freq=int(100e6), with_ethernet=False,
+                 with_etherbone=False, with_hybrid_ethernet=False, eth_ip="192.168.1.50",
+                 etherbone_burst=False, with_udp_streamer=False,
                  with_led_chaser=True, with_sata=False, sata_gen="gen2", with_sata_pll_refclk=False, vadj="1.2V", with_video_terminal=False,
                  with_video_framebuffer=False, **kwargs):
         platform = digilent_nexys_video.Platform(toolchain=toolchain)
@@ -101,12 +107,24 @@ class BaseSoC(SoCCore):
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
-        # Ethernet ---------------------------------------------------------------------------------
-        if with_ethernet:
+        # Ethernet / Etherbone ---------------------------------------------------------------------
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            self.add_ethernet(phy=self.ethphy)
+            if with_ethernet:
+                self.add_ethernet(phy=self.ethphy)
+            if with_etherbone and etherbone_burst:
+                add_etherbone_burst(self, phy=self.ethphy, ip_address=eth_ip)
+            elif with_etherbone:
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
+
+        # UDP DRAM Streamer ------------------------------------------------------------------------
+        if with_udp_streamer:
+            assert with_etherbone or with_hybrid_ethernet, "UDP DRAM Streamer requires Etherbone."
+            add_udp_dram_streamer(self)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -166,12 +184,18 @@ def main():
     target_group.add_argument("--build",                  action="store_true", help="Build design.")
     target_group.add_argument("--load",                   action="store_true", help="Load bitstream.")
     target_group.add_argument("--sys-clk-freq",           default=100e6,       help="System clock frequency.")
-    target_group.add_argument("--with-ethernet",          action="store_true", help="Enable Ethernet support.")
+    ethopts = target_group.add_mutually_exclusive_group()
+    ethopts.add_argument("--with-ethernet",         action="store_true", help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",        action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet",  action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
+    target_group.add_argument("--eth-ip",                 default="192.168.1.50", help="Etherbone IP address.")
+    target_group.add_argument("--etherbone-burst",        action="store_true", help="Use burst/pipelined Etherbone (see software/etherbone_batch.py).")
+    target_group.add_argument("--with-udp-streamer",      action="store_true", help="Enable DRAM -> UDP Streamer (with Etherbone, see software/udp_dram_dump.py).")
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard",        action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",            action="store_true", help="Enable SDCard support.")
     target_group.add_argument("--with-sata",              action="store_true", help="Enable SATA support (over FMCRAID).")
-    target_group.add_argument("--sata-gen",               default="2",         help="SATA Gen.", choices=["1", "2"])
+    target_group.add_argument("--sata-gen",               default="2",         help="SATA Gen (no Gen3: GTPs limited to 3.75Gbps on -1 speedgrade).", choices=["1", "2"])
     target_group.add_argument("--with-sata-pll-refclk",   action="store_true", help="Generate SATA RefClk from PLL.")
     target_group.add_argument("--vadj",                   default="1.2V",      help="FMC VADJ value.", choices=["1.2V", "1.8V", "2.5V", "3.3V"])
     viopts = target_group.add_mutually_exclusive_group()
@@ -182,10 +206,17 @@ def main():
     vivado_build_args(parser)
     args = parser.parse_args()
 
+    assert args.with_etherbone or not args.etherbone_burst, "--etherbone-burst requires Etherbone."
+
     soc = BaseSoC(
         toolchain              = args.toolchain,
         sys_clk_freq           = int(float(args.sys_clk_freq)),
         with_ethernet          = args.with_ethernet,
+        with_etherbone         = args.with_etherbone,
+        with_hybrid_ethernet   = args.with_hybrid_ethernet,
+        eth_ip                 = args.eth_ip,
+        etherbone_burst        = args.etherbone_burst,
+        with_udp_streamer      = args.with_udp_streamer,
         with_sata              = args.with_sata,
         sata_gen               = "gen" + args.sata_gen,
         with_sata_pll_refclk   = args.with_sata_pll_refclk,
@@ -18,7 +18,8 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.integration.soc import SoCRegion
 
-from litex.soc.cores.hyperbus import HyperRAM
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.hyperram import HyperRAMFrontend
 
 from liteeth.phy.titaniumrgmii import LiteEthPHYRGMII
 
@@ -48,12 +49,14 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(200e6),
-        with_spi_flash = False,
-        with_hyperram  = False,
-        with_ethernet  = False,
-        with_etherbone = False,
-        eth_phy        = 0,
-        eth_ip         = "192.168.1.50",
+        with_spi_flash       = False,
+        with_hyperram        = False,
+        hyperram_cache_size  = 0,
+        with_ethernet        = False,
+        with_etherbone       = False,
+        with_hybrid_ethernet = False,
+        eth_phy              = 0,
+        eth_ip               = "192.168.1.50",
         **kwargs):
         platform = efinix_titanium_ti60_f225_dev_kit.Platform()
 
@@ -71,11 +74,14 @@ class BaseSoC(SoCCore):
 
         # HyperRAM ---------------------------------------------------------------------------------
         if with_hyperram:
-            self.submodules.hyperram = HyperRAM(platform.request("hyperram"), latency=7, sys_clk_freq=sys_clk_freq)
+            self.submodules.hyperram = HyperRAMFrontend(platform.request("hyperram"),
+                sys_clk_freq = sys_clk_freq,
+                latency      = 7,
+                cache_size   = hyperram_cache_size)
             self.bus.add_slave("main_ram", slave=self.hyperram.bus, region=SoCRegion(origin=0x40000000, size=32*1024*1024))
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             platform.add_extension(efinix_titanium_ti60_f225_dev_kit.rgmii_ethernet_qse_ios("P1"))
             pads = platform.request("eth", eth_phy)
             self.submodules.ethphy = LiteEthPHYRGMII(
@@ -87,6 +93,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy, software_debug=True)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
 
             # FIXME: Avoid this.
             platform.toolchain.excluded_ios.append(platform.lookup_request("eth_clocks").tx)
@@ -125,12 +133,14 @@ def main():
     target_group.add_argument("--sys-clk-freq",   default=200e6,       help="System clock frequency.")
     target_group.add_argument("--with-spi-flash", action="store_true", help="Enable SPI Flash (MMAPed).")
     target_group.add_argument("--with-hyperram",  action="store_true", help="Enable HyperRAM.")
+    target_group.add_argument("--hyperram-cache-size", default=0, type=int, help="HyperRAM Cache size in bytes (0 to disable).")
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard",      action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",          action="store_true", help="Enable SDCard support.")
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",        action="store_true",              help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone",       action="store_true",              help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true",              help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     target_group.add_argument("--eth-ip",          default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
     target_group.add_argument("--eth-phy",         default=0, type=int,              help="Ethernet PHY: 0 (default) or 1.")
     builder_args(parser)
@@ -138,13 +148,15 @@ def main():
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_spi_flash = args.with_spi_flash,
-        with_hyperram  = args.with_hyperram,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_phy        = args.eth_phy,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        with_spi_flash       = args.with_spi_flash,
+        with_hyperram        = args.with_hyperram,
+        hyperram_cache_size  = args.hyperram_cache_size,
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_ip               = args.eth_ip,
+        eth_phy              = args.eth_phy,
          **soc_core_argdict(args))
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
@@ -21,6 +21,8 @@ from litex.soc.interconnect import axi
 
 from liteeth.phy.trionrgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -43,12 +45,14 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(75e6),
-        with_spi_flash  = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_phy         = 0,
-        eth_ip          = "192.168.1.50",
-        with_led_chaser = True,
+        with_spi_flash       = False,
+        with_ethernet        = False,
+        with_etherbone       = False,
+        with_hybrid_ethernet = False,
+        eth_phy              = 0,
+        eth_ip               = "192.168.1.50",
+        eth_data_width       = 8,
+        with_led_chaser      = True,
         **kwargs):
         platform = efinix_trion_t120_bga576_dev_kit.Platform()
 
@@ -86,16 +90,18 @@ class BaseSoC(SoCCore):
         self.submodules.i2c = I2CMaster(pads=platform.request("i2c"))
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 platform           = platform,
                 clock_pads         = platform.request("eth_clocks", eth_phy),
                 pads               = platform.request("eth", eth_phy),
                 with_hw_init_reset = False)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, software_debug=False)
+                self.add_ethernet(phy=self.ethphy, software_debug=False, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=eth_data_width)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, data_width=eth_data_width)
 
             # FIXME: Avoid this.
             platform.toolchain.excluded_ios.append(platform.lookup_request("eth_clocks").tx)
@@ -346,19 +352,23 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true",              help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true",              help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true",        help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     target_group.add_argument("--eth-ip",          default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
     target_group.add_argument("--eth-phy",         default=0, type=int,              help="Ethernet PHY: 0 (default) or 1.")
+    target_group.add_argument("--eth-data-width",  default=8, type=int,              help="Ethernet datapath width (in bits).", choices=[8, 32])
     builder_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_spi_flash = args.with_spi_flash,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_phy        = args.eth_phy,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        with_spi_flash       = args.with_spi_flash,
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_ip               = args.eth_ip,
+        eth_phy              = args.eth_phy,
+        eth_data_width       = args.eth_data_width,
         **soc_core_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
@@ -37,7 +37,11 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.clock import *
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie_flash import LitePCIeFlash
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -61,7 +65,9 @@ class CRG(Module):
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_pcie=False, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_pcie=False,
+                 pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_bench=False, with_pcie_flash=False, with_led_chaser=True, **kwargs):
         platform = fairwaves_xtrx.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -77,7 +83,14 @@ class BaseSoC(SoCCore):
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x2"),
                 data_width = 64,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
             # ICAP (For FPGA reload over PCIe).
             from litex.soc.cores.icap import ICAP
@@ -85,11 +98,19 @@ class BaseSoC(SoCCore):
             self.icap.add_reload()
             self.icap.add_timing_constraints(platform, sys_clk_freq, self.crg.cd_sys.clk)
 
-            # Flash (For SPIFlash update over PCIe).
-            from litex.soc.cores.gpio import GPIOOut
-            from litex.soc.cores.spi_flash import S7SPIFlash
-            self.submodules.flash_cs_n = GPIOOut(platform.request("flash_cs_n"))
-            self.submodules.flash      = S7SPIFlash(platform.request("flash"), sys_clk_freq, 25e6)
+            # Flash (For SPIFlash update over PCIe, DMA-fed Programmer or CSR-driven SPI).
+            if with_pcie_flash:
+                assert not with_pcie_bench, "PCIe Flash Programmer and Benchmark both use the last DMA."
+                self.submodules.pcie_flash = LitePCIeFlash(getattr(self, f"pcie_dma{pcie_dmas - 1}"),
+                    pads         = platform.request("flash"),
+                    cs_n         = platform.request("flash_cs_n"),
+                    device       = platform.device,
+                    sys_clk_freq = sys_clk_freq)
+            else:
+                from litex.soc.cores.gpio import GPIOOut
+                from litex.soc.cores.spi_flash import S7SPIFlash
+                self.submodules.flash_cs_n = GPIOOut(platform.request("flash_cs_n"))
+                self.submodules.flash      = S7SPIFlash(platform.request("flash"), sys_clk_freq, 25e6)
 
 
         # Leds -------------------------------------------------------------------------------------
@@ -102,21 +123,29 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
+    from litex_boards.software.flash_incremental import flash_args, flash_argdict
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Fairwaves XTRX")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",           action="store_true", help="Build design.")
-    target_group.add_argument("--load",            action="store_true", help="Load bitstream.")
-    target_group.add_argument("--flash",           action="store_true", help="Flash bitstream.")
-    target_group.add_argument("--sys-clk-freq",    default=125e6,       help="System clock frequency.")
-    target_group.add_argument("--with-pcie",       action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",          action="store_true", help="Generate PCIe driver.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--flash",                    action="store_true",    help="Flash bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=125e6,          help="System clock frequency.")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--with-pcie-flash",          action="store_true",    help="Enable PCIe SPI Flash Programmer and ICAP reload (see software/litepcie_flash.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
+    flash_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_pcie    = args.with_pcie,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_pcie                = args.with_pcie,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_pcie_flash          = args.with_pcie_flash,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     builder  = Builder(soc, **builder_argdict(args))
@@ -131,8 +160,10 @@ def main():
         prog.load_bitstream(builder.get_bitstream_filename(mode="sram"))
 
     if args.flash:
+        from litex_boards.software.flash_incremental import flash_regions
         prog = soc.platform.create_programmer()
-        prog.flash(0, builder.get_bitstream_filename(mode="flash"))
+        flash_regions(prog, [(0, builder.get_bitstream_filename(mode="flash"))], builder.output_dir,
+            **flash_argdict(args))
 
 if __name__ == "__main__":
     main()
@@ -23,6 +23,8 @@ from litedram.phy import ECP5DDRPHY
 
 from liteeth.phy.mii import LiteEthPHYMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -77,7 +79,7 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(80e6), toolchain="trellis", with_ethernet=False,
-                 with_etherbone=False, with_led_chaser=True, **kwargs):
+                 with_etherbone=False, with_hybrid_ethernet=False, with_led_chaser=True, **kwargs):
         platform = fpc_iii.Platform(toolchain=toolchain)
 
         # CRG --------------------------------------------------------------------------------------
@@ -105,7 +107,7 @@ class BaseSoC(SoCCore):
         self.comb += platform.request("dram_vtt_en").eq(0 if self.integrated_main_ram_size else 1)
 
         # Ethernet ---------------------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -113,6 +115,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -133,6 +137,7 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
@@ -142,10 +147,11 @@ def main():
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        toolchain      = args.toolchain,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        toolchain            = args.toolchain,
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
         **soc_core_argdict(args))
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
@@ -30,6 +30,10 @@ from litedram.phy import ECP5DDRPHY
 
 from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.etherbone_burst import add_etherbone_burst
+from litex_boards.cores.bitstream import bitstream_args, bitstream_argdict, bitstream_settings
+
 # CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -82,10 +86,13 @@ class _CRG(Module):
 class BaseSoC(SoCCore):
     def __init__(self, revision="1.0", device="85F", sdram_device="MT41K64M16", sys_clk_freq=int(60e6), 
         toolchain="trellis", with_ethernet=False, with_etherbone=False, eth_ip="192.168.1.50", 
-        eth_dynamic_ip   = False,
-        with_spi_flash   = False,
-        with_led_chaser  = True,
-        with_syzygy_gpio = True,
+        with_hybrid_ethernet = False,
+        eth_dynamic_ip       = False,
+        etherbone_burst      = False,
+        eth_data_width       = 8,
+        with_spi_flash       = False,
+        with_led_chaser      = True,
+        with_syzygy_gpio     = True,
         **kwargs)       :
         platform = gsd_butterstick.Platform(revision=revision, device=device ,toolchain=toolchain)
 
@@ -119,16 +126,23 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0e-9, # KSZ9031RNX phy adds a 1.2ns RX delay
                 )
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
-            if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip,
+                    data_width=eth_data_width)
+            if with_etherbone and etherbone_burst:
+                add_etherbone_burst(self, phy=self.ethphy, ip_address=eth_ip,
+                    data_width=eth_data_width)
+            elif with_etherbone:
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=eth_data_width)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, dynamic_ip=eth_dynamic_ip,
+                    data_width=eth_data_width)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -164,8 +178,11 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true",    help="Add Ethernet.")
     ethopts.add_argument("--with-etherbone", action="store_true",    help="Add EtherBone.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true", help="Add Ethernet (CPU) + EtherBone (Hardware, on 192.168.1.51).")
     target_group.add_argument("--eth-ip",          default="192.168.1.50", help="Ethernet/Etherbone IP address.")
     target_group.add_argument("--eth-dynamic-ip",  action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
+    target_group.add_argument("--eth-data-width",  default=8, type=int,   help="Ethernet datapath width (in bits).", choices=[8, 32])
+    target_group.add_argument("--etherbone-burst", action="store_true",    help="Use burst/pipelined Etherbone (see software/etherbone_batch.py).")
     target_group.add_argument("--with-spi-flash",  action="store_true",    help="Enable SPI Flash (MMAPed).")
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
@@ -174,22 +191,27 @@ def main():
     builder_args(parser)
     soc_core_args(parser)
     trellis_args(parser)
+    bitstream_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
+    assert args.with_etherbone or not args.etherbone_burst, "--etherbone-burst requires Etherbone."
 
     soc = BaseSoC(
-        toolchain        = args.toolchain,
-        revision         = args.revision,
-        device           = args.device,
-        sdram_device     = args.sdram_device,
-        sys_clk_freq     = int(float(args.sys_clk_freq)),
-        with_ethernet    = args.with_ethernet,
-        with_etherbone   = args.with_etherbone,
-        eth_ip           = args.eth_ip,
-        eth_dynamic_ip   = args.eth_dynamic_ip,
-        with_spi_flash   = args.with_spi_flash,
-        with_syzygy_gpio = args.with_syzygy_gpio,
+        toolchain            = args.toolchain,
+        revision             = args.revision,
+        device               = args.device,
+        sdram_device         = args.sdram_device,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_ip               = args.eth_ip,
+        eth_dynamic_ip       = args.eth_dynamic_ip,
+        etherbone_burst      = args.etherbone_burst,
+        eth_data_width       = args.eth_data_width,
+        with_spi_flash       = args.with_spi_flash,
+        with_syzygy_gpio     = args.with_syzygy_gpio,
         **soc_core_argdict(args))
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
@@ -197,6 +219,7 @@ def main():
         soc.add_sdcard()
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
+    builder_kargs.update(bitstream_settings(soc.platform, **bitstream_argdict(args)))
     if args.build:
         builder.build(**builder_kargs)
 
@@ -30,7 +30,10 @@ from litedram.common import PHYPadsReducer
 from litedram.modules import K4B1G0446F
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -65,9 +68,15 @@ class _CRG(Module):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(100e6),
         io_voltage="3.3V",
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_sata       = False,
+        with_led_chaser          = True,
+        with_pcie                = False,
+        pcie_dmas                = 1,
+        pcie_address_width       = 32,
+        pcie_dma_buffering_depth = 1024,
+        with_pcie_bench          = False,
+        with_sata                = False,
+        sata_drives              = 1,
+        sata_stripe_size         = 16,
         **kwargs):
         platform = hpcstore_xc7k420t.Platform(io_voltage)
 
@@ -99,7 +108,14 @@ class BaseSoC(SoCCore):
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
         # TODO verify / test
         # SATA -------------------------------------------------------------------------------------
@@ -114,15 +130,32 @@ class BaseSoC(SoCCore):
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-52]")
 
             # PHY
-            self.submodules.sata_phy = LiteSATAPHY(platform.device,
-                refclk     = sata_refclk,
-                pads       = platform.request("sata", 0),
-                gen        = "gen2",
-                clk_freq   = sys_clk_freq,
-                data_width = 16)
-
-            # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            if sata_drives == 1:
+                self.submodules.sata_phy = LiteSATAPHY(platform.device,
+                    refclk     = sata_refclk,
+                    pads       = platform.request("sata", 0),
+                    gen        = "gen2",
+                    clk_freq   = sys_clk_freq,
+                    data_width = 16)
+
+                # Core
+                self.add_sata(phy=self.sata_phy, mode="read+write")
+
+            # PHYs/Cores/RAID-0 (with Benchmark, see software/sata_raid_bench.py).
+            else:
+                from litex_boards.cores.sata_raid import add_sata_raid0
+                assert sata_drives == 2, "HPC Store XC7K420T has 2 SATA ports."
+                sata_phys = []
+                for n in range(sata_drives):
+                    sata_phy = LiteSATAPHY(platform.device,
+                        refclk     = sata_refclk,
+                        pads       = platform.request("sata", n),
+                        gen        = "gen2",
+                        clk_freq   = sys_clk_freq,
+                        data_width = 16)
+                    setattr(self.submodules, f"sata_phy{n}", sata_phy)
+                    sata_phys.append(sata_phy)
+                add_sata_raid0(self, sata_phys, stripe_sectors=sata_stripe_size)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -139,22 +172,30 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on AliExpress HPC Store XC7K420T")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",           action="store_true", help="Build design.")
-    target_group.add_argument("--load",            action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq",    default=100e6,       help="System clock frequency.")
-    target_group.add_argument("--io-voltage",      default="3.3V",       help="IO voltage chosen by Jumper J3. Can be: '3.3V' or '2.5V'")
-    target_group.add_argument("--with-pcie",       action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",          action="store_true", help="Generate PCIe driver.")
-    target_group.add_argument("--with-sata",       action="store_true", help="Enable SATA support.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=100e6,          help="System clock frequency.")
+    target_group.add_argument("--io-voltage",               default="3.3V",         help="IO voltage chosen by Jumper J3. Can be: '3.3V' or '2.5V'")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
+    target_group.add_argument("--with-sata",                action="store_true",    help="Enable SATA support.")
+    target_group.add_argument("--sata-drives",              default=1, type=int,    help="Number of SATA drives (1 or 2; 2: RAID-0).")
+    target_group.add_argument("--sata-stripe-size",         default=16, type=int,   help="SATA RAID-0 stripe size (in sectors).")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        io_voltage     = args.io_voltage,
-        with_pcie      = args.with_pcie,
-        with_sata      = args.with_sata,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        io_voltage               = args.io_voltage,
+        with_pcie                = args.with_pcie,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_sata                = args.with_sata,
+        sata_drives              = args.sata_drives,
+        sata_stripe_size         = args.sata_stripe_size,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -67,7 +67,7 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, bios_flash_offset, sys_clk_freq=int(24e6), with_led_chaser=True,
-                 with_video_terminal=False, **kwargs):
+                 with_video_terminal=False, spi_flash_xip=False, **kwargs):
         platform = icebreaker.Platform()
         platform.add_extension(icebreaker.break_off_pmod)
 
@@ -98,7 +98,11 @@ class BaseSoC(SoCCore):
         # SPI Flash --------------------------------------------------------------------------------
         from litespi.modules import W25Q128JV
         from litespi.opcodes import SpiNorFlashOpCodes as Codes
-        self.add_spi_flash(mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=False)
+        if spi_flash_xip:
+            from litex_boards.cores.spi_flash import add_spi_flash_xip
+            add_spi_flash_xip(self, mode="4x", module=W25Q128JV, with_master=False)
+        else:
+            self.add_spi_flash(mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=False)
 
         # Add ROM linker region --------------------------------------------------------------------
         self.bus.add_region("rom", SoCRegion(
@@ -122,16 +126,20 @@ class BaseSoC(SoCCore):
 
 # Flash --------------------------------------------------------------------------------------------
 
-def flash(build_dir, build_name, bios_flash_offset):
+def flash(build_dir, build_name, bios_flash_offset, mode="full", extra_regions=[]):
     from litex.build.lattice.programmer import IceStormProgrammer
+    from litex_boards.software.flash_incremental import flash_regions
     prog = IceStormProgrammer()
-    prog.flash(bios_flash_offset, f"{build_dir}/software/bios/bios.bin")
-    prog.flash(0x00000000,        f"{build_dir}/gateware/{build_name}.bin")
+    flash_regions(prog, [
+        (bios_flash_offset, f"{build_dir}/software/bios/bios.bin"),
+        (0x00000000,        f"{build_dir}/gateware/{build_name}.bin"),
+    ], build_dir, mode=mode, extra_regions=extra_regions)
 
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
+    from litex_boards.software.flash_incremental import flash_args, flash_argdict
     parser = LiteXSoCArgumentParser(description="LiteX SoC on iCEBreaker")
     target_group = parser.add_argument_group(title="Target options")
     target_group.add_argument("--build",               action="store_true", help="Build design.")
@@ -140,15 +148,18 @@ def main():
     target_group.add_argument("--sys-clk-freq",        default=24e6,        help="System clock frequency.")
     target_group.add_argument("--bios-flash-offset",   default="0x40000",   help="BIOS offset in SPI Flash.")
     target_group.add_argument("--with-video-terminal", action="store_true", help="Enable Video Terminal (with DVI PMOD).")
+    target_group.add_argument("--spi-flash-xip",       action="store_true", help="Run BIOS from SPI Flash in XIP performance mode (fastest opcode, prefetch and cache, see software/spi_flash_bench.py).")
     builder_args(parser)
     soc_core_args(parser)
     icestorm_args(parser)
+    flash_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         bios_flash_offset   = int(args.bios_flash_offset, 0),
         sys_clk_freq        = int(float(args.sys_clk_freq)),
         with_video_terminal = args.with_video_terminal,
+        spi_flash_xip       = args.spi_flash_xip,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -160,7 +171,8 @@ def main():
         prog.load_bitstream(builder.get_bitstream_filename(mode="sram", ext=".bin")) # FIXME
 
     if args.flash:
-        flash(builder.output_dir, soc.build_name, args.bios_flash_offset)
+        flash(builder.output_dir, soc.build_name, int(args.bios_flash_offset, 0),
+            **flash_argdict(args))
 
 if __name__ == "__main__":
     main()
@@ -69,7 +69,7 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, bios_flash_offset, spi_flash_module="AT25SF161", sys_clk_freq=int(12e6),
-                 with_led_chaser=True, **kwargs):
+                 with_led_chaser=True, spi_flash_xip=False, **kwargs):
         platform = kosagi_fomu_pvt.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -102,14 +102,19 @@ class BaseSoC(SoCCore):
         from litespi.modules import AT25SF161, GD25Q16C, MX25R1635F, W25Q128JV
         from litespi.opcodes import SpiNorFlashOpCodes as Codes
 
-        # lambdas for lazy module instantiation.
+        # Modules and default read opcodes (modules are instantiated only for the selected one).
         spi_flash_modules = {
-            "AT25SF161":  lambda: AT25SF161( Codes.READ_1_1_4),
-            "GD25Q16C":   lambda: GD25Q16C(  Codes.READ_1_1_1),
-            "MX25R1635F": lambda: MX25R1635F(Codes.READ_1_1_4),
-            "W25Q128JV":  lambda: W25Q128JV( Codes.READ_1_1_4),
+            "AT25SF161":  (AT25SF161,  Codes.READ_1_1_4),
+            "GD25Q16C":   (GD25Q16C,   Codes.READ_1_1_1),
+            "MX25R1635F": (MX25R1635F, Codes.READ_1_1_4),
+            "W25Q128JV":  (W25Q128JV,  Codes.READ_1_1_4),
         }
-        self.add_spi_flash(mode="4x", module=spi_flash_modules[spi_flash_module](), with_master=False)
+        spi_flash_module_cls, spi_flash_opcode = spi_flash_modules[spi_flash_module]
+        if spi_flash_xip:
+            from litex_boards.cores.spi_flash import add_spi_flash_xip
+            add_spi_flash_xip(self, mode="4x", module=spi_flash_module_cls, with_master=False)
+        else:
+            self.add_spi_flash(mode="4x", module=spi_flash_module_cls(spi_flash_opcode), with_master=False)
 
         # Add ROM linker region --------------------------------------------------------------------
         self.bus.add_region("rom", SoCRegion(
@@ -127,8 +132,9 @@ class BaseSoC(SoCCore):
 
 # Flash --------------------------------------------------------------------------------------------
 
-def flash(build_dir, build_name, bios_flash_offset):
+def flash(build_dir, build_name, bios_flash_offset, mode="full", extra_regions=[]):
     from litex.build.dfu import DFUProg
+    from litex_boards.software.flash_incremental import flash_regions
     prog = DFUProg(vid="1209", pid="5bf0")
     bitstream = open(f"{build_dir}/gateware/{build_name}.bin",  "rb")
     bios      = open(f"{build_dir}/software/bios/bios.bin", "rb")
@@ -151,21 +157,26 @@ def flash(build_dir, build_name, bios_flash_offset):
     bitstream.close()
     bios.close()
     image.close()
-    prog.load_bitstream(f"{build_dir}/image.bin")
+    # DFU only writes whole images: the image is only skipped when unchanged.
+    flash_regions(prog, [(0, f"{build_dir}/image.bin")], build_dir, mode=mode, partial=False,
+        flash=lambda address, filename: prog.load_bitstream(filename))
 
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
+    from litex_boards.software.flash_incremental import flash_args, flash_argdict
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Fomu")
     target_group = parser.add_argument_group(title="Target options")
     target_group.add_argument("--build",             action="store_true", help="Build design.")
     target_group.add_argument("--sys-clk-freq",      default=12e6,        help="System clock frequency.")
     target_group.add_argument("--bios-flash-offset", default="0x20000",   help="BIOS offset in SPI Flash.")
     target_group.add_argument("--flash",             action="store_true", help="Flash Bitstream.")
+    target_group.add_argument("--spi-flash-xip",     action="store_true", help="Run BIOS from SPI Flash in XIP performance mode (fastest opcode, prefetch and cache, see software/spi_flash_bench.py).")
     builder_args(parser)
     soc_core_args(parser)
     icestorm_args(parser)
+    flash_args(parser, with_regions=False)
     args = parser.parse_args()
 
     dfu_flash_offset = 0x40000
@@ -173,6 +184,7 @@ def main():
     soc = BaseSoC(
         bios_flash_offset = dfu_flash_offset + int(args.bios_flash_offset, 0),
         sys_clk_freq      = int(float(args.sys_clk_freq)),
+        spi_flash_xip     = args.spi_flash_xip,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -180,7 +192,8 @@ def main():
         builder.build(**icestorm_argdict(args))
 
     if args.flash:
-        flash(builder.output_dir, soc.build_name, int(args.bios_flash_offset, 0))
+        flash(builder.output_dir, soc.build_name, int(args.bios_flash_offset, 0),
+            **flash_argdict(args))
 
 if __name__ == "__main__":
     main()
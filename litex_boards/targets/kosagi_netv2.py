@@ -25,7 +25,11 @@ from litedram.phy import s7ddrphy
 from liteeth.phy.rmii import LiteEthPHYRMII
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie_flash import LitePCIeFlash
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -60,7 +64,9 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="a7-35", sys_clk_freq=int(100e6), with_pcie=False,
-                 with_ethernet=False, with_led_chaser=True, **kwargs):
+                 pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_bench=False, with_pcie_flash=False, with_ethernet=False,
+                 with_led_chaser=True, **kwargs):
         platform = kosagi_netv2.Platform(variant=variant)
 
         # CRG --------------------------------------------------------------------------------------
@@ -93,7 +99,25 @@ class BaseSoC(SoCCore):
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
+
+            # PCIe SPI Flash Programmer (on the last DMA) + ICAP (For FPGA reload over PCIe).
+            if with_pcie_flash:
+                assert not with_pcie_bench, "PCIe Flash Programmer and Benchmark both use the last DMA."
+                self.submodules.pcie_flash = LitePCIeFlash(getattr(self, f"pcie_dma{pcie_dmas - 1}"),
+                    pads         = platform.request("spiflash4x"),
+                    device       = platform.device,
+                    sys_clk_freq = sys_clk_freq)
+                from litex.soc.cores.icap import ICAP
+                self.submodules.icap = ICAP()
+                self.icap.add_timing_constraints(platform, sys_clk_freq, self.crg.cd_sys.clk)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -107,26 +131,32 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on NeTV2")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",           action="store_true", help="Build design.")
-    target_group.add_argument("--load",            action="store_true", help="Load bitstream.")
-    target_group.add_argument("--variant",         default="a7-35",     help="Board variant (a7-35 or a7-100).")
-    target_group.add_argument("--sys-clk-freq",    default=100e6,       help="System clock frequency.")
-    target_group.add_argument("--with-ethernet",   action="store_true", help="Enable Ethernet support.")
-    target_group.add_argument("--with-pcie",       action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",          action="store_true", help="Generate PCIe driver.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--variant",                  default="a7-35",        help="Board variant (a7-35 or a7-100).")
+    target_group.add_argument("--sys-clk-freq",             default=100e6,          help="System clock frequency.")
+    target_group.add_argument("--with-ethernet",            action="store_true",    help="Enable Ethernet support.")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--with-pcie-flash",          action="store_true",    help="Enable PCIe SPI Flash Programmer and ICAP reload (see software/litepcie_flash.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
     sdopts = target_group.add_mutually_exclusive_group()
-    sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
-    sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
+    sdopts.add_argument("--with-spi-sdcard", action="store_true",                   help="Enable SPI-mode SDCard support.")
+    sdopts.add_argument("--with-sdcard",     action="store_true",                   help="Enable SDCard support.")
 
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        variant       = args.variant,
-        sys_clk_freq  = int(float(args.sys_clk_freq)),
-        with_ethernet = args.with_ethernet,
-        with_pcie     = args.with_pcie,
+        variant                  = args.variant,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_ethernet            = args.with_ethernet,
+        with_pcie                = args.with_pcie,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_pcie_flash          = args.with_pcie_flash,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     if args.with_spi_sdcard:
@@ -25,6 +25,10 @@ from litedram.phy import ECP5DDRPHY
 
 from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.etherbone_burst import add_etherbone_burst
+from litex_boards.cores.udp_dram import add_udp_dram_streamer
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -78,6 +82,10 @@ class BaseSoC(SoCCore):
     def __init__(self, device="85F", sys_clk_freq=int(75e6), toolchain="trellis",
         with_ethernet          = False,
         with_etherbone         = False,
+        with_hybrid_ethernet   = False,
+        etherbone_burst        = False,
+        eth_data_width         = 8,
+        with_udp_streamer      = False,
         with_video_terminal    = False,
         with_video_framebuffer = False,
         with_led_chaser        = True,
@@ -104,15 +112,24 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0e-9)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
-            if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
+            if with_etherbone and etherbone_burst:
+                add_etherbone_burst(self, phy=self.ethphy, data_width=eth_data_width)
+            elif with_etherbone:
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, data_width=eth_data_width)
+
+        # UDP DRAM Streamer ------------------------------------------------------------------------
+        if with_udp_streamer:
+            assert with_etherbone or with_hybrid_ethernet, "UDP DRAM Streamer requires Etherbone."
+            add_udp_dram_streamer(self)
 
         # HDMI -------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
@@ -233,6 +250,10 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
+    target_group.add_argument("--eth-data-width", default=8, type=int, help="Ethernet datapath width (in bits).", choices=[8, 32])
+    target_group.add_argument("--etherbone-burst", action="store_true", help="Use burst/pipelined Etherbone (see software/etherbone_batch.py).")
+    target_group.add_argument("--with-udp-streamer", action="store_true", help="Enable DRAM -> UDP Streamer (with Etherbone, see software/udp_dram_dump.py).")
     viopts = target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
@@ -242,12 +263,18 @@ def main():
     trellis_args(parser)
     args = parser.parse_args()
 
+    assert args.with_etherbone or not args.etherbone_burst, "--etherbone-burst requires Etherbone."
+
     soc = BaseSoC(
         device                 = args.device,
         sys_clk_freq           = int(float(args.sys_clk_freq)),
         toolchain              = args.toolchain,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        with_hybrid_ethernet   = args.with_hybrid_ethernet,
+        etherbone_burst        = args.etherbone_burst,
+        eth_data_width         = args.eth_data_width,
+        with_udp_streamer      = args.with_udp_streamer,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         **soc_core_argdict(args)
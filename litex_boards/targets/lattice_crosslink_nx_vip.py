@@ -14,7 +14,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 
 from litex_boards.platforms import lattice_crosslink_nx_vip
 
-from litex.soc.cores.hyperbus import HyperRAM
+from litex_boards.cores.hyperram import HyperRAMFrontend
 
 from litex.soc.cores.ram import NXLRAM
 from litex.build.io import CRG
@@ -64,7 +64,7 @@ class BaseSoC(SoCCore):
         "sram": 0x40000000,
         "csr":  0xf0000000,
     }
-    def __init__(self, sys_clk_freq=int(75e6), hyperram="none", toolchain="radiant",
+    def __init__(self, sys_clk_freq=int(75e6), hyperram="none", hyperram_cache_size=0, toolchain="radiant",
                  with_led_chaser=True, **kwargs):
         platform = lattice_crosslink_nx_vip.Platform(toolchain=toolchain)
         platform.add_platform_command("ldc_set_sysconfig {{MASTER_SPI_PORT=SERIAL}}")
@@ -87,7 +87,7 @@ class BaseSoC(SoCCore):
             # Use HyperRAM generic PHY as SRAM -----------------------------------------------------
             size = 8*1024*kB
             hr_pads = platform.request("hyperram", int(hyperram))
-            self.submodules.hyperram = HyperRAM(hr_pads, sys_clk_freq=sys_clk_freq)
+            self.submodules.hyperram = HyperRAMFrontend(hr_pads, sys_clk_freq=sys_clk_freq, cache_size=hyperram_cache_size)
             self.bus.add_slave("sram", slave=self.hyperram.bus, region=SoCRegion(size=size))
 
         # Leds -------------------------------------------------------------------------------------
@@ -107,6 +107,7 @@ def main():
     target_group.add_argument("--toolchain",     default="radiant",   help="FPGA toolchain (radiant or prjoxide).")
     target_group.add_argument("--sys-clk-freq",  default=75e6,        help="System clock frequency.")
     target_group.add_argument("--with-hyperram", default="none",      help="Enable use of HyperRAM chip (none, 0 or 1).")
+    target_group.add_argument("--hyperram-cache-size", default=0, type=int, help="HyperRAM Cache size in bytes (0 to disable).")
     target_group.add_argument("--prog-target",   default="direct",    help="Programming Target (direct or flash).")
     builder_args(parser)
     soc_core_args(parser)
@@ -114,9 +115,10 @@ def main():
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        hyperram     = args.with_hyperram,
-        toolchain    = args.toolchain,
+        sys_clk_freq        = int(float(args.sys_clk_freq)),
+        hyperram            = args.with_hyperram,
+        hyperram_cache_size = args.hyperram_cache_size,
+        toolchain           = args.toolchain,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -24,6 +24,8 @@ from litedram.phy import ECP5DDRPHY
 
 from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -75,8 +77,8 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(75e6), device="LFE5UM5G", with_ethernet=False,
-                 with_etherbone=False, with_led_chaser=True, eth_ip="192.168.1.50", eth_phy=0,
-                 toolchain="trellis", **kwargs):
+                 with_etherbone=False, with_hybrid_ethernet=False, with_led_chaser=True,
+                 eth_ip="192.168.1.50", eth_phy=0, toolchain="trellis", **kwargs):
         platform = lattice_versa_ecp5.Platform(toolchain=toolchain, device=device)
 
         # CRG --------------------------------------------------------------------------------------
@@ -99,7 +101,7 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
@@ -109,6 +111,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -130,6 +134,7 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true",              help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true",              help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true",        help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     target_group.add_argument("--eth-ip",          default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
     target_group.add_argument("--eth-phy",         default=0, type=int,              help="Ethernet PHY (0 or 1).")
     builder_args(parser)
@@ -138,13 +143,14 @@ def main():
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        device         = args.device,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_phy        = args.eth_phy,
-        toolchain      = args.toolchain,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        device               = args.device,
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_ip               = args.eth_ip,
+        eth_phy              = args.eth_phy,
+        toolchain            = args.toolchain,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -22,6 +22,8 @@ from litedram.phy import GENSDRPHY
 
 from liteeth.phy.s6rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -46,7 +48,9 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(75e6), with_ethernet=False, with_etherbone=False, eth_phy=0, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=int(75e6), with_ethernet=False, with_etherbone=False,
+        with_hybrid_ethernet=False, eth_phy=0, with_dual_ethernet=False,
+        eth_dual_mode="independent", with_udp_streamer=False, with_led_chaser=True, **kwargs):
         platform     = linsn_rv901t.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -65,7 +69,7 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
@@ -74,10 +78,41 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy, with_timing_constraints=False)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, with_timing_constraints=False)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, with_timing_constraints=False)
             # Timing Constraints.
             platform.add_period_constraint(platform.lookup_request("eth_clocks", eth_phy).rx, 1e9/125e6)
             platform.add_false_path_constraints(self.crg.cd_sys.clk, platform.lookup_request("eth_clocks", eth_phy).rx)
 
+        # Dual Ethernet ----------------------------------------------------------------------------
+        # Both PHYs, each with its own MAC/UDP/IP stack (192.168.1.50 on PHY 0 with Etherbone,
+        # 192.168.1.51 on PHY 1), UDP DRAM Streamers on independent ports or aggregated over both.
+        if with_dual_ethernet:
+            from litex_boards.cores.eth_multiport import add_multiport_ethernet
+            for n in range(2):
+                setattr(self.submodules, f"ethphy{n}", LiteEthPHYRGMII(
+                    clock_pads = self.platform.request("eth_clocks", n),
+                    pads       = self.platform.request("eth", n),
+                    tx_delay   = 0e-9))
+            # 32-bit datapath in sys clock domain: eases timing of the two stacks on Spartan6.
+            self.ethcores = add_multiport_ethernet(self, phys=[self.ethphy0, self.ethphy1],
+                data_width              = 32,
+                with_timing_constraints = False)
+            # Timing Constraints.
+            for n in range(2):
+                platform.add_period_constraint(platform.lookup_request("eth_clocks", n).rx, 1e9/125e6)
+                platform.add_false_path_constraints(self.crg.cd_sys.clk, platform.lookup_request("eth_clocks", n).rx)
+
+        # UDP DRAM Streamer ------------------------------------------------------------------------
+        if with_udp_streamer:
+            assert with_etherbone or with_hybrid_ethernet or with_dual_ethernet
+            if with_dual_ethernet:
+                from litex_boards.cores.eth_multiport import add_multiport_udp_dram_streamer
+                add_multiport_udp_dram_streamer(self, self.ethcores, mode=eth_dual_mode)
+            else:
+                from litex_boards.cores.udp_dram import add_udp_dram_streamer
+                add_udp_dram_streamer(self)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.submodules.leds = LedChaser(
@@ -94,18 +129,26 @@ def main():
     target_group.add_argument("--load",          action="store_true", help="Load bitstream.")
     target_group.add_argument("--sys-clk-freq",  default=75e6,        help="System clock frequency.")
     ethopts = target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
-    target_group.add_argument("--eth-phy",         default=0, type=int, help="Ethernet PHY (0 or 1).")
+    ethopts.add_argument("--with-ethernet",      action="store_true", help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",     action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
+    ethopts.add_argument("--with-dual-ethernet", action="store_true", help="Enable both Ethernet PHYs (Etherbone on PHY 0, a UDP/IP stack per PHY).")
+    target_group.add_argument("--eth-phy",           default=0, type=int,     help="Ethernet PHY (0 or 1).")
+    target_group.add_argument("--eth-dual-mode",     default="independent",   help="Dual Ethernet UDP streaming mode (independent: a Streamer per PHY, aggregated: one Streamer over both PHYs).", choices=["independent", "aggregated"])
+    target_group.add_argument("--with-udp-streamer", action="store_true",     help="Enable DRAM -> UDP Streamer (requires --with-etherbone, --with-hybrid-ethernet or --with-dual-ethernet).")
     builder_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_phy        = int(args.eth_phy),
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_phy              = int(args.eth_phy),
+        with_dual_ethernet   = args.with_dual_ethernet,
+        eth_dual_mode        = args.eth_dual_mode,
+        with_udp_streamer    = args.with_udp_streamer,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -9,6 +9,7 @@
 from migen import *
 
 from litex_boards.platforms import litex_acorn_baseboard
+from litex_boards.cores.bitstream import bitstream_args, bitstream_argdict, bitstream_settings
 
 from litex.build.lattice.trellis import trellis_args, trellis_argdict
 
@@ -20,6 +21,8 @@ from litex.soc.cores.bitbang import I2CMaster
 
 from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -60,12 +63,17 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(75e6), toolchain="trellis",
-        with_spi_flash      = False,
-        with_ethernet       = False,
-        with_etherbone      = False,
-        with_video_terminal = False,
-        with_lcd            = False,
-        with_ws2812         = False,
+        with_spi_flash       = False,
+        spi_flash_xip        = False,
+        with_ethernet        = False,
+        with_etherbone       = False,
+        with_hybrid_ethernet = False,
+        eth_data_width       = 8,
+        with_video_terminal  = False,
+        with_lcd             = False,
+        with_ws2812          = False,
+        with_sata            = False,
+        sata_gen             = "gen2",
         **kwargs):
         platform = litex_acorn_baseboard.Platform(toolchain=toolchain)
 
@@ -79,18 +87,24 @@ class BaseSoC(SoCCore):
         if with_spi_flash:
             from litespi.modules import W25Q128JV
             from litespi.opcodes import SpiNorFlashOpCodes as Codes
-            self.add_spi_flash(mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=True)
+            if spi_flash_xip:
+                from litex_boards.cores.spi_flash import add_spi_flash_xip
+                add_spi_flash_xip(self, mode="4x", module=W25Q128JV, with_master=True)
+            else:
+                self.add_spi_flash(mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=True)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0e-9)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=eth_data_width)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, data_width=eth_data_width)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, data_width=eth_data_width)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal:
@@ -104,6 +118,26 @@ class BaseSoC(SoCCore):
         # M2 --------------------------------------------------------------------------------------
         self.comb += platform.request("m2_devslp").eq(0) # Enable SATA M2.
 
+        # SATA -------------------------------------------------------------------------------------
+        if with_sata:
+            from litex_boards.cores.sata_ecp5 import LiteSATAECP5PHY
+            from litex_boards.cores.sata_raid import add_sata_raid0
+
+            # PHY (ECP5 SerDes DCU0/CH0, 150MHz RefClk).
+            self.submodules.sata_phy = LiteSATAECP5PHY(
+                refclk      = platform.request("refclk"),
+                tx_pads     = platform.request("m2_tx"),
+                rx_pads     = platform.request("m2_rx"),
+                gen         = sata_gen,
+                clk_freq    = sys_clk_freq,
+                refclk_freq = 150e6)
+
+            # Core.
+            self.add_sata(phy=self.sata_phy, mode="read+write")
+
+            # Benchmark (Pattern Generator/Checker, see software/sata_raid_bench.py).
+            add_sata_raid0(self, crossbars=[self.sata_crossbar])
+
         # WS2812 ----------------------------------------------------------------------------------
         if with_ws2812:
             from litex.build.generic_platform import Pins, IOStandard
@@ -120,6 +154,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
+    from litex_boards.software.flash_incremental import flash_args, flash_argdict
     parser = LiteXSoCArgumentParser(description="LiteX SoC on LiteX Acorn Baseboard")
     target_group = parser.add_argument_group(title="Target options")
     target_group.add_argument("--build",        action="store_true", help="Build design.")
@@ -130,29 +165,41 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
+    target_group.add_argument("--eth-data-width", default=8, type=int, help="Ethernet datapath width (in bits).", choices=[8, 32])
     sdopts = target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     viopts = target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal", action="store_true", help="Enable Video Terminal (HDMI).")
     target_group.add_argument("--with-spi-flash", action="store_true",      help="Enable SPI Flash (MMAPed).")
+    target_group.add_argument("--spi-flash-xip",  action="store_true",      help="Run SPI Flash in XIP performance mode (fastest opcode, prefetch and cache, see software/spi_flash_bench.py).")
     target_group.add_argument("--with-lcd",       action="store_true",      help="Enable OLED LCD support.")
     target_group.add_argument("--with-ws2812",    action="store_true",      help="Enable WS2812 on PMOD1:0.")
+    target_group.add_argument("--with-sata",      action="store_true",      help="Enable SATA support (over M2, with benchmark, see software/sata_raid_bench.py).")
+    target_group.add_argument("--sata-gen",       default="2",              help="SATA Gen.", choices=["1", "2"])
 
     builder_args(parser)
     soc_core_args(parser)
     trellis_args(parser)
+    flash_args(parser)
+    bitstream_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq        = int(float(args.sys_clk_freq)),
-        toolchain           = args.toolchain,
-        with_spi_flash      = args.with_spi_flash,
-        with_ethernet       = args.with_ethernet,
-        with_etherbone      = args.with_etherbone,
-        with_video_terminal = args.with_video_terminal,
-        with_lcd            = args.with_lcd,
-        with_ws2812         = args.with_ws2812,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        toolchain            = args.toolchain,
+        with_spi_flash       = args.with_spi_flash,
+        spi_flash_xip        = args.spi_flash_xip,
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_data_width       = args.eth_data_width,
+        with_video_terminal  = args.with_video_terminal,
+        with_lcd             = args.with_lcd,
+        with_ws2812          = args.with_ws2812,
+        with_sata            = args.with_sata,
+        sata_gen             = "gen" + args.sata_gen,
         **soc_core_argdict(args)
     )
     if args.with_spi_sdcard:
@@ -161,6 +208,7 @@ def main():
         soc.add_sdcard()
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
+    builder_kargs.update(bitstream_settings(soc.platform, **bitstream_argdict(args)))
     if args.build:
         builder.build(**builder_kargs)
 
@@ -169,8 +217,10 @@ def main():
         prog.load_bitstream(builder.get_bitstream_filename(mode="sram"))
 
     if args.flash:
+        from litex_boards.software.flash_incremental import flash_regions
         prog = soc.platform.create_programmer()
-        prog.flash(None, prog.load_bitstream(builder.get_bitstream_filename(mode="flash")))
+        flash_regions(prog, [(0, builder.get_bitstream_filename(mode="flash"))], builder.output_dir,
+            **flash_argdict(args))
 
 if __name__ == "__main__":
     main()
@@ -19,11 +19,16 @@ from litex.soc.integration.builder import *
 
 from litex.soc.cores.clock import *
 
-from litedram.modules import MT8KTF51264
+from litedram.modules import MT8KTF51264, parse_spd_hexdump, SDRAMModule
 from litedram.phy import s7ddrphy
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_dram import LitePCIeDRAMDMA
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie_flash import LitePCIeFlash
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -51,7 +56,10 @@ class CRG(Module):
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(100e6), with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(100e6), with_pcie=False,
+                 pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_dram_dma=False, with_pcie_bench=False, with_pcie_flash=False,
+                 spd_dump=None, **kwargs):
         platform = numato_nereid.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -67,10 +75,18 @@ class BaseSoC(SoCCore):
                 nphases          = 4,
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
+            if spd_dump is not None:
+                ram_spd    = parse_spd_hexdump(spd_dump)
+                ram_module = SDRAMModule.from_spd_data(ram_spd, sys_clk_freq)
+                ram_size   = None # From SPD.
+                print("DDR3: loaded config from", spd_dump)
+            else:
+                ram_module = MT8KTF51264(sys_clk_freq, "1:4", speedgrade="800")
+                ram_size   = 0x40000000
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
-                module        = MT8KTF51264(sys_clk_freq, "1:4", speedgrade="800"),
-                size          = 0x40000000,
+                module        = ram_module,
+                size          = ram_size,
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
@@ -79,7 +95,31 @@ class BaseSoC(SoCCore):
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA <-> DRAM (DRAM used as a staging buffer by the Host).
+            if with_pcie_dram_dma:
+                assert hasattr(self, "sdram"), "PCIe DMA <-> DRAM requires DRAM."
+                self.submodules.pcie_dram = LitePCIeDRAMDMA(self.pcie_dma0, self.sdram.crossbar)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
+
+            # PCIe SPI Flash Programmer (on the last DMA) + ICAP (For FPGA reload over PCIe).
+            if with_pcie_flash:
+                assert not with_pcie_bench, "PCIe Flash Programmer and Benchmark both use the last DMA."
+                assert not (with_pcie_dram_dma and pcie_dmas < 2), "PCIe DMA <-> DRAM and Flash Programmer require 2 DMAs."
+                self.submodules.pcie_flash = LitePCIeFlash(getattr(self, f"pcie_dma{pcie_dmas - 1}"),
+                    pads         = platform.request("spiflash4x"),
+                    device       = platform.device,
+                    sys_clk_freq = sys_clk_freq)
+                from litex.soc.cores.icap import ICAP
+                self.submodules.icap = ICAP()
+                self.icap.add_timing_constraints(platform, sys_clk_freq, self.crg.cd_sys.clk)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -87,18 +127,28 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Nereid")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",        action="store_true", help="Build design.")
-    target_group.add_argument("--load",         action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq", default=100e6,       help="System clock frequency.")
-    target_group.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",       action="store_true", help="Generate PCIe driver.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=100e6,          help="System clock frequency.")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-dram-dma",       action="store_true",    help="Connect PCIe DMA to DRAM (Host <-> DRAM streaming).")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--with-pcie-flash",          action="store_true",    help="Enable PCIe SPI Flash Programmer and ICAP reload (see software/litepcie_flash.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
+    target_group.add_argument("--spd-dump",                 type=str,               help="DDR3 configuration file, dumped using the `sdram_spd` command in LiteX BIOS.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-         sys_clk_freq = int(float(args.sys_clk_freq)),
-         with_pcie    = args.with_pcie,
+         sys_clk_freq             = int(float(args.sys_clk_freq)),
+         with_pcie                = args.with_pcie,
+         with_pcie_dram_dma       = args.with_pcie_dram_dma,
+         with_pcie_bench          = args.with_pcie_bench,
+         with_pcie_flash          = args.with_pcie_flash,
+         spd_dump                 = args.spd_dump,
+         **pcie_argdict(args),
          **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
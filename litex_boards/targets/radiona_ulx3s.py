@@ -13,6 +13,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import radiona_ulx3s
+from litex_boards.cores.bitstream import bitstream_args, bitstream_argdict, bitstream_settings
 
 from litex.build.lattice.trellis import trellis_args, trellis_argdict
 
@@ -26,6 +27,7 @@ from litex.soc.cores.gpio import GPIOOut
 
 from litedram import modules as litedram_modules
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+from litex_boards.cores.sdram import sdram_rate_auto
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -89,9 +91,13 @@ class BaseSoC(SoCCore):
     def __init__(self, device="LFE5U-45F", revision="2.0", toolchain="trellis",
         sys_clk_freq=int(50e6), sdram_module_cls="MT48LC16M16", sdram_rate="1:1",
         with_led_chaser=True, with_video_terminal=False, with_video_framebuffer=False,
-        with_spi_flash=False, **kwargs):
+        with_spi_flash=False, with_sdram_bist=False, **kwargs):
         platform = radiona_ulx3s.Platform(device=device, revision=revision, toolchain=toolchain)
 
+        # SDRAM Rate -------------------------------------------------------------------------------
+        sdram_rate = sdram_rate_auto(getattr(litedram_modules, sdram_module_cls), sys_clk_freq,
+            sdram_rate)
+
         # CRG --------------------------------------------------------------------------------------
         with_usb_pll   = kwargs.get("uart_name", None) == "usb_acm"
         with_video_pll = with_video_terminal or with_video_framebuffer
@@ -108,7 +114,8 @@ class BaseSoC(SoCCore):
                 phy           = self.sdrphy,
                 module        = getattr(litedram_modules, sdram_module_cls)(sys_clk_freq, sdram_rate),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size", 8192),
+                with_bist     = with_sdram_bist,
             )
 
         # Video ------------------------------------------------------------------------------------
@@ -157,13 +164,15 @@ def main():
     sdopts.add_argument("--with-spi-sdcard", action="store_true",   help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true",   help="Enable SDCard support.")
     target_group.add_argument("--with-oled",       action="store_true",   help="Enable SDD1331 OLED support.")
-    target_group.add_argument("--sdram-rate",      default="1:1",         help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    target_group.add_argument("--sdram-rate",      default="1:1", choices=["1:1", "1:2", "auto"], help="SDRAM Rate (1:1 Full Rate, 1:2 Half Rate or auto).")
+    target_group.add_argument("--with-sdram-bist", action="store_true",   help="Enable SDRAM BIST Generator/Checker (rate benchmark with the sdram_bist BIOS command).")
     viopts = target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     builder_args(parser)
     soc_core_args(parser)
     trellis_args(parser)
+    bitstream_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -173,6 +182,7 @@ def main():
         sys_clk_freq           = int(float(args.sys_clk_freq)),
         sdram_module_cls       = args.sdram_module,
         sdram_rate             = args.sdram_rate,
+        with_sdram_bist        = args.with_sdram_bist,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         with_spi_flash         = args.with_spi_flash,
@@ -186,6 +196,7 @@ def main():
 
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
+    builder_kargs.update(bitstream_settings(soc.platform, **bitstream_argdict(args)))
     if args.build:
         builder.build(**builder_kargs)
 
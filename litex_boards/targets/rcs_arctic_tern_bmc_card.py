@@ -23,6 +23,8 @@ from litex.soc.integration.soc import SoCRegion
 from litedram.modules import MT41J256M16
 from litedram.phy import ECP5DDRPHY
 from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
+
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
 from litex.soc.cores.video import VideoGenericPHY
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -99,6 +101,7 @@ class BaseSoC(SoCCore):
         with_video_framebuffer = False,
         with_ethernet          = False,
         with_etherbone         = False,
+        with_hybrid_ethernet   = False,
         eth_ip                 = "192.168.1.50",
         **kwargs):
         platform = rcs_arctic_tern_bmc_card.Platform(toolchain=toolchain)
@@ -125,7 +128,7 @@ class BaseSoC(SoCCore):
         )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", 0),
                 pads       = self.platform.request("eth", 0),
@@ -135,6 +138,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
 
         # Video Output -----------------------------------------------------------------------------
         if with_video_colorbars or with_video_terminal or with_video_framebuffer:
@@ -164,6 +169,7 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true",              help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true",              help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true",        help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     target_group.add_argument("--eth-ip",          default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
     builder_args(parser)
     soc_core_args(parser)
@@ -171,11 +177,12 @@ def main():
     args = parser.parse_args()
 
     soc = BaseSoC(
-        toolchain    = args.toolchain,
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
+        toolchain            = args.toolchain,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        eth_ip               = args.eth_ip,
         **soc_core_argdict(args))
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
@@ -10,11 +10,12 @@
 # Build/Load bitstream:
 # ./siglent_ds1104xe.py --with-etherbone --uart-name=crossover --csr-csv=csr.csv --build --load
 #
-# Test Ethernet:
+# Test Ethernet (Firmware/Etherbone):
 # ping 192.168.1.50
+# ping 192.168.1.51
 #
 # Test Console:
-# litex_server --udp
+# litex_server --udp --udp-ip=192.168.1.51
 # litex_term crossover
 # --------------------------------------------------------------------------------------------------
 
@@ -34,6 +35,8 @@ from litedram.phy import s7ddrphy
 
 from liteeth.phy.mii import LiteEthPHYMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -65,7 +68,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(100e6), with_etherbone=True, eth_ip="192.168.1.50", with_video_terminal=False, with_video_framebuffer=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(100e6), with_etherbone=True, eth_ip="192.168.1.50", etherbone_ip="192.168.1.51", with_video_terminal=False, with_video_framebuffer=False, **kwargs):
         platform = siglent_sds1104xe.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -89,54 +92,14 @@ class BaseSoC(SoCCore):
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
-        # Etherbone --------------------------------------------------------------------------------
+        # Ethernet (Firmware) + Etherbone (Hardware) ----------------------------------------------
         if with_etherbone:
-            # FIXME: Simplify LiteEth Hybrid MAC integration.
-            from liteeth.common import convert_ip
-            from liteeth.mac import LiteEthMAC
-            from liteeth.core.arp import LiteEthARP
-            from liteeth.core.ip import LiteEthIP
-            from liteeth.core.udp import LiteEthUDP
-            from liteeth.core.icmp import LiteEthICMP
-            from liteeth.core import LiteEthUDPIPCore
-            from liteeth.frontend.etherbone import LiteEthEtherbone
-
-            # Ethernet PHY
             self.submodules.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            etherbone_ip_address  = convert_ip("192.168.1.51")
-            etherbone_mac_address = 0x10e2d5000001
-
-            # Ethernet MAC
-            self.submodules.ethmac = LiteEthMAC(phy=self.ethphy, dw=8,
-                interface  = "hybrid",
-                endianness = self.cpu.endianness,
-                hw_mac     = etherbone_mac_address)
-
-            # Software Interface.
-            self.add_memory_region("ethmac", getattr(self.mem_map, "ethmac", None), 0x2000, type="io")
-            self.add_wb_slave(self.mem_regions["ethmac"].origin, self.ethmac.bus, 0x2000)
-            if self.irq.enabled:
-                self.irq.add("ethmac", use_loc_if_exists=True)
-
-            # Hardware Interface.
-            self.submodules.arp  = LiteEthARP(self.ethmac, etherbone_mac_address, etherbone_ip_address, sys_clk_freq, dw=8)
-            self.submodules.ip   = LiteEthIP(self.ethmac, etherbone_mac_address, etherbone_ip_address, self.arp.table, dw=8)
-            self.submodules.icmp = LiteEthICMP(self.ip, etherbone_ip_address, dw=8)
-            self.submodules.udp  = LiteEthUDP(self.ip, etherbone_ip_address, dw=8)
-            self.add_constant("ETH_PHY_NO_RESET") # Disable reset from BIOS to avoid disabling Hardware Interface.
-
-            # Etherbone
-            self.submodules.etherbone = LiteEthEtherbone(self.udp, 1234, mode="master")
-            self.bus.add_master(master=self.etherbone.wishbone.bus)
-
-            # Timing constraints
-            eth_rx_clk = self.ethphy.crg.cd_eth_rx.clk
-            eth_tx_clk = self.ethphy.crg.cd_eth_tx.clk
-            self.platform.add_period_constraint(eth_rx_clk, 1e9/self.ethphy.rx_clk_freq)
-            self.platform.add_period_constraint(eth_tx_clk, 1e9/self.ethphy.tx_clk_freq)
-            self.platform.add_false_path_constraints(self.crg.cd_sys.clk, eth_rx_clk, eth_tx_clk)
+            for i, n in enumerate(eth_ip.split(".")):
+                self.add_constant(f"LOCALIP{i + 1}", int(n))
+            add_hybrid_ethernet(self, phy=self.ethphy, ip_address=etherbone_ip)
 
         # Video ------------------------------------------------------------------------------------
         video_timings = ("800x480@60Hz", {
@@ -166,8 +129,9 @@ def main():
     target_group.add_argument("--build",          action="store_true",              help="Build design.")
     target_group.add_argument("--load",           action="store_true",              help="Load bitstream.")
     target_group.add_argument("--sys-clk-freq",   default=100e6,                    help="System clock frequency.")
-    target_group.add_argument("--with-etherbone", action="store_true",              help="Enable Etherbone support.")
-    target_group.add_argument("--eth-ip",         default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
+    target_group.add_argument("--with-etherbone", action="store_true",              help="Enable Ethernet (Firmware) + Etherbone (Hardware) support.")
+    target_group.add_argument("--eth-ip",         default="192.168.1.50", type=str, help="Ethernet (Firmware) IP address.")
+    target_group.add_argument("--etherbone-ip",   default="192.168.1.51", type=str, help="Hardware Etherbone IP address (must differ from --eth-ip).")
     viopts = target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
@@ -180,6 +144,7 @@ def main():
         sys_clk_freq   = int(float(args.sys_clk_freq)),
         with_etherbone = args.with_etherbone,
         eth_ip         = args.eth_ip,
+        etherbone_ip   = args.etherbone_ip,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         **soc_core_argdict(args)
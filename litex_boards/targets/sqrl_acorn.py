@@ -42,7 +42,11 @@ from litedram.modules import MT41K512M16
 from litedram.phy import s7ddrphy
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie_flash import LitePCIeFlash
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -73,7 +77,8 @@ class CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="cle-215+", sys_clk_freq=int(100e6), with_led_chaser=True,
-                 with_pcie=False, with_sata=False, **kwargs):
+                 with_pcie=False, pcie_dmas=1, pcie_address_width=64, pcie_dma_buffering_depth=1024,
+                 with_pcie_bench=False, with_pcie_flash=False, with_sata=False, **kwargs):
         platform = sqrl_acorn.Platform(variant=variant)
 
         # CRG --------------------------------------------------------------------------------------
@@ -107,7 +112,14 @@ class BaseSoC(SoCCore):
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1, address_width=64)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
             # FIXME: Apply it to all targets (integrate it in LitePCIe?).
             platform.add_period_constraint(self.crg.cd_sys.clk, 1e9/sys_clk_freq)
             platform.toolchain.pre_placement_commands.add("set_clock_groups -group [get_clocks {sys_clk}] -group [get_clocks userclk2] -asynchronous", sys_clk=self.crg.cd_sys.clk)
@@ -121,11 +133,19 @@ class BaseSoC(SoCCore):
             self.icap.add_reload()
             self.icap.add_timing_constraints(platform, sys_clk_freq, self.crg.cd_sys.clk)
 
-            # Flash (For SPIFlash update over PCIe).
-            from litex.soc.cores.gpio import GPIOOut
-            from litex.soc.cores.spi_flash import S7SPIFlash
-            self.submodules.flash_cs_n = GPIOOut(platform.request("flash_cs_n"))
-            self.submodules.flash      = S7SPIFlash(platform.request("flash"), sys_clk_freq, 25e6)
+            # Flash (For SPIFlash update over PCIe, DMA-fed Programmer or CSR-driven SPI).
+            if with_pcie_flash:
+                assert not with_pcie_bench, "PCIe Flash Programmer and Benchmark both use the last DMA."
+                self.submodules.pcie_flash = LitePCIeFlash(getattr(self, f"pcie_dma{pcie_dmas - 1}"),
+                    pads         = platform.request("flash"),
+                    cs_n         = platform.request("flash_cs_n"),
+                    device       = platform.device,
+                    sys_clk_freq = sys_clk_freq)
+            else:
+                from litex.soc.cores.gpio import GPIOOut
+                from litex.soc.cores.spi_flash import S7SPIFlash
+                self.submodules.flash_cs_n = GPIOOut(platform.request("flash_cs_n"))
+                self.submodules.flash      = S7SPIFlash(platform.request("flash"), sys_clk_freq, 25e6)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -173,25 +193,31 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Acorn CLE-101/215(+)")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",           action="store_true", help="Build design.")
-    target_group.add_argument("--load",            action="store_true", help="Load bitstream.")
-    target_group.add_argument("--flash",           action="store_true", help="Flash bitstream.")
-    target_group.add_argument("--variant",         default="cle-215+",  help="Board variant (cle-215+, cle-215 or cle-101).")
-    target_group.add_argument("--sys-clk-freq",    default=100e6,       help="System clock frequency.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--flash",                    action="store_true",    help="Flash bitstream.")
+    target_group.add_argument("--variant",                  default="cle-215+",     help="Board variant (cle-215+, cle-215 or cle-101).")
+    target_group.add_argument("--sys-clk-freq",             default=100e6,          help="System clock frequency.")
     pcieopts = target_group.add_mutually_exclusive_group()
-    pcieopts.add_argument("--with-pcie",     action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",          action="store_true", help="Generate PCIe driver.")
-    target_group.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support (requires SDCard adapter on P2).")
-    pcieopts.add_argument("--with-sata",     action="store_true", help="Enable SATA support (over PCIe2SATA).")
+    pcieopts.add_argument("--with-pcie",     action="store_true",                   help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--with-pcie-flash",          action="store_true",    help="Enable PCIe SPI Flash Programmer and ICAP reload (see software/litepcie_flash.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
+    target_group.add_argument("--with-spi-sdcard",          action="store_true",    help="Enable SPI-mode SDCard support (requires SDCard adapter on P2).")
+    pcieopts.add_argument("--with-sata",     action="store_true",                   help="Enable SATA support (over PCIe2SATA).")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser, address_width=64)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        variant      = args.variant,
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_pcie    = args.with_pcie,
-        with_sata    = args.with_sata,
+        variant                  = args.variant,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_pcie                = args.with_pcie,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_pcie_flash          = args.with_pcie_flash,
+        with_sata                = args.with_sata,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     if args.with_spi_sdcard:
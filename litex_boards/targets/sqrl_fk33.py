@@ -29,7 +29,10 @@ from litepcie.phy.usppciephy import USPHBMPCIEPHY
 from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
 from litepcie.frontend.dma import LitePCIeDMA
 from litepcie.frontend.wishbone import LitePCIeWishboneBridge
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie import pcie_gen3_data_width, pcie_max_dmas, pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -56,7 +59,9 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_led_chaser=True, with_pcie=False, with_hbm=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_led_chaser=True, with_pcie=False,
+                 pcie_lanes=4, pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_bench=False, with_hbm=False, **kwargs):
         platform = sqrl_fk33.Platform()
         if with_hbm:
             assert 225e6 <= sys_clk_freq <= 450e6
@@ -94,37 +99,46 @@ class BaseSoC(SoCCore):
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
             assert self.csr_data_width == 32
-            # PHY
-            self.submodules.pcie_phy = USPHBMPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            self.submodules.pcie_phy = USPHBMPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                speed      = "gen3",
+                data_width = pcie_gen3_data_width(pcie_lanes),
                 bar0_size  = 0x20000)
 
             # Endpoint
-            self.submodules.pcie_endpoint = LitePCIeEndpoint(self.pcie_phy, max_pending_requests=8)
+            self.submodules.pcie_endpoint = LitePCIeEndpoint(self.pcie_phy,
+                max_pending_requests = 8,
+                address_width        = pcie_address_width)
 
             # Wishbone bridge
             self.submodules.pcie_bridge = LitePCIeWishboneBridge(self.pcie_endpoint,
                 base_address = self.mem_map["csr"])
             self.bus.add_master(master=self.pcie_bridge.wishbone)
 
-            # DMA0
-            self.submodules.pcie_dma0 = LitePCIeDMA(self.pcie_phy, self.pcie_endpoint,
-                with_buffering = True, buffering_depth=1024,
-                with_loopback  = True)
-
-            self.add_constant("DMA_CHANNELS", 1)
+            # DMAs
+            assert pcie_dmas <= pcie_max_dmas
+            self.interrupts = {}
+            for i in range(pcie_dmas):
+                dma = LitePCIeDMA(self.pcie_phy, self.pcie_endpoint,
+                    with_buffering = True, buffering_depth=pcie_dma_buffering_depth,
+                    with_loopback  = True,
+                    address_width  = pcie_address_width)
+                setattr(self.submodules, f"pcie_dma{i}", dma)
+                self.interrupts[f"PCIE_DMA{i}_WRITER"] = dma.writer.irq
+                self.interrupts[f"PCIE_DMA{i}_READER"] = dma.reader.irq
+            self.add_constant("DMA_CHANNELS",   pcie_dmas)
+            self.add_constant("DMA_ADDR_WIDTH", pcie_address_width)
 
             # MSI
             self.submodules.pcie_msi = LitePCIeMSI()
             self.comb += self.pcie_msi.source.connect(self.pcie_phy.msi)
-            self.interrupts = {
-                "PCIE_DMA0_WRITER":    self.pcie_dma0.writer.irq,
-                "PCIE_DMA0_READER":    self.pcie_dma0.reader.irq,
-            }
             for i, (k, v) in enumerate(sorted(self.interrupts.items())):
                 self.comb += self.pcie_msi.irqs[i].eq(v)
                 self.add_constant(k + "_INTERRUPT", i)
 
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.submodules.leds = LedChaser(
@@ -137,20 +151,26 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on FK33")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",        action="store_true", help="Build design.")
-    target_group.add_argument("--load",         action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq", default=125e6,       help="System clock frequency.")
-    target_group.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--with-hbm",     action="store_true", help="Use HBM2.")
-    target_group.add_argument("--driver",       action="store_true", help="Generate PCIe driver.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=125e6,          help="System clock frequency.")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--pcie-lanes",               default=4, type=int, choices=[4, 8, 16], help="PCIe lanes (4, 8 or 16, Gen3 with 128, 256 or 512-bit datapath).")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--with-hbm",                 action="store_true",    help="Use HBM2.")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_pcie    = args.with_pcie,
-        with_hbm     = args.with_hbm,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_pcie                = args.with_pcie,
+        pcie_lanes               = args.pcie_lanes,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_hbm                 = args.with_hbm,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -22,7 +22,11 @@ from litedram.modules import MT40A512M8
 from litedram.phy import usddrphy
 
 from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_dram import LitePCIeDRAMDMA
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie import pcie_gen3_data_width, pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -57,7 +61,9 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(125e6), ddram_channel=0, with_led_chaser=True,
-                 with_pcie=False, with_sata=False, **kwargs):
+                 with_pcie=False, pcie_lanes=4, pcie_dmas=1, pcie_address_width=32,
+                 pcie_dma_buffering_depth=1024, with_pcie_dram_dma=False, with_pcie_bench=False,
+                 with_sata=False, sata_gen="gen2", with_sata_streamer=False, **kwargs):
         platform = sqrl_xcu1525.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -84,10 +90,23 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                speed      = "gen3",
+                data_width = pcie_gen3_data_width(pcie_lanes),
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA <-> DRAM (DRAM used as a staging buffer by the Host).
+            if with_pcie_dram_dma:
+                assert hasattr(self, "sdram"), "PCIe DMA <-> DRAM requires DRAM."
+                self.submodules.pcie_dram = LitePCIeDRAMDMA(self.pcie_dma0, self.sdram.crossbar)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -106,21 +125,35 @@ class BaseSoC(SoCCore):
             ]
             platform.add_extension(_sata_io)
 
-            # RefClk, Generate 150MHz from PLL.
+            # RefClk, Generate 150MHz from a dedicated PLL (independent of sys_clk_freq).
             self.clock_domains.cd_sata_refclk = ClockDomain()
-            self.crg.pll.create_clkout(self.cd_sata_refclk, 150e6)
+            self.submodules.sata_pll = sata_pll = USPMMCM(speedgrade=-2)
+            sata_pll.register_clkin(self.crg.pll.clkin, 300e6)
+            sata_pll.create_clkout(self.cd_sata_refclk, 150e6)
             sata_refclk = ClockSignal("sata_refclk")
 
-            # PHY
+            # PHY (Gen3: 32-bit datapath, sata_tx/rx clk @ 150MHz instead of 300MHz).
+            assert sata_gen != "gen3" or sys_clk_freq >= 150e6, "SATA Gen3 requires --sys-clk-freq >= 150e6."
             self.submodules.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = sata_refclk,
                 pads       = platform.request("qsfp2sata"),
-                gen        = "gen2",
+                gen        = sata_gen,
                 clk_freq   = sys_clk_freq,
-                data_width = 16)
+                data_width = {"gen1": 16, "gen2": 16, "gen3": 32}[sata_gen])
 
             # Core
             self.add_sata(phy=self.sata_phy, mode="read+write")
+            # add_sata constrains sata_tx/rx clks for a 16-bit datapath (300MHz at Gen3):
+            # re-constrain them @ 150MHz for the Gen3 32-bit datapath.
+            if sata_gen == "gen3":
+                for clk in [self.sata_phy.crg.cd_sata_tx.clk, self.sata_phy.crg.cd_sata_rx.clk]:
+                    platform.toolchain.clocks.pop(clk)
+                    platform.add_period_constraint(clk, 1e9/150e6)
+
+            # LiteDRAM <-> SATA Streamer (Recorder/Player, see software/sata_dram_bench.py).
+            if with_sata_streamer:
+                from litex_boards.cores.sata_dram import add_sata_dram_streamer
+                add_sata_dram_streamer(self)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -134,22 +167,34 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on XCU1525")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",         action="store_true", help="Build design.")
-    target_group.add_argument("--load",          action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq",  default=125e6,       help="System clock frequency.")
-    target_group.add_argument("--ddram-channel", default="0",         help="DDRAM channel (0, 1, 2 or 3).")
-    target_group.add_argument("--with-pcie",     action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",        action="store_true", help="Generate PCIe driver.")
-    target_group.add_argument("--with-sata",     action="store_true", help="Enable SATA support (over SFP2SATA).")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=125e6,          help="System clock frequency.")
+    target_group.add_argument("--ddram-channel",            default="0",            help="DDRAM channel (0, 1, 2 or 3).")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--pcie-lanes",               default=4, type=int, choices=[4, 8, 16], help="PCIe lanes (4, 8 or 16, Gen3 with 128, 256 or 512-bit datapath).")
+    target_group.add_argument("--with-pcie-dram-dma",       action="store_true",    help="Connect PCIe DMA to DRAM (Host <-> DRAM streaming).")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
+    target_group.add_argument("--with-sata",                action="store_true",    help="Enable SATA support (over SFP2SATA).")
+    target_group.add_argument("--sata-gen",                 default="2",            help="SATA Gen (3 requires --sys-clk-freq >= 150e6, ex: 187.5e6).", choices=["1", "2", "3"])
+    target_group.add_argument("--with-sata-streamer",       action="store_true",    help="Enable LiteDRAM <-> SATA Streamer (Recorder/Player, see software/sata_dram_bench.py).")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq  = int(float(args.sys_clk_freq)),
-        ddram_channel = int(args.ddram_channel, 0),
-        with_pcie     = args.with_pcie,
-        with_sata     = args.with_sata,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        ddram_channel            = int(args.ddram_channel, 0),
+        with_pcie                = args.with_pcie,
+        pcie_lanes               = args.pcie_lanes,
+        with_pcie_dram_dma       = args.with_pcie_dram_dma,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_sata                = args.with_sata,
+        sata_gen                 = "gen" + args.sata_gen,
+        with_sata_streamer       = args.with_sata_streamer,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
 	)
     builder = Builder(soc, **builder_argdict(args))
@@ -22,6 +22,7 @@ from litex.soc.cores.led import LedChaser
 
 from litedram.modules import AS4C32M16
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
+from litex_boards.cores.sdram import sdram_rate_auto
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -62,9 +63,13 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(50e6), with_led_chaser=True, with_mister_sdram=True,
-                 with_mister_video_terminal=False, sdram_rate="1:1", **kwargs):
+                 with_mister_video_terminal=False, sdram_rate="1:1",
+                 with_sdram_bist=False, **kwargs):
         platform = terasic_de10nano.Platform()
 
+        # SDRAM Rate -------------------------------------------------------------------------------
+        sdram_rate = sdram_rate_auto(AS4C32M16, sys_clk_freq, sdram_rate)
+
         # CRG --------------------------------------------------------------------------------------
         self.submodules.crg = _CRG(platform, sys_clk_freq, with_sdram=with_mister_sdram, sdram_rate=sdram_rate)
 
@@ -78,7 +83,8 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy           = self.sdrphy,
                 module        = AS4C32M16(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size", 8192),
+                with_bist     = with_sdram_bist,
             )
 
         # Video Terminal ---------------------------------------------------------------------------
@@ -103,7 +109,8 @@ def main():
     target_group.add_argument("--sys-clk-freq",               default=50e6,        help="System clock frequency.")
     target_group.add_argument("--with-mister-sdram",          action="store_true", help="Enable SDRAM with MiSTer expansion board.")
     target_group.add_argument("--with-mister-video-terminal", action="store_true", help="Enable Video Terminal with Mister expansion board.")
-    target_group.add_argument("--sdram-rate",                 default="1:1",       help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    target_group.add_argument("--sdram-rate",                 default="1:1", choices=["1:1", "1:2", "auto"], help="SDRAM Rate (1:1 Full Rate, 1:2 Half Rate or auto).")
+    target_group.add_argument("--with-sdram-bist",            action="store_true", help="Enable SDRAM BIST Generator/Checker (rate benchmark with the sdram_bist BIOS command).")
     builder_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
@@ -113,6 +120,7 @@ def main():
         with_mister_sdram          = args.with_mister_sdram,
         with_mister_video_terminal = args.with_mister_video_terminal,
         sdram_rate                 = args.sdram_rate,
+        with_sdram_bist            = args.with_sdram_bist,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
@@ -21,6 +21,8 @@ from litex.soc.cores.led import LedChaser
 
 from liteeth.phy.mii import LiteEthPHYMII
 
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -55,8 +57,8 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(50e6), with_led_chaser=True, with_uartbone=False, with_jtagbone=False, with_video_terminal=False,
-                 with_ethernet=False, with_etherbone=False, eth_ip="192.168.1.50",
-                 eth_dynamic_ip=False,
+                 with_ethernet=False, with_etherbone=False, with_hybrid_ethernet=False,
+                 eth_ip="192.168.1.50", eth_dynamic_ip=False,
                  **kwargs):
         self.platform = platform = terasic_deca.Platform()
 
@@ -84,7 +86,7 @@ class BaseSoC(SoCCore):
             self.add_jtagbone()
         
         # Ethernet ---------------------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.platform.toolchain.additional_sdc_commands += [
                 'create_clock -name eth_rx_clk -period 40.0 [get_ports {eth_clocks_rx}]',
                 'create_clock -name eth_tx_clk -period 40.0 [get_ports {eth_clocks_tx}]',
@@ -99,6 +101,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal:
@@ -123,6 +127,7 @@ def main():
     ethopts = target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",      action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone",     action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
     target_group.add_argument("--eth-ip",              default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
     target_group.add_argument("--eth-dynamic-ip",      action="store_true", help="Enable dynamic Ethernet IP addresses setting.")
     target_group.add_argument("--with-uartbone",       action="store_true", help="Enable UARTbone support.")
@@ -136,6 +141,7 @@ def main():
         sys_clk_freq             = int(float(args.sys_clk_freq)),
         with_ethernet            = args.with_ethernet,
         with_etherbone           = args.with_etherbone,
+        with_hybrid_ethernet     = args.with_hybrid_ethernet,
         eth_ip                   = args.eth_ip,
         eth_dynamic_ip           = args.eth_dynamic_ip,
         with_uartbone            = args.with_uartbone,
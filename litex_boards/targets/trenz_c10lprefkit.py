@@ -22,15 +22,18 @@ from litedram.phy import GENSDRPHY
 
 from liteeth.phy.mii import LiteEthPHYMII
 
-from litex.soc.cores.hyperbus import HyperRAM
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.hyperram import HyperRAMFrontend
 
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, with_sys2x=False):
         self.rst = Signal()
         self.clock_domains.cd_sys    = ClockDomain()
         self.clock_domains.cd_sys_ps = ClockDomain()
+        if with_sys2x:
+            self.clock_domains.cd_sys2x = ClockDomain()
 
         # # #
 
@@ -43,6 +46,8 @@ class _CRG(Module):
         pll.register_clkin(clk12, 12e6)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
         pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
+        if with_sys2x:
+            pll.create_clkout(self.cd_sys2x, 2*sys_clk_freq)
 
         # SDRAM clock
         self.comb += platform.request("sdram_clock").eq(self.cd_sys_ps.clk)
@@ -56,18 +61,22 @@ class BaseSoC(SoCCore):
     mem_map.update(SoCCore.mem_map)
 
     def __init__(self, sys_clk_freq=int(50e6), with_led_chaser=True,
-        with_ethernet=False, with_etherbone=False,
+        with_ethernet=False, with_etherbone=False, with_hybrid_ethernet=False,
+        hyperram_clk_ratio="4:1", hyperram_cache_size=0,
         **kwargs):
         platform = trenz_c10lprefkit.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.submodules.crg = _CRG(platform, sys_clk_freq)
+        self.submodules.crg = _CRG(platform, sys_clk_freq, with_sys2x=(hyperram_clk_ratio == "2:1"))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on C10 LP RefKit", **kwargs)
 
         # HyperRam ---------------------------------------------------------------------------------
-        self.submodules.hyperram = HyperRAM(platform.request("hyperram"), sys_clk_freq=sys_clk_freq)
+        self.submodules.hyperram = HyperRAMFrontend(platform.request("hyperram"),
+            sys_clk_freq = sys_clk_freq,
+            clk_ratio    = hyperram_clk_ratio,
+            cache_size   = hyperram_cache_size)
         self.add_wb_slave(self.mem_map["hyperram"], self.hyperram.bus)
         self.add_memory_region("hyperram", self.mem_map["hyperram"], 8*1024*1024)
 
@@ -81,7 +90,7 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -89,6 +98,8 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -102,19 +113,25 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on C10 LP RefKit")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",          action="store_true", help="Build design.")
-    target_group.add_argument("--load",           action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq",   default=50e6,        help="System clock frequency.")
-    target_group.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
-    target_group.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    target_group.add_argument("--build",               action="store_true", help="Build design.")
+    target_group.add_argument("--load",                action="store_true", help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",        default=50e6,        help="System clock frequency.")
+    target_group.add_argument("--with-ethernet",       action="store_true", help="Enable Ethernet support.")
+    target_group.add_argument("--with-etherbone",      action="store_true", help="Enable Etherbone support.")
+    target_group.add_argument("--with-hybrid-ethernet", action="store_true", help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support.")
+    target_group.add_argument("--hyperram-clk-ratio",  default="4:1", choices=["4:1", "2:1"],       help="HyperRAM Clk ratio to sys_clk_freq (4:1 or 2:1).")
+    target_group.add_argument("--hyperram-cache-size", default=0, type=int, help="HyperRAM Cache size in bytes (0 to disable).")
     builder_args(parser)
     soc_core_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        with_hybrid_ethernet = args.with_hybrid_ethernet,
+        hyperram_clk_ratio   = args.hyperram_clk_ratio,
+        hyperram_cache_size  = args.hyperram_cache_size,
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
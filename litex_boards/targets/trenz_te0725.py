@@ -17,28 +17,35 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litex.soc.cores.hyperbus import HyperRAM
+from litex_boards.cores.hyperram import HyperRAMFrontend
 
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, with_sys2x=False):
         self.rst = Signal()
         self.clock_domains.cd_sys       = ClockDomain()
+        if with_sys2x:
+            self.clock_domains.cd_sys2x = ClockDomain()
 
         self.submodules.pll = pll = S7PLL(speedgrade=-1)
         self.comb += pll.reset.eq(~platform.request("cpu_reset") | self.rst)
         pll.register_clkin(platform.request("clk100"), 100e6)
         pll.create_clkout(self.cd_sys,       sys_clk_freq)
+        if with_sys2x:
+            pll.create_clkout(self.cd_sys2x, 2*sys_clk_freq)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(100e6), with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=int(100e6), with_led_chaser=True,
+        hyperram_clk_ratio  = "4:1",
+        hyperram_cache_size = 0,
+        **kwargs):
         platform = trenz_te0725.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.submodules.crg = _CRG(platform, sys_clk_freq)
+        self.submodules.crg = _CRG(platform, sys_clk_freq, with_sys2x=(hyperram_clk_ratio == "2:1"))
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Trenz TE0725 Board", **kwargs)
@@ -46,7 +53,10 @@ class BaseSoC(SoCCore):
         # Use HyperRAM generic PHY as SRAM ---------------------------------------------------------
         size = int((64*1024*1024) / 8)
         hr_pads = platform.request("hyperram", 0)
-        self.submodules.hyperram = HyperRAM(hr_pads, sys_clk_freq=sys_clk_freq)
+        self.submodules.hyperram = HyperRAMFrontend(hr_pads,
+            sys_clk_freq = sys_clk_freq,
+            clk_ratio    = hyperram_clk_ratio,
+            cache_size   = hyperram_cache_size)
         self.bus.add_slave("hyperram", slave=self.hyperram.bus, region=SoCRegion(origin=0x20000000, size=size))
 
         # Leds -------------------------------------------------------------------------------------
@@ -62,10 +72,12 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Trenz TE0725")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",           action="store_true", help="Build design.")
-    target_group.add_argument("--load",            action="store_true", help="Load bitstream.")
-    target_group.add_argument("--flash",           action="store_true", help="Flash bitstream.")
-    target_group.add_argument("--sys-clk-freq",    default=100e6,       help="System clock frequency.")
+    target_group.add_argument("--build",               action="store_true",  help="Build design.")
+    target_group.add_argument("--load",                action="store_true",  help="Load bitstream.")
+    target_group.add_argument("--flash",               action="store_true",  help="Flash bitstream.")
+    target_group.add_argument("--sys-clk-freq",        default=100e6,        help="System clock frequency.")
+    target_group.add_argument("--hyperram-clk-ratio",  default="4:1", choices=["4:1", "2:1"],        help="HyperRAM Clk ratio to sys_clk_freq (4:1 or 2:1).")
+    target_group.add_argument("--hyperram-cache-size", default=0, type=int,  help="HyperRAM Cache size in bytes (0 to disable).")
 
     builder_args(parser)
     soc_core_args(parser)
@@ -73,7 +85,9 @@ def main():
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
+        sys_clk_freq        = int(float(args.sys_clk_freq)),
+        hyperram_clk_ratio  = args.hyperram_clk_ratio,
+        hyperram_cache_size = args.hyperram_cache_size,
         **soc_core_argdict(args)
     )
 
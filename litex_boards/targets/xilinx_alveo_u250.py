@@ -23,8 +23,14 @@ from litex.soc.cores.led import LedChaser
 from litedram.modules import MTA18ASF2G72PZ
 from litedram.phy import usddrphy
 
+from litex_boards.cores.eth_10gbaser import LiteEthPHY10GBASER, add_etherbone_10gbaser
+
 from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_dram import LitePCIeDRAMDMA
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie import pcie_gen3_data_width, pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -58,7 +64,9 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_led_chaser=True, with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_etherbone=False, eth_ip="192.168.1.50",
+                 with_led_chaser=True, with_pcie=False, pcie_lanes=4, pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_dram_dma=False, with_pcie_bench=False, **kwargs):
         platform = xilinx_alveo_u250.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -84,12 +92,43 @@ class BaseSoC(SoCCore):
         # Firmware RAM (To ease initial LiteDRAM calibration support) ------------------------------
         self.add_ram("firmware_ram", 0x20000000, 0x8000)
 
+        # 10G Etherbone (10GBASE-R on QSFP28 0 Lane 0, 161.1328125MHz RefClk) ----------------------
+        if with_etherbone:
+            qsfp_pads = self.platform.request("qsfp28", 0)
+            self.comb += [
+                qsfp_pads.fs0.eq(0),
+                qsfp_pads.fs1.eq(1), # RefClk: 161.1328125MHz.
+                qsfp_pads.refclk_reset.eq(0),
+                qsfp_pads.resetl.eq(1),
+                qsfp_pads.lpmode.eq(0),
+            ]
+            self.submodules.ethphy = LiteEthPHY10GBASER(
+                refclk_pads  = qsfp_pads,
+                refclk_freq  = 161.1328125e6,
+                data_pads    = qsfp_pads,
+                sys_clk_freq = self.clk_freq,
+                device       = self.platform.device)
+            add_etherbone_10gbaser(self, self.ethphy, ip_address=eth_ip)
+
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                speed      = "gen3",
+                data_width = pcie_gen3_data_width(pcie_lanes),
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA <-> DRAM (DRAM used as a staging buffer by the Host).
+            if with_pcie_dram_dma:
+                assert hasattr(self, "sdram"), "PCIe DMA <-> DRAM requires DRAM."
+                self.submodules.pcie_dram = LitePCIeDRAMDMA(self.pcie_dma0, self.sdram.crossbar)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -103,18 +142,30 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Alveo U250")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",        action="store_true", help="Build design.")
-    target_group.add_argument("--load",         action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq", default=125e6,       help="System clock frequency.")
-    target_group.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",       action="store_true", help="Generate PCIe driver.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=125e6,          help="System clock frequency.")
+    target_group.add_argument("--with-etherbone",           action="store_true",    help="Enable 10G Etherbone support (10GBASE-R on QSFP28 0 Lane 0).")
+    target_group.add_argument("--eth-ip",                   default="192.168.1.50", help="Etherbone IP address.")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--pcie-lanes",               default=4, type=int, choices=[4, 8, 16], help="PCIe lanes (4, 8 or 16, Gen3 with 128, 256 or 512-bit datapath).")
+    target_group.add_argument("--with-pcie-dram-dma",       action="store_true",    help="Connect PCIe DMA to DRAM (Host <-> DRAM streaming).")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_pcie    = args.with_pcie,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_etherbone           = args.with_etherbone,
+        eth_ip                   = args.eth_ip,
+        with_pcie                = args.with_pcie,
+        pcie_lanes               = args.pcie_lanes,
+        with_pcie_dram_dma       = args.with_pcie_dram_dma,
+        with_pcie_bench          = args.with_pcie_bench,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
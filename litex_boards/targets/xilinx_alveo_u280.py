@@ -28,11 +28,15 @@ from litex.soc.interconnect.csr import *
 from litex.soc.cores.ram.xilinx_usp_hbm2 import USPHBM2
 
 from litex.soc.cores.led import LedChaser
-from litedram.modules import MTA18ASF2G72PZ
+from litedram.modules import MTA18ASF2G72PZ, parse_spd_hexdump, SDRAMRegisteredModule
 from litedram.phy import usddrphy
 
 from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.eth_10gbaser import LiteEthPHY10GBASER, add_etherbone_10gbaser
+from litex_boards.cores.pcie import pcie_gen3_data_width, pcie_args, pcie_argdict
 
 from litedram.common import *
 from litedram.frontend.axi import *
@@ -85,7 +89,10 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(150e6), ddram_channel=0, with_pcie=False, with_led_chaser=False, with_hbm=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(150e6), ddram_channel=0, with_pcie=False,
+                 pcie_lanes=4, pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_bench=False, with_etherbone=False, eth_ip="192.168.1.50",
+                 with_led_chaser=False, with_hbm=False, spd_dump=None, **kwargs):
         platform = xilinx_alveo_u280.Platform()
         if with_hbm:
             assert 225e6 <= sys_clk_freq <= 450e6
@@ -127,22 +134,53 @@ class BaseSoC(SoCCore):
                     sys_clk_freq     = sys_clk_freq,
                     iodelay_clk_freq = 600e6,
                     is_rdimm         = True)
+                if spd_dump is not None:
+                    ram_spd    = parse_spd_hexdump(spd_dump)
+                    ram_module = SDRAMRegisteredModule.from_spd_data(ram_spd, sys_clk_freq)
+                    ram_size   = None # From SPD.
+                    print("DDR4: loaded config from", spd_dump)
+                else:
+                    ram_module = MTA18ASF2G72PZ(sys_clk_freq, "1:4")
+                    ram_size   = 0x40000000
                 self.add_sdram("sdram",
                     phy           = self.ddrphy,
-                    module        = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
-                    size          = 0x40000000,
+                    module        = ram_module,
+                    size          = ram_size,
                     l2_cache_size = kwargs.get("l2_size", 8192)
                 )
 
             # Firmware RAM (To ease initial LiteDRAM calibration support) --------------------------
             self.add_ram("firmware_ram", 0x20000000, 0x8000)
 
+        # 10G Etherbone (10GBASE-R on QSFP28 0 Lane 0, 161.1328125MHz RefClk) ----------------------
+        if with_etherbone:
+            qsfp_pads = self.platform.request("qsfp28", 0)
+            self.comb += [
+                qsfp_pads.resetl.eq(1),
+                qsfp_pads.lpmode.eq(0),
+            ]
+            self.submodules.ethphy = LiteEthPHY10GBASER(
+                refclk_pads  = qsfp_pads,
+                refclk_freq  = 161.1328125e6,
+                data_pads    = qsfp_pads,
+                sys_clk_freq = self.clk_freq,
+                device       = self.platform.device)
+            add_etherbone_10gbaser(self, self.ethphy, ip_address=eth_ip)
+
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                speed      = "gen3",
+                data_width = pcie_gen3_data_width(pcie_lanes),
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -156,29 +194,41 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on Alveo U280")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",           action="store_true", help="Build design.")
-    target_group.add_argument("--load",            action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq",    default=150e6,       help="System clock frequency.") # HBM2 with 250MHz, DDR4 with 150MHz (1:4)
-    target_group.add_argument("--ddram-channel",   default="0",         help="DDRAM channel (0, 1, 2 or 3).") # also selects clk 0 or 1
-    target_group.add_argument("--with-pcie",       action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",          action="store_true", help="Generate PCIe driver.")
-    target_group.add_argument("--with-hbm",        action="store_true", help="Use HBM2.")
-    target_group.add_argument("--with-analyzer",   action="store_true", help="Enable Analyzer.")
-    target_group.add_argument("--with-led-chaser", action="store_true", help="Enable LED Chaser.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=150e6,          help="System clock frequency.") # HBM2 with 250MHz, DDR4 with 150MHz (1:4)
+    target_group.add_argument("--ddram-channel",            default="0",            help="DDRAM channel (0, 1, 2 or 3).") # also selects clk 0 or 1
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--pcie-lanes",               default=4, type=int, choices=[4, 8, 16], help="PCIe lanes (4, 8 or 16, Gen3 with 128, 256 or 512-bit datapath).")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
+    target_group.add_argument("--with-etherbone",           action="store_true",    help="Enable 10G Etherbone support (10GBASE-R on QSFP28 0 Lane 0).")
+    target_group.add_argument("--eth-ip",                   default="192.168.1.50", help="Etherbone IP address.")
+    target_group.add_argument("--with-hbm",                 action="store_true",    help="Use HBM2.")
+    target_group.add_argument("--with-analyzer",            action="store_true",    help="Enable Analyzer.")
+    target_group.add_argument("--with-led-chaser",          action="store_true",    help="Enable LED Chaser.")
+    target_group.add_argument("--spd-dump",                 type=str,               help="DDR4 configuration file, dumped using the `sdram_spd` command in LiteX BIOS.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     if args.with_hbm:
         args.sys_clk_freq = 250e6
 
     soc = BaseSoC(
-        sys_clk_freq    = int(float(args.sys_clk_freq)),
-        ddram_channel   = int(args.ddram_channel, 0),
-        with_pcie       = args.with_pcie,
-        with_led_chaser = args.with_led_chaser,
-        with_hbm        = args.with_hbm,
-        with_analyzer   = args.with_analyzer,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        ddram_channel            = int(args.ddram_channel, 0),
+        with_pcie                = args.with_pcie,
+        pcie_lanes               = args.pcie_lanes,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_etherbone           = args.with_etherbone,
+        eth_ip                   = args.eth_ip,
+        with_led_chaser          = args.with_led_chaser,
+        with_hbm                 = args.with_hbm,
+        spd_dump                 = args.spd_dump,
+        with_analyzer            = args.with_analyzer,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
 	)
     builder = Builder(soc, **builder_argdict(args))
@@ -18,14 +18,23 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
+from litex.soc.cores.bitbang import I2CMaster
 
-from litedram.modules import MT8JTF12864
+from litedram.modules import MT8JTF12864, parse_spd_hexdump, SDRAMModule
 from litedram.phy import s7ddrphy
 
 from liteeth.phy import LiteEthPHY
 
+from litex_boards.cores.eth_10gbaser import LiteEthPHY10GBASER, add_etherbone_10gbaser
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_dram import LitePCIeDRAMDMA
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.bitstream import bitstream_args, bitstream_argdict, bitstream_settings
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -51,8 +60,13 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_ethernet=False, with_led_chaser=True,
-                 with_spi_flash=False, with_pcie=False, with_sata=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_ethernet=False, with_etherbone=False,
+                 with_hybrid_ethernet=False, eth_ip="192.168.1.50", with_led_chaser=True,
+                 with_spi_flash=False, with_pcie=False,
+                 pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_dram_dma=False, with_pcie_bench=False, with_sata=False,
+                 sata_drives=1, sata_stripe_size=16, with_sata_streamer=False,
+                 with_spd_i2c=False, spd_dump=None, **kwargs):
         platform = xilinx_kc705.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -67,19 +81,39 @@ class BaseSoC(SoCCore):
                 memtype      = "DDR3",
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
+            if spd_dump is not None:
+                ram_spd    = parse_spd_hexdump(spd_dump)
+                ram_module = SDRAMModule.from_spd_data(ram_spd, sys_clk_freq)
+                print("DDR3: loaded config from", spd_dump)
+            else:
+                ram_module = MT8JTF12864(sys_clk_freq, "1:4") # Default SO-DIMM, 1GB.
             self.add_sdram("sdram",
                 phy           = self.ddrphy,
-                module        = MT8JTF12864(sys_clk_freq, "1:4"),
+                module        = ram_module,
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
-        if with_ethernet:
+        if with_ethernet or with_hybrid_ethernet:
             self.submodules.ethphy = LiteEthPHY(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 clk_freq   = self.clk_freq)
-            self.add_ethernet(phy=self.ethphy)
+            if with_ethernet:
+                self.add_ethernet(phy=self.ethphy)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
+
+        # 10G Etherbone (10GBASE-R on SFP+, 156.25MHz RefClk on the User SMA MGT Clock) ------------
+        if with_etherbone:
+            self.submodules.ethphy = LiteEthPHY10GBASER(
+                refclk_pads  = self.platform.request("user_sma_mgt_refclk"),
+                refclk_freq  = 156.25e6,
+                data_pads    = self.platform.request("sfp", 0),
+                sys_clk_freq = self.clk_freq,
+                device       = self.platform.device)
+            self.comb += self.platform.request("sfp_tx_disable_n", 0).eq(1)
+            add_etherbone_10gbaser(self, self.ethphy, ip_address=eth_ip)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -92,7 +126,19 @@ class BaseSoC(SoCCore):
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA <-> DRAM (DRAM used as a staging buffer by the Host).
+            if with_pcie_dram_dma:
+                assert hasattr(self, "sdram"), "PCIe DMA <-> DRAM requires DRAM."
+                self.submodules.pcie_dram = LitePCIeDRAMDMA(self.pcie_dma0, self.sdram.crossbar)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -108,25 +154,81 @@ class BaseSoC(SoCCore):
                     Subsignal("rx_p", Pins("G4")),
                     Subsignal("rx_n", Pins("G3")),
                 ),
+                # AB09-FMCRAID (4 SATA ports, 150MHz RefClk) on HPC / https://www.dgway.com/AB09-FMCRAID_E.html
+                ("fmc2sata_refclk", 0,
+                    Subsignal("p", Pins("HPC:GBTCLK0_M2C_P")),
+                    Subsignal("n", Pins("HPC:GBTCLK0_M2C_N")),
+                ),
+                *[("fmc2sata", n,
+                    Subsignal("tx_p", Pins(f"HPC:DP{n}_C2M_P")),
+                    Subsignal("tx_n", Pins(f"HPC:DP{n}_C2M_N")),
+                    Subsignal("rx_p", Pins(f"HPC:DP{n}_M2C_P")),
+                    Subsignal("rx_n", Pins(f"HPC:DP{n}_M2C_N")),
+                ) for n in range(4)],
             ]
             platform.add_extension(_sata_io)
 
-            # RefClk, Generate 150MHz from PLL.
-            self.clock_domains.cd_sata_refclk = ClockDomain()
-            self.crg.pll.create_clkout(self.cd_sata_refclk, 150e6)
-            sata_refclk = ClockSignal("sata_refclk")
-            platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-52]")
-
-            # PHY
-            self.submodules.sata_phy = LiteSATAPHY(platform.device,
-                refclk     = sata_refclk,
-                pads       = platform.request("sfp2sata"),
-                gen        = "gen2",
-                clk_freq   = sys_clk_freq,
-                data_width = 16)
-
-            # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            # Single Drive (over SFP2SATA).
+            if sata_drives == 1:
+                # RefClk, Generate 150MHz from a dedicated PLL (independent of sys_clk_freq).
+                self.clock_domains.cd_sata_refclk = ClockDomain()
+                self.submodules.sata_pll = sata_pll = S7PLL(speedgrade=-2)
+                sata_pll.register_clkin(self.crg.pll.clkin, 200e6)
+                sata_pll.create_clkout(self.cd_sata_refclk, 150e6)
+                sata_refclk = ClockSignal("sata_refclk")
+                platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-52]")
+
+                # PHY
+                self.submodules.sata_phy = LiteSATAPHY(platform.device,
+                    refclk     = sata_refclk,
+                    pads       = platform.request("sfp2sata"),
+                    gen        = "gen2",
+                    clk_freq   = sys_clk_freq,
+                    data_width = 16)
+
+                # Core
+                self.add_sata(phy=self.sata_phy, mode="read+write")
+                sata_crossbars = [self.sata_crossbar]
+
+            # RAID-0 (over AB09-FMCRAID).
+            else:
+                from litex_boards.cores.sata_raid import add_sata_raid0
+                assert sata_drives <= 4, "AB09-FMCRAID has 4 SATA ports."
+
+                # RefClk, 150MHz from FMC (shared by the PHYs, same GTX Quad).
+                refclk_pads = platform.request("fmc2sata_refclk")
+                sata_refclk = Signal()
+                self.specials += Instance("IBUFDS_GTE2",
+                    i_CEB = 0,
+                    i_I   = refclk_pads.p,
+                    i_IB  = refclk_pads.n,
+                    o_O   = sata_refclk)
+                platform.add_period_constraint(refclk_pads.p, 1e9/150e6)
+
+                # PHYs
+                sata_phys = []
+                for n in range(sata_drives):
+                    sata_phy = LiteSATAPHY(platform.device,
+                        refclk     = sata_refclk,
+                        pads       = platform.request("fmc2sata", n),
+                        gen        = "gen2",
+                        clk_freq   = sys_clk_freq,
+                        data_width = 16)
+                    setattr(self.submodules, f"sata_phy{n}", sata_phy)
+                    sata_phys.append(sata_phy)
+
+                # Cores/RAID-0 (with Benchmark, see software/sata_raid_bench.py).
+                add_sata_raid0(self, sata_phys, stripe_sectors=sata_stripe_size)
+                sata_crossbars = [getattr(self, f"sata_crossbar{n}") for n in range(sata_drives)]
+
+            # LiteDRAM <-> SATA Streamer (Recorder/Player, see software/sata_dram_bench.py).
+            if with_sata_streamer:
+                from litex_boards.cores.sata_dram import add_sata_dram_streamer
+                add_sata_dram_streamer(self, crossbars=sata_crossbars)
+
+        # System I2C (behind multiplexer, gives access to SO-DIMM SPD) -----------------------------
+        if with_spd_i2c or spd_dump is not None:
+            self.submodules.i2c = I2CMaster(platform.request("i2c"))
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -140,27 +242,52 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on KC705")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",          action="store_true", help="Build design.")
-    target_group.add_argument("--load",           action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq",   default=125e6,       help="System clock frequency.")
-    target_group.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
-    target_group.add_argument("--with-spi-flash", action="store_true", help="Enable SPI Flash (MMAPed).")
-    target_group.add_argument("--with-pcie",      action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",         action="store_true", help="Generate PCIe driver.")
-    target_group.add_argument("--with-sata",      action="store_true", help="Enable SATA support (over SFP2SATA).")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=125e6,          help="System clock frequency.")
+    ethopts = target_group.add_mutually_exclusive_group()
+    ethopts.add_argument("--with-ethernet",  action="store_true",                   help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone", action="store_true",                   help="Enable 10G Etherbone support (10GBASE-R on SFP+, 156.25MHz on User SMA MGT Clock).")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true",             help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support (1G Ethernet PHY).")
+    target_group.add_argument("--eth-ip",                   default="192.168.1.50", help="Etherbone IP address.")
+    target_group.add_argument("--with-spi-flash",           action="store_true",    help="Enable SPI Flash (MMAPed).")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-dram-dma",       action="store_true",    help="Connect PCIe DMA to DRAM (Host <-> DRAM streaming).")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
+    target_group.add_argument("--with-sata",                action="store_true",    help="Enable SATA support (over SFP2SATA).")
+    target_group.add_argument("--sata-drives",              default=1, type=int,    help="Number of SATA drives (1: over SFP2SATA, 2-4: RAID-0 over AB09-FMCRAID on HPC).")
+    target_group.add_argument("--sata-stripe-size",         default=16, type=int,   help="SATA RAID-0 stripe size (in sectors).")
+    target_group.add_argument("--with-sata-streamer",       action="store_true",    help="Enable LiteDRAM <-> SATA Streamer (Recorder/Player, see software/sata_dram_bench.py).")
+    target_group.add_argument("--with-spd-i2c",             action="store_true",    help="Enable System I2C (SO-DIMM SPD access for the `sdram_spd` BIOS command).")
+    target_group.add_argument("--spd-dump",                 type=str,               help="DDR3 configuration file, dumped using the `sdram_spd` command in LiteX BIOS (built with --with-spd-i2c).")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
+    bitstream_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_ethernet  = args.with_ethernet,
-        with_spi_flash = args.with_spi_flash,
-        with_pcie      = args.with_pcie,
-        with_sata      = args.with_sata,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_ethernet            = args.with_ethernet,
+        with_etherbone           = args.with_etherbone,
+        with_hybrid_ethernet     = args.with_hybrid_ethernet,
+        eth_ip                   = args.eth_ip,
+        with_spi_flash           = args.with_spi_flash,
+        with_pcie                = args.with_pcie,
+        with_pcie_dram_dma       = args.with_pcie_dram_dma,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_sata                = args.with_sata,
+        sata_drives              = args.sata_drives,
+        sata_stripe_size         = args.sata_stripe_size,
+        with_sata_streamer       = args.with_sata_streamer,
+        with_spd_i2c             = args.with_spd_i2c,
+        spd_dump                 = args.spd_dump,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))
+    bitstream_settings(soc.platform, **bitstream_argdict(args))
     if args.build:
         builder.build()
 
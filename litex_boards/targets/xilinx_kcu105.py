@@ -23,8 +23,17 @@ from litedram.phy import usddrphy
 
 from liteeth.phy.ku_1000basex import KU_1000BASEX
 
+from litex_boards.cores.eth_10gbaser import LiteEthPHY10GBASER, add_etherbone_10gbaser
+from litex_boards.cores.eth_hybrid import add_hybrid_ethernet
+from litex_boards.cores.udp_dram import add_udp_dram_streamer
+
 from litepcie.phy.uspciephy import USPCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_dram import LitePCIeDRAMDMA
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie_flash import LitePCIeFlash, USICAP
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -45,6 +54,12 @@ class _CRG(Module):
         pll.create_clkout(self.cd_pll4x, sys_clk_freq*4, buf=None, with_reset=False)
         pll.create_clkout(self.cd_idelay, 200e6)
         pll.create_clkout(self.cd_eth,    200e6)
+        # Check MMCM config early (sys4x shares the VCO with the 200MHz IDELAY/Eth clocks).
+        try:
+            pll.compute_config()
+        except ValueError:
+            msg = "No MMCM config for {:3.2f}MHz sys_clk_freq (ex: 125e6, 175e6, 200e6)."
+            raise ValueError(msg.format(sys_clk_freq/1e6)) from None
         platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
 
         self.specials += [
@@ -61,7 +76,12 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(125e6), with_ethernet=False, with_etherbone=False,
-                 eth_ip="192.168.1.50", with_led_chaser=True, with_pcie=False, with_sata=False,
+                 with_hybrid_ethernet=False, eth_ip="192.168.1.50", eth_phy="1000basex",
+                 with_led_chaser=True, with_pcie=False,
+                 pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_dram_dma=False, with_pcie_bench=False, with_pcie_flash=False,
+                 with_sata=False, sata_gen="gen2", sata_refclk="pll", with_udp_streamer=False,
+                 sata_drives=1, sata_stripe_size=16, with_sata_streamer=False,
                  **kwargs):
         platform = xilinx_kcu105.Platform()
 
@@ -85,7 +105,8 @@ class BaseSoC(SoCCore):
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        with_eth = with_ethernet or with_etherbone or with_hybrid_ethernet
+        if with_eth and eth_phy == "1000basex":
             self.submodules.ethphy = KU_1000BASEX(self.crg.cd_eth.clk,
                 data_pads    = self.platform.request("sfp", 0),
                 sys_clk_freq = self.clk_freq)
@@ -95,13 +116,55 @@ class BaseSoC(SoCCore):
                 self.add_ethernet(phy=self.ethphy)
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+            if with_hybrid_ethernet:
+                add_hybrid_ethernet(self, phy=self.ethphy)
+
+        # 10G Etherbone (10GBASE-R on SFP+ 0, 156.25MHz Si570 RefClk) ------------------------------
+        if eth_phy == "10gbaser":
+            assert with_etherbone, "10GBASE-R is only supported with Etherbone (64-bit UDP/IP)."
+            self.submodules.ethphy = LiteEthPHY10GBASER(
+                refclk_pads  = self.platform.request("si570_refclk"),
+                refclk_freq  = 156.25e6,
+                data_pads    = self.platform.request("sfp", 0),
+                sys_clk_freq = self.clk_freq,
+                device       = self.platform.device)
+            self.comb += self.platform.request("sfp_tx_disable_n", 0).eq(1)
+            add_etherbone_10gbaser(self, self.ethphy, ip_address=eth_ip)
+
+        # UDP DRAM Streamer ------------------------------------------------------------------------
+        if with_udp_streamer:
+            assert with_etherbone, "UDP DRAM Streamer requires Etherbone."
+            add_udp_dram_streamer(self)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
             self.submodules.pcie_phy = USPCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA <-> DRAM (DRAM used as a staging buffer by the Host).
+            if with_pcie_dram_dma:
+                assert hasattr(self, "sdram"), "PCIe DMA <-> DRAM requires DRAM."
+                self.submodules.pcie_dram = LitePCIeDRAMDMA(self.pcie_dma0, self.sdram.crossbar)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
+
+            # PCIe SPI Flash Programmer (on the last DMA) + ICAP (For FPGA reload over PCIe).
+            if with_pcie_flash:
+                assert not with_pcie_bench, "PCIe Flash Programmer and Benchmark both use the last DMA."
+                assert not (with_pcie_dram_dma and pcie_dmas < 2), "PCIe DMA <-> DRAM and Flash Programmer require 2 DMAs."
+                self.submodules.pcie_flash = LitePCIeFlash(getattr(self, f"pcie_dma{pcie_dmas - 1}"),
+                    pads         = None, # Primary configuration Flash (through STARTUPE3).
+                    device       = platform.device,
+                    sys_clk_freq = sys_clk_freq)
+                self.submodules.icap = USICAP()
+                self.icap.add_timing_constraints(platform, sys_clk_freq, self.crg.cd_sys.clk)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -117,25 +180,77 @@ class BaseSoC(SoCCore):
                     Subsignal("rx_p", Pins("T2")),
                     Subsignal("rx_n", Pins("T1")),
                 ),
+                ("sfp2sata", 1,
+                    Subsignal("tx_p", Pins("W4")),
+                    Subsignal("tx_n", Pins("W3")),
+                    Subsignal("rx_p", Pins("V2")),
+                    Subsignal("rx_n", Pins("V1")),
+                ),
+                # 150MHz RefClk on USER_SMA_MGT_CLOCK.
+                ("sata_refclk", 0,
+                    Subsignal("p", Pins("V6")),
+                    Subsignal("n", Pins("V5")),
+                ),
             ]
             platform.add_extension(_sata_io)
-
-            # RefClk, Generate 150MHz from PLL.
-            self.clock_domains.cd_sata_refclk = ClockDomain()
-            self.crg.pll.create_clkout(self.cd_sata_refclk, 150e6)
-            sata_refclk = ClockSignal("sata_refclk")
-            platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-1753]")
-
-            # PHY
-            self.submodules.sata_phy = LiteSATAPHY(platform.device,
-                refclk     = sata_refclk,
-                pads       = platform.request("sfp2sata"),
-                gen        = "gen2",
-                clk_freq   = sys_clk_freq,
-                data_width = 16)
-
-            # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            assert sata_drives in [1, 2], "KCU105 has 2 SFP cages."
+
+            # RefClk: Generate 150MHz from a dedicated PLL (independent of sys_clk_freq) or use
+            # external 150MHz on SMA (lower jitter, recommended for Gen3), shared by the PHYs.
+            assert sata_refclk in ["pll", "sma"]
+            if sata_refclk == "pll":
+                self.clock_domains.cd_sata_refclk = ClockDomain()
+                self.submodules.sata_pll = sata_pll = USMMCM(speedgrade=-2)
+                sata_pll.register_clkin(self.crg.pll.clkin, 125e6)
+                sata_pll.create_clkout(self.cd_sata_refclk, 150e6)
+                platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-1753]")
+                refclk = ClockSignal("sata_refclk")
+            else:
+                refclk_pads = platform.request("sata_refclk")
+                refclk      = Signal()
+                self.specials += Instance("IBUFDS_GTE3",
+                    i_CEB = 0,
+                    i_I   = refclk_pads.p,
+                    i_IB  = refclk_pads.n,
+                    o_O   = refclk)
+                platform.add_period_constraint(refclk_pads.p, 1e9/150e6)
+
+            # PHYs (Gen3: 32-bit datapath, sata_tx/rx clk @ 150MHz instead of 300MHz).
+            assert sata_gen != "gen3" or sys_clk_freq >= 150e6, "SATA Gen3 requires --sys-clk-freq >= 150e6."
+            sata_phys = []
+            for n in range(sata_drives):
+                sata_phy = LiteSATAPHY(platform.device,
+                    refclk     = refclk,
+                    pads       = platform.request("sfp2sata", n),
+                    gen        = sata_gen,
+                    clk_freq   = sys_clk_freq,
+                    data_width = {"gen1": 16, "gen2": 16, "gen3": 32}[sata_gen])
+                sata_phys.append(sata_phy)
+
+            # Core (Single Drive).
+            if sata_drives == 1:
+                self.submodules.sata_phy = sata_phys[0]
+                self.add_sata(phy=self.sata_phy, mode="read+write")
+                # add_sata constrains sata_tx/rx clks for a 16-bit datapath (300MHz at Gen3):
+                # re-constrain them @ 150MHz for the Gen3 32-bit datapath.
+                if sata_gen == "gen3":
+                    for clk in [self.sata_phy.crg.cd_sata_tx.clk, self.sata_phy.crg.cd_sata_rx.clk]:
+                        platform.toolchain.clocks.pop(clk)
+                        platform.add_period_constraint(clk, 1e9/150e6)
+                sata_crossbars = [self.sata_crossbar]
+
+            # Cores/RAID-0 (with Benchmark, see software/sata_raid_bench.py).
+            else:
+                from litex_boards.cores.sata_raid import add_sata_raid0
+                for n, sata_phy in enumerate(sata_phys):
+                    setattr(self.submodules, f"sata_phy{n}", sata_phy)
+                add_sata_raid0(self, sata_phys, stripe_sectors=sata_stripe_size)
+                sata_crossbars = [getattr(self, f"sata_crossbar{n}") for n in range(sata_drives)]
+
+            # LiteDRAM <-> SATA Streamer (Recorder/Player, see software/sata_dram_bench.py).
+            if with_sata_streamer:
+                from litex_boards.cores.sata_dram import add_sata_dram_streamer
+                add_sata_dram_streamer(self, crossbars=sata_crossbars)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -149,27 +264,53 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on KCU105")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",           action="store_true",    help="Build design.")
-    target_group.add_argument("--load",            action="store_true",    help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq",    default=125e6,          help="System clock frequency.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=125e6,          help="System clock frequency.")
     ethopts = target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true",          help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true",          help="Enable Etherbone support.")
-    target_group.add_argument("--eth-ip",          default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    target_group.add_argument("--with-pcie",       action="store_true",    help="Enable PCIe support.")
-    target_group.add_argument("--driver",          action="store_true",    help="Generate PCIe driver.")
-    target_group.add_argument("--with-sata",       action="store_true",    help="Enable SATA support (over SFP2SATA).")
+    ethopts.add_argument("--with-ethernet",  action="store_true",                   help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone", action="store_true",                   help="Enable Etherbone support.")
+    ethopts.add_argument("--with-hybrid-ethernet", action="store_true",             help="Enable Ethernet (CPU) + Etherbone (Hardware, on 192.168.1.51) support (1000basex only).")
+    target_group.add_argument("--eth-ip",                   default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    target_group.add_argument("--eth-phy",                  default="1000basex",    help="Ethernet PHY (10gbaser: Etherbone only, line rate with --sys-clk-freq=175e6 or 200e6).", choices=["1000basex", "10gbaser"])
+    target_group.add_argument("--with-udp-streamer",        action="store_true",    help="Enable DRAM -> UDP Streamer (with Etherbone, see software/udp_dram_dump.py).")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-dram-dma",       action="store_true",    help="Connect PCIe DMA to DRAM (Host <-> DRAM streaming).")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--with-pcie-flash",          action="store_true",    help="Enable PCIe SPI Flash Programmer and ICAP reload (see software/litepcie_flash.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
+    target_group.add_argument("--with-sata",                action="store_true",    help="Enable SATA support (over SFP2SATA).")
+    target_group.add_argument("--sata-gen",                 default="2",            help="SATA Gen (3 requires --sys-clk-freq >= 150e6).", choices=["1", "2", "3"])
+    target_group.add_argument("--sata-refclk",              default="pll",          help="SATA RefClk (pll: 150MHz from PLL, sma: external 150MHz on USER_SMA_MGT_CLOCK).", choices=["pll", "sma"])
+    target_group.add_argument("--sata-drives",              default=1, type=int,    help="Number of SATA drives (1 or 2, over SFP2SATA on SFP0/SFP1; 2: RAID-0).")
+    target_group.add_argument("--sata-stripe-size",         default=16, type=int,   help="SATA RAID-0 stripe size (in sectors).")
+    target_group.add_argument("--with-sata-streamer",       action="store_true",    help="Enable LiteDRAM <-> SATA Streamer (Recorder/Player, see software/sata_dram_bench.py).")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
+    if args.eth_phy == "10gbaser" and not args.with_etherbone:
+        parser.error("--eth-phy=10gbaser requires --with-etherbone.")
 
     soc = BaseSoC(
-        sys_clk_freq   = int(float(args.sys_clk_freq)),
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        with_pcie      = args.with_pcie,
-        with_sata      = args.with_sata,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_ethernet            = args.with_ethernet,
+        with_etherbone           = args.with_etherbone,
+        with_hybrid_ethernet     = args.with_hybrid_ethernet,
+        eth_ip                   = args.eth_ip,
+        eth_phy                  = args.eth_phy,
+        with_pcie                = args.with_pcie,
+        with_pcie_dram_dma       = args.with_pcie_dram_dma,
+        with_pcie_bench          = args.with_pcie_bench,
+        with_pcie_flash          = args.with_pcie_flash,
+        with_sata                = args.with_sata,
+        sata_gen                 = "gen" + args.sata_gen,
+        sata_refclk              = args.sata_refclk,
+        sata_drives              = args.sata_drives,
+        sata_stripe_size         = args.sata_stripe_size,
+        with_sata_streamer       = args.with_sata_streamer,
+        with_udp_streamer        = args.with_udp_streamer,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
 	)
     builder = Builder(soc, **builder_argdict(args))
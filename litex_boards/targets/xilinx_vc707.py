@@ -19,9 +19,13 @@ from litex.soc.cores.led import LedChaser
 from litedram.modules import MT8JTF12864
 from litedram.phy import s7ddrphy
 
+from litex_boards.cores.eth_10gbaser import LiteEthPHY10GBASER, add_etherbone_10gbaser
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.software import generate_litepcie_software
+
+from litex_boards.cores.pcie_bench import add_pcie_bench
+from litex_boards.cores.pcie import pcie_args, pcie_argdict
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -47,7 +51,9 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(125e6), with_led_chaser=True, with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=int(125e6), with_etherbone=False, eth_ip="192.168.1.50",
+                 with_led_chaser=True, with_pcie=False, pcie_dmas=1, pcie_address_width=32, pcie_dma_buffering_depth=1024,
+                 with_pcie_bench=False, **kwargs):
         platform = xilinx_vc707.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -68,12 +74,30 @@ class BaseSoC(SoCCore):
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
+        # 10G Etherbone (10GBASE-R on SFP+, 156.25MHz RefClk on the User SMA MGT Clock) ------------
+        if with_etherbone:
+            self.submodules.ethphy = LiteEthPHY10GBASER(
+                refclk_pads  = self.platform.request("user_sma_mgt_refclk"),
+                refclk_freq  = 156.25e6,
+                data_pads    = self.platform.request("sfp", 0),
+                sys_clk_freq = self.clk_freq,
+                device       = self.platform.device)
+            self.comb += self.platform.request("sfp_tx_disable_n", 0).eq(1)
+            add_etherbone_10gbaser(self, self.ethphy, ip_address=eth_ip)
+
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy,
+                ndmas               = pcie_dmas,
+                address_width       = pcie_address_width,
+                dma_buffering_depth = pcie_dma_buffering_depth)
+
+            # PCIe DMA Benchmark (Pattern Generator/Checker on the last DMA).
+            if with_pcie_bench:
+                add_pcie_bench(self)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -87,18 +111,26 @@ def main():
     from litex.soc.integration.soc import LiteXSoCArgumentParser
     parser = LiteXSoCArgumentParser(description="LiteX SoC on VC707")
     target_group = parser.add_argument_group(title="Target options")
-    target_group.add_argument("--build",        action="store_true", help="Build design.")
-    target_group.add_argument("--load",         action="store_true", help="Load bitstream.")
-    target_group.add_argument("--sys-clk-freq", default=125e6,       help="System clock frequency.")
-    target_group.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support.")
-    target_group.add_argument("--driver",       action="store_true", help="Generate PCIe driver.")
+    target_group.add_argument("--build",                    action="store_true",    help="Build design.")
+    target_group.add_argument("--load",                     action="store_true",    help="Load bitstream.")
+    target_group.add_argument("--sys-clk-freq",             default=125e6,          help="System clock frequency.")
+    target_group.add_argument("--with-etherbone",           action="store_true",    help="Enable 10G Etherbone support (10GBASE-R on SFP+, 156.25MHz on User SMA MGT Clock).")
+    target_group.add_argument("--eth-ip",                   default="192.168.1.50", help="Etherbone IP address.")
+    target_group.add_argument("--with-pcie",                action="store_true",    help="Enable PCIe support.")
+    target_group.add_argument("--with-pcie-bench",          action="store_true",    help="Enable PCIe DMA Benchmark (Pattern Generator/Checker, see software/litepcie_bench.py).")
+    target_group.add_argument("--driver",                   action="store_true",    help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    pcie_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        with_pcie_   = args.with_pcie,
+        sys_clk_freq             = int(float(args.sys_clk_freq)),
+        with_etherbone           = args.with_etherbone,
+        eth_ip                   = args.eth_ip,
+        with_pcie                = args.with_pcie,
+        with_pcie_bench          = args.with_pcie_bench,
+        **pcie_argdict(args),
         **soc_core_argdict(args)
     )
     builder = Builder(soc, **builder_argdict(args))